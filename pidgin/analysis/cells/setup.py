@@ -118,6 +118,13 @@ print(f"Analyzing experiment in: {exp_dir.resolve()}")"""
             turn_metrics_data = turn_metrics_data or []
             messages_data = messages_data or []
             conversations_data = conversations_data or []
+        elif "parquet_dir" in manifest_or_data:
+            # New style with turns exported to the Parquet archive
+            return self._create_parquet_loading_cell(
+                manifest_or_data["manifest"],
+                manifest_or_data["parquet_dir"],
+                manifest_or_data.get("conversations", []),
+            )
         elif "manifest" in manifest_or_data:
             # New style - data dict
             manifest = manifest_or_data["manifest"]
@@ -158,6 +165,61 @@ if not conversations.empty:
 
         return self._make_code_cell(code)
 
+    def _create_parquet_loading_cell(
+        self,
+        manifest: Dict[str, Any],
+        parquet_dir: str,
+        conversations_data: List[Dict],
+    ) -> "NotebookNode":
+        """Create a data loading cell that queries the Parquet archive.
+
+        Args:
+            manifest: Experiment manifest
+            parquet_dir: Root directory of the Parquet archive
+            conversations_data: Conversations from database
+
+        Returns:
+            Jupyter notebook code cell
+        """
+        exp_id = manifest.get("experiment_id", "unknown")
+
+        code = f"""# Load experiment data from the Parquet archive
+import duckdb
+
+experiment_id = "{exp_id}"
+parquet_dir = Path(r"{parquet_dir}")
+
+
+def archive(table):
+    \"\"\"Query an archived table lazily, limited to this experiment.
+
+    Filters on experiment_id and model_pair (the partition columns) only
+    read matching files; other filters skip row groups by their statistics.
+    \"\"\"
+    return duckdb.sql(
+        f"SELECT * FROM read_parquet('{{parquet_dir / table}}/*/*/*.parquet', "
+        "hive_partitioning = true, union_by_name = true) "
+        "WHERE experiment_id = $experiment_id",
+        params={{"experiment_id": experiment_id}},
+    )
+
+
+# Lazy relations: nothing is read until they are queried
+turns = archive("conversation_turns")
+messages = archive("messages")
+thinking_traces = archive("thinking_traces")
+
+# Turn metrics used by the analysis below
+turn_metrics = turns.select(
+    "* EXCLUDE (a_minhash, b_minhash), overall_convergence AS convergence_score"
+).order("conversation_id, turn_number").df()
+conversations = pd.DataFrame({conversations_data})
+
+print(f"Loaded {{len(turn_metrics)}} turns from {{len(conversations)}} conversations")
+print("Turn columns:", list(turn_metrics.columns))"""
+
+        return self._make_code_cell(code)
+
     def create_export_cell(self) -> "NotebookNode":
         """Create data export code cell.
 
@@ -1,7 +1,105 @@
 """Convergence metrics for tracking when AI agents start sounding alike."""
 
 import re
-from typing import Any, List, Tuple
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from ..metrics.compression import ConversationCompression
+
+AGENT_LABEL_PATTERN = re.compile(r"\*\*Agent [AB]\*\*:\s*")
+AGENT_MARKER_PATTERN = re.compile(r"\*\*Agent [AB]\*\*")
+EXCESS_NEWLINES_PATTERN = re.compile(r"\n\s*\n\s*\n")
+SENTENCE_END_PATTERN = re.compile(r"[.!?]+[\s]")
+LIST_ITEM_PATTERN = re.compile(r"^[\s]*[-*•]|\d+\.", re.MULTILINE)
+
+# Per-message counts summed over the comparison window
+PROFILE_FIELDS = (
+    "length",
+    "sentences",
+    "paragraphs",
+    "lists",
+    "questions",
+    "code_blocks",
+    "exclamations",
+    "commas",
+    "semicolons",
+    "colons",
+    "dashes",
+)
+LENGTH = PROFILE_FIELDS.index("length")
+SENTENCES = PROFILE_FIELDS.index("sentences")
+STRUCTURE_FEATURES = range(
+    PROFILE_FIELDS.index("paragraphs"), PROFILE_FIELDS.index("exclamations")
+)
+PUNCTUATION_FEATURES = range(PROFILE_FIELDS.index("exclamations"), len(PROFILE_FIELDS))
+
+
+def clean_message_content(content: str) -> str:
+    """Remove embedded agent labels and excess blank lines from a message."""
+    # Remove embedded agent labels like "**Agent A**:" and "**Agent B**:"
+    content = AGENT_LABEL_PATTERN.sub("", content)
+
+    # Remove markdown formatting artifacts from collaborative responses
+    content = AGENT_MARKER_PATTERN.sub("", content)
+
+    # Remove excessive newlines and clean up spacing
+    content = EXCESS_NEWLINES_PATTERN.sub("\n\n", content)
+    return content.strip()
+
+
+def profile_message(content: str) -> Tuple[int, ...]:
+    """Count the structural features of a cleaned message.
+
+    Args:
+        content: Cleaned message content
+
+    Returns:
+        Counts in PROFILE_FIELDS order
+    """
+    # Count sentences (add 1 for last sentence if no trailing punctuation)
+    sentences = len(SENTENCE_END_PATTERN.findall(content))
+    if content and not content.endswith((".", "!", "?")):
+        sentences += 1
+
+    return (
+        len(content),
+        sentences,
+        content.count("\n\n") + 1,
+        len(LIST_ITEM_PATTERN.findall(content)),
+        content.count("?"),
+        content.count("```"),
+        content.count("!"),
+        content.count(","),
+        content.count(";"),
+        content.count(":"),
+        content.count("-") + content.count("—"),
+    )
+
+
+def _ratio(value_a: float, value_b: float) -> float:
+    """Smaller over larger value, or 0.0 if either is zero."""
+    if value_a == 0 or value_b == 0:
+        return 0.0
+    return min(value_a, value_b) / max(value_a, value_b)
+
+
+def _profile_similarity(
+    profile_a: Sequence[float], profile_b: Sequence[float]
+) -> float:
+    """Average ratio similarity of paired features; both zero counts as 1.0."""
+    similarities = []
+    for value_a, value_b in zip(profile_a, profile_b, strict=True):
+        if value_a == 0 and value_b == 0:
+            similarities.append(1.0)  # Both have none, that's similar
+        else:
+            similarities.append(_ratio(value_a, value_b))
+    return sum(similarities) / len(similarities) if similarities else 0.0
+
+
+def _per_char(sums: List[int], fields: range) -> List[float]:
+    """Normalize summed counts by the total characters of the messages."""
+    total_chars = sums[LENGTH]
+    return [sums[i] / total_chars if total_chars > 0 else 0 for i in fields]
 
 
 class ConvergenceCalculator:
@@ -16,6 +114,7 @@ class ConvergenceCalculator:
         """
         self.window_size = window_size
         self.history: List[float] = []
+        self._reset_profiles([])
 
         # Default weights if none provided
         self.weights = weights or {
@@ -34,38 +133,45 @@ class ConvergenceCalculator:
 
         Returns 0.0 (completely different) to 1.0 (identical).
 
+        Messages are profiled once, the first time they are seen. When called
+        again with the same, since extended, list only the appended messages
+        are processed, so each call costs O(1) in conversation length.
+
         Args:
             messages: Full conversation history
 
         Returns:
             Convergence score between 0.0 and 1.0
         """
-        # Get recent messages from each agent, ensuring balance
-        # Only use messages from agent turns (not system/external)
-        agent_messages = [m for m in messages if m.agent_id in ["agent_a", "agent_b"]]
-        recent_messages = (
-            agent_messages[-self.window_size :]
-            if len(agent_messages) > self.window_size
-            else agent_messages
-        )
+        self._ingest(messages)
 
-        recent_a = [m for m in recent_messages if m.agent_id == "agent_a"]
-        recent_b = [m for m in recent_messages if m.agent_id == "agent_b"]
+        # Only use messages from agent turns (not system/external)
+        window_count = min(self._agent_count, self.window_size)
+        counts = self._agent_a_counts
+        count_a = counts[-1] - counts[-1 - window_count]
+        count_b = window_count - count_a
 
-        if not recent_a or not recent_b:
+        if not count_a or not count_b:
             return 0.0
 
-        # Balance the comparison by taking equal numbers of recent messages
-        min_count = min(len(recent_a), len(recent_b))
-        recent_a = recent_a[-min_count:] if min_count > 0 else recent_a
-        recent_b = recent_b[-min_count:] if min_count > 0 else recent_b
-
-        # Clean the message content before analysis
-        recent_a = [self._clean_message_content(m) for m in recent_a]
-        recent_b = [self._clean_message_content(m) for m in recent_b]
+        # Balance the comparison by taking equal numbers of recent messages,
+        # which are the last min_count of each agent overall
+        min_count = min(count_a, count_b)
+        totals_a = self._profile_totals["agent_a"]
+        totals_b = self._profile_totals["agent_b"]
+        sums_a = [
+            end - start
+            for end, start in zip(totals_a[-1], totals_a[-1 - min_count], strict=True)
+        ]
+        sums_b = [
+            end - start
+            for end, start in zip(totals_b[-1], totals_b[-1 - min_count], strict=True)
+        ]
 
         # First check for exact content matches
-        content_sim = self._content_similarity(recent_a, recent_b)
+        content_sim = self._content_similarity(
+            self._last_content["agent_a"], self._last_content["agent_b"]
+        )
 
         # If content is very similar, weight it heavily
         if content_sim > 0.9:
@@ -74,10 +180,18 @@ class ConvergenceCalculator:
             )  # Heavily weight exact matches
         else:
             # Calculate multiple structural similarity metrics
-            length_sim = self._length_similarity(recent_a, recent_b)
-            sentence_sim = self._sentence_pattern_similarity(recent_a, recent_b)
-            structure_sim = self._structure_similarity(recent_a, recent_b)
-            punctuation_sim = self._punctuation_similarity(recent_a, recent_b)
+            length_sim = _ratio(sums_a[LENGTH] / min_count, sums_b[LENGTH] / min_count)
+            sentence_sim = _ratio(
+                sums_a[SENTENCES] / min_count, sums_b[SENTENCES] / min_count
+            )
+            structure_sim = _profile_similarity(
+                [sums_a[i] / min_count for i in STRUCTURE_FEATURES],
+                [sums_b[i] / min_count for i in STRUCTURE_FEATURES],
+            )
+            punctuation_sim = _profile_similarity(
+                _per_char(sums_a, PUNCTUATION_FEATURES),
+                _per_char(sums_b, PUNCTUATION_FEATURES),
+            )
 
             # Weighted average including content similarity
             similarity = (
@@ -93,40 +207,61 @@ class ConvergenceCalculator:
 
         return round(similarity, 2)
 
-    def _clean_message_content(self, message: Any) -> Any:
-        """Clean message content by removing embedded agent labels and formatting."""
-        content = message.content
-
-        # Remove embedded agent labels like "**Agent A**:" and "**Agent B**:"
-        content = re.sub(r"\*\*Agent [AB]\*\*:\s*", "", content)
-
-        # Remove markdown formatting artifacts from collaborative responses
-        content = re.sub(r"\*\*Agent [AB]\*\*", "", content)
-
-        # Remove excessive newlines and clean up spacing
-        content = re.sub(r"\n\s*\n\s*\n", "\n\n", content)
-        content = content.strip()
-
-        # Create a new message object with cleaned content
-        from types import SimpleNamespace
-
-        cleaned_message = SimpleNamespace()
-        cleaned_message.content = content
-        cleaned_message.agent_id = message.agent_id
-        cleaned_message.role = message.role
-        cleaned_message.timestamp = getattr(message, "timestamp", None)
-
-        return cleaned_message
-
-    def _content_similarity(self, messages_a: List, messages_b: List) -> float:
-        """Calculate direct content similarity between messages."""
-        if not messages_a or not messages_b:
-            return 0.0
-
-        # Get the most recent message from each agent for comparison
-        content_a = messages_a[-1].content.strip().lower()
-        content_b = messages_b[-1].content.strip().lower()
+    def _ingest(self, messages: List[Any]) -> None:
+        """Profile the messages appended since the last call.
 
+        A different list, or one that has shrunk, is profiled from scratch.
+        """
+        if messages is not self._messages or len(messages) < self._seen:
+            self._reset_profiles(messages)
+
+        new_messages = []
+        for message in messages[self._seen :]:
+            agent_id = message.agent_id
+            if agent_id not in self._profile_totals:
+                continue
+            new_messages.append((agent_id, message.content))
+            content = clean_message_content(message.content)
+            totals = self._profile_totals[agent_id]
+            totals.append(
+                [
+                    a + b
+                    for a, b in zip(totals[-1], profile_message(content), strict=True)
+                ]
+            )
+            self._last_content[agent_id] = content.lower()
+            self._agent_a_counts.append(
+                self._agent_a_counts[-1] + (agent_id == "agent_a")
+            )
+            self._agent_count += 1
+
+        # One flush per call, so marginal ratios cover the turn just taken
+        if new_messages:
+            self.compression.add_messages(new_messages)
+        self._seen = len(messages)
+
+    def _reset_profiles(self, messages: List[Any]) -> None:
+        """Forget profiled messages and start following a new list."""
+        self._messages = messages
+        self._seen = 0
+        self._agent_count = 0
+        # Differences between entries k apart are window sums, so only the
+        # last window_size + 1 entries are kept
+        span = self.window_size + 1
+        zero = [0] * len(PROFILE_FIELDS)
+        # Running sums of message profiles, one entry per message of the agent
+        self._profile_totals: Dict[str, Deque[List[int]]] = {
+            "agent_a": deque([zero], maxlen=span),
+            "agent_b": deque([zero], maxlen=span),
+        }
+        # Running count of agent A messages, one entry per agent message
+        self._agent_a_counts: Deque[int] = deque([0], maxlen=span)
+        self._last_content: Dict[str, str] = {"agent_a": "", "agent_b": ""}
+        # Whole-conversation compression of the raw message text
+        self.compression = ConversationCompression()
+
+    def _content_similarity(self, content_a: str, content_b: str) -> float:
+        """Calculate direct content similarity between two cleaned messages."""
         # Handle exact matches
         if content_a == content_b:
             return 1.0
@@ -153,137 +288,26 @@ class ConvergenceCalculator:
         union = len(words_a.union(words_b))
         return intersection / union if union > 0 else 0.0
 
-    def _length_similarity(self, messages_a: List, messages_b: List) -> float:
-        """Calculate similarity based on message lengths."""
-        if not messages_a or not messages_b:
-            return 0.0
-
-        # Compare average message lengths
-        avg_len_a = sum(len(m.content) for m in messages_a) / len(messages_a)
-        avg_len_b = sum(len(m.content) for m in messages_b) / len(messages_b)
-
-        if avg_len_a == 0 or avg_len_b == 0:
-            return 0.0
-
-        # Ratio similarity (closer to 1.0 means more similar)
-        ratio = min(avg_len_a, avg_len_b) / max(avg_len_a, avg_len_b)
-        return ratio
-
-    def _sentence_pattern_similarity(self, messages_a: List, messages_b: List) -> float:
-        """Calculate similarity based on sentence patterns."""
-        # Extract sentences using simple regex
-        sentence_pattern = r"[.!?]+[\s]"
-
-        def avg_sentences(messages):
-            total_sentences = 0
-            for m in messages:
-                # Count sentences (add 1 for last sentence if no trailing punctuation)
-                count = len(re.findall(sentence_pattern, m.content))
-                if m.content and not m.content.strip().endswith((".", "!", "?")):
-                    count += 1
-                total_sentences += count
-            return total_sentences / len(messages) if messages else 0
-
-        avg_sent_a = avg_sentences(messages_a)
-        avg_sent_b = avg_sentences(messages_b)
-
-        if avg_sent_a == 0 or avg_sent_b == 0:
-            return 0.0
-
-        ratio = min(avg_sent_a, avg_sent_b) / max(avg_sent_a, avg_sent_b)
-        return ratio
+    def get_compression_ratios(self) -> Dict[str, float]:
+        """Get compression ratios of the conversation seen by calculate().
 
-    def _structure_similarity(self, messages_a: List, messages_b: List) -> float:
-        """Calculate similarity based on structural patterns.
+        Ratios fall as the conversation repeats itself, so a low marginal
+        ratio means the last turn added little that was not said before.
 
-        Includes paragraphs, lists, questions.
+        Returns:
+            Cumulative and marginal ratios per agent and combined, as
+            stored in conversation_turns at import
         """
+        return self.compression.ratios()
 
-        def extract_features(messages):
-            features = {"paragraphs": 0, "lists": 0, "questions": 0, "code_blocks": 0}
-
-            for m in messages:
-                content = m.content
-                # Count paragraphs (double newlines)
-                features["paragraphs"] += len(re.findall(r"\n\n", content)) + 1
-                # Count list items (lines starting with -, *, or numbers)
-                features["lists"] += len(
-                    re.findall(r"^[\s]*[-*•]|\d+\.", content, re.MULTILINE)
-                )
-                # Count questions
-                features["questions"] += content.count("?")
-                # Count code blocks (triple backticks)
-                features["code_blocks"] += content.count("```")
-
-            # Normalize by message count
-            for key in features:
-                features[key] = features[key] / len(messages) if messages else 0
-
-            return features
-
-        features_a = extract_features(messages_a)
-        features_b = extract_features(messages_b)
-
-        # Calculate similarity for each feature
-        similarities = []
-        for key in features_a:
-            if features_a[key] == 0 and features_b[key] == 0:
-                similarities.append(1.0)  # Both have none, that's similar
-            elif features_a[key] == 0 or features_b[key] == 0:
-                similarities.append(0.0)  # One has none, that's different
-            else:
-                ratio = min(features_a[key], features_b[key]) / max(
-                    features_a[key], features_b[key]
-                )
-                similarities.append(ratio)
-
-        return sum(similarities) / len(similarities) if similarities else 0.0
-
-    def _punctuation_similarity(self, messages_a: List, messages_b: List) -> float:
-        """Calculate similarity based on punctuation patterns."""
-
-        def punctuation_profile(messages):
-            profile = {
-                "exclamations": 0,
-                "commas": 0,
-                "semicolons": 0,
-                "colons": 0,
-                "dashes": 0,
-            }
-
-            total_chars = 0
-            for m in messages:
-                content = m.content
-                total_chars += len(content)
-                profile["exclamations"] += content.count("!")
-                profile["commas"] += content.count(",")
-                profile["semicolons"] += content.count(";")
-                profile["colons"] += content.count(":")
-                profile["dashes"] += content.count("-") + content.count("—")
-
-            # Normalize by total characters
-            for key in profile:
-                profile[key] = profile[key] / total_chars if total_chars > 0 else 0
-
-            return profile
-
-        profile_a = punctuation_profile(messages_a)
-        profile_b = punctuation_profile(messages_b)
-
-        # Calculate similarity
-        similarities = []
-        for key in profile_a:
-            if profile_a[key] == 0 and profile_b[key] == 0:
-                similarities.append(1.0)
-            elif profile_a[key] == 0 or profile_b[key] == 0:
-                similarities.append(0.0)
-            else:
-                ratio = min(profile_a[key], profile_b[key]) / max(
-                    profile_a[key], profile_b[key]
-                )
-                similarities.append(ratio)
+    def get_marginal_compression_ratio(self) -> Optional[float]:
+        """Get the marginal compression ratio of the last turn.
 
-        return sum(similarities) / len(similarities) if similarities else 0.0
+        Returns:
+            Ratio over both agents' messages, or None if the turn added
+            no text
+        """
+        return self.compression.marginal_ratio
 
     def get_trend(self) -> str:
         """Get the trend of convergence (increasing, decreasing, stable)."""
@@ -14,6 +14,7 @@ except ImportError:
     nbformat = None
 
 from ..database.event_store import EventStore
+from ..database.parquet_exporter import partition_dir
 from ..io.logger import get_logger
 from .notebook_cells import NotebookCells
 
@@ -28,6 +29,7 @@ class NotebookGenerator:
         experiment_dir: Path,
         event_store: EventStore,
         cells: Optional[NotebookCells] = None,
+        parquet_dir: Optional[Path] = None,
     ):
         """Initialize with experiment directory and EventStore.
 
@@ -35,12 +37,16 @@ class NotebookGenerator:
             experiment_dir: Path to experiment directory
             event_store: EventStore instance for database access
             cells: Optional custom cells instance
+            parquet_dir: Optional Parquet archive the experiment was exported
+                to, which the notebook then queries instead of embedding
+                turn data
         """
         self.experiment_dir = experiment_dir
         self.manifest_path = experiment_dir / "manifest.json"
         self.notebook_path = experiment_dir / "analysis.ipynb"
         self.event_store = event_store
         self.cells = cells or NotebookCells()
+        self.parquet_dir = parquet_dir
 
     def generate(self) -> bool:
         """Generate analysis notebook from experiment data.
@@ -103,21 +109,29 @@ class NotebookGenerator:
         # Get conversations data
         conversations = self.event_store.get_experiment_conversations(experiment_id)
 
-        # Get metrics for all conversations
-        all_metrics = []
-        for conv in conversations:
-            metrics = self.event_store.get_conversation_turn_metrics(
-                conv["conversation_id"]
-            )
-            all_metrics.extend(metrics)
-
         # Prepare data dictionary
         data = {
             "manifest": manifest,
             "experiment": experiment_data,
             "conversations": conversations,
-            "metrics": all_metrics,
         }
+        if (
+            self.parquet_dir
+            and partition_dir(
+                self.parquet_dir, "conversation_turns", experiment_id
+            ).exists()
+        ):
+            # Turns are queried from the archive when the notebook runs
+            data["parquet_dir"] = str(self.parquet_dir.resolve())
+        else:
+            # Get metrics for all conversations
+            all_metrics = []
+            for conv in conversations:
+                metrics = self.event_store.get_conversation_turn_metrics(
+                    conv["conversation_id"]
+                )
+                all_metrics.extend(metrics)
+            data["metrics"] = all_metrics
 
         cells = []
 
@@ -56,9 +56,11 @@ rc.STYLE_OPTION_HELP = "#d8dee9"  # Nord4 light gray for option descriptions
 import rich_click as click
 
 from ..ui.display_utils import DisplayUtils
+from .attractors import attractors
 from .branch import branch
 from .config import config
 from .constants import BANNER
+from .export import export
 from .models import models
 from .monitor import monitor
 from .run import run
@@ -154,6 +156,8 @@ class CustomGroup(click.Group):
 [bold #5e81ac]monitor[/bold #5e81ac]     System health monitor reading from JSONL files.
 [bold #5e81ac]stop[/bold #5e81ac]        Stop a running experiment gracefully.
 [bold #5e81ac]models[/bold #5e81ac]      List all available AI models.
+[bold #5e81ac]attractors[/bold #5e81ac]  Find attractor states shared across conversations.
+[bold #5e81ac]export[/bold #5e81ac]      Export experiments to a partitioned Parquet archive.
 [bold #5e81ac]config[/bold #5e81ac]      Create configuration file with example settings."""
 
         console.print(
@@ -205,6 +209,8 @@ cli.add_command(monitor)
 cli.add_command(models)
 cli.add_command(config)
 cli.add_command(branch)
+cli.add_command(attractors)
+cli.add_command(export)
 
 
 def main() -> None:
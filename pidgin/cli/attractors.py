@@ -0,0 +1,125 @@
+"""Find near-identical text that conversations converged to."""
+
+import duckdb
+import rich_click as click
+from rich.console import Console
+from rich.table import Table
+
+from ..database.attractor_repository import (
+    MESSAGE_ITEMS,
+    TAIL_ITEMS,
+    AttractorRepository,
+)
+from ..database.connection_registry import connection_registry
+from ..io.paths import get_database_path
+from ..ui.display_utils import DisplayUtils
+
+console = Console()
+display = DisplayUtils(console)
+
+# Characters of member text shown per cluster
+PREVIEW_LENGTH = 120
+
+
+@click.command()
+@click.option(
+    "--messages",
+    is_flag=True,
+    help="Compare individual messages instead of conversation endings",
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(0.0, 1.0),
+    default=0.8,
+    show_default=True,
+    help="Minimum estimated similarity of items in a cluster",
+)
+@click.option(
+    "--experiment",
+    "-e",
+    "experiments",
+    multiple=True,
+    help="Only search these experiment IDs (repeatable)",
+)
+@click.option(
+    "--limit",
+    type=int,
+    default=10,
+    show_default=True,
+    help="Maximum number of clusters to show",
+)
+def attractors(messages, threshold, experiments, limit):
+    """Find attractor states shared across conversations.
+
+    Searches the MinHash index built during import for conversation
+    endings (or, with --messages, single messages) that are near-identical
+    across conversations and experiments.
+
+    [bold]EXAMPLES:[/bold]
+
+    [#4c566a]All imported experiments:[/#4c566a]
+        pidgin attractors
+
+    [#4c566a]Messages in one experiment:[/#4c566a]
+        pidgin attractors --messages -e my_experiment
+    """
+    db_path = get_database_path()
+    if not db_path.exists():
+        display.warning(
+            "No experiment database found",
+            context=f"Expected {db_path}. Experiments are imported when they complete.",
+            use_panel=False,
+        )
+        return
+
+    db = connection_registry.connect(db_path, read_only=True)
+    try:
+        repository = AttractorRepository(db)
+        try:
+            clusters = repository.find_clusters(
+                MESSAGE_ITEMS if messages else TAIL_ITEMS,
+                threshold,
+                experiments,
+            )
+        except duckdb.CatalogException:
+            display.warning(
+                "The database has no attractor index",
+                context="Re-import experiments to build it.",
+                use_panel=False,
+            )
+            return
+
+        if not clusters:
+            display.info("No near-identical text found", use_panel=False)
+            return
+
+        items = "messages" if messages else "conversation endings"
+        console.print()
+        console.print(
+            f"[bold cyan]{len(clusters)} clusters of near-identical {items}[/bold cyan]"
+        )
+        console.print()
+
+        table = Table(box=None, padding=(0, 2))
+        table.add_column("Convs", justify="right", style="cyan")
+        table.add_column("Items", justify="right", style="dim")
+        table.add_column("Similarity", justify="right", style="dim")
+        table.add_column("Example")
+
+        for cluster in clusters[:limit]:
+            text = repository.get_member_text(cluster.members[0]) or ""
+            text = " ".join(text.split())
+            if len(text) > PREVIEW_LENGTH:
+                text = text[: PREVIEW_LENGTH - 1] + "…"
+            table.add_row(
+                str(len(cluster.conversations)),
+                str(len(cluster.members)),
+                f"≥{cluster.similarity:.2f}",
+                text,
+            )
+
+        console.print(table)
+        if len(clusters) > limit:
+            display.dim(f"{len(clusters) - limit} more clusters not shown")
+    finally:
+        connection_registry.release(db)
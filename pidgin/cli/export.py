@@ -0,0 +1,75 @@
+"""Export imported experiments to a Parquet archive."""
+
+from pathlib import Path
+
+import rich_click as click
+from rich.console import Console
+
+from ..database.connection_registry import connection_registry
+from ..database.parquet_exporter import ParquetExporter
+from ..io.paths import get_database_path, get_parquet_dir
+from ..ui.display_utils import DisplayUtils
+
+console = Console()
+display = DisplayUtils(console)
+
+
+@click.command()
+@click.option(
+    "--experiment",
+    "-e",
+    "experiments",
+    multiple=True,
+    help="Only export these experiment IDs (repeatable)",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Archive directory [default: pidgin/parquet]",
+)
+def export(experiments, output):
+    """Export experiments to a partitioned Parquet archive.
+
+    Writes conversation turns, messages, thinking traces and token usage
+    as zstd-compressed Parquet files partitioned by experiment and model
+    pair. Exporting an experiment again replaces its files. The archive
+    can be shared and queried without the experiment database.
+
+    [bold]EXAMPLES:[/bold]
+
+    [#4c566a]All imported experiments:[/#4c566a]
+        pidgin export
+
+    [#4c566a]Query the archive with DuckDB:[/#4c566a]
+        SELECT * FROM read_parquet('pidgin/parquet/conversation_turns/*/*/*.parquet',
+            hive_partitioning = true) WHERE experiment_id = 'my_experiment'
+    """
+    db_path = get_database_path()
+    if not db_path.exists():
+        display.warning(
+            "No experiment database found",
+            context=f"Expected {db_path}. Experiments are imported when they complete.",
+            use_panel=False,
+        )
+        return
+
+    output_dir = output or get_parquet_dir()
+    db = connection_registry.connect(db_path, read_only=True)
+    try:
+        exported = ParquetExporter(db).export_experiments(
+            output_dir, experiments or None
+        )
+    finally:
+        connection_registry.release(db)
+
+    if not exported:
+        display.info("No imported experiments to export", use_panel=False)
+        return
+
+    turns = sum(counts["conversation_turns"] for counts in exported.values())
+    display.success(
+        f"Exported {len(exported)} experiments ({turns} turns) to {output_dir}",
+        use_panel=False,
+    )
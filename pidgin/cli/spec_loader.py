@@ -125,6 +125,7 @@ class SpecLoader:
         display_mode = spec.get("display_mode", "chat")
         prompt_tag = spec.get("prompt_tag", "[HUMAN]")
         allow_truncation = spec.get("allow_truncation", False)
+        synthetic = spec.get("synthetic")
 
         return ExperimentConfig(
             name=name,
@@ -145,6 +146,7 @@ class SpecLoader:
             display_mode=display_mode,
             prompt_tag=prompt_tag,
             allow_truncation=allow_truncation,
+            synthetic=synthetic,
         )
 
     def show_spec_info(self, spec_file: Path, config: ExperimentConfig) -> None:
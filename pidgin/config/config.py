@@ -33,10 +33,19 @@ class Config:
             "convergence_threshold": DEFAULT_CONVERGENCE_THRESHOLD,
             "convergence_action": DEFAULT_CONVERGENCE_ACTION,
             "convergence_profile": DEFAULT_CONVERGENCE_PROFILE,  # Now defaults
+            "compression_threshold": None,  # Disabled by default
         },
         "ollama": {
             "auto_start": False,  # Require explicit consent or config
         },
+        "database": {
+            "import_workers": 1,  # Calculate import metrics in this process
+            "metrics_engine": "turn",
+            "event_reader": "duckdb",  # Legacy event files are read in Python
+            "live_import": False,  # Import after experiments complete
+            "live_import_interval": 30.0,
+            "parquet_export": False,  # Also write experiments to pidgin/parquet
+        },
         "convergence": {
             "profile": DEFAULT_CONVERGENCE_PROFILE,
             # Custom weights (used when profile is "custom")
@@ -86,6 +95,18 @@ class Config:
                     # },
                 },
             },
+            "hedging": {
+                "enabled": False,  # Opt-in: fire a backup request when slow
+                "percentile": 95.0,  # Hedge past this latency percentile
+                "min_samples": 20,  # Latency samples needed per model
+                "max_history": 200,  # Latency samples kept per model
+                "min_delay_seconds": 1.0,  # Never hedge earlier than this
+            },
+            "cassette": {
+                "mode": "off",  # "record" real responses or "replay" them offline
+                "directory": None,  # Defaults to <output>/cassettes
+                "speed": 1.0,  # Replay speed multiplier, 0 for no delays
+            },
             "overrides": {
                 # Per-provider overrides - uncomment to customize
                 # "anthropic": {
@@ -172,6 +193,7 @@ conversation:
   convergence_threshold: 0.85    # Stop when convergence exceeds this (0.0-1.0)
   convergence_action: stop       # What to do: stop, warn, or continue
   convergence_profile: balanced  # Profile: balanced, structural, semantic, etc.
+  # compression_threshold: 0.1   # Also stop when a turn is this repetitive (0.0-1.0)
 
 convergence:
   # Choose a built-in profile or use custom weights
@@ -198,6 +220,14 @@ defaults:
 ollama:
   auto_start: false  # Set to true to auto-start server without prompting
 
+database:
+  import_workers: 1  # Processes for import metrics (0 = one per CPU core)
+  metrics_engine: turn  # or batch
+  event_reader: duckdb  # or python
+  live_import: false  # Set to true to import turns while experiments run
+  live_import_interval: 30  # Seconds between imports of running experiments
+  parquet_export: false  # Set to true to also export experiments to Parquet
+
 experiments:
   unattended:
     convergence_threshold: 0.75
@@ -258,6 +258,23 @@ class ModelLoader:
                     "limits": {"max_context_tokens": 100000},
                     "metadata": {"stable": True, "notes": "Test model for development"},
                 },
+                "local:synthetic": {
+                    "provider": "local",
+                    "display_name": "Synthetic Load",
+                    "aliases": ["synthetic"],
+                    "api": {"model_id": "local:synthetic"},
+                    "capabilities": {
+                        "streaming": True,
+                        "vision": False,
+                        "tool_calling": False,
+                        "system_messages": True,
+                    },
+                    "limits": {"max_context_tokens": 100000},
+                    "metadata": {
+                        "stable": True,
+                        "notes": "Synthetic load generator for benchmarks",
+                    },
+                },
                 "silent:none": {
                     "provider": "silent",
                     "display_name": "Silent",
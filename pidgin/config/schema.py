@@ -55,6 +55,15 @@ class ConversationConfig(BaseModel):
         default=DEFAULT_CONVERGENCE_PROFILE,
         description="Convergence profile name or 'custom'",
     )
+    compression_threshold: Optional[float] = Field(
+        default=None,
+        gt=0.0,
+        le=1.0,
+        description=(
+            "Apply the convergence action when a turn compresses below this "
+            "ratio given the conversation so far (disabled if None)"
+        ),
+    )
 
     @field_validator("convergence_profile")
     @classmethod
@@ -181,6 +190,43 @@ class RateLimitingConfig(BaseModel):
     custom_limits: Dict[str, ProviderRateLimit] = Field(default_factory=dict)
 
 
+class HedgingConfig(BaseModel):
+    """Schema for hedged request configuration."""
+
+    enabled: bool = Field(
+        default=False, description="Fire a backup request when a response is slow"
+    )
+    percentile: float = Field(
+        default=95.0,
+        gt=0,
+        le=100,
+        description="Latency percentile after which to hedge",
+    )
+    min_samples: int = Field(
+        default=20, ge=1, description="Latency samples required before hedging"
+    )
+    max_history: int = Field(
+        default=200, ge=1, description="Latency samples kept per model"
+    )
+    min_delay_seconds: float = Field(
+        default=1.0, ge=0, description="Never hedge earlier than this"
+    )
+
+
+class CassetteConfig(BaseModel):
+    """Schema for provider record/replay configuration."""
+
+    mode: Literal["off", "record", "replay"] = Field(
+        default="off", description="Record provider responses or replay them"
+    )
+    directory: Optional[str] = Field(
+        default=None, description="Cassette directory (default: output/cassettes)"
+    )
+    speed: float = Field(
+        default=1.0, ge=0, description="Replay speed multiplier (0 for no delays)"
+    )
+
+
 class ProviderContextConfig(BaseModel):
     """Schema for provider context management."""
 
@@ -215,9 +261,39 @@ class ProvidersConfig(BaseModel):
         default_factory=ProviderContextConfig
     )
     rate_limiting: RateLimitingConfig = Field(default_factory=RateLimitingConfig)
+    hedging: HedgingConfig = Field(default_factory=HedgingConfig)
+    cassette: CassetteConfig = Field(default_factory=CassetteConfig)
     overrides: Dict[str, ProviderOverride] = Field(default_factory=dict)
 
 
+class DatabaseConfig(BaseModel):
+    """Schema for database import configuration."""
+
+    import_workers: int = Field(
+        default=1,
+        ge=0,
+        description="Processes to calculate metrics in on import (0 = one per core)",
+    )
+    metrics_engine: Literal["turn", "batch"] = Field(
+        default="turn", description="Calculate metrics turn by turn or in batches"
+    )
+    event_reader: Literal["duckdb", "python"] = Field(
+        default="duckdb",
+        description="Read event files with DuckDB's JSON reader or in Python",
+    )
+    live_import: bool = Field(
+        default=False,
+        description="Import turns into the database while experiments run",
+    )
+    live_import_interval: float = Field(
+        default=30.0, gt=0, description="Seconds between imports of running experiments"
+    )
+    parquet_export: bool = Field(
+        default=False,
+        description="Export experiments to the Parquet archive after import",
+    )
+
+
 class PidginConfig(BaseModel):
     """Root schema for Pidgin configuration."""
 
@@ -230,5 +306,6 @@ class PidginConfig(BaseModel):
     experiments: ExperimentsConfig = Field(default_factory=ExperimentsConfig)
     providers: ProvidersConfig = Field(default_factory=ProvidersConfig)
     ollama: OllamaConfig = Field(default_factory=OllamaConfig)
+    database: DatabaseConfig = Field(default_factory=DatabaseConfig)
 
     model_config = {"extra": "allow"}  # Allow extra fields for backward compatibility
@@ -6,6 +6,7 @@ from typing import Optional
 from ..config.config import Config
 from ..config.model_loader import load_models
 from ..config.model_types import ModelConfig
+from ..providers.hedging import HedgingPolicy
 from ..providers.token_tracker import GlobalTokenTracker
 
 
@@ -28,6 +29,9 @@ class AppContext:
         # Initialize token tracker with config
         self.token_tracker = GlobalTokenTracker(self.config)
 
+        # Hedging policy is shared so latency history spans conversations
+        self.hedging_policy = HedgingPolicy.from_config(self.config)
+
         # Load model registry from JSON (single source of truth)
         self.models = load_models()
 
@@ -15,6 +15,7 @@ from ..config.config import Config
 from ..config.system_prompts import get_system_prompts
 from ..io.logger import get_logger
 from ..io.output_manager import OutputManager
+from ..providers.hedging import HedgingPolicy
 from ..providers.token_tracker import GlobalTokenTracker
 from ..ui.display_utils import DisplayUtils
 from .conversation_lifecycle import ConversationLifecycle
@@ -45,6 +46,7 @@ class Conductor:
         transcript_manager=None,
         convergence_threshold_override: Optional[float] = None,
         convergence_action_override: Optional[str] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
     ):
         """Initialize the Conductor.
 
@@ -59,6 +61,7 @@ class Conductor:
             transcript_manager: Optional transcript manager
             convergence_threshold_override: Override convergence threshold
             convergence_action_override: Override convergence action
+            hedging_policy: Optional policy for hedging slow provider requests
         """
         # Core components
         self.output_manager = output_manager
@@ -78,7 +81,9 @@ class Conductor:
         self.convergence_calculator = ConvergenceCalculator(weights=convergence_weights)
 
         # Lifecycle manager needs to be set up
-        self.lifecycle = ConversationLifecycle(console, token_tracker)
+        self.lifecycle = ConversationLifecycle(
+            console, token_tracker, self.rate_limiter, hedging_policy
+        )
 
         # Message handler needs references
         self.message_handler = MessageHandler(
@@ -13,12 +13,18 @@ class ConversationLifecycle:
     """Manages conversation lifecycle using focused components."""
 
     def __init__(
-        self, console=None, token_tracker: Optional[GlobalTokenTracker] = None
+        self,
+        console=None,
+        token_tracker: Optional[GlobalTokenTracker] = None,
+        rate_limiter=None,
+        hedging_policy=None,
     ):
         self.console = console
         self.token_tracker = token_tracker
 
-        self.setup = ConversationSetup(console, token_tracker)
+        self.setup = ConversationSetup(
+            console, token_tracker, rate_limiter, hedging_policy
+        )
         self.state: Optional[ConversationState] = None
 
         self.bus = None
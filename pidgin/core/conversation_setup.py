@@ -13,15 +13,21 @@ from .types import Agent
 class ConversationSetup:
     """Handles conversation initialization and event system setup."""
 
-    def __init__(self, console=None, token_tracker=None):
+    def __init__(
+        self, console=None, token_tracker=None, rate_limiter=None, hedging_policy=None
+    ):
         """Initialize setup handler.
 
         Args:
             console: Optional console for output
             token_tracker: Optional token tracker for rate limiting
+            rate_limiter: Optional rate limiter shared with hedge requests
+            hedging_policy: Optional policy for hedging slow requests
         """
         self.console = console
         self.token_tracker = token_tracker
+        self.rate_limiter = rate_limiter
+        self.hedging_policy = hedging_policy
         self.base_providers = {}
 
     def set_providers(self, base_providers):
@@ -79,6 +85,8 @@ class ConversationSetup:
                 agent_id=agent_id,
                 bus=bus,
                 token_tracker=self.token_tracker,
+                rate_limiter=self.rate_limiter,
+                hedging_policy=self.hedging_policy,
             )
 
         return (
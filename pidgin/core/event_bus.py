@@ -10,6 +10,7 @@ from typing import Any, Callable, Dict, List, Type, TypeVar
 from ..io.logger import get_logger
 from .constants import SystemDefaults
 from .events import Event
+from .message_stream import StreamChannel
 
 logger = get_logger("event_bus")
 
@@ -43,6 +44,7 @@ class EventBus:
         self._jsonl_lock = threading.RLock()  # Protect JSONL file access (reentrant)
         self._history_lock = threading.RLock()  # Protect event history (reentrant)
         self._subscriber_lock = threading.RLock()  # Protect subscriber list (reentrant)
+        self.streams = StreamChannel()  # Live text of in-flight messages
 
     def _serialize_value(self, value: Any) -> Any:
         """Convert a value to a JSON-serializable format."""
@@ -217,8 +219,9 @@ class EventBus:
         if self.event_log_dir:
             self._write_to_jsonl(event, event_data)
 
-        # Note: Database writes are disabled during active experiments to avoid
-        # concurrency issues. Database is populated via batch loading after completion.
+        # Note: Events are not written to the database here, so experiments
+        # never contend for it. The database is populated from the JSONL files
+        # after completion, or while running by LiveImporter.
 
         # Get handlers for this event type and parent types
         handlers = []
@@ -297,6 +300,7 @@ class EventBus:
     async def stop(self):
         """Stop event bus and close resources."""
         self._running = False
+        self.streams.close()
 
         # Close all JSONL files
         with self._jsonl_lock:
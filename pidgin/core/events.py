@@ -56,6 +56,7 @@ class MessageRequestEvent(Event):
     allow_truncation: bool = False
     thinking_enabled: Optional[bool] = None
     thinking_budget: Optional[int] = None
+    rate_limit_wait_ms: Optional[int] = None
 
 
 @dataclass
@@ -90,6 +91,14 @@ class MessageCompleteEvent(Event):
     completion_tokens: int
     total_tokens: int
     duration_ms: int
+    # Latency breakdown (None when not measured, e.g. legacy logs)
+    rate_limit_wait_ms: Optional[int] = None
+    request_send_ms: Optional[int] = None
+    time_to_first_token_ms: Optional[int] = None
+    tokens_per_second: Optional[float] = None
+    chunk_gap_p50_ms: Optional[float] = None
+    chunk_gap_p95_ms: Optional[float] = None
+    chunk_gap_max_ms: Optional[float] = None
 
 
 @dataclass
@@ -60,7 +60,9 @@ class MessageHandler:
             The agent's message or None if skipped
         """
         # Handle rate limiting
-        await self._handle_rate_limiting(conversation_id, agent, conversation_history)
+        wait_time = await self._handle_rate_limiting(
+            conversation_id, agent, conversation_history
+        )
 
         # Request and wait for message
         message = await self._request_and_wait_for_message(
@@ -70,14 +72,19 @@ class MessageHandler:
             conversation_history,
             interrupt_handler,
             timeout,
+            rate_limit_wait_ms=int(wait_time * 1000),
         )
 
         return message
 
     async def _handle_rate_limiting(
         self, conversation_id: str, agent: Agent, conversation_history: List[Message]
-    ) -> None:
-        """Handle rate limiting before making a request."""
+    ) -> float:
+        """Handle rate limiting before making a request.
+
+        Returns:
+            Seconds spent waiting for the rate limiter
+        """
         # Estimate payload size for rate limiting
         payload_tokens = self._estimate_payload_tokens(
             conversation_history, agent.model
@@ -94,6 +101,8 @@ class MessageHandler:
         if wait_time > RateLimits.RATE_LIMIT_WAIT_THRESHOLD:
             await self._emit_rate_limit_event(conversation_id, provider, wait_time)
 
+        return wait_time
+
     async def _emit_rate_limit_event(
         self, conversation_id: str, provider: str, wait_time: float
     ) -> None:
@@ -119,6 +128,7 @@ class MessageHandler:
         conversation_history: List[Message],
         interrupt_handler,
         timeout: float,
+        rate_limit_wait_ms: Optional[int] = None,
     ) -> Optional[Message]:
         """Request message and wait for response with interrupt handling."""
         request_start = time.time()
@@ -129,7 +139,11 @@ class MessageHandler:
 
         # Request message
         await self._emit_message_request(
-            conversation_id, agent, turn_number, conversation_history
+            conversation_id,
+            agent,
+            turn_number,
+            conversation_history,
+            rate_limit_wait_ms,
         )
 
         # Wait for response with interrupt handling
@@ -166,6 +180,7 @@ class MessageHandler:
         agent: Agent,
         turn_number: int,
         conversation_history: List[Message],
+        rate_limit_wait_ms: Optional[int] = None,
     ) -> None:
         """Emit message request event."""
         await self.bus.emit(
@@ -177,6 +192,7 @@ class MessageHandler:
                 temperature=agent.temperature,
                 thinking_enabled=agent.thinking_enabled,
                 thinking_budget=agent.thinking_budget,
+                rate_limit_wait_ms=rate_limit_wait_ms,
             )
         )
 
@@ -0,0 +1,144 @@
+"""Live channel for text of messages that are still being generated."""
+
+import asyncio
+from typing import AsyncIterator, Callable, List, Tuple
+
+from ..io.logger import get_logger
+
+logger = get_logger("message_stream")
+
+
+class MessageStream:
+    """Append-only buffer for a single streamed response.
+
+    Each chunk is stored once, in arrival order. The provider wrapper builds
+    the final message from this buffer, and readers follow along with their
+    own cursor, so chunks are neither copied per reader nor serialized as
+    events.
+    """
+
+    def __init__(self, conversation_id: str, agent_id: str, turn_number: int):
+        """Initialize stream.
+
+        Args:
+            conversation_id: Conversation the response belongs to
+            agent_id: Agent generating the response
+            turn_number: Turn the response belongs to
+        """
+        self.conversation_id = conversation_id
+        self.agent_id = agent_id
+        self.turn_number = turn_number
+        self.chunks: List[Tuple[str, str]] = []
+        self.closed = False
+        self._waiters: List[asyncio.Future] = []
+
+    def append(self, chunk_type: str, content: str) -> None:
+        """Add a chunk and wake any waiting readers.
+
+        Args:
+            chunk_type: "thinking" or "response"
+            content: Chunk text
+        """
+        self.chunks.append((chunk_type, content))
+        self._wake()
+
+    def close(self) -> None:
+        """Mark the stream finished so readers stop iterating."""
+        self.closed = True
+        self._wake()
+
+    def text(self, chunk_type: str = "response") -> str:
+        """Join all chunks of one type.
+
+        Args:
+            chunk_type: "thinking" or "response"
+
+        Returns:
+            The accumulated text
+        """
+        return "".join(content for kind, content in self.chunks if kind == chunk_type)
+
+    async def follow(self) -> AsyncIterator[Tuple[str, str]]:
+        """Iterate over chunks as they arrive, starting from the first.
+
+        Yields:
+            (chunk_type, content) tuples until the stream is closed
+        """
+        cursor = 0
+        while True:
+            while cursor < len(self.chunks):
+                yield self.chunks[cursor]
+                cursor += 1
+            if self.closed:
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            await waiter
+
+    def _wake(self) -> None:
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+
+class StreamChannel:
+    """Announces new message streams to interested displays and writers.
+
+    Subscribers are called synchronously with each new MessageStream and
+    decide for themselves whether to follow it. Closing the channel closes
+    the streams still open, so their readers finish, and drops subscribers.
+    """
+
+    def __init__(self):
+        """Initialize channel."""
+        self._subscribers: List[Callable[[MessageStream], None]] = []
+        self._open: List[MessageStream] = []
+
+    def subscribe(self, callback: Callable[[MessageStream], None]) -> None:
+        """Register a callback for new streams.
+
+        Args:
+            callback: Called with each MessageStream when it opens
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[MessageStream], None]) -> None:
+        """Remove a previously registered callback.
+
+        Args:
+            callback: Callback to remove
+        """
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def open(
+        self, conversation_id: str, agent_id: str, turn_number: int
+    ) -> MessageStream:
+        """Create a stream for a response and announce it.
+
+        Args:
+            conversation_id: Conversation the response belongs to
+            agent_id: Agent generating the response
+            turn_number: Turn the response belongs to
+
+        Returns:
+            The new MessageStream
+        """
+        stream = MessageStream(conversation_id, agent_id, turn_number)
+        self._open = [s for s in self._open if not s.closed]
+        self._open.append(stream)
+        for callback in list(self._subscribers):
+            try:
+                callback(stream)
+            except Exception as e:
+                logger.error(f"Stream subscriber {callback} failed: {e}")
+        return stream
+
+    def close(self) -> None:
+        """Close streams still open and remove all subscribers."""
+        for stream in self._open:
+            if not stream.closed:
+                stream.close()
+        self._open = []
+        self._subscribers = []
@@ -2,6 +2,7 @@
 
 from typing import Optional
 
+from ..io.logger import get_logger
 from .constants import EndReason
 from .events import (
     SystemPromptEvent,
@@ -11,6 +12,8 @@ from .events import (
 )
 from .types import Agent, Conversation, Message
 
+logger = get_logger("turn_executor")
+
 
 class TurnExecutor:
     """Executes conversation turns and handles turn-level events."""
@@ -167,8 +170,32 @@ class TurnExecutor:
             else conv_config.get("convergence_action", "stop")
         )
 
-        if convergence_score >= threshold:
+        # Optionally also act when the turn mostly repeats earlier text
+        compression_threshold = conv_config.get("compression_threshold")
+        marginal_ratio = None
+        if compression_threshold is not None:
+            marginal_ratio = (
+                self.convergence_calculator.get_marginal_compression_ratio()
+            )
+        # A turn that added no text says nothing about repetition
+        repetitive = (
+            marginal_ratio is not None and marginal_ratio <= compression_threshold
+        )
+        converged = convergence_score >= threshold
+
+        if converged or repetitive:
             if action == "stop":
+                if converged:
+                    logger.info(
+                        f"Turn {turn_number}: convergence {convergence_score:.2f} "
+                        f"reached threshold {threshold}"
+                    )
+                else:
+                    logger.info(
+                        f"Turn {turn_number}: marginal compression ratio "
+                        f"{marginal_ratio:.3f} reached threshold "
+                        f"{compression_threshold}"
+                    )
                 # Signal to stop due to high convergence
                 # Store the reason so conductor can emit the appropriate end event
                 self.stop_reason = EndReason.HIGH_CONVERGENCE
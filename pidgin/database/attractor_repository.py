@@ -0,0 +1,354 @@
+"""Repository for the MinHash index of near-identical text across conversations."""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import duckdb
+
+from ..io.logger import get_logger
+from ..metrics.minhash import MinHasher, band_buckets, estimate_similarity
+from .base_repository import BaseRepository
+
+logger = get_logger("attractor_repository")
+
+# Item types in the index
+MESSAGE_ITEMS = "message"
+TAIL_ITEMS = "tail"
+
+# Fields identifying each cluster member
+MEMBER_FIELDS = ("experiment_id", "conversation_id", "turn_number", "agent_id")
+
+
+@dataclass
+class AttractorCluster:
+    """Messages or conversation tails that converged to near-identical text."""
+
+    # experiment_id, conversation_id, turn_number and agent_id of each item
+    members: List[Dict[str, Any]] = field(default_factory=list)
+    # Lowest estimated similarity of a member to the first member
+    similarity: float = 1.0
+
+    @property
+    def conversations(self) -> List[Tuple[str, str]]:
+        """Distinct (experiment_id, conversation_id) pairs in the cluster."""
+        return list(
+            dict.fromkeys(
+                (member["experiment_id"], member["conversation_id"])
+                for member in self.members
+            )
+        )
+
+
+class _DisjointSet:
+    """Union-find over item IDs."""
+
+    def __init__(self) -> None:
+        self.parent: Dict[int, int] = {}
+
+    def find(self, item: int) -> int:
+        parent = self.parent.setdefault(item, item)
+        if parent != item:
+            parent = self.parent[item] = self.find(parent)
+        return parent
+
+    def union(self, item_a: int, item_b: int) -> None:
+        root_a, root_b = self.find(item_a), self.find(item_b)
+        if root_a != root_b:
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+class AttractorRepository(BaseRepository):
+    """Stores MinHash signatures with an LSH banding index and queries it.
+
+    Each imported message is indexed, as is each conversation's tail: the
+    union of both agents' last TAIL_TURNS messages. Signatures are split
+    into BANDS bands; items sharing a band bucket are candidates, which are
+    then checked against the similarity threshold using their signatures.
+    The index grows with each import, so queries cover all experiments.
+    """
+
+    BANDS = 8
+    TAIL_TURNS = 3
+
+    def __init__(
+        self,
+        db: duckdb.DuckDBPyConnection,
+        hasher: Optional[MinHasher] = None,
+        enable_profiling: bool = False,
+    ):
+        """Initialize repository.
+
+        Args:
+            db: Active DuckDB connection
+            hasher: Hasher the signatures were made with, used to merge them
+            enable_profiling: Whether to enable query profiling
+        """
+        super().__init__(db, enable_profiling)
+        self.hasher = hasher or MinHasher()
+
+    def index_conversation(
+        self,
+        experiment_id: str,
+        conversation_id: str,
+        turn_signatures: Sequence[Tuple[int, List[int], List[int]]],
+        resumed: bool = False,
+    ) -> None:
+        """Add a conversation's message and tail signatures to the index.
+
+        Args:
+            experiment_id: Experiment ID
+            conversation_id: Conversation ID
+            turn_signatures: (turn_number, agent_a_signature, agent_b_signature)
+                tuples in turn order; empty signatures are not indexed
+            resumed: Whether earlier turns of the conversation were indexed
+                before; their signatures then complete the tail, which
+                replaces the old tail along with any re-imported turns
+        """
+        tail = list(turn_signatures[-self.TAIL_TURNS :])
+        if resumed and turn_signatures:
+            earlier = self._remove_turns_from(
+                experiment_id, conversation_id, turn_signatures[0][0]
+            )
+            tail = (earlier + tail)[-self.TAIL_TURNS :]
+
+        items: List[Tuple[str, int, str, List[int]]] = []
+        for turn_number, signature_a, signature_b in turn_signatures:
+            if signature_a:
+                items.append((MESSAGE_ITEMS, turn_number, "agent_a", signature_a))
+            if signature_b:
+                items.append((MESSAGE_ITEMS, turn_number, "agent_b", signature_b))
+
+        tail_signature = self.hasher.merge(
+            signature
+            for _, signature_a, signature_b in tail
+            for signature in (signature_a, signature_b)
+        )
+        if tail_signature:
+            items.append((TAIL_ITEMS, tail[-1][0], "both", tail_signature))
+
+        if not items:
+            return
+
+        item_ids = [
+            row[0]
+            for row in self.fetchall(
+                "SELECT nextval('minhash_item_id_seq') FROM range(?)", [len(items)]
+            )
+        ]
+
+        # Rows are written as literals: binding list parameters costs far
+        # more per value than parsing them. Only the IDs are caller text.
+        signature_rows = ", ".join(
+            f"({item_id}, '{item_type}', {turn_number}, '{agent_id}', "
+            f"[{', '.join(map(str, signature))}])"
+            for item_id, (item_type, turn_number, agent_id, signature) in zip(
+                item_ids, items, strict=True
+            )
+        )
+        self.execute(
+            f"""
+            INSERT INTO minhash_signatures
+            SELECT col0, col1, ?, ?, col2, col3, col4
+            FROM (VALUES {signature_rows})
+            """,
+            [experiment_id, conversation_id],
+        )
+
+        band_rows = ", ".join(
+            f"('{item_type}', {band}, {bucket}, {item_id})"
+            for item_id, (item_type, _, _, signature) in zip(
+                item_ids, items, strict=True
+            )
+            for band, bucket in enumerate(band_buckets(signature, self.BANDS))
+        )
+        self.execute(f"INSERT INTO minhash_bands VALUES {band_rows}")
+
+    def _remove_turns_from(
+        self, experiment_id: str, conversation_id: str, first_turn: int
+    ) -> List[Tuple[int, List[int], List[int]]]:
+        """Remove a conversation's tail and its messages from a turn on.
+
+        Args:
+            experiment_id: Experiment ID
+            conversation_id: Conversation ID
+            first_turn: First turn number whose messages to remove
+
+        Returns:
+            (turn_number, agent_a_signature, agent_b_signature) of the
+            TAIL_TURNS turns before first_turn, in turn order
+        """
+        removed = """
+            SELECT item_id FROM minhash_signatures
+            WHERE experiment_id = ? AND conversation_id = ?
+                AND (item_type = 'tail' OR turn_number >= ?)
+        """
+        params = [experiment_id, conversation_id, first_turn]
+        self.execute(f"DELETE FROM minhash_bands WHERE item_id IN ({removed})", params)
+        self.execute(
+            f"DELETE FROM minhash_signatures WHERE item_id IN ({removed})", params
+        )
+
+        rows = self.fetchall(
+            """
+            SELECT turn_number, agent_id, signature FROM minhash_signatures
+            WHERE experiment_id = ? AND conversation_id = ?
+                AND item_type = ? AND turn_number >= ? AND turn_number < ?
+            """,
+            [
+                experiment_id,
+                conversation_id,
+                MESSAGE_ITEMS,
+                first_turn - self.TAIL_TURNS,
+                first_turn,
+            ],
+        )
+        signatures: Dict[int, Dict[str, List[int]]] = {}
+        for turn_number, agent_id, signature in rows:
+            signatures.setdefault(turn_number, {})[agent_id] = signature
+        return [
+            (turn_number, turn.get("agent_a", []), turn.get("agent_b", []))
+            for turn_number, turn in sorted(signatures.items())
+        ]
+
+    def find_clusters(
+        self,
+        item_type: str = TAIL_ITEMS,
+        threshold: float = 0.8,
+        experiment_ids: Optional[Iterable[str]] = None,
+        min_size: int = 2,
+    ) -> List[AttractorCluster]:
+        """Find groups of near-identical messages or conversation tails.
+
+        Args:
+            item_type: "tail" to compare conversation endings, or "message"
+            threshold: Minimum estimated Jaccard similarity of word 3-grams
+            experiment_ids: Optional experiments to restrict the search to
+            min_size: Minimum number of items in a cluster
+
+        Returns:
+            Clusters, those spanning the most conversations first
+        """
+        experiment_ids = list(experiment_ids or [])
+        experiment_filter = ""
+        params: List[Any] = [item_type]
+        if experiment_ids:
+            placeholders = ", ".join("?" for _ in experiment_ids)
+            experiment_filter = f"""
+                AND b.item_id IN (
+                    SELECT item_id FROM minhash_signatures
+                    WHERE experiment_id IN ({placeholders})
+                )
+            """
+            params.extend(experiment_ids)
+
+        # Candidate groups: items sharing a bucket in some band
+        groups_query = f"""
+            SELECT list(b.item_id ORDER BY b.item_id) AS item_ids
+            FROM minhash_bands b
+            WHERE b.item_type = ? {experiment_filter}
+            GROUP BY b.band, b.bucket
+            HAVING count(*) > 1
+        """
+        groups = [row[0] for row in self.fetchall(groups_query, params)]
+        if not groups:
+            return []
+
+        items = {
+            row[0]: row[1:]
+            for row in self.fetchall(
+                f"""
+                SELECT item_id, experiment_id, conversation_id, turn_number,
+                       agent_id, signature
+                FROM minhash_signatures
+                WHERE item_id IN (
+                    SELECT UNNEST(item_ids) FROM ({groups_query})
+                )
+                """,
+                params,
+            )
+        }
+        candidates = sorted(items)
+
+        # Join candidates that pass the threshold against a representative
+        clusters = _DisjointSet()
+        for group in groups:
+            representatives: List[int] = []
+            for item_id in group:
+                signature = items[item_id][4]
+                root = clusters.find(item_id)
+                for representative in representatives:
+                    if clusters.find(representative) == root or (
+                        estimate_similarity(signature, items[representative][4])
+                        >= threshold
+                    ):
+                        clusters.union(item_id, representative)
+                        break
+                else:
+                    representatives.append(item_id)
+
+        members: Dict[int, List[int]] = {}
+        for item_id in candidates:
+            if item_id in clusters.parent:
+                members.setdefault(clusters.find(item_id), []).append(item_id)
+
+        results = []
+        for root, member_ids in members.items():
+            if len(member_ids) < min_size:
+                continue
+            root_signature = items[root][4]
+            results.append(
+                AttractorCluster(
+                    members=[
+                        dict(zip(MEMBER_FIELDS, items[item_id][:4], strict=True))
+                        for item_id in member_ids
+                    ],
+                    similarity=min(
+                        estimate_similarity(items[item_id][4], root_signature)
+                        for item_id in member_ids
+                    ),
+                )
+            )
+
+        results.sort(key=lambda c: (len(c.conversations), len(c.members)), reverse=True)
+        return results
+
+    def get_member_text(self, member: Dict[str, Any]) -> Optional[str]:
+        """Get the message text of a cluster member.
+
+        For tails, this is agent A's message in the last turn covered.
+
+        Args:
+            member: Member dictionary from an AttractorCluster
+
+        Returns:
+            Message text, or None if the turn is not in conversation_turns
+        """
+        column = (
+            "agent_b_message" if member["agent_id"] == "agent_b" else "agent_a_message"
+        )
+        row = self.fetchone(
+            f"""
+            SELECT {column} FROM conversation_turns
+            WHERE experiment_id = ? AND conversation_id = ? AND turn_number = ?
+            """,
+            [member["experiment_id"], member["conversation_id"], member["turn_number"]],
+        )
+        return row[0] if row else None
+
+    def delete_experiment(self, experiment_id: str) -> None:
+        """Remove an experiment's signatures from the index.
+
+        Args:
+            experiment_id: Experiment ID
+        """
+        self.execute(
+            """
+            DELETE FROM minhash_bands WHERE item_id IN (
+                SELECT item_id FROM minhash_signatures WHERE experiment_id = ?
+            )
+            """,
+            [experiment_id],
+        )
+        self.execute(
+            "DELETE FROM minhash_signatures WHERE experiment_id = ?", [experiment_id]
+        )
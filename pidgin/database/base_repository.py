@@ -30,9 +30,12 @@ class BaseRepository:
         "conversations",
         "conversation_turns",
         "experiments",
+        "message_bodies",
+        "message_records",
         "metrics",
         "thinking_traces",
         "token_usage",
+        "turn_records",
     }
 
     def __init__(self, db: duckdb.DuckDBPyConnection, enable_profiling: bool = False):
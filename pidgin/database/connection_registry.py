@@ -0,0 +1,150 @@
+"""Process-wide DuckDB connections, one per database file."""
+
+import atexit
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple, TypeVar, Union
+
+import duckdb
+
+from ..core.exceptions import DatabaseLockError
+from ..io.logger import get_logger
+from .schema_manager import SchemaManager
+
+logger = get_logger("connection_registry")
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Database:
+    """An open database file and the cursors handed out for it."""
+
+    connection: duckdb.DuckDBPyConnection
+    read_only: bool
+    cursors: int = 0
+    # State shared by all cursors of the file, by name
+    shared: Dict[str, Any] = field(default_factory=dict)
+
+
+class ConnectionRegistry:
+    """Hands out cursors of one shared connection per database file.
+
+    The first request for a file opens it, ensuring the schema unless it
+    is opened read-only; later requests get cursors of the same connection,
+    which share its database instance and caches but each have their own
+    transaction. The file is closed when the last cursor is released, so
+    other processes can open it again, and at interpreter exit.
+
+    Read-only requests are served by a read-write connection when the
+    process already has one. A read-write request for a file the process
+    has open read-only fails, as DuckDB cannot open a file in both modes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._databases: Dict[str, _Database] = {}
+        # Database file of each cursor handed out, by cursor identity; the
+        # cursor is kept so its identity is not reused before it is released
+        self._owners: Dict[int, Tuple[str, duckdb.DuckDBPyConnection]] = {}
+        self._schema_manager = SchemaManager()
+
+    def connect(
+        self, db_path: Union[str, Path], read_only: bool = False
+    ) -> duckdb.DuckDBPyConnection:
+        """Get a cursor for a database file, opening it if needed.
+
+        Args:
+            db_path: Path to DuckDB database file
+            read_only: Whether only reads are needed; the file is opened
+                read-only if the process does not have it open yet
+
+        Returns:
+            Cursor to pass to release() when done
+
+        Raises:
+            DatabaseLockError: If read-write access is requested for a file
+                this process has open read-only
+        """
+        key = os.path.abspath(db_path)
+        with self._lock:
+            database = self._databases.get(key)
+            if database is None:
+                connection = duckdb.connect(key, read_only=read_only)
+                if not read_only:
+                    self._schema_manager.ensure_schema(connection, key)
+                database = _Database(connection, read_only)
+                self._databases[key] = database
+                logger.debug(f"Opened {key}{' read-only' if read_only else ''}")
+            elif database.read_only and not read_only:
+                raise DatabaseLockError(
+                    f"{key} is open read-only in this process; "
+                    "close its read-only connections before writing"
+                )
+
+            cursor = database.connection.cursor()
+            database.cursors += 1
+            self._owners[id(cursor)] = (key, cursor)
+            return cursor
+
+    def shared_state(
+        self, cursor: duckdb.DuckDBPyConnection, name: str, factory: Callable[[], T]
+    ) -> T:
+        """Get state shared by all cursors of a cursor's database file.
+
+        Lets objects using different cursors of one file coordinate, e.g.
+        allocate numbers none of them hands out twice. The state lives as
+        long as the file stays open.
+
+        Args:
+            cursor: Cursor returned by connect(), or any other connection
+            name: Name of the state
+            factory: Creates the state on first use
+
+        Returns:
+            The file's state of that name; a new object for connections
+            the registry did not hand out
+        """
+        with self._lock:
+            owner = self._owners.get(id(cursor))
+            if owner is None:
+                return factory()
+            shared = self._databases[owner[0]].shared
+            if name not in shared:
+                shared[name] = factory()
+            return shared[name]
+
+    def release(self, cursor: duckdb.DuckDBPyConnection) -> None:
+        """Close a cursor, closing its database file if it was the last one.
+
+        Args:
+            cursor: Cursor returned by connect()
+        """
+        with self._lock:
+            owner = self._owners.pop(id(cursor), None)
+            cursor.close()
+            if owner is None:
+                return
+            key, _ = owner
+            database = self._databases[key]
+            database.cursors -= 1
+            if database.cursors == 0:
+                database.connection.close()
+                del self._databases[key]
+                logger.debug(f"Closed {key}")
+
+    def close_all(self) -> None:
+        """Close every open database file, invalidating its cursors."""
+        with self._lock:
+            for key, database in self._databases.items():
+                database.connection.close()
+                logger.debug(f"Closed {key}")
+            self._databases.clear()
+            self._owners.clear()
+
+
+# Shared by all EventStores and ImportServices of the process
+connection_registry = ConnectionRegistry()
+atexit.register(connection_registry.close_all)
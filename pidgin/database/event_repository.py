@@ -1,121 +1,191 @@
 """Repository for event operations."""
 
 import json
+import threading
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
+
+import duckdb
 
 from ..core.events import Event
 from ..io.logger import get_logger
 from .base_repository import BaseRepository
+from .connection_registry import connection_registry
+from .importers.bulk_insert import BulkInserter
 
 logger = get_logger("event_repository")
 
 
+def _json_default(value: Any) -> Any:
+    """Convert values json cannot serialize: datetimes, models and objects."""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if hasattr(value, "__dict__"):
+        return vars(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def serialize_event(event: Event, conversation_id: str) -> str:
+    """Serialize an event as stored in the events table.
+
+    Args:
+        event: Event to serialize
+        conversation_id: Conversation ID
+
+    Returns:
+        JSON string of the event's fields
+    """
+    event_dict: Dict[str, Any] = {
+        "event_type": event.__class__.__name__,
+        "conversation_id": conversation_id,
+        "timestamp": event.timestamp.isoformat(),
+        "event_id": event.event_id,
+    }
+    for field_name in event.__dataclass_fields__:
+        if field_name not in ("timestamp", "event_id"):
+            event_dict[field_name] = getattr(event, field_name)
+    return json.dumps(event_dict, default=_json_default)
+
+
+class EventSequences:
+    """Last event sequence number allocated per conversation of a database.
+
+    Shared by all repositories writing to the same database file, so that
+    repositories on different cursors of its connection never allocate the
+    same number twice.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.last: Dict[str, int] = {}
+
+
 class EventRepository(BaseRepository):
-    """Repository for event storage and retrieval."""
+    """Repository for event storage and retrieval.
+
+    Event sequence numbers are allocated in memory, continuing from the
+    highest stored sequence of each conversation, which is read once. The
+    allocation state is shared by all repositories on the same database
+    file (see ConnectionRegistry.shared_state), so the process must be the
+    only writer of the file's events, as it is the only one with the file
+    open for writing.
+    """
+
+    def __init__(self, db: duckdb.DuckDBPyConnection, enable_profiling: bool = False):
+        """Initialize with DuckDB connection.
+
+        Args:
+            db: Active DuckDB connection
+            enable_profiling: Whether to enable query profiling
+        """
+        super().__init__(db, enable_profiling)
+        self._sequences = connection_registry.shared_state(
+            db, "event_sequences", EventSequences
+        )
+
+    def _allocate_sequences(self, conversation_id: str, count: int) -> int:
+        """Allocate consecutive sequence numbers for a conversation's events.
+
+        Args:
+            conversation_id: Conversation ID
+            count: Number of events
+
+        Returns:
+            First sequence number allocated
+        """
+        with self._sequences.lock:
+            last = self._sequences.last.get(conversation_id)
+            if last is None:
+                last = self.fetchone(
+                    "SELECT COALESCE(MAX(sequence), 0) FROM events "
+                    "WHERE conversation_id = ?",
+                    [conversation_id],
+                )[0]
+            self._sequences.last[conversation_id] = last + count
+            return last + 1
+
+    def _forget_sequences(self, conversation_id: Optional[str] = None) -> None:
+        """Make the next allocation reread the stored sequences.
+
+        Args:
+            conversation_id: Conversation to forget; all if None
+        """
+        with self._sequences.lock:
+            if conversation_id is None:
+                self._sequences.last.clear()
+            else:
+                self._sequences.last.pop(conversation_id, None)
 
     def save_event(self, event: Event, experiment_id: str, conversation_id: str):
-        """Save an event to the database with atomic sequence generation.
+        """Save an event to the database.
 
         Args:
             event: Event to save
             experiment_id: Experiment ID
             conversation_id: Conversation ID
         """
-        # Convert event to dict for storage
-        event_dict: Dict[str, Any] = {
-            "event_type": event.__class__.__name__,
-            "conversation_id": conversation_id,
-            "timestamp": event.timestamp.isoformat(),
-            "event_id": event.event_id,
-        }
-
-        # Add event-specific fields
-        for field_name in event.__dataclass_fields__:
-            if field_name not in ["timestamp", "event_id"]:
-                value = getattr(event, field_name)
-                if value is None:
-                    event_dict[field_name] = None
-                elif hasattr(value, "isoformat"):
-                    # Handle datetime objects
-                    event_dict[field_name] = value.isoformat()
-                elif hasattr(value, "model_dump"):
-                    # Handle Pydantic models
-                    event_dict[field_name] = value.model_dump(mode="json")
-                elif hasattr(value, "__dict__") and not isinstance(
-                    value, (str, int, float, bool, list, dict)
-                ):
-                    # Handle dataclass objects
-                    sub_dict = {}
-                    for k, v in value.__dict__.items():
-                        if hasattr(v, "isoformat"):
-                            sub_dict[k] = v.isoformat()
-                        elif hasattr(v, "model_dump"):
-                            sub_dict[k] = v.model_dump(mode="json")
-                        elif hasattr(v, "__dict__") and not isinstance(
-                            v, (str, int, float, bool, list, dict)
-                        ):
-                            # Recursively handle nested objects
-                            sub_dict[k] = {
-                                kk: vv.isoformat() if hasattr(vv, "isoformat") else vv
-                                for kk, vv in v.__dict__.items()
-                            }
-                        else:
-                            sub_dict[k] = v
-                    event_dict[field_name] = sub_dict
-                elif isinstance(value, list):
-                    # Handle lists - check each item
-                    serialized_list = []
-                    for item in value:
-                        if hasattr(item, "model_dump"):
-                            serialized_list.append(item.model_dump(mode="json"))
-                        elif hasattr(item, "__dict__") and not isinstance(
-                            item, (str, int, float, bool)
-                        ):
-                            serialized_list.append(dict(item.__dict__.items()))
-                        else:
-                            serialized_list.append(item)
-                    event_dict[field_name] = serialized_list
-                else:
-                    event_dict[field_name] = value
-
-        # Atomic INSERT with subquery for sequence generation
-        # This eliminates the race condition by calculating the sequence
-        # within the same INSERT statement
-        query = """
+        sequence = self._allocate_sequences(conversation_id, 1)
+        self.execute(
+            """
             INSERT INTO events (
                 timestamp, event_type, conversation_id,
                 experiment_id, event_data, sequence
-            )
-            SELECT ?, ?, ?, ?, ?,
-                   COALESCE(MAX(sequence), 0) + 1
-            FROM events
-            WHERE conversation_id = ?
-            RETURNING sequence
-        """
-
-        result = self.fetchone(
-            query,
+            ) VALUES (?, ?, ?, ?, ?, ?)
+            """,
             [
                 event.timestamp,
                 event.__class__.__name__,
                 conversation_id,
                 experiment_id,
-                json.dumps(event_dict),
-                conversation_id,  # For the WHERE clause in the subquery
+                serialize_event(event, conversation_id),
+                sequence,
             ],
         )
+        logger.debug(
+            f"Saved {event.__class__.__name__} for conversation {conversation_id} with sequence {sequence}"
+        )
 
-        if result:
-            sequence = result[0]
-            logger.debug(
-                f"Saved {event.__class__.__name__} for conversation {conversation_id} with sequence {sequence}"
-            )
-        else:
-            # Fallback for DuckDB versions that might not support RETURNING
-            logger.debug(
-                f"Saved {event.__class__.__name__} for conversation {conversation_id}"
+    def save_events(
+        self, events: Iterable[Event], experiment_id: str, conversation_id: str
+    ) -> int:
+        """Save a conversation's events in order with one bulk insert.
+
+        Args:
+            events: Events to save, in order
+            experiment_id: Experiment ID
+            conversation_id: Conversation ID
+
+        Returns:
+            Number of events saved
+        """
+        events = list(events)
+        if not events:
+            return 0
+
+        sequence = self._allocate_sequences(conversation_id, len(events))
+        batch = BulkInserter(self.db, "events", batch_size=len(events))
+        for offset, event in enumerate(events):
+            batch.append(
+                {
+                    "timestamp": event.timestamp,
+                    "event_type": event.__class__.__name__,
+                    "conversation_id": conversation_id,
+                    "experiment_id": experiment_id,
+                    "event_data": serialize_event(event, conversation_id),
+                    "sequence": sequence + offset,
+                }
             )
+        try:
+            batch.flush()
+        except Exception:
+            # Sequence numbers were not used
+            self._forget_sequences(conversation_id)
+            raise
+
+        logger.debug(f"Saved {len(events)} events for conversation {conversation_id}")
+        return len(events)
 
     def get_events(
         self,
@@ -199,6 +269,7 @@ class EventRepository(BaseRepository):
             conversation_id: Conversation ID
         """
         self.execute("DELETE FROM events WHERE conversation_id = ?", [conversation_id])
+        self._forget_sequences(conversation_id)
         logger.debug(f"Deleted events for conversation {conversation_id}")
 
     def delete_events_for_experiment(self, experiment_id: str):
@@ -208,4 +279,5 @@ class EventRepository(BaseRepository):
             experiment_id: Experiment ID
         """
         self.execute("DELETE FROM events WHERE experiment_id = ?", [experiment_id])
+        self._forget_sequences()
         logger.debug(f"Deleted events for experiment {experiment_id}")
@@ -7,18 +7,21 @@ repository-based architecture.
 
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-import duckdb
+from typing import Any, Dict, Iterable, List, Optional
 
 from ..core.events import Event
+from ..core.exceptions import DatabaseError
 from ..io.logger import get_logger
+from .attractor_repository import AttractorCluster, AttractorRepository
+from .connection_registry import connection_registry
 from .conversation_repository import ConversationRepository
 from .event_repository import EventRepository
 from .experiment_repository import ExperimentRepository
+from .import_ledger_repository import ImportLedgerRepository
 from .import_service import ImportResult, ImportService
 from .message_repository import MessageRepository
 from .metrics_repository import MetricsRepository
+from .summary_repository import SummaryRepository
 from .thinking_repository import ThinkingRepository
 
 logger = get_logger("event_store")
@@ -31,11 +34,14 @@ class EventStore:
     and JSONL import functionality through a clean repository pattern.
     """
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(self, db_path: Optional[Path] = None, read_only: bool = False):
         """Initialize with DuckDB connection and repositories.
 
         Args:
             db_path: Path to DuckDB database file (uses default if None)
+            read_only: Open the database read-only, e.g. for monitors and
+                notebooks, so that other processes can read it at the same
+                time; imports and other writes then fail
         """
         if db_path is None:
             from ..io.paths import get_database_path
@@ -43,13 +49,13 @@ class EventStore:
             db_path = get_database_path()
 
         self.db_path = db_path
-        # Create parent directory if it doesn't exist
-        db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.db = duckdb.connect(str(db_path))
-
-        # Create schema manager instance
-        self._schema_manager = None
-        self._ensure_schema()
+        self.read_only = read_only
+        if not read_only:
+            # Create parent directory if it doesn't exist
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+        # A cursor of the process's connection to the file
+        self.db = connection_registry.connect(db_path, read_only=read_only)
+        self._importer: Optional[ImportService] = None
 
         # Initialize repositories
         self.events = EventRepository(self.db)
@@ -58,33 +64,54 @@ class EventStore:
         self.messages = MessageRepository(self.db)
         self.metrics = MetricsRepository(self.db)
         self.thinking = ThinkingRepository(self.db)
-
-        # Initialize import service
-        self.importer = ImportService(str(db_path))
+        self.attractors = AttractorRepository(self.db)
+        self.import_ledger = ImportLedgerRepository(self.db)
+        self.summaries = SummaryRepository(self.db)
 
         logger.debug(f"Initialized EventStore with database: {db_path}")
 
-    def _ensure_schema(self):
-        """Ensure database schema exists."""
-        from .schema_manager import SchemaManager
+    @property
+    def importer(self) -> ImportService:
+        """Import service sharing this store's database, created on first use.
 
-        if self._schema_manager is None:
-            self._schema_manager = SchemaManager()
-
-        self._schema_manager.ensure_schema(self.db, str(self.db_path))
+        Raises:
+            DatabaseError: If the store is read-only
+        """
+        if self._importer is None:
+            if self.read_only:
+                raise DatabaseError(f"Cannot import into read-only {self.db_path}")
+
+            from ..config import Config
+
+            config = Config()
+            self._importer = ImportService(
+                str(self.db_path),
+                config.get("database.metrics_engine", "turn"),
+                config.get("database.import_workers", 1),
+                config.get("database.event_reader", "duckdb"),
+            )
+        return self._importer
 
     def close(self):
-        """Close database connection."""
-        if hasattr(self, "db") and self.db:
-            self.db.close()
-        if hasattr(self, "importer") and hasattr(self.importer, "db"):
-            self.importer.db.close()
+        """Release database connection."""
+        if getattr(self, "_importer", None) is not None:
+            self._importer.close()
+            self._importer = None
+        if getattr(self, "db", None) is not None:
+            connection_registry.release(self.db)
+            self.db = None
 
     # Event Operations (delegate to EventRepository)
     def save_event(self, event: Event, experiment_id: str, conversation_id: str):
         """Save an event to the database."""
         self.events.save_event(event, experiment_id, conversation_id)
 
+    def save_events(
+        self, events: Iterable[Event], experiment_id: str, conversation_id: str
+    ) -> int:
+        """Save a conversation's events in order with one bulk insert."""
+        return self.events.save_events(events, experiment_id, conversation_id)
+
     def get_events(self, **kwargs) -> List[Dict[str, Any]]:
         """Get events with optional filters."""
         return self.events.get_events(**kwargs)
@@ -118,6 +145,17 @@ class EventStore:
         """Get summary statistics for an experiment."""
         return self.experiments.get_experiment_summary(experiment_id)
 
+    # Summary Operations (delegate to SummaryRepository)
+    def get_model_pair_summaries(
+        self, experiment_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get summaries by model pair, of one or all experiments."""
+        return self.summaries.get_model_pair_summaries(experiment_id)
+
+    def refresh_summaries(self, experiment_id: str):
+        """Recompute an experiment's summaries, e.g. after writing to it directly."""
+        self.summaries.refresh_experiment(experiment_id)
+
     # Conversation Operations (delegate to ConversationRepository)
     def create_conversation(
         self, experiment_id: str, conversation_id: str, config: dict
@@ -310,11 +348,15 @@ class EventStore:
             # Delete experiment-level events
             self.events.delete_events_for_experiment(experiment_id)
 
-            # Delete from conversation_turns table (for imported data)
+            # Delete imported turns and the message text only they used
             self.db.execute(
-                "DELETE FROM conversation_turns WHERE experiment_id = ?",
+                "DELETE FROM turn_records WHERE experiment_id = ?",
                 [experiment_id],
             )
+            self.messages.delete_unreferenced_bodies()
+            self.attractors.delete_experiment(experiment_id)
+            self.import_ledger.delete_experiment(experiment_id)
+            self.summaries.delete_experiment(experiment_id)
 
             # Finally delete experiment
             self.experiments.delete_experiment(experiment_id)
@@ -347,6 +389,8 @@ class EventStore:
             self.thinking.delete_thinking_for_conversation(conversation_id)
             self.events.delete_events_for_conversation(conversation_id)
             self.conversations.delete_conversation(conversation_id)
+            self.summaries.delete_conversation(conversation_id)
+            self.messages.delete_unreferenced_bodies()
 
             # Commit transaction
             self.db.commit()
@@ -389,6 +433,24 @@ class EventStore:
         return self.importer.import_all_pending(experiments_dir)
 
     # Query methods for generators (all read-only)
+    def find_attractor_clusters(
+        self,
+        item_type: str = "tail",
+        threshold: float = 0.8,
+        experiment_ids: Optional[List[str]] = None,
+    ) -> List[AttractorCluster]:
+        """Find conversations or messages that converged to near-identical text.
+
+        Args:
+            item_type: "tail" for conversation endings, or "message"
+            threshold: Minimum estimated similarity of word 3-grams
+            experiment_ids: Optional experiments to restrict the search to
+
+        Returns:
+            Clusters, those spanning the most conversations first
+        """
+        return self.attractors.find_clusters(item_type, threshold, experiment_ids)
+
     def get_experiment_conversations(self, experiment_id: str) -> List[Dict[str, Any]]:
         """Get all conversations for an experiment.
 
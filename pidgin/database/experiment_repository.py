@@ -5,6 +5,8 @@ import uuid
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import duckdb
+
 from ..core.constants import ExperimentStatus
 from ..io.logger import get_logger
 from .base_repository import BaseRepository
@@ -157,12 +159,28 @@ class ExperimentRepository(BaseRepository):
     def get_experiment_metrics(self, experiment_id: str) -> Dict[str, Any]:
         """Get aggregate metrics for an experiment.
 
+        Read from experiment_summaries, or calculated from conversations
+        and turn_metrics for experiments without a summary.
+
         Args:
             experiment_id: Experiment ID
 
         Returns:
             Dict of experiment metrics
         """
+        summary = self._get_summary(experiment_id)
+        if summary is not None:
+            return {
+                "total_conversations": summary["total_conversations"],
+                "completed_conversations": summary["completed_conversations"],
+                "failed_conversations": summary["failed_conversations"],
+                "avg_convergence": summary["avg_convergence"] or 0.0,
+                "max_convergence": summary["max_convergence"] or 0.0,
+                "min_convergence": summary["min_convergence"] or 0.0,
+                "avg_turn_convergence": summary["avg_turn_convergence"] or 0.0,
+                "conversations_with_metrics": summary["conversations_with_metrics"],
+            }
+
         # Get conversation stats
         conv_stats = self.fetchone(
             """
@@ -207,6 +225,18 @@ class ExperimentRepository(BaseRepository):
 
         return metrics
 
+    def _get_summary(self, experiment_id: str) -> Optional[Dict[str, Any]]:
+        """Get an experiment's row of experiment_summaries, if it has one."""
+        try:
+            result = self.fetchone(
+                "SELECT * FROM experiment_summaries WHERE experiment_id = ?",
+                [experiment_id],
+            )
+        except duckdb.CatalogException:
+            # Databases from before summaries, opened read-only
+            return None
+        return self.row_to_dict(result) if result else None
+
     def delete_experiment(self, experiment_id: str):
         """Delete an experiment record.
 
@@ -229,19 +259,27 @@ class ExperimentRepository(BaseRepository):
         if not experiment:
             return {}
 
-        # Get conversation stats
-        conversations = self.fetchall(
-            """
-            SELECT conversation_id, status
-            FROM conversations
-            WHERE experiment_id = ?
-        """,
-            [experiment_id],
-        )
+        summary = self._get_summary(experiment_id)
+        if summary is not None:
+            total = summary["total_conversations"]
+            completed = summary["completed_conversations"]
+            failed = summary["failed_conversations"]
+            running = summary["running_conversations"]
+        else:
+            # Get conversation stats
+            conversations = self.fetchall(
+                """
+                SELECT conversation_id, status
+                FROM conversations
+                WHERE experiment_id = ?
+            """,
+                [experiment_id],
+            )
 
-        completed = sum(1 for c in conversations if c[1] == "completed")
-        failed = sum(1 for c in conversations if c[1] == "failed")
-        running = sum(1 for c in conversations if c[1] == "running")
+            total = len(conversations)
+            completed = sum(1 for c in conversations if c[1] == "completed")
+            failed = sum(1 for c in conversations if c[1] == "failed")
+            running = sum(1 for c in conversations if c[1] == "running")
 
         # Get metrics
         metrics = self.get_experiment_metrics(experiment_id)
@@ -249,7 +287,7 @@ class ExperimentRepository(BaseRepository):
         return {
             "experiment_id": experiment_id,
             "status": experiment["status"],
-            "total_conversations": len(conversations),
+            "total_conversations": total,
             "completed": completed,
             "failed": failed,
             "running": running,
@@ -0,0 +1,85 @@
+"""Repository for the progress of incremental JSONL imports."""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from ..io.logger import get_logger
+from .base_repository import BaseRepository
+
+logger = get_logger("import_ledger_repository")
+
+
+@dataclass
+class LedgerEntry:
+    """How far a JSONL file has been imported."""
+
+    # Size and modification time of the file when it was last imported
+    file_size: int
+    file_mtime: float
+    # Where the next import continues reading: the end of the last
+    # completed turn, so turns in progress are read again in full
+    byte_offset: int
+    # Last turn number imported from the file
+    last_turn: Optional[int] = None
+
+    def is_current(self, file_size: int, file_mtime: float) -> bool:
+        """Whether the file is unchanged since it was imported."""
+        return file_size == self.file_size and file_mtime == self.file_mtime
+
+
+class ImportLedgerRepository(BaseRepository):
+    """Records which part of each experiment JSONL file has been imported."""
+
+    def get_entries(self, experiment_id: str) -> Dict[str, LedgerEntry]:
+        """Get the ledger entries of an experiment's files.
+
+        Args:
+            experiment_id: Experiment ID
+
+        Returns:
+            Entries by file name
+        """
+        rows = self.fetchall(
+            """
+            SELECT file_name, file_size, file_mtime, byte_offset, last_turn
+            FROM import_ledger
+            WHERE experiment_id = ?
+            """,
+            [experiment_id],
+        )
+        return {file_name: LedgerEntry(*values) for file_name, *values in rows}
+
+    def record(self, experiment_id: str, file_name: str, entry: LedgerEntry) -> None:
+        """Record how far a file has been imported.
+
+        Args:
+            experiment_id: Experiment ID
+            file_name: Name of the file in the experiment directory
+            entry: Import progress of the file
+        """
+        self.execute(
+            """
+            INSERT OR REPLACE INTO import_ledger (
+                experiment_id, file_name, file_size, file_mtime,
+                byte_offset, last_turn, imported_at
+            ) VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """,
+            [
+                experiment_id,
+                file_name,
+                entry.file_size,
+                entry.file_mtime,
+                entry.byte_offset,
+                entry.last_turn,
+            ],
+        )
+
+    def delete_experiment(self, experiment_id: str) -> None:
+        """Forget an experiment's import progress.
+
+        Args:
+            experiment_id: Experiment ID
+        """
+        self.execute(
+            "DELETE FROM import_ledger WHERE experiment_id = ?", [experiment_id]
+        )
@@ -6,15 +6,52 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
-import duckdb
-
 from ..io.logger import get_logger
-from .importers import ConversationImporter, EventProcessor, MetricsImporter
-from .schema_manager import SchemaManager
+from .attractor_repository import AttractorRepository
+from .connection_registry import connection_registry
+from .import_ledger_repository import ImportLedgerRepository, LedgerEntry
+from .importers import (
+    ConversationImporter,
+    EventProcessor,
+    EventScanner,
+    MessageBodies,
+    MetricsImporter,
+)
+from .summary_repository import SummaryRepository
 
 logger = get_logger("import_service")
 
 
+def _resume_offset(jsonl_file: Path, start: int) -> int:
+    """Find where the next import of a JSONL file should continue reading.
+
+    That is the end of the last complete line, at or after start, that
+    completes a turn. Events after it belong to turns still in progress,
+    which are then read again in full.
+
+    Args:
+        jsonl_file: Path to JSONL file
+        start: Byte offset reading starts from
+
+    Returns:
+        Byte offset
+    """
+    offset = position = start
+    with open(jsonl_file, "rb") as f:
+        f.seek(start)
+        for line in f:
+            position += len(line)
+            if not line.endswith(b"\n"):
+                break  # Still being written
+            if b"TurnCompleteEvent" in line:
+                try:
+                    if json.loads(line).get("event_type") == "TurnCompleteEvent":
+                        offset = position
+                except ValueError:
+                    continue
+    return offset
+
+
 @dataclass
 class ImportResult:
     """Result of an import operation."""
@@ -34,33 +71,69 @@ class ImportService:
     - ConversationImporter: Handles conversation and message data
     - MetricsImporter: Handles metrics and turn data
     - EventProcessor: Processes JSONL files and coordinates importers
+    - AttractorRepository: Indexes message signatures for near-duplicate search
+    - ImportLedgerRepository: Records how far each JSONL file was imported
+
+    Imports are incremental: each file is read from where the last import
+    of the experiment stopped, and turns read again replace their rows.
     """
 
-    def __init__(self, db_path: str):
+    def __init__(
+        self,
+        db_path: str,
+        metrics_engine: str = "turn",
+        workers: int = 1,
+        event_reader: str = "duckdb",
+    ):
         """Initialize with database path.
 
         Args:
             db_path: Path to DuckDB database file
+            metrics_engine: "turn" to calculate metrics turn by turn, or
+                "batch" to use BatchMetricsCalculator, which analyzes
+                each distinct message text once per import
+            workers: Processes to calculate metrics in; 1 calculates them
+                in this process, 0 uses one per CPU core. Rows are always
+                inserted from this process in one transaction.
+            event_reader: "duckdb" to scan event files with DuckDB's JSON
+                reader, or "python" to deserialize each event; legacy
+                event files are always read in Python
         """
         self.db_path = db_path
-        self.db = duckdb.connect(db_path)
-
-        # Create schema manager and ensure schema exists
-        self._schema_manager = SchemaManager()
-        self._schema_manager.ensure_schema(self.db, db_path)
+        # Shares the process's connection to the file, which has the schema
+        self.db = connection_registry.connect(db_path)
 
         # Initialize importers
-        self.conversation_importer = ConversationImporter(self.db)
-        self.metrics_importer = MetricsImporter(self.db)
+        message_bodies = MessageBodies(self.db)
+        self.conversation_importer = ConversationImporter(self.db, message_bodies)
+        self.metrics_importer = MetricsImporter(self.db, message_bodies)
+        self.attractor_repository = AttractorRepository(self.db)
+        self.import_ledger = ImportLedgerRepository(self.db)
+        self.summaries = SummaryRepository(self.db)
         self.event_processor = EventProcessor(
-            self.conversation_importer, self.metrics_importer
+            self.conversation_importer,
+            self.metrics_importer,
+            metrics_engine,
+            self.attractor_repository,
+            workers,
+            EventScanner(self.db) if event_reader == "duckdb" else None,
         )
 
-    def import_experiment_from_jsonl(self, exp_dir: Path) -> ImportResult:
+    def import_experiment_from_jsonl(
+        self, exp_dir: Path, running: bool = False
+    ) -> ImportResult:
         """Import experiment data from JSONL files into conversation_turns table.
 
+        Files unchanged since the experiment was last imported are skipped,
+        and the rest are read from the end of the last turn imported from
+        them. Conversations continued from earlier turns restore metric
+        state from those turns, so periodic imports of a running experiment
+        only calculate the new turns.
+
         Args:
             exp_dir: Directory containing manifest.json and JSONL files
+            running: Whether the experiment is still running; it is
+                recorded as completed otherwise
 
         Returns:
             ImportResult with success status and counts
@@ -95,21 +168,90 @@ class ImportService:
                     error="No JSONL files found",
                 )
 
-            # Process each JSONL file (typically one per conversation)
-            total_turns = 0
-            conversations_processed = 0
-
             self.db.begin()
 
             # First, ensure experiment exists in database
-            self.conversation_importer.ensure_experiment_exists(experiment_id, manifest)
+            self.conversation_importer.ensure_experiment_exists(
+                experiment_id, manifest, "running" if running else "completed"
+            )
 
+            # Only read what was added to each file since the last import
+            ledger = self.import_ledger.get_entries(experiment_id)
+            changed_files: List[Path] = []
+            offsets: List[int] = []
+            progress: List[LedgerEntry] = []
             for jsonl_file in jsonl_files:
-                turns_count, convs_created = self.event_processor.process_jsonl_file(
-                    jsonl_file, experiment_id, manifest
+                stat = jsonl_file.stat()
+                entry = ledger.get(jsonl_file.name)
+                if entry and entry.is_current(stat.st_size, stat.st_mtime):
+                    continue
+                if entry and entry.byte_offset > stat.st_size:
+                    logger.warning(f"{jsonl_file.name} was rewritten, reading it again")
+                    entry = None
+                offset = entry.byte_offset if entry else 0
+                changed_files.append(jsonl_file)
+                offsets.append(offset)
+                # Found before reading, so turns appended meanwhile are
+                # read again next time rather than skipped
+                progress.append(
+                    LedgerEntry(
+                        stat.st_size,
+                        stat.st_mtime,
+                        _resume_offset(jsonl_file, offset),
+                        entry.last_turn if entry else None,
+                    )
+                )
+            if len(changed_files) < len(jsonl_files):
+                logger.info(
+                    f"Skipping {len(jsonl_files) - len(changed_files)} "
+                    f"unchanged files of {experiment_id}"
+                )
+
+            # Read every file first so semantic similarity is weighted by
+            # the whole experiment
+            file_conversations = self.event_processor.read_jsonl_files(
+                changed_files, offsets
+            )
+
+            # Import all files at once so metrics can be calculated in parallel
+            all_conversations = {
+                conversation_id: conv_data
+                for conversations in file_conversations
+                for conversation_id, conv_data in conversations.items()
+            }
+            self.event_processor.resume_conversations(all_conversations, experiment_id)
+            self.event_processor.fit_corpus(
+                conv_data
+                for conversations in file_conversations
+                for conv_data in conversations.values()
+            )
+            total_turns, conversations_processed = (
+                self.event_processor.import_conversations(
+                    all_conversations, experiment_id
+                )
+            )
+
+            # Experiments imported before summaries were maintained get
+            # summaries of all their conversations
+            if self.summaries.get_experiment_summary(experiment_id) is None:
+                self.summaries.refresh_experiment(experiment_id)
+            else:
+                self.summaries.refresh_conversations(
+                    experiment_id, list(all_conversations)
                 )
-                total_turns += turns_count
-                conversations_processed += convs_created
+
+            for jsonl_file, conversations, entry in zip(
+                changed_files, file_conversations, progress, strict=True
+            ):
+                entry.last_turn = max(
+                    (
+                        turn_number
+                        for conv_data in conversations.values()
+                        for turn_number in conv_data["turns"]
+                    ),
+                    default=entry.last_turn,
+                )
+                self.import_ledger.record(experiment_id, jsonl_file.name, entry)
 
             self.db.commit()
 
@@ -144,6 +286,9 @@ class ImportService:
     def import_all_pending(self, experiments_dir: Path) -> List[ImportResult]:
         """Import all experiments that have JSONL files but haven't been imported.
 
+        Experiments imported before are imported again incrementally, except
+        those imported before imports were tracked in the import ledger.
+
         Args:
             experiments_dir: Root directory containing experiment subdirectories
 
@@ -168,11 +313,11 @@ class ImportService:
             # Check if already imported (look for data in conversation_turns)
             experiment_id = exp_dir.name
             existing_count = self.db.execute(
-                "SELECT COUNT(*) FROM conversation_turns WHERE experiment_id = ?",
+                "SELECT COUNT(*) FROM turn_records WHERE experiment_id = ?",
                 [experiment_id],
             ).fetchone()[0]
 
-            if existing_count > 0:
+            if existing_count > 0 and not self.import_ledger.get_entries(experiment_id):
                 logger.info(
                     f"Experiment {experiment_id} already imported ({existing_count} turns)"
                 )
@@ -185,6 +330,7 @@ class ImportService:
         return results
 
     def close(self):
-        """Close the database connection."""
+        """Release the database connection."""
         if self.db:
-            self.db.close()
+            connection_registry.release(self.db)
+            self.db = None
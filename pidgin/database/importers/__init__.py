@@ -2,6 +2,15 @@
 
 from .conversation_importer import ConversationImporter
 from .event_processor import EventProcessor
+from .event_scanner import EventScanner
+from .message_bodies import MessageBodies, message_hash
 from .metrics_importer import MetricsImporter
 
-__all__ = ["ConversationImporter", "EventProcessor", "MetricsImporter"]
+__all__ = [
+    "ConversationImporter",
+    "EventProcessor",
+    "EventScanner",
+    "MessageBodies",
+    "MetricsImporter",
+    "message_hash",
+]
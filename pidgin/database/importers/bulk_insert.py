@@ -0,0 +1,159 @@
+"""Columnar batches of rows loaded into a table in one statement."""
+
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional
+
+import duckdb
+
+from ...io.logger import get_logger
+
+logger = get_logger("bulk_insert")
+
+# Staged as text and cast in SQL: timestamps so that timezone-aware and
+# naive values are converted as when bound as parameters, JSON so that
+# already-serialized JSON strings are not parsed again
+_STAGED_AS_TEXT = {"TIMESTAMP": "TIMESTAMPTZ", "JSON": "JSON"}
+
+
+class BulkInserter:
+    """Rows for one table, collected in columns and inserted in bulk.
+
+    Row-at-a-time INSERTs are DuckDB's slowest path. Rows are kept as one
+    list per column and loaded with a single INSERT ... SELECT from a
+    newline-delimited JSON staging file, read by DuckDB's JSON reader with
+    the column types of the table. Column names and types are read from
+    the schema once.
+    """
+
+    def __init__(
+        self,
+        db: duckdb.DuckDBPyConnection,
+        table: str,
+        batch_size: int = 10000,
+        replace: bool = False,
+        ignore: bool = False,
+    ):
+        """Initialize batch.
+
+        Args:
+            db: DuckDB connection
+            table: Table to insert into
+            batch_size: Rows after which the batch is flushed automatically
+            replace: Replace rows with the same primary key instead of
+                failing on them
+            ignore: Skip rows with the primary key of an existing row
+                instead of failing on them
+        """
+        self.db = db
+        self.table = table
+        self.batch_size = batch_size
+        self.replace = replace
+        self.ignore = ignore
+        self._schema: Optional[Dict[str, str]] = None
+        self._columns: Dict[str, List[Any]] = {}
+        self._row_count = 0
+
+    def __len__(self) -> int:
+        return self._row_count
+
+    @property
+    def schema(self) -> Dict[str, str]:
+        """Column types of the table by name, in table order."""
+        if self._schema is None:
+            self._schema = {
+                name: column_type
+                for name, column_type, *_ in self.db.execute(
+                    f"DESCRIBE {self.table}"
+                ).fetchall()
+            }
+        return self._schema
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """Add a row, flushing the batch once it is full.
+
+        Columns missing from some rows of a batch are NULL in those rows;
+        columns missing from all rows get their defaults.
+
+        Args:
+            row: Values by column name
+
+        Raises:
+            ValueError: If the table has no such column
+        """
+        for column in row:
+            if column not in self._columns:
+                if column not in self.schema:
+                    raise ValueError(f"Unknown column '{column}' for {self.table}")
+                self._columns[column] = [None] * self._row_count
+        for column, values in self._columns.items():
+            values.append(row.get(column))
+        self._row_count += 1
+
+        if self._row_count >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """Insert the collected rows.
+
+        Returns:
+            Number of rows inserted
+        """
+        if not self._row_count:
+            return 0
+
+        row_count = self._row_count
+        collected = self._columns
+        self.discard()
+
+        columns = [column for column in self.schema if column in collected]
+        read_types = []
+        select = []
+        for column in columns:
+            column_type = self.schema[column]
+            cast = _STAGED_AS_TEXT.get(column_type)
+            read_types.append(f"'{column}': '{'VARCHAR' if cast else column_type}'")
+            select.append(f'CAST("{column}" AS {cast})' if cast else f'"{column}"')
+
+        fd, path = tempfile.mkstemp(prefix=f"pidgin_{self.table}_", suffix=".jsonl")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                for values in zip(*(collected[c] for c in columns), strict=True):
+                    f.write(
+                        json.dumps(dict(zip(columns, values, strict=True)), default=str)
+                    )
+                    f.write("\n")
+
+            self.db.execute(
+                f"""
+                INSERT {self._conflict_clause()}INTO {self.table}
+                    ({", ".join(f'"{c}"' for c in columns)})
+                SELECT {", ".join(select)}
+                FROM read_json(
+                    ?, format = 'newline_delimited',
+                    columns = {{{", ".join(read_types)}}}
+                )
+                """,
+                [path],
+            )
+        except Exception as e:
+            logger.error(f"Failed to insert {row_count} rows into {self.table}: {e}")
+            raise
+        finally:
+            os.unlink(path)
+
+        return row_count
+
+    def _conflict_clause(self) -> str:
+        """OR clause of the INSERT statement for primary key conflicts."""
+        if self.replace:
+            return "OR REPLACE "
+        if self.ignore:
+            return "OR IGNORE "
+        return ""
+
+    def discard(self) -> None:
+        """Drop the collected rows without inserting them."""
+        self._columns = {}
+        self._row_count = 0
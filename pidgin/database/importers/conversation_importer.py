@@ -2,11 +2,13 @@
 
 import json
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List, Optional
 
 import duckdb
 
 from ...io.logger import get_logger
+from .bulk_insert import BulkInserter
+from .message_bodies import MessageBodies
 
 logger = get_logger("conversation_importer")
 
@@ -14,21 +16,42 @@ logger = get_logger("conversation_importer")
 class ConversationImporter:
     """Handles importing conversation-level data."""
 
-    def __init__(self, db: duckdb.DuckDBPyConnection):
+    def __init__(
+        self,
+        db: duckdb.DuckDBPyConnection,
+        message_bodies: Optional[MessageBodies] = None,
+    ):
         """Initialize with database connection.
 
         Args:
             db: DuckDB connection
+            message_bodies: Message text queue, shared with the
+                MetricsImporter so each text is queued once
         """
         self.db = db
+        self.message_bodies = message_bodies or MessageBodies(db)
+        self.message_rows = BulkInserter(db, "message_records", replace=True)
+        self.thinking_rows = BulkInserter(db, "thinking_traces", replace=True)
 
-    def ensure_experiment_exists(self, experiment_id: str, manifest: Dict) -> None:
+    def ensure_experiment_exists(
+        self, experiment_id: str, manifest: Dict, status: str = "completed"
+    ) -> None:
         """Ensure experiment exists in database before importing turns.
 
+        An existing experiment's status and conversation counts are brought
+        up to date, e.g. when a running experiment is imported again.
+
         Args:
             experiment_id: Experiment ID
             manifest: Manifest data containing experiment config
+            status: Status to record for the experiment
         """
+        counts = [
+            manifest.get("total_conversations", 0),
+            manifest.get("completed_conversations", 0),
+            manifest.get("failed_conversations", 0),
+        ]
+
         # Check if experiment already exists
         result = self.db.execute(
             "SELECT experiment_id FROM experiments WHERE experiment_id = ?",
@@ -54,15 +77,23 @@ class ConversationImporter:
                     experiment_id,
                     name,
                     json.dumps(config),
-                    "completed",  # Status is completed since we're importing after completion
+                    status,
                     created_at,
-                    manifest.get("total_conversations", 0),
-                    manifest.get("completed_conversations", 0),
-                    manifest.get("failed_conversations", 0),
+                    *counts,
                 ],
             )
 
             logger.info(f"Created experiment record for {experiment_id}")
+        else:
+            self.db.execute(
+                """
+                UPDATE experiments
+                SET status = ?, total_conversations = ?,
+                    completed_conversations = ?, failed_conversations = ?
+                WHERE experiment_id = ?
+            """,
+                [status, *counts, experiment_id],
+            )
 
     def ensure_conversation_exists(
         self, experiment_id: str, conversation_id: str, conv_data: Dict
@@ -127,10 +158,82 @@ class ConversationImporter:
 
         return False
 
+    def get_conversation_configs(self, experiment_id: str) -> Dict[str, Dict]:
+        """Get the configuration of an experiment's imported conversations.
+
+        Args:
+            experiment_id: Experiment ID
+
+        Returns:
+            Configuration as read from events, by conversation ID
+        """
+        rows = self.db.execute(
+            """
+            SELECT
+                conversation_id, agent_a_model, agent_b_model,
+                agent_a_temperature, agent_b_temperature, initial_prompt
+            FROM conversations
+            WHERE experiment_id = ?
+            """,
+            [experiment_id],
+        ).fetchall()
+        return {
+            conversation_id: {
+                "agent_a_model": agent_a_model,
+                "agent_b_model": agent_b_model,
+                "temperature_a": temperature_a,
+                "temperature_b": temperature_b,
+                "initial_prompt": initial_prompt,
+                "awareness_a": None,
+                "awareness_b": None,
+            }
+            for (
+                conversation_id,
+                agent_a_model,
+                agent_b_model,
+                temperature_a,
+                temperature_b,
+                initial_prompt,
+            ) in rows
+        }
+
+    def update_conversation_totals(self, conversation_ids: List[str]) -> None:
+        """Update turn counts, final convergence and end times from turns.
+
+        For conversations continued by an import, once their turns are
+        inserted.
+
+        Args:
+            conversation_ids: Conversation IDs
+        """
+        if not conversation_ids:
+            return
+        self.db.execute(
+            """
+            UPDATE conversations SET
+                total_turns = totals.total_turns,
+                final_convergence_score = totals.final_convergence_score,
+                completed_at = totals.completed_at
+            FROM (
+                SELECT
+                    conversation_id,
+                    count(*) AS total_turns,
+                    arg_max_null(convergence_score, turn_number)
+                        AS final_convergence_score,
+                    arg_max_null(timestamp, turn_number) AS completed_at
+                FROM turn_metrics
+                WHERE list_contains(?, conversation_id)
+                GROUP BY conversation_id
+            ) AS totals
+            WHERE conversations.conversation_id = totals.conversation_id
+            """,
+            [conversation_ids],
+        )
+
     def insert_messages(
         self, conversation_id: str, turn_number: int, turn_data: Dict, messages: Dict
     ) -> None:
-        """Insert messages into messages table for compatibility.
+        """Queue a turn's messages for the messages table, for compatibility.
 
         Args:
             conversation_id: Conversation ID
@@ -138,46 +241,24 @@ class ConversationImporter:
             turn_data: Turn data containing messages
             messages: Message metadata from events
         """
-        # Insert agent A message
-        self.db.execute(
-            """
-            INSERT INTO messages (
-                conversation_id, turn_number, agent_id,
-                content, timestamp, token_count
-            ) VALUES (?, ?, ?, ?, ?, ?)
-        """,
-            [
-                conversation_id,
-                turn_number,
-                "agent_a",
-                turn_data["agent_a_message"],
-                turn_data["timestamp"],
-                messages.get("agent_a", {}).get("total_tokens", 0),
-            ],
-        )
-
-        # Insert agent B message
-        self.db.execute(
-            """
-            INSERT INTO messages (
-                conversation_id, turn_number, agent_id,
-                content, timestamp, token_count
-            ) VALUES (?, ?, ?, ?, ?, ?)
-        """,
-            [
-                conversation_id,
-                turn_number,
-                "agent_b",
-                turn_data["agent_b_message"],
-                turn_data["timestamp"],
-                messages.get("agent_b", {}).get("total_tokens", 0),
-            ],
-        )
+        for agent_id in ("agent_a", "agent_b"):
+            self.message_rows.append(
+                {
+                    "conversation_id": conversation_id,
+                    "turn_number": turn_number,
+                    "agent_id": agent_id,
+                    "message_hash": self.message_bodies.add(
+                        turn_data[f"{agent_id}_message"]
+                    ),
+                    "timestamp": turn_data["timestamp"],
+                    "token_count": messages.get(agent_id, {}).get("total_tokens", 0),
+                }
+            )
 
     def insert_thinking_trace(
         self, conversation_id: str, turn_number: int, agent_id: str, thinking: Dict
     ) -> None:
-        """Insert thinking trace into thinking_traces table.
+        """Queue a thinking trace for the thinking_traces table.
 
         Args:
             conversation_id: Conversation ID
@@ -185,20 +266,26 @@ class ConversationImporter:
             agent_id: Agent ID (agent_a or agent_b)
             thinking: Thinking trace data
         """
-        self.db.execute(
-            """
-            INSERT INTO thinking_traces (
-                conversation_id, turn_number, agent_id,
-                thinking_content, thinking_tokens, duration_ms, timestamp
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-            [
-                conversation_id,
-                turn_number,
-                agent_id,
-                thinking.get("thinking_content", ""),
-                thinking.get("thinking_tokens"),
-                thinking.get("duration_ms"),
-                thinking.get("timestamp"),
-            ],
+        self.thinking_rows.append(
+            {
+                "conversation_id": conversation_id,
+                "turn_number": turn_number,
+                "agent_id": agent_id,
+                "thinking_content": thinking.get("thinking_content", ""),
+                "thinking_tokens": thinking.get("thinking_tokens"),
+                "duration_ms": thinking.get("duration_ms"),
+                "timestamp": thinking.get("timestamp"),
+            }
         )
+
+    def flush(self) -> None:
+        """Insert queued messages and thinking traces."""
+        self.message_bodies.flush()
+        self.message_rows.flush()
+        self.thinking_rows.flush()
+
+    def discard(self) -> None:
+        """Drop queued rows, e.g. after a failed import."""
+        self.message_bodies.discard()
+        self.message_rows.discard()
+        self.thinking_rows.discard()
@@ -1,23 +1,37 @@
 """Process JSONL event files for import."""
 
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from ...core.events import (
     ConversationStartEvent,
     MessageCompleteEvent,
     ThinkingCompleteEvent,
     TurnCompleteEvent,
+    TurnStartEvent,
 )
 from ...io.event_deserializer import EventDeserializer
 from ...io.logger import get_logger
-from ...metrics.flat_calculator import FlatMetricsCalculator
+from ..attractor_repository import AttractorRepository
 from .conversation_importer import ConversationImporter
+from .event_scanner import EventScanner
 from .metrics_importer import MetricsImporter
+from .metrics_pipeline import MetricsPipeline
 
 logger = get_logger("event_processor")
 
 
+def _corpus_messages(conversations: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Every message of the conversations, including earlier turns."""
+    for conv_data in conversations:
+        for turn in conv_data["turns"].values():
+            yield turn["agent_a_message"]
+            yield turn["agent_b_message"]
+        for _, agent_a_message, agent_b_message in conv_data.get("history", ()):
+            yield agent_a_message
+            yield agent_b_message
+
+
 class EventProcessor:
     """Process JSONL event files and extract conversation data."""
 
@@ -25,23 +39,41 @@ class EventProcessor:
         self,
         conversation_importer: ConversationImporter,
         metrics_importer: MetricsImporter,
+        metrics_engine: str = "turn",
+        attractor_repository: Optional[AttractorRepository] = None,
+        workers: int = 1,
+        event_scanner: Optional[EventScanner] = None,
     ):
         """Initialize with importers.
 
         Args:
             conversation_importer: Conversation data importer
             metrics_importer: Metrics and turn data importer
+            metrics_engine: "turn" or "batch" (see METRICS_ENGINES)
+            attractor_repository: Optional near-duplicate index to add
+                imported message signatures to
+            workers: Processes to calculate metrics in; 1 calculates them
+                in this process, 0 uses one per CPU core
+            event_scanner: Optional DuckDB reader for read_jsonl_files;
+                without it, events are deserialized in Python
         """
         self.conversation_importer = conversation_importer
         self.metrics_importer = metrics_importer
+        self.attractor_repository = attractor_repository
+        self.event_scanner = event_scanner
         self.event_deserializer = EventDeserializer()
-        self.metrics_calculator = FlatMetricsCalculator()
+        self.metrics_engine = metrics_engine
+        self.metrics_pipeline = MetricsPipeline(metrics_engine, workers)
 
     def process_jsonl_file(
         self, jsonl_file: Path, experiment_id: str, manifest: Dict
     ) -> Tuple[int, int]:
         """Process a single JSONL file and extract turns.
 
+        Semantic similarity is weighted by the messages of this file only;
+        to weight it by a whole experiment, use read_jsonl_file, fit_corpus
+        and import_conversations.
+
         Args:
             jsonl_file: Path to JSONL file
             experiment_id: Experiment ID
@@ -50,11 +82,75 @@ class EventProcessor:
         Returns:
             Tuple of (turns_processed, conversations_created)
         """
+        conversations = self.read_jsonl_file(jsonl_file)
+        self.fit_corpus(conversations.values())
+        return self.import_conversations(conversations, experiment_id)
+
+    def fit_corpus(self, conversations: Iterable[Dict[str, Any]]) -> None:
+        """Start a new semantic similarity corpus from conversation messages.
+
+        Args:
+            conversations: Conversation data from read_jsonl_file, including
+                earlier turns added by resume_conversations
+        """
+        self.metrics_pipeline.fit_corpus(_corpus_messages(conversations))
+
+    def read_jsonl_files(
+        self, jsonl_files: Sequence[Path], offsets: Optional[Sequence[int]] = None
+    ) -> List[Dict[str, Dict[str, Any]]]:
+        """Group the events of several JSONL files by conversation and turn.
+
+        Files read from the start are scanned with the event scanner if
+        there is one, falling back to read_jsonl_file for legacy event
+        formats. The rest of a file read from an offset is small, and read
+        with read_jsonl_file.
+
+        Args:
+            jsonl_files: Paths to JSONL files
+            offsets: Byte offset to start reading each file from; defaults
+                to the start of every file
+
+        Returns:
+            Conversation data by conversation ID for each file, in order
+        """
+        offsets = offsets or [0] * len(jsonl_files)
+        scanned: Dict[Path, Dict[str, Dict[str, Any]]] = {}
+        whole_files = [
+            jsonl_file
+            for jsonl_file, offset in zip(jsonl_files, offsets, strict=True)
+            if not offset
+        ]
+        if self.event_scanner and whole_files:
+            file_conversations = self.event_scanner.scan(whole_files)
+            if file_conversations is not None:
+                scanned = dict(zip(whole_files, file_conversations, strict=True))
+
+        return [
+            scanned[jsonl_file]
+            if jsonl_file in scanned
+            else self.read_jsonl_file(jsonl_file, offset)
+            for jsonl_file, offset in zip(jsonl_files, offsets, strict=True)
+        ]
+
+    def read_jsonl_file(
+        self, jsonl_file: Path, start: int = 0
+    ) -> Dict[str, Dict[str, Any]]:
+        """Group the events of a JSONL file by conversation and turn.
+
+        Args:
+            jsonl_file: Path to JSONL file
+            start: Byte offset to start reading from, at the start of a line
+
+        Returns:
+            Conversation data by conversation ID
+        """
         # Group events by conversation and turn
         conversations: Dict[str, Dict[str, Any]] = {}
 
         # Read all events from the file
-        for line_num, event in self.event_deserializer.read_jsonl_events(jsonl_file):
+        for line_num, event in self.event_deserializer.read_jsonl_events(
+            jsonl_file, start
+        ):
             if not event:
                 continue
 
@@ -68,6 +164,9 @@ class EventProcessor:
                     "turns": {},
                     "config": {},
                     "messages": {},
+                    "turn_messages": {},  # Message metadata per turn
+                    "pending_messages": {},  # Messages of the turn in progress
+                    "turn_starts": {},
                     "thinking": {},  # Track thinking traces
                 }
 
@@ -85,22 +184,34 @@ class EventProcessor:
                     "awareness_b": getattr(event, "awareness_b", None),
                 }
 
+            elif isinstance(event, TurnStartEvent):
+                conv["turn_starts"][event.turn_number] = event.timestamp
+
             elif isinstance(event, TurnCompleteEvent):
                 turn_num = event.turn_number
                 conv["turns"][turn_num] = {
                     "timestamp": event.timestamp,
+                    "started_at": conv["turn_starts"].get(turn_num),
                     "convergence_score": event.convergence_score,
                     "agent_a_message": event.turn.agent_a_message.content,
                     "agent_b_message": event.turn.agent_b_message.content,
                 }
+                # Messages complete before their turn does
+                conv["turn_messages"][turn_num] = conv["pending_messages"]
+                conv["pending_messages"] = {}
 
             elif isinstance(event, MessageCompleteEvent):
-                conv["messages"][event.agent_id] = {
+                message_data = {
                     "prompt_tokens": event.prompt_tokens,
                     "completion_tokens": event.completion_tokens,
                     "total_tokens": event.total_tokens,
                     "duration_ms": event.duration_ms,
+                    "rate_limit_wait_ms": event.rate_limit_wait_ms,
+                    "time_to_first_token_ms": event.time_to_first_token_ms,
+                    "tokens_per_second": event.tokens_per_second,
                 }
+                conv["messages"][event.agent_id] = message_data
+                conv["pending_messages"][event.agent_id] = message_data
 
             elif isinstance(event, ThinkingCompleteEvent):
                 # Store thinking trace keyed by (turn_number, agent_id)
@@ -112,62 +223,156 @@ class EventProcessor:
                     "timestamp": getattr(event, "timestamp", None),
                 }
 
-        # Calculate metrics for each conversation
-        turns_processed = 0
-        conversations_created = 0
+        return conversations
 
+    def resume_conversations(
+        self, conversations: Dict[str, Dict[str, Any]], experiment_id: str
+    ) -> None:
+        """Prepare conversations continued from an earlier import.
+
+        Conversations already imported get the messages of their earlier
+        turns as "history", to restore metric calculators' state from, and
+        their imported configuration if the events read did not start them.
+
+        Args:
+            conversations: Conversation data from read_jsonl_file
+            experiment_id: Experiment ID
+        """
+        imported = self.conversation_importer.get_conversation_configs(experiment_id)
         for conversation_id, conv_data in conversations.items():
-            if not conv_data["turns"]:
+            if conversation_id not in imported or not conv_data["turns"]:
                 continue
+            conv_data["resumed"] = True
+            conv_data["history"] = self.metrics_importer.get_earlier_turns(
+                experiment_id, conversation_id, min(conv_data["turns"])
+            )
+            if not conv_data["config"]:
+                conv_data["config"] = imported[conversation_id]
 
-            # Create conversation record if it doesn't exist
-            if self.conversation_importer.ensure_conversation_exists(
-                experiment_id, conversation_id, conv_data
-            ):
-                conversations_created += 1
+    def import_conversations(
+        self, conversations: Dict[str, Dict[str, Any]], experiment_id: str
+    ) -> Tuple[int, int]:
+        """Calculate metrics for conversations and insert them.
 
-            # Reset metrics calculator for this conversation
-            self.metrics_calculator = FlatMetricsCalculator()
+        Metrics of all conversations are calculated first, in worker
+        processes if configured, then inserted from this process so the
+        database has a single writer. Rows are written in bulk, one
+        statement per table.
 
-            # Process turns in order
-            for turn_num in sorted(conv_data["turns"].keys()):
-                turn_data = conv_data["turns"][turn_num]
+        Args:
+            conversations: Conversation data from read_jsonl_file
+            experiment_id: Experiment ID
 
-                # Calculate metrics
-                flat_metrics = self.metrics_calculator.calculate_turn_metrics(
-                    turn_num, turn_data["agent_a_message"], turn_data["agent_b_message"]
+        Returns:
+            Tuple of (turns_processed, conversations_created)
+        """
+        # Calculate metrics for all turns of each conversation, in order
+        conversation_ids = [
+            conversation_id
+            for conversation_id, conv_data in conversations.items()
+            if conv_data["turns"]
+        ]
+        all_turn_numbers = [
+            sorted(conversations[conversation_id]["turns"].keys())
+            for conversation_id in conversation_ids
+        ]
+        all_metrics = self.metrics_pipeline.calculate_many(
+            [
+                (
+                    conversations[conversation_id]["turns"],
+                    turn_numbers,
+                    conversations[conversation_id]["config"].get("initial_prompt"),
+                    conversations[conversation_id].get("history", []),
                 )
-
-                # Prepare data for insertion
-                turn_row = self.metrics_importer.prepare_turn_row(
-                    experiment_id,
-                    conversation_id,
-                    turn_num,
-                    turn_data,
-                    conv_data["config"],
-                    flat_metrics,
-                    conv_data.get("messages", {}),
+                for conversation_id, turn_numbers in zip(
+                    conversation_ids, all_turn_numbers, strict=True
                 )
+            ]
+        )
 
-                # Insert into database
-                self.metrics_importer.insert_turn(turn_row)
+        turns_processed = 0
+        conversations_created = 0
 
-                # Also populate messages and turn_metrics tables for transcript generation
-                self.conversation_importer.insert_messages(
-                    conversation_id, turn_num, turn_data, conv_data.get("messages", {})
-                )
-                self.metrics_importer.insert_turn_metrics(
-                    conversation_id, turn_num, turn_data, flat_metrics
-                )
+        try:
+            for conversation_id, turn_numbers, conversation_metrics in zip(
+                conversation_ids, all_turn_numbers, all_metrics, strict=True
+            ):
+                conv_data = conversations[conversation_id]
+
+                # Create conversation record if it doesn't exist
+                if self.conversation_importer.ensure_conversation_exists(
+                    experiment_id, conversation_id, conv_data
+                ):
+                    conversations_created += 1
+
+                for turn_num, flat_metrics in zip(
+                    turn_numbers, conversation_metrics, strict=True
+                ):
+                    turn_data = conv_data["turns"][turn_num]
+                    turn_messages = (
+                        conv_data["turn_messages"].get(turn_num)
+                        or conv_data["messages"]
+                    )
+
+                    # Prepare data for insertion
+                    turn_row = self.metrics_importer.prepare_turn_row(
+                        experiment_id,
+                        conversation_id,
+                        turn_num,
+                        turn_data,
+                        conv_data["config"],
+                        flat_metrics,
+                        turn_messages,
+                    )
+
+                    # Queue for insertion
+                    self.metrics_importer.insert_turn(turn_row)
+
+                    # Also populate messages and turn_metrics tables for transcript generation
+                    self.conversation_importer.insert_messages(
+                        conversation_id, turn_num, turn_data, turn_messages
+                    )
+                    self.metrics_importer.insert_turn_metrics(
+                        conversation_id, turn_num, turn_data, flat_metrics
+                    )
+
+                    # Insert thinking traces for this turn if any
+                    thinking_data = conv_data.get("thinking", {})
+                    for (t_num, agent_id), thinking in thinking_data.items():
+                        if t_num == turn_num:
+                            self.conversation_importer.insert_thinking_trace(
+                                conversation_id, turn_num, agent_id, thinking
+                            )
+
+                    turns_processed += 1
 
-                # Insert thinking traces for this turn if any
-                thinking_data = conv_data.get("thinking", {})
-                for (t_num, agent_id), thinking in thinking_data.items():
-                    if t_num == turn_num:
-                        self.conversation_importer.insert_thinking_trace(
-                            conversation_id, turn_num, agent_id, thinking
-                        )
+                # Make the conversation searchable for near-identical text
+                if self.attractor_repository:
+                    self.attractor_repository.index_conversation(
+                        experiment_id,
+                        conversation_id,
+                        [
+                            (turn_num, metrics["a_minhash"], metrics["b_minhash"])
+                            for turn_num, metrics in zip(
+                                turn_numbers, conversation_metrics, strict=True
+                            )
+                        ],
+                        resumed=conv_data.get("resumed", False),
+                    )
 
-                turns_processed += 1
+            # Write the queued rows of all conversations at once
+            self.metrics_importer.flush()
+            self.conversation_importer.flush()
+            self.conversation_importer.update_conversation_totals(
+                [
+                    conversation_id
+                    for conversation_id in conversation_ids
+                    if conversations[conversation_id].get("resumed")
+                ]
+            )
+        except Exception:
+            self.metrics_importer.discard()
+            self.conversation_importer.discard()
+            raise
 
         return turns_processed, conversations_created
@@ -0,0 +1,321 @@
+"""Read JSONL event files with DuckDB's JSON reader for import."""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import duckdb
+
+from ...io.deserializers.base import BaseDeserializer
+from ...io.logger import get_logger
+
+logger = get_logger("event_scanner")
+
+# Fields read from the event files; everything else is skipped by the reader
+_EVENT_COLUMNS = {
+    "event_type": "VARCHAR",
+    "conversation_id": "VARCHAR",
+    "turn_number": "BIGINT",
+    "agent_id": "VARCHAR",
+    "timestamp": "VARCHAR",
+    # Legacy events nest their fields under "data"
+    "data": "JSON",
+    # ConversationStartEvent, which the event reader skips without agents
+    "agent_a": "JSON",
+    "agent_b": "JSON",
+    "agent_a_model": "VARCHAR",
+    "agent_b_model": "VARCHAR",
+    "initial_prompt": "VARCHAR",
+    # TurnCompleteEvent
+    "turn": (
+        "STRUCT(agent_a_message STRUCT(content VARCHAR), "
+        "agent_b_message STRUCT(content VARCHAR))"
+    ),
+    "convergence_score": "DOUBLE",
+    # MessageCompleteEvent and ThinkingCompleteEvent
+    "prompt_tokens": "BIGINT",
+    "completion_tokens": "BIGINT",
+    "total_tokens": "BIGINT",
+    "duration_ms": "BIGINT",
+    "rate_limit_wait_ms": "BIGINT",
+    "time_to_first_token_ms": "BIGINT",
+    "tokens_per_second": "DOUBLE",
+    "thinking_content": "VARCHAR",
+    "thinking_tokens": "BIGINT",
+}
+
+# Events of a conversation in file order
+_EVENTS = """
+    SELECT rowid AS seq, * FROM import_events
+    WHERE conversation_id IS NOT NULL AND conversation_id <> ''
+"""
+
+# Events only the Python event reader understands: payloads nested under
+# "data", renamed event types and turns with flat messages
+_LEGACY_EVENTS = """
+    SELECT count(*) FROM import_events
+    WHERE (data IS NOT NULL AND event_type IS NOT NULL)
+        OR event_type = 'ConversationCreated'
+        OR (event_type = 'TurnCompleteEvent' AND turn IS NULL)
+"""
+
+# Last completion of each turn with the start of the turn before it, and
+# the completion before it, which ends the previous turn's messages
+_TURNS = f"""
+    CREATE TEMP TABLE import_turns AS
+    WITH events AS ({_EVENTS}),
+    completions AS (
+        SELECT
+            seq, filename, conversation_id, turn_number, timestamp,
+            convergence_score,
+            COALESCE(turn.agent_a_message.content, '') AS agent_a_message,
+            COALESCE(turn.agent_b_message.content, '') AS agent_b_message,
+            lag(seq, 1, -1) OVER (
+                PARTITION BY filename, conversation_id ORDER BY seq
+            ) AS previous_seq
+        FROM events
+        WHERE event_type = 'TurnCompleteEvent' AND turn_number IS NOT NULL
+        QUALIFY row_number() OVER (
+            PARTITION BY filename, conversation_id, turn_number ORDER BY seq DESC
+        ) = 1
+    )
+    SELECT
+        c.*,
+        arg_max(s.timestamp, s.seq) AS started_at
+    FROM completions c
+    LEFT JOIN events s
+        ON s.event_type = 'TurnStartEvent'
+        AND s.filename = c.filename
+        AND s.conversation_id = c.conversation_id
+        AND s.turn_number = c.turn_number
+        AND s.seq < c.seq
+    GROUP BY ALL
+"""
+
+# Message metadata of each turn: each agent's last message completed since
+# the previous turn, or if there were none, in the whole conversation
+_TURN_MESSAGES = f"""
+    WITH messages AS (
+        SELECT
+            seq, filename, conversation_id, agent_id,
+            COALESCE(prompt_tokens, 0) AS prompt_tokens,
+            COALESCE(completion_tokens, 0) AS completion_tokens,
+            COALESCE(total_tokens, 0) AS total_tokens,
+            COALESCE(duration_ms, 0) AS duration_ms,
+            rate_limit_wait_ms, time_to_first_token_ms, tokens_per_second
+        FROM ({_EVENTS})
+        WHERE event_type = 'MessageCompleteEvent' AND agent_id IS NOT NULL
+    ),
+    pending AS (
+        SELECT t.turn_number, m.*
+        FROM import_turns t
+        JOIN messages m
+            ON m.filename = t.filename
+            AND m.conversation_id = t.conversation_id
+            AND m.seq > t.previous_seq
+            AND m.seq < t.seq
+    ),
+    latest AS (
+        SELECT t.turn_number, m.*
+        FROM import_turns t
+        JOIN messages m
+            ON m.filename = t.filename AND m.conversation_id = t.conversation_id
+        WHERE NOT EXISTS (
+            SELECT 1 FROM pending p
+            WHERE p.filename = t.filename
+                AND p.conversation_id = t.conversation_id
+                AND p.turn_number = t.turn_number
+        )
+    )
+    SELECT
+        filename, conversation_id, turn_number, agent_id,
+        prompt_tokens, completion_tokens, total_tokens, duration_ms,
+        rate_limit_wait_ms, time_to_first_token_ms, tokens_per_second
+    FROM (SELECT * FROM pending UNION ALL SELECT * FROM latest)
+    QUALIFY row_number() OVER (
+        PARTITION BY filename, conversation_id, turn_number, agent_id
+        ORDER BY seq DESC
+    ) = 1
+"""
+
+# Configuration from each conversation's last start event
+_CONFIGS = f"""
+    SELECT filename, conversation_id, agent_a_model, agent_b_model, initial_prompt
+    FROM ({_EVENTS})
+    WHERE event_type = 'ConversationStartEvent'
+        AND agent_a IS NOT NULL AND agent_b IS NOT NULL
+    QUALIFY row_number() OVER (
+        PARTITION BY filename, conversation_id ORDER BY seq DESC
+    ) = 1
+"""
+
+# Last thinking trace of each agent and turn
+_THINKING = f"""
+    SELECT
+        filename, conversation_id, COALESCE(turn_number, 0) AS turn_number,
+        agent_id, COALESCE(thinking_content, '') AS thinking_content,
+        thinking_tokens, duration_ms, timestamp
+    FROM ({_EVENTS})
+    WHERE event_type = 'ThinkingCompleteEvent' AND agent_id IS NOT NULL
+    QUALIFY row_number() OVER (
+        PARTITION BY filename, conversation_id, COALESCE(turn_number, 0), agent_id
+        ORDER BY seq DESC
+    ) = 1
+"""
+
+_MESSAGE_FIELDS = (
+    "prompt_tokens",
+    "completion_tokens",
+    "total_tokens",
+    "duration_ms",
+    "rate_limit_wait_ms",
+    "time_to_first_token_ms",
+    "tokens_per_second",
+)
+
+
+def _parse_timestamp(value: Optional[str]) -> datetime:
+    """Parse an event timestamp as the event reader does."""
+    return BaseDeserializer.parse_timestamp(value) if value else datetime.now()
+
+
+class EventScanner:
+    """Reads the events of an experiment into conversation data with SQL.
+
+    All event files are scanned by DuckDB's JSON reader in one pass, which
+    parses only the fields the import needs, into a temporary table. Turns,
+    their message metadata, conversation configuration and thinking traces
+    are derived from it with SQL, giving the same conversation data as
+    EventProcessor.read_jsonl_file without deserializing events in Python.
+    """
+
+    def __init__(self, db: duckdb.DuckDBPyConnection):
+        """Initialize with database connection.
+
+        Args:
+            db: DuckDB connection
+        """
+        self.db = db
+
+    def scan(
+        self, jsonl_files: Sequence[Path]
+    ) -> Optional[List[Dict[str, Dict[str, Any]]]]:
+        """Read conversation data from JSONL event files.
+
+        Args:
+            jsonl_files: Paths to JSONL files
+
+        Returns:
+            Conversation data by conversation ID for each file, in order, or
+            None if a file has legacy events or cannot be read by DuckDB
+        """
+        paths = [str(path) for path in jsonl_files]
+        columns = ", ".join(
+            f"'{name}': '{type_}'" for name, type_ in _EVENT_COLUMNS.items()
+        )
+
+        # A cursor has its own transaction and temporary tables, so a failed
+        # scan leaves the import's transaction intact
+        cursor = self.db.cursor()
+        try:
+            cursor.execute(
+                f"""
+                CREATE TEMP TABLE import_events AS
+                SELECT * FROM read_json(
+                    ?, format = 'newline_delimited', filename = true,
+                    columns = {{{columns}}}
+                )
+                """,
+                [paths],
+            )
+            if cursor.execute(_LEGACY_EVENTS).fetchone()[0]:
+                logger.info("Legacy events found, reading events in Python")
+                return None
+
+            cursor.execute(_TURNS)
+            turns = cursor.execute("SELECT * FROM import_turns ORDER BY seq").fetchall()
+            messages = cursor.execute(_TURN_MESSAGES).fetchall()
+            configs = cursor.execute(_CONFIGS).fetchall()
+            thinking = cursor.execute(_THINKING).fetchall()
+        except duckdb.Error as e:
+            logger.info(f"Could not scan events with DuckDB, reading in Python: {e}")
+            return None
+        finally:
+            cursor.close()
+
+        file_conversations: Dict[str, Dict[str, Dict[str, Any]]] = {
+            path: {} for path in paths
+        }
+
+        for (
+            _,
+            filename,
+            conversation_id,
+            turn_number,
+            timestamp,
+            convergence_score,
+            agent_a_message,
+            agent_b_message,
+            _,
+            started_at,
+        ) in turns:
+            conversations = file_conversations[filename]
+            if conversation_id not in conversations:
+                conversations[conversation_id] = {
+                    "turns": {},
+                    "config": {},
+                    # Message metadata is resolved per turn
+                    "messages": {},
+                    "turn_messages": {},
+                    "thinking": {},
+                }
+            conversations[conversation_id]["turns"][turn_number] = {
+                "timestamp": _parse_timestamp(timestamp),
+                "started_at": _parse_timestamp(started_at) if started_at else None,
+                "convergence_score": convergence_score,
+                "agent_a_message": agent_a_message,
+                "agent_b_message": agent_b_message,
+            }
+
+        # Only conversations with turns are imported
+        for filename, conversation_id, turn_number, agent_id, *values in messages:
+            conv = file_conversations[filename][conversation_id]
+            conv["turn_messages"].setdefault(turn_number, {})[agent_id] = dict(
+                zip(_MESSAGE_FIELDS, values, strict=True)
+            )
+
+        for filename, conversation_id, *values in configs:
+            conv = file_conversations[filename].get(conversation_id)
+            if conv is not None:
+                agent_a_model, agent_b_model, initial_prompt = values
+                conv["config"] = {
+                    "agent_a_model": agent_a_model,
+                    "agent_b_model": agent_b_model,
+                    # Not restored from start events by the event reader
+                    "temperature_a": None,
+                    "temperature_b": None,
+                    "initial_prompt": initial_prompt,
+                    "awareness_a": None,
+                    "awareness_b": None,
+                }
+
+        for (
+            filename,
+            conversation_id,
+            turn_number,
+            agent_id,
+            thinking_content,
+            thinking_tokens,
+            duration_ms,
+            timestamp,
+        ) in thinking:
+            conv = file_conversations[filename].get(conversation_id)
+            if conv is not None:
+                conv["thinking"][(turn_number, agent_id)] = {
+                    "thinking_content": thinking_content,
+                    "thinking_tokens": thinking_tokens,
+                    "duration_ms": duration_ms,
+                    "timestamp": _parse_timestamp(timestamp),
+                }
+
+        return [file_conversations[path] for path in paths]
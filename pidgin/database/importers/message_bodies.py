@@ -0,0 +1,66 @@
+"""Content-addressed storage of message text."""
+
+import hashlib
+from typing import Optional, Set
+
+import duckdb
+
+from .bulk_insert import BulkInserter
+
+
+def message_hash(content: Optional[str]) -> Optional[str]:
+    """Key of a message text in message_bodies.
+
+    Args:
+        content: Message text
+
+    Returns:
+        Hex SHA-256 of the UTF-8 text, as DuckDB's sha256(), or None for
+        no text
+    """
+    if content is None:
+        return None
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class MessageBodies:
+    """Message text queued for the message_bodies table.
+
+    Each distinct text is queued once per batch and inserted unless the
+    table already has it, so turns and messages that repeat a text only
+    store its hash.
+    """
+
+    def __init__(self, db: duckdb.DuckDBPyConnection):
+        """Initialize with database connection.
+
+        Args:
+            db: DuckDB connection
+        """
+        self.rows = BulkInserter(db, "message_bodies", ignore=True)
+        self._queued: Set[str] = set()
+
+    def add(self, content: Optional[str]) -> Optional[str]:
+        """Queue a message text unless it is already queued.
+
+        Args:
+            content: Message text
+
+        Returns:
+            Hash to store in place of the text
+        """
+        key = message_hash(content)
+        if key is not None and key not in self._queued:
+            self._queued.add(key)
+            self.rows.append({"message_hash": key, "content": content})
+        return key
+
+    def flush(self) -> None:
+        """Insert queued texts."""
+        self.rows.flush()
+        self._queued.clear()
+
+    def discard(self) -> None:
+        """Drop queued texts, e.g. after a failed import."""
+        self.rows.discard()
+        self._queued.clear()
@@ -1,26 +1,64 @@
 """Import metrics and turn data into database."""
 
-import hashlib
 import json
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 import duckdb
 
 from ...io.logger import get_logger
+from .bulk_insert import BulkInserter
+from .message_bodies import MessageBodies
 
 logger = get_logger("metrics_importer")
 
 
 class MetricsImporter:
-    """Handles metrics calculation and turn data import."""
+    """Handles metrics calculation and turn data import.
 
-    def __init__(self, db: duckdb.DuckDBPyConnection):
+    Rows are collected in columnar batches and written by flush(),
+    replacing those of turns imported before. Turn rows go to turn_records,
+    which references message text in message_bodies by hash.
+    """
+
+    def __init__(
+        self,
+        db: duckdb.DuckDBPyConnection,
+        message_bodies: Optional[MessageBodies] = None,
+    ):
         """Initialize with database connection.
 
         Args:
             db: DuckDB connection
+            message_bodies: Message text queue, shared with the
+                ConversationImporter so each text is queued once
         """
         self.db = db
+        self.message_bodies = message_bodies or MessageBodies(db)
+        self.turn_rows = BulkInserter(db, "turn_records", replace=True)
+        self.turn_metrics_rows = BulkInserter(db, "turn_metrics", replace=True)
+
+    def get_earlier_turns(
+        self, experiment_id: str, conversation_id: str, before_turn: int
+    ) -> List[Tuple[int, str, str]]:
+        """Get the messages of imported turns before a turn.
+
+        Args:
+            experiment_id: Experiment ID
+            conversation_id: Conversation ID
+            before_turn: First turn number not to include
+
+        Returns:
+            (turn_number, agent_a_message, agent_b_message) tuples in turn order
+        """
+        return self.db.execute(
+            """
+            SELECT turn_number, agent_a_message, agent_b_message
+            FROM conversation_turns
+            WHERE experiment_id = ? AND conversation_id = ? AND turn_number < ?
+            ORDER BY turn_number
+            """,
+            [experiment_id, conversation_id, before_turn],
+        ).fetchall()
 
     def prepare_turn_row(
         self,
@@ -32,7 +70,9 @@ class MetricsImporter:
         metrics: Dict,
         messages: Dict,
     ) -> Dict[str, Any]:
-        """Prepare a complete row for the conversation_turns table.
+        """Prepare a complete row for the turn_records table.
+
+        The turn's message text is queued for message_bodies.
 
         Args:
             experiment_id: Experiment ID
@@ -46,9 +86,8 @@ class MetricsImporter:
         Returns:
             Dictionary ready for database insertion
         """
-        # Calculate message hashes
-        a_hash = hashlib.sha256(turn_data["agent_a_message"].encode()).hexdigest()
-        b_hash = hashlib.sha256(turn_data["agent_b_message"].encode()).hexdigest()
+        agent_a = messages.get("agent_a", {})
+        agent_b = messages.get("agent_b", {})
 
         # Base row with identifiers and metadata
         row = {
@@ -64,23 +103,21 @@ class MetricsImporter:
             "temperature_a": config.get("temperature_a"),
             "temperature_b": config.get("temperature_b"),
             "initial_prompt": config.get("initial_prompt"),
-            # Message content and hashes
-            "agent_a_message": turn_data["agent_a_message"],
-            "agent_b_message": turn_data["agent_b_message"],
-            "a_message_hash": a_hash,
-            "b_message_hash": b_hash,
+            # Message text, stored once in message_bodies
+            "a_message_hash": self.message_bodies.add(turn_data["agent_a_message"]),
+            "b_message_hash": self.message_bodies.add(turn_data["agent_b_message"]),
             # Token usage
             "a_prompt_tokens": messages.get("agent_a", {}).get("prompt_tokens"),
             "a_completion_tokens": messages.get("agent_a", {}).get("completion_tokens"),
             "b_prompt_tokens": messages.get("agent_b", {}).get("prompt_tokens"),
             "b_completion_tokens": messages.get("agent_b", {}).get("completion_tokens"),
             # Timing
-            "response_time_a": messages.get("agent_a", {}).get("duration_ms"),
-            "response_time_b": messages.get("agent_b", {}).get("duration_ms"),
+            "response_time_a": agent_a.get("duration_ms"),
+            "response_time_b": agent_b.get("duration_ms"),
             "processing_time_ms": None,
-            "api_latency_a": None,
-            "api_latency_b": None,
-            "turn_duration_ms": None,
+            "api_latency_a": agent_a.get("time_to_first_token_ms"),
+            "api_latency_b": agent_b.get("time_to_first_token_ms"),
+            "turn_duration_ms": self._turn_duration_ms(turn_data, agent_a, agent_b),
             "conversation_velocity": 0.0,
             "adaptation_rate": 0.0,
         }
@@ -94,36 +131,40 @@ class MetricsImporter:
 
         return row
 
-    def insert_turn(self, row: Dict[str, Any]) -> None:
-        """Insert a turn row into the conversation_turns table.
+    def _turn_duration_ms(
+        self, turn_data: Dict, agent_a: Dict, agent_b: Dict
+    ) -> Optional[int]:
+        """Get wall-clock turn duration, falling back to summed response times.
 
         Args:
-            row: Complete row dictionary
-        """
-        # Generate INSERT statement dynamically
-        columns = list(row.keys())
-        placeholders = ", ".join(["?" for _ in columns])
-        column_names = ", ".join(columns)
-
-        query = f"""
-            INSERT INTO conversation_turns ({column_names})
-            VALUES ({placeholders})
+            turn_data: Turn data with start and completion timestamps
+            agent_a: Message metadata for agent A
+            agent_b: Message metadata for agent B
+
+        Returns:
+            Turn duration in milliseconds, or None if unknown
         """
+        started_at = turn_data.get("started_at")
+        if started_at is not None:
+            return int((turn_data["timestamp"] - started_at).total_seconds() * 1000)
+
+        durations = [agent_a.get("duration_ms"), agent_b.get("duration_ms")]
+        if all(d is not None for d in durations):
+            return sum(durations)
+        return None
 
-        values = [row[col] for col in columns]
+    def insert_turn(self, row: Dict[str, Any]) -> None:
+        """Queue a turn row for the turn_records table.
 
-        try:
-            self.db.execute(query, values)
-        except Exception as e:
-            logger.error(
-                f"Failed to insert turn {row['conversation_id']}:{row['turn_number']}: {e}"
-            )
-            raise
+        Args:
+            row: Complete row dictionary
+        """
+        self.turn_rows.append(row)
 
     def insert_turn_metrics(
         self, conversation_id: str, turn_number: int, turn_data: Dict, metrics: Dict
     ) -> None:
-        """Insert turn metrics into turn_metrics table for compatibility.
+        """Queue turn metrics for the turn_metrics table, for compatibility.
 
         Args:
             conversation_id: Conversation ID
@@ -132,31 +173,32 @@ class MetricsImporter:
             metrics: Calculated metrics
         """
         # Extract key metrics
-        self.db.execute(
-            """
-            INSERT INTO turn_metrics (
-                conversation_id, turn_number, timestamp,
-                convergence_score,
-                message_a_length, message_b_length,
-                message_a_word_count, message_b_word_count,
-                message_a_unique_words, message_b_unique_words,
-                shared_vocabulary,
-                message_a_response_time_ms, message_b_response_time_ms
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            [
-                conversation_id,
-                turn_number,
-                turn_data["timestamp"],
-                turn_data.get("convergence_score"),
-                metrics.get("a_message_length"),
-                metrics.get("b_message_length"),
-                metrics.get("a_word_count"),
-                metrics.get("b_word_count"),
-                metrics.get("a_unique_words"),
-                metrics.get("b_unique_words"),
-                json.dumps(metrics.get("shared_vocabulary", [])),
-                metrics.get("response_time_a"),
-                metrics.get("response_time_b"),
-            ],
+        self.turn_metrics_rows.append(
+            {
+                "conversation_id": conversation_id,
+                "turn_number": turn_number,
+                "timestamp": turn_data["timestamp"],
+                "convergence_score": turn_data.get("convergence_score"),
+                "message_a_length": metrics.get("a_message_length"),
+                "message_b_length": metrics.get("b_message_length"),
+                "message_a_word_count": metrics.get("a_word_count"),
+                "message_b_word_count": metrics.get("b_word_count"),
+                "message_a_unique_words": metrics.get("a_unique_words"),
+                "message_b_unique_words": metrics.get("b_unique_words"),
+                "shared_vocabulary": json.dumps(metrics.get("shared_vocabulary", [])),
+                "message_a_response_time_ms": metrics.get("response_time_a"),
+                "message_b_response_time_ms": metrics.get("response_time_b"),
+            }
         )
+
+    def flush(self) -> None:
+        """Insert queued message text, turn_records and turn_metrics rows."""
+        self.message_bodies.flush()
+        self.turn_rows.flush()
+        self.turn_metrics_rows.flush()
+
+    def discard(self) -> None:
+        """Drop queued rows, e.g. after a failed import."""
+        self.message_bodies.discard()
+        self.turn_rows.discard()
+        self.turn_metrics_rows.discard()
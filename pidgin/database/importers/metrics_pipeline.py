@@ -0,0 +1,190 @@
+"""Calculate conversation metrics for import, serially or in worker processes."""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ...io.logger import get_logger
+from ...metrics.batch_calculator import BatchMetricsCalculator
+from ...metrics.flat_calculator import FlatMetricsCalculator
+from ...metrics.semantic import HashedEmbedder
+
+logger = get_logger("metrics_pipeline")
+
+# "turn" calculates metrics turn by turn; "batch" uses BatchMetricsCalculator
+METRICS_ENGINES = ("turn", "batch")
+
+# (turn_number, agent_a_message, agent_b_message)
+TurnMessages = Tuple[int, str, str]
+
+# (turns by turn number, turn numbers in order, initial prompt, earlier turns)
+ConversationJob = Tuple[
+    Dict[int, Dict[str, Any]], List[int], Optional[str], List[TurnMessages]
+]
+
+# Metrics of one conversation as column name -> one value per turn
+MetricColumns = Dict[str, List[Any]]
+
+
+class MetricsPipeline:
+    """Calculates the flat metrics of whole conversations.
+
+    Combines the turn metrics of the selected engine with semantic
+    similarity from a HashedEmbedder fitted to the corpus being imported.
+    Conversations are independent, so calculate_many can spread them over
+    worker processes, each with its own calculators.
+    """
+
+    def __init__(self, metrics_engine: str = "turn", workers: int = 1):
+        """Initialize pipeline.
+
+        Args:
+            metrics_engine: "turn" or "batch" (see METRICS_ENGINES)
+            workers: Worker processes for calculate_many; 1 calculates in
+                this process, 0 uses one per CPU core
+
+        Raises:
+            ValueError: If the engine is unknown or workers is negative
+        """
+        if metrics_engine not in METRICS_ENGINES:
+            raise ValueError(
+                f"Unknown metrics engine '{metrics_engine}', "
+                f"expected one of {', '.join(METRICS_ENGINES)}"
+            )
+        if workers < 0:
+            raise ValueError(f"workers must be 0 or more, got {workers}")
+        self.metrics_engine = metrics_engine
+        self.workers = workers or multiprocessing.cpu_count()
+        # Words are interned once per corpus and shared by its conversations
+        self.token_index: Dict[str, int] = {}
+        self.metrics_calculator = FlatMetricsCalculator(self.token_index)
+        # Shared across files so repeated messages are only analyzed once
+        self.batch_calculator = (
+            BatchMetricsCalculator() if metrics_engine == "batch" else None
+        )
+        self.embedder = HashedEmbedder()
+
+    def fit_corpus(self, messages: Iterable[str]) -> None:
+        """Start a new corpus for semantic similarity weights.
+
+        Args:
+            messages: Every message of the corpus
+        """
+        self.embedder = HashedEmbedder()
+        self.token_index.clear()
+        self.metrics_calculator.clear_cache()
+        self.embedder.fit(messages)
+
+    def calculate(
+        self,
+        turns: Dict[int, Dict[str, Any]],
+        turn_numbers: List[int],
+        initial_prompt: Optional[str] = None,
+        history: Sequence[TurnMessages] = (),
+    ) -> List[Dict[str, Any]]:
+        """Calculate flat metrics for the turns of one conversation.
+
+        Turns continuing a conversation whose earlier turns were calculated
+        before are given those turns as history. They are replayed to
+        restore the calculators' conversation state, without calculating
+        their metrics again.
+
+        Args:
+            turns: Turn data by turn number
+            turn_numbers: Turn numbers in order
+            initial_prompt: Prompt the conversation started from, if known
+            history: Earlier turns of the conversation, in order
+
+        Returns:
+            Flat metrics for each turn, in the same order
+        """
+        messages = [
+            (n, turns[n]["agent_a_message"], turns[n]["agent_b_message"])
+            for n in turn_numbers
+        ]
+        if self.batch_calculator:
+            results = self.batch_calculator.calculate_conversation(messages, history)
+        else:
+            self.metrics_calculator.reset()
+            for _, agent_a_message, agent_b_message in history:
+                self.metrics_calculator.replay_turn(agent_a_message, agent_b_message)
+            results = [
+                self.metrics_calculator.calculate_turn_metrics(*message)
+                for message in messages
+            ]
+
+        semantic = self.embedder.calculate_conversation(
+            initial_prompt, messages, history[-1] if history else None
+        )
+        for flat_metrics, similarities in zip(results, semantic, strict=True):
+            flat_metrics.update(similarities)
+        return results
+
+    def calculate_many(
+        self, jobs: Sequence[ConversationJob]
+    ) -> List[List[Dict[str, Any]]]:
+        """Calculate flat metrics for several conversations.
+
+        With more than one worker, conversations are calculated in a pool
+        of worker processes, which return each conversation's metrics as
+        columns to keep transfers small.
+
+        Args:
+            jobs: (turns, turn_numbers, initial_prompt, history) per
+                conversation
+
+        Returns:
+            Flat metrics per turn for each conversation, in job order
+        """
+        workers = min(self.workers, len(jobs))
+        if workers <= 1:
+            return [self.calculate(*job) for job in jobs]
+
+        logger.debug(
+            f"Calculating metrics of {len(jobs)} conversations in {workers} processes"
+        )
+        # Spawned rather than forked: the importing process holds a DuckDB
+        # connection and threads that children must not inherit
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.metrics_engine, self.embedder),
+        ) as pool:
+            chunksize = max(1, len(jobs) // (workers * 4))
+            return [
+                _from_columns(columns)
+                for columns in pool.map(_calculate_columns, jobs, chunksize=chunksize)
+            ]
+
+
+# Pipeline of the current worker process, set by _init_worker
+_worker_pipeline: Optional[MetricsPipeline] = None
+
+
+def _init_worker(metrics_engine: str, embedder: HashedEmbedder) -> None:
+    """Give a worker process its own calculators and the fitted embedder."""
+    global _worker_pipeline
+    _worker_pipeline = MetricsPipeline(metrics_engine)
+    _worker_pipeline.embedder = embedder
+
+
+def _calculate_columns(job: ConversationJob) -> MetricColumns:
+    """Calculate one conversation's metrics in a worker process."""
+    assert _worker_pipeline is not None, "worker not initialized"
+    return _to_columns(_worker_pipeline.calculate(*job))
+
+
+def _to_columns(rows: List[Dict[str, Any]]) -> MetricColumns:
+    """Transpose per-turn metric dictionaries, which share their keys."""
+    if not rows:
+        return {}
+    return {key: [row[key] for row in rows] for key in rows[0]}
+
+
+def _from_columns(columns: MetricColumns) -> List[Dict[str, Any]]:
+    """Rebuild per-turn metric dictionaries from columns."""
+    return [
+        dict(zip(columns, values, strict=True))
+        for values in zip(*columns.values(), strict=True)
+    ]
@@ -5,12 +5,17 @@ from typing import Any, Dict, List, Optional
 
 from ..io.logger import get_logger
 from .base_repository import BaseRepository
+from .importers.message_bodies import message_hash
 
 logger = get_logger("message_repository")
 
 
 class MessageRepository(BaseRepository):
-    """Repository for message storage and retrieval operations."""
+    """Repository for message storage and retrieval operations.
+
+    Messages are stored in message_records, which references their text in
+    message_bodies by hash, and read through the messages view.
+    """
 
     def save_message(
         self,
@@ -18,7 +23,7 @@ class MessageRepository(BaseRepository):
         turn_number: int,
         agent_id: str,
         role: str,
-        content: str,
+        content: Optional[str],
         tokens_used: Optional[int] = None,
     ):
         """Save a message.
@@ -28,13 +33,21 @@ class MessageRepository(BaseRepository):
             turn_number: Turn number
             agent_id: Agent ID
             role: Message role
-            content: Message content
+            content: Message content; None is stored as a NULL hash
             tokens_used: Optional token count
         """
+        content_hash = message_hash(content)
+        if content_hash is not None:
+            self.execute(
+                "INSERT OR IGNORE INTO message_bodies (message_hash, content) "
+                "VALUES (?, ?)",
+                [content_hash, content],
+            )
+
         query = """
-            INSERT INTO messages (
+            INSERT INTO message_records (
                 conversation_id, turn_number, agent_id,
-                content, timestamp, token_count
+                message_hash, timestamp, token_count
             ) VALUES (?, ?, ?, ?, ?, ?)
         """
 
@@ -44,7 +57,7 @@ class MessageRepository(BaseRepository):
                 conversation_id,
                 turn_number,
                 agent_id,
-                content,
+                content_hash,
                 datetime.now(),
                 tokens_used or 0,
             ],
@@ -110,7 +123,7 @@ class MessageRepository(BaseRepository):
         Returns:
             Number of messages
         """
-        return self.count("messages", conversation_id=conversation_id)
+        return self.count("message_records", conversation_id=conversation_id)
 
     def get_total_tokens(self, conversation_id: str) -> int:
         """Get total token count for a conversation.
@@ -122,7 +135,7 @@ class MessageRepository(BaseRepository):
             Total tokens used
         """
         result = self.fetchone(
-            "SELECT SUM(token_count) FROM messages WHERE conversation_id = ?",
+            "SELECT SUM(token_count) FROM message_records WHERE conversation_id = ?",
             [conversation_id],
         )
         return result[0] if result and result[0] else 0
@@ -134,10 +147,28 @@ class MessageRepository(BaseRepository):
             conversation_id: Conversation ID
         """
         self.execute(
-            "DELETE FROM messages WHERE conversation_id = ?", [conversation_id]
+            "DELETE FROM message_records WHERE conversation_id = ?", [conversation_id]
         )
         logger.debug(f"Deleted messages for conversation {conversation_id}")
 
+    def delete_unreferenced_bodies(self):
+        """Delete message text no longer used by any message or turn."""
+        self.execute(
+            """
+            DELETE FROM message_bodies
+            WHERE message_hash NOT IN (
+                SELECT message_hash FROM message_records
+                WHERE message_hash IS NOT NULL
+                UNION
+                SELECT a_message_hash FROM turn_records
+                WHERE a_message_hash IS NOT NULL
+                UNION
+                SELECT b_message_hash FROM turn_records
+                WHERE b_message_hash IS NOT NULL
+            )
+            """
+        )
+
     def get_agent_message_stats(
         self, conversation_id: str, agent_id: str
     ) -> Dict[str, Any]:
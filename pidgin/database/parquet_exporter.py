@@ -0,0 +1,155 @@
+"""Export experiment data to a Hive-partitioned Parquet archive."""
+
+import shutil
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+from urllib.parse import quote
+
+import duckdb
+
+from ..io.logger import get_logger
+from .base_repository import BaseRepository
+
+logger = get_logger("parquet_exporter")
+
+# Partition directories below each table's directory
+PARTITION_COLUMNS = ("experiment_id", "model_pair")
+
+# Rows exported per table, with the partition columns. Sorted so that the
+# min/max statistics of each row group cover narrow ranges.
+_EXPORTS = {
+    "conversation_turns": """
+        SELECT c.*, {model_pair} AS model_pair
+        FROM conversation_turns c
+        WHERE c.experiment_id = ?
+        ORDER BY c.conversation_id, c.turn_number
+    """,
+    "messages": """
+        SELECT m.*, c.experiment_id, {model_pair} AS model_pair
+        FROM messages m
+        JOIN conversations c USING (conversation_id)
+        WHERE c.experiment_id = ?
+        ORDER BY m.conversation_id, m.turn_number, m.agent_id
+    """,
+    "thinking_traces": """
+        SELECT t.*, c.experiment_id, {model_pair} AS model_pair
+        FROM thinking_traces t
+        JOIN conversations c USING (conversation_id)
+        WHERE c.experiment_id = ?
+        ORDER BY t.conversation_id, t.turn_number, t.agent_id
+    """,
+    "token_usage": """
+        SELECT u.*, c.experiment_id, {model_pair} AS model_pair
+        FROM token_usage u
+        JOIN conversations c USING (conversation_id)
+        WHERE c.experiment_id = ?
+        ORDER BY u.conversation_id, u.timestamp
+    """,
+}
+_MODEL_PAIR = (
+    "COALESCE(c.agent_a_model, 'unknown') || '__' || "
+    "COALESCE(c.agent_b_model, 'unknown')"
+)
+
+EXPORT_TABLES = tuple(_EXPORTS)
+
+
+def partition_dir(output_dir: Path, table: str, experiment_id: str) -> Path:
+    """Directory of an experiment's partition of an exported table.
+
+    Args:
+        output_dir: Root directory of the archive
+        table: Exported table name
+        experiment_id: Experiment ID
+
+    Returns:
+        Path of the experiment_id=... directory, URL-encoded as by DuckDB
+    """
+    return output_dir / table / f"experiment_id={quote(experiment_id, safe='')}"
+
+
+class ParquetExporter(BaseRepository):
+    """Writes experiments to a Parquet archive partitioned like a Hive table.
+
+    Each table is written below output_dir/<table>/ into
+    experiment_id=<id>/model_pair=<agent_a_model>__<agent_b_model>/
+    directories as zstd-compressed Parquet files. Readers such as DuckDB's
+    read_parquet(..., hive_partitioning = true) skip the files of other
+    experiments and model pairs when a query filters on them, and skip row
+    groups by their min/max statistics, so many experiments can be
+    analyzed without loading them into one database file.
+    """
+
+    def __init__(self, db: duckdb.DuckDBPyConnection, row_group_size: int = 100000):
+        """Initialize exporter.
+
+        Args:
+            db: DuckDB connection to export from
+            row_group_size: Rows per Parquet row group
+        """
+        super().__init__(db)
+        self.row_group_size = row_group_size
+
+    def export_experiment(self, experiment_id: str, output_dir: Path) -> Dict[str, int]:
+        """Export an experiment, replacing an earlier export of it.
+
+        Args:
+            experiment_id: Experiment ID
+            output_dir: Root directory of the archive
+
+        Returns:
+            Rows exported by table name
+        """
+        counts = {}
+        for table, query in _EXPORTS.items():
+            partition = partition_dir(output_dir, table, experiment_id)
+            if partition.exists():
+                shutil.rmtree(partition)
+            table_dir = output_dir / table
+            table_dir.mkdir(parents=True, exist_ok=True)
+
+            result = self.fetchone(
+                f"""
+                COPY ({query.format(model_pair=_MODEL_PAIR)})
+                TO '{table_dir.as_posix().replace("'", "''")}' (
+                    FORMAT parquet,
+                    PARTITION_BY ({", ".join(PARTITION_COLUMNS)}),
+                    COMPRESSION zstd,
+                    ROW_GROUP_SIZE {int(self.row_group_size)},
+                    APPEND
+                )
+                """,
+                [experiment_id],
+            )
+            counts[table] = result[0] if result else 0
+
+        logger.info(
+            f"Exported {experiment_id} to {output_dir}: "
+            + ", ".join(f"{count} {table}" for table, count in counts.items())
+        )
+        return counts
+
+    def export_experiments(
+        self, output_dir: Path, experiment_ids: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, int]]:
+        """Export several experiments.
+
+        Args:
+            output_dir: Root directory of the archive
+            experiment_ids: Experiments to export; all imported ones if None
+
+        Returns:
+            Rows exported by table name, by experiment ID
+        """
+        if experiment_ids is None:
+            experiment_ids = [
+                row[0]
+                for row in self.fetchall(
+                    "SELECT DISTINCT experiment_id FROM turn_records "
+                    "ORDER BY experiment_id"
+                )
+            ]
+        return {
+            experiment_id: self.export_experiment(experiment_id, output_dir)
+            for experiment_id in experiment_ids
+        }
@@ -19,14 +19,20 @@ def _load_schema(name: str) -> str:
 
 
 # Schema constants - loaded from files
+MESSAGE_BODIES_SCHEMA = _load_schema("message_bodies")
 CONVERSATION_TURNS_SCHEMA = _load_schema("conversation_turns")
 EVENT_SCHEMA = _load_schema("events")
 EXPERIMENTS_SCHEMA = _load_schema("experiments")
 CONVERSATIONS_SCHEMA = _load_schema("conversations")
 TURN_METRICS_SCHEMA = _load_schema("turn_metrics")
 MESSAGES_SCHEMA = _load_schema("messages")
+THINKING_TRACES_SCHEMA = _load_schema("thinking_traces")
 TOKEN_USAGE_SCHEMA = _load_schema("token_usage")
 CONTEXT_TRUNCATIONS_SCHEMA = _load_schema("context_truncations")
+MINHASH_INDEX_SCHEMA = _load_schema("minhash_index")
+IMPORT_LEDGER_SCHEMA = _load_schema("import_ledger")
+SUMMARIES_SCHEMA = _load_schema("summaries")
+SCHEMA_METADATA_SCHEMA = _load_schema("schema_metadata")
 MATERIALIZED_VIEWS = _load_schema("views")
 
 
@@ -35,11 +41,17 @@ def get_all_schemas():
     return [
         EXPERIMENTS_SCHEMA,
         CONVERSATIONS_SCHEMA,
+        MESSAGE_BODIES_SCHEMA,
         CONVERSATION_TURNS_SCHEMA,
         EVENT_SCHEMA,
         TURN_METRICS_SCHEMA,
         MESSAGES_SCHEMA,
+        THINKING_TRACES_SCHEMA,
         TOKEN_USAGE_SCHEMA,
         CONTEXT_TRUNCATIONS_SCHEMA,
+        MINHASH_INDEX_SCHEMA,
+        IMPORT_LEDGER_SCHEMA,
+        SUMMARIES_SCHEMA,
+        SCHEMA_METADATA_SCHEMA,
         MATERIALIZED_VIEWS,
     ]
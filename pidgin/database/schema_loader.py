@@ -1,7 +1,21 @@
 """Schema loader for DuckDB database schemas."""
 
+import re
 from pathlib import Path
-from typing import List
+from typing import List, NamedTuple
+
+# Migration files are named like 001_description.sql, with optional
+# statements to run after the schema files in 001_description.after.sql
+_MIGRATION_FILE = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+
+class Migration(NamedTuple):
+    """A versioned schema change for existing databases."""
+
+    version: int
+    name: str
+    sql: str
+    after_sql: str = ""  # Run once the schema files created the current tables
 
 
 class SchemaLoader:
@@ -9,6 +23,7 @@ class SchemaLoader:
 
     def __init__(self):
         self.schemas_dir = Path(__file__).parent / "schemas"
+        self.migrations_dir = self.schemas_dir / "migrations"
 
     def load_schema(self, name: str) -> str:
         """Load a schema by name.
@@ -41,11 +56,16 @@ class SchemaLoader:
             "experiments",
             "conversations",
             "turn_metrics",
+            "message_bodies",  # Text of turns and messages, by hash
             "conversation_turns",  # Wide-table schema
             "messages",
             "thinking_traces",  # Extended thinking/reasoning traces
             "token_usage",
             "context_truncations",
+            "minhash_index",  # Near-duplicate text index
+            "import_ledger",  # Progress of incremental imports
+            "summaries",  # Aggregates maintained by imports
+            "schema_metadata",  # Schema fingerprint and migration version
             # Views are optional and created separately
         ]
 
@@ -69,17 +89,57 @@ class SchemaLoader:
         DROP VIEW IF EXISTS vocabulary_analysis CASCADE;
         DROP VIEW IF EXISTS convergence_trends CASCADE;
         DROP VIEW IF EXISTS experiment_dashboard CASCADE;
+        DROP TABLE IF EXISTS schema_metadata CASCADE;
+        DROP TABLE IF EXISTS model_pair_summaries CASCADE;
+        DROP TABLE IF EXISTS experiment_summaries CASCADE;
+        DROP TABLE IF EXISTS conversation_summaries CASCADE;
+        DROP TABLE IF EXISTS import_ledger CASCADE;
+        DROP TABLE IF EXISTS minhash_bands CASCADE;
+        DROP TABLE IF EXISTS minhash_signatures CASCADE;
+        DROP SEQUENCE IF EXISTS minhash_item_id_seq CASCADE;
         DROP TABLE IF EXISTS context_truncations CASCADE;
         DROP TABLE IF EXISTS token_usage CASCADE;
         DROP TABLE IF EXISTS thinking_traces CASCADE;
-        DROP TABLE IF EXISTS messages CASCADE;
+        DROP VIEW IF EXISTS messages CASCADE;
+        DROP TABLE IF EXISTS message_records CASCADE;
         DROP TABLE IF EXISTS turn_metrics CASCADE;
-        DROP TABLE IF EXISTS conversation_turns CASCADE;
+        DROP VIEW IF EXISTS conversation_turns CASCADE;
+        DROP TABLE IF EXISTS turn_records CASCADE;
+        DROP TABLE IF EXISTS message_bodies CASCADE;
         DROP TABLE IF EXISTS conversations CASCADE;
         DROP TABLE IF EXISTS experiments CASCADE;
         DROP TABLE IF EXISTS events CASCADE;
         """
 
+    def get_migrations(self) -> List[Migration]:
+        """Get schema migrations in the order they are applied.
+
+        Each migration brings databases created by older versions of the
+        schema files up to date, e.g. adding columns or dropping replaced
+        indexes. Migrations must tolerate tables that do not exist yet,
+        which the schema files create afterwards. Statements that need
+        the current tables, e.g. to copy rows into a rebuilt table, go in
+        the migration's .after.sql file.
+
+        Returns:
+            Migrations sorted by version
+        """
+        migrations = []
+        if self.migrations_dir.is_dir():
+            for path in self.migrations_dir.iterdir():
+                match = _MIGRATION_FILE.match(path.name)
+                if match:
+                    after_path = path.with_suffix(".after.sql")
+                    migrations.append(
+                        Migration(
+                            int(match[1]),
+                            match[2],
+                            path.read_text(),
+                            after_path.read_text() if after_path.exists() else "",
+                        )
+                    )
+        return sorted(migrations)
+
     def get_views_sql(self) -> str:
         """Get SQL for creating views.
 
@@ -99,6 +159,12 @@ def get_all_schemas() -> List[str]:
     return loader.get_all_schemas()
 
 
+def get_migrations() -> List[Migration]:
+    """Get schema migrations in the order they are applied."""
+    loader = SchemaLoader()
+    return loader.get_migrations()
+
+
 def get_drop_all_sql() -> str:
     """Get SQL to drop all tables (for clean migrations)."""
     loader = SchemaLoader()
@@ -1,19 +1,45 @@
 """Schema manager with caching to avoid repeated schema checks."""
 
+import hashlib
 import os
 import threading
-from typing import Set
+from typing import Dict, Set
 
 import duckdb
 
 from ..io.logger import get_logger
 from .schema import get_all_schemas
+from .schema_loader import get_migrations
 
 logger = get_logger("schema_manager")
 
 
+def schema_fingerprint() -> str:
+    """Hash of all schema and migration SQL.
+
+    Returns:
+        Hex digest that changes whenever any schema file changes
+    """
+    digest = hashlib.sha256()
+    for schema_sql in get_all_schemas():
+        digest.update(schema_sql.encode())
+    for migration in get_migrations():
+        digest.update(
+            f"{migration.version}:{migration.sql}:{migration.after_sql}".encode()
+        )
+    return digest.hexdigest()
+
+
 class SchemaManager:
-    """Schema manager that ensures schema is created only once per session."""
+    """Schema manager that ensures schema is created only once per session.
+
+    Databases record the fingerprint of the schema they were created or
+    last updated with in schema_metadata. When it matches the current
+    schema files, nothing is executed; otherwise pending migrations are
+    applied in version order, the schema files are executed, followed by
+    the pending migrations' .after.sql statements, and the new fingerprint
+    is recorded, all in one transaction.
+    """
 
     def __init__(self) -> None:
         self._lock = threading.Lock()
@@ -39,17 +65,79 @@ class SchemaManager:
             if cache_key in self._initialized_databases:
                 return
 
-            logger.debug(f"Initializing schema for {cache_key}")
-
-            # Create all tables
-            for schema_sql in get_all_schemas():
-                db.execute(schema_sql)
+            fingerprint = schema_fingerprint()
+            metadata = self._read_metadata(db)
+            if metadata.get("fingerprint") == fingerprint:
+                logger.debug(f"Schema of {cache_key} is current")
+            else:
+                logger.debug(f"Initializing schema for {cache_key}")
+                self._update_schema(db, metadata, fingerprint)
 
             # Mark as initialized
             self._initialized_databases.add(cache_key)
 
             logger.debug(f"Schema initialized for {cache_key}")
 
+    def _read_metadata(self, db: duckdb.DuckDBPyConnection) -> Dict[str, str]:
+        """Read schema_metadata, empty for databases without it."""
+        try:
+            return dict(db.execute("SELECT key, value FROM schema_metadata").fetchall())
+        except duckdb.CatalogException:
+            return {}
+
+    def _update_schema(
+        self,
+        db: duckdb.DuckDBPyConnection,
+        metadata: Dict[str, str],
+        fingerprint: str,
+    ) -> None:
+        """Apply pending migrations and the schema files.
+
+        Args:
+            db: DuckDB connection
+            metadata: Current schema_metadata entries
+            fingerprint: Fingerprint of the current schema files
+        """
+        migrations = get_migrations()
+        latest = migrations[-1].version if migrations else 0
+        if "migration_version" in metadata:
+            applied = int(metadata["migration_version"])
+        else:
+            # Databases from before versioning need every migration, new
+            # ones none, as the schema files create the current tables
+            has_tables = db.execute(
+                "SELECT count(*) FROM duckdb_tables() WHERE NOT temporary"
+            ).fetchone()[0]
+            applied = 0 if has_tables else latest
+
+        db.execute("BEGIN TRANSACTION")
+        try:
+            pending = [m for m in migrations if m.version > applied]
+            for migration in pending:
+                logger.info(
+                    f"Applying schema migration {migration.version}: {migration.name}"
+                )
+                db.execute(migration.sql)
+
+            for schema_sql in get_all_schemas():
+                db.execute(schema_sql)
+
+            for migration in pending:
+                if migration.after_sql:
+                    db.execute(migration.after_sql)
+
+            db.executemany(
+                "INSERT OR REPLACE INTO schema_metadata (key, value) VALUES (?, ?)",
+                [
+                    ["fingerprint", fingerprint],
+                    ["migration_version", str(max(applied, latest))],
+                ],
+            )
+            db.execute("COMMIT")
+        except Exception:
+            db.execute("ROLLBACK")
+            raise
+
     def clear_cache(self) -> None:
         """Clear the schema cache (useful for testing)."""
         with self._lock:
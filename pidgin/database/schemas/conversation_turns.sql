@@ -1,8 +1,10 @@
 -- Optimized DuckDB Schema for Pidgin Conversation Metrics
 -- Designed for 150+ metrics with wide-table optimization
 
--- Main conversation turns table
-CREATE TABLE IF NOT EXISTS conversation_turns (
+-- Main conversation turns table. Message text is stored once per distinct
+-- text in message_bodies and referenced by hash; the conversation_turns
+-- view below has the columns of the table as it was before
+CREATE TABLE IF NOT EXISTS turn_records (
     -- Primary identifiers (12 bytes)
     experiment_id VARCHAR NOT NULL,
     conversation_id VARCHAR NOT NULL,
@@ -20,11 +22,11 @@ CREATE TABLE IF NOT EXISTS conversation_turns (
     temperature_b DOUBLE,
     initial_prompt TEXT,
 
-    -- Message content and hashes (variable, ~1-2KB typical)
-    agent_a_message TEXT,
-    agent_b_message TEXT,
-    a_message_hash VARCHAR(64),  -- SHA256 for deduplication
+    -- Message hashes, keys of message_bodies
+    a_message_hash VARCHAR(64),  -- SHA256 of agent A's message
     b_message_hash VARCHAR(64),
+    a_minhash UINTEGER[],  -- MinHash of word 3-grams, for near-duplicate search
+    b_minhash UINTEGER[],
 
     -- Token usage for cost tracking (16 bytes)
     a_prompt_tokens INTEGER,
@@ -57,6 +59,8 @@ CREATE TABLE IF NOT EXISTS conversation_turns (
     a_character_entropy DOUBLE NOT NULL DEFAULT 0.0,
     a_bigram_entropy DOUBLE NOT NULL DEFAULT 0.0,
     a_compression_ratio DOUBLE NOT NULL DEFAULT 0.0,
+    a_cumulative_compression_ratio DOUBLE NOT NULL DEFAULT 0.0,  -- All of A's messages so far
+    a_marginal_compression_ratio DOUBLE NOT NULL DEFAULT 0.0,  -- This message given earlier ones
 
     -- Symbol & punctuation (9 bytes + 8 for density)
     a_symbol_density DOUBLE NOT NULL DEFAULT 0.0,
@@ -109,6 +113,8 @@ CREATE TABLE IF NOT EXISTS conversation_turns (
     -- Repetition and novelty (8 bytes)
     a_turn_repetition DOUBLE NOT NULL DEFAULT 0.0,
     a_new_words INTEGER NOT NULL DEFAULT 0,
+    a_prompt_similarity DOUBLE NOT NULL DEFAULT 0.0,  -- Hashed TF-IDF cosine
+    a_self_similarity DOUBLE NOT NULL DEFAULT 0.0,  -- vs own previous turn
 
     -- ========== AGENT B METRICS ========== --
     -- (Identical structure to Agent A)
@@ -133,6 +139,8 @@ CREATE TABLE IF NOT EXISTS conversation_turns (
     b_character_entropy DOUBLE NOT NULL DEFAULT 0.0,
     b_bigram_entropy DOUBLE NOT NULL DEFAULT 0.0,
     b_compression_ratio DOUBLE NOT NULL DEFAULT 0.0,
+    b_cumulative_compression_ratio DOUBLE NOT NULL DEFAULT 0.0,  -- All of B's messages so far
+    b_marginal_compression_ratio DOUBLE NOT NULL DEFAULT 0.0,  -- This message given earlier ones
 
     b_symbol_density DOUBLE NOT NULL DEFAULT 0.0,
     b_emoji_count TINYINT NOT NULL DEFAULT 0,
@@ -179,6 +187,8 @@ CREATE TABLE IF NOT EXISTS conversation_turns (
 
     b_turn_repetition DOUBLE NOT NULL DEFAULT 0.0,
     b_new_words INTEGER NOT NULL DEFAULT 0,
+    b_prompt_similarity DOUBLE NOT NULL DEFAULT 0.0,  -- Hashed TF-IDF cosine
+    b_self_similarity DOUBLE NOT NULL DEFAULT 0.0,  -- vs own previous turn
 
     -- ========== CONVERGENCE METRICS ========== --
     -- (Measured between agents, 160 bytes)
@@ -187,7 +197,7 @@ CREATE TABLE IF NOT EXISTS conversation_turns (
     length_convergence DOUBLE NOT NULL DEFAULT 0.0,
     style_similarity DOUBLE NOT NULL DEFAULT 0.0,
     structural_similarity DOUBLE NOT NULL DEFAULT 0.0,
-    semantic_similarity DOUBLE NOT NULL DEFAULT 0.0,
+    semantic_similarity DOUBLE NOT NULL DEFAULT 0.0,  -- Hashed TF-IDF cosine, A vs B
     mimicry_score_a_to_b DOUBLE NOT NULL DEFAULT 0.0,
     mimicry_score_b_to_a DOUBLE NOT NULL DEFAULT 0.0,
     sentiment_convergence DOUBLE NOT NULL DEFAULT 0.0,
@@ -203,6 +213,8 @@ CREATE TABLE IF NOT EXISTS conversation_turns (
     prosodic_alignment DOUBLE NOT NULL DEFAULT 0.0,
     discourse_coherence DOUBLE NOT NULL DEFAULT 0.0,
     cumulative_convergence DOUBLE NOT NULL DEFAULT 0.0,
+    cumulative_compression_ratio DOUBLE NOT NULL DEFAULT 0.0,  -- Whole conversation so far
+    marginal_compression_ratio DOUBLE NOT NULL DEFAULT 0.0,  -- This turn given earlier ones
 
     -- ========== TEMPORAL & META ========== --
     -- (64 bytes)
@@ -221,7 +233,32 @@ CREATE TABLE IF NOT EXISTS conversation_turns (
 );
 
 -- Indexes for common query patterns
-CREATE INDEX IF NOT EXISTS idx_conversation_turns_timestamp ON conversation_turns(timestamp);
-CREATE INDEX IF NOT EXISTS idx_conversation_turns_experiment_timestamp ON conversation_turns(experiment_id, timestamp);
-CREATE INDEX IF NOT EXISTS idx_conversation_turns_convergence ON conversation_turns(overall_convergence);
-CREATE INDEX IF NOT EXISTS idx_conversation_turns_models ON conversation_turns(agent_a_model, agent_b_model);
+CREATE INDEX IF NOT EXISTS idx_turn_records_timestamp ON turn_records(timestamp);
+CREATE INDEX IF NOT EXISTS idx_turn_records_experiment_timestamp ON turn_records(experiment_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_turn_records_convergence ON turn_records(overall_convergence);
+CREATE INDEX IF NOT EXISTS idx_turn_records_models ON turn_records(agent_a_model, agent_b_model);
+
+-- Turns with their message text
+CREATE OR REPLACE VIEW conversation_turns AS
+SELECT
+    t.experiment_id,
+    t.conversation_id,
+    t.turn_number,
+    t.timestamp,
+    t.agent_a_model,
+    t.agent_b_model,
+    t.awareness_a,
+    t.awareness_b,
+    t.temperature_a,
+    t.temperature_b,
+    t.initial_prompt,
+    a.content AS agent_a_message,
+    b.content AS agent_b_message,
+    t.* EXCLUDE (
+        experiment_id, conversation_id, turn_number, timestamp,
+        agent_a_model, agent_b_model, awareness_a, awareness_b,
+        temperature_a, temperature_b, initial_prompt
+    )
+FROM turn_records t
+LEFT JOIN message_bodies a ON a.message_hash = t.a_message_hash
+LEFT JOIN message_bodies b ON b.message_hash = t.b_message_hash;
@@ -13,7 +13,8 @@ CREATE TABLE IF NOT EXISTS events (
 );
 
 -- Indexes for performance
-CREATE INDEX IF NOT EXISTS idx_events_conversation ON events(conversation_id);
+-- Also orders each conversation's events and finds its last sequence
+CREATE INDEX IF NOT EXISTS idx_events_conv_seq ON events(conversation_id, sequence);
 CREATE INDEX IF NOT EXISTS idx_events_experiment ON events(experiment_id);
 CREATE INDEX IF NOT EXISTS idx_events_type ON events(event_type);
 CREATE INDEX IF NOT EXISTS idx_events_date ON events(event_date);
@@ -0,0 +1,13 @@
+-- How far each experiment JSONL file has been imported, so later imports
+-- only read what was appended since
+CREATE TABLE IF NOT EXISTS import_ledger (
+    experiment_id TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    file_size BIGINT NOT NULL,  -- Size when last imported
+    file_mtime DOUBLE NOT NULL,  -- Modification time when last imported
+    byte_offset BIGINT NOT NULL,  -- End of the last completed turn read
+    last_turn INTEGER,  -- Last turn number imported from the file
+    imported_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (experiment_id, file_name)
+);
@@ -0,0 +1,6 @@
+-- Message text, stored once however many turns repeat it, e.g. when a
+-- conversation settles into exchanging the same messages
+CREATE TABLE IF NOT EXISTS message_bodies (
+    message_hash VARCHAR(64) PRIMARY KEY,  -- SHA256 of the text
+    content TEXT NOT NULL
+);
@@ -1,9 +1,10 @@
--- Messages table
-CREATE TABLE IF NOT EXISTS messages (
+-- Messages table. Text is stored in message_bodies and referenced by hash;
+-- the messages view below has the columns of the table as it was before
+CREATE TABLE IF NOT EXISTS message_records (
     conversation_id TEXT,
     turn_number INTEGER,
     agent_id TEXT,
-    content TEXT,
+    message_hash VARCHAR(64),  -- Key of message_bodies
     timestamp TIMESTAMP DEFAULT now(),
 
     -- Token information
@@ -16,10 +17,23 @@ CREATE TABLE IF NOT EXISTS messages (
 );
 
 -- Indexes for message queries
-CREATE INDEX IF NOT EXISTS idx_messages_conversation ON messages(conversation_id);
-CREATE INDEX IF NOT EXISTS idx_messages_turn ON messages(turn_number);
-CREATE INDEX IF NOT EXISTS idx_messages_agent ON messages(agent_id);
-CREATE INDEX IF NOT EXISTS idx_messages_timestamp ON messages(timestamp);
+CREATE INDEX IF NOT EXISTS idx_message_records_conversation ON message_records(conversation_id);
+CREATE INDEX IF NOT EXISTS idx_message_records_turn ON message_records(turn_number);
+CREATE INDEX IF NOT EXISTS idx_message_records_agent ON message_records(agent_id);
+CREATE INDEX IF NOT EXISTS idx_message_records_timestamp ON message_records(timestamp);
+
+-- Messages with their text
+CREATE OR REPLACE VIEW messages AS
+SELECT
+    m.conversation_id,
+    m.turn_number,
+    m.agent_id,
+    b.content,
+    m.timestamp,
+    m.token_count,
+    m.model_reported_tokens
+FROM message_records m
+LEFT JOIN message_bodies b ON b.message_hash = m.message_hash;
 
 -- Full-text index (if supported by DuckDB version)
--- CREATE FULLTEXT INDEX IF NOT EXISTS idx_messages_content ON messages(content);
+-- CREATE FULLTEXT INDEX IF NOT EXISTS idx_messages_content ON message_bodies(content);
@@ -0,0 +1,13 @@
+-- Metric columns added to conversation_turns after the initial schema
+ALTER TABLE IF EXISTS conversation_turns ADD COLUMN IF NOT EXISTS a_prompt_similarity DOUBLE DEFAULT 0.0;
+ALTER TABLE IF EXISTS conversation_turns ADD COLUMN IF NOT EXISTS a_self_similarity DOUBLE DEFAULT 0.0;
+ALTER TABLE IF EXISTS conversation_turns ADD COLUMN IF NOT EXISTS b_prompt_similarity DOUBLE DEFAULT 0.0;
+ALTER TABLE IF EXISTS conversation_turns ADD COLUMN IF NOT EXISTS b_self_similarity DOUBLE DEFAULT 0.0;
+ALTER TABLE IF EXISTS conversation_turns ADD COLUMN IF NOT EXISTS a_minhash UINTEGER[];
+ALTER TABLE IF EXISTS conversation_turns ADD COLUMN IF NOT EXISTS b_minhash UINTEGER[];
+ALTER TABLE IF EXISTS conversation_turns ADD COLUMN IF NOT EXISTS a_cumulative_compression_ratio DOUBLE DEFAULT 0.0;
+ALTER TABLE IF EXISTS conversation_turns ADD COLUMN IF NOT EXISTS a_marginal_compression_ratio DOUBLE DEFAULT 0.0;
+ALTER TABLE IF EXISTS conversation_turns ADD COLUMN IF NOT EXISTS b_cumulative_compression_ratio DOUBLE DEFAULT 0.0;
+ALTER TABLE IF EXISTS conversation_turns ADD COLUMN IF NOT EXISTS b_marginal_compression_ratio DOUBLE DEFAULT 0.0;
+ALTER TABLE IF EXISTS conversation_turns ADD COLUMN IF NOT EXISTS cumulative_compression_ratio DOUBLE DEFAULT 0.0;
+ALTER TABLE IF EXISTS conversation_turns ADD COLUMN IF NOT EXISTS marginal_compression_ratio DOUBLE DEFAULT 0.0;
@@ -0,0 +1,2 @@
+-- idx_events_conv_seq replaced the index on events(conversation_id)
+DROP INDEX IF EXISTS idx_events_conversation;
@@ -0,0 +1,28 @@
+-- Store each distinct text once and copy the rows set aside by
+-- 003_message_bodies.sql, referencing their text by hash
+INSERT OR IGNORE INTO message_bodies (message_hash, content)
+SELECT sha256(content), content
+FROM (
+    SELECT agent_a_message AS content FROM legacy_conversation_turns
+    UNION
+    SELECT agent_b_message FROM legacy_conversation_turns
+    UNION
+    SELECT content FROM legacy_messages
+)
+WHERE content IS NOT NULL;
+
+INSERT INTO turn_records BY NAME
+SELECT
+    * EXCLUDE (
+        agent_a_message, agent_b_message, a_message_hash, b_message_hash
+    ),
+    sha256(agent_a_message) AS a_message_hash,
+    sha256(agent_b_message) AS b_message_hash
+FROM legacy_conversation_turns;
+
+INSERT INTO message_records BY NAME
+SELECT * EXCLUDE (content), sha256(content) AS message_hash
+FROM legacy_messages;
+
+DROP TABLE legacy_conversation_turns;
+DROP TABLE legacy_messages;
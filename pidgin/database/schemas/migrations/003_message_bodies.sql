@@ -0,0 +1,31 @@
+-- conversation_turns and messages become views over turn_records and
+-- message_records, which reference message text in message_bodies by hash.
+-- Set the old tables aside for 003_message_bodies.after.sql to copy; their
+-- indexes would block renaming them
+DROP INDEX IF EXISTS idx_conversation_turns_timestamp;
+DROP INDEX IF EXISTS idx_conversation_turns_experiment_timestamp;
+DROP INDEX IF EXISTS idx_conversation_turns_convergence;
+DROP INDEX IF EXISTS idx_conversation_turns_models;
+DROP INDEX IF EXISTS idx_messages_conversation;
+DROP INDEX IF EXISTS idx_messages_turn;
+DROP INDEX IF EXISTS idx_messages_agent;
+DROP INDEX IF EXISTS idx_messages_timestamp;
+ALTER TABLE IF EXISTS conversation_turns RENAME TO legacy_conversation_turns;
+ALTER TABLE IF EXISTS messages RENAME TO legacy_messages;
+
+-- For databases without them, so the copy finds nothing
+CREATE TABLE IF NOT EXISTS legacy_conversation_turns (
+    experiment_id VARCHAR,
+    conversation_id VARCHAR,
+    turn_number SMALLINT,
+    agent_a_message TEXT,
+    agent_b_message TEXT,
+    a_message_hash VARCHAR(64),
+    b_message_hash VARCHAR(64)
+);
+CREATE TABLE IF NOT EXISTS legacy_messages (
+    conversation_id TEXT,
+    turn_number INTEGER,
+    agent_id TEXT,
+    content TEXT
+);
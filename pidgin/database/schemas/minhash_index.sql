@@ -0,0 +1,27 @@
+-- MinHash signatures of messages and conversation tails, with an LSH
+-- banding index for finding near-identical text across conversations
+CREATE SEQUENCE IF NOT EXISTS minhash_item_id_seq;
+
+CREATE TABLE IF NOT EXISTS minhash_signatures (
+    item_id BIGINT PRIMARY KEY DEFAULT nextval('minhash_item_id_seq'),
+    item_type VARCHAR NOT NULL,  -- 'message' or 'tail'
+    experiment_id VARCHAR NOT NULL,
+    conversation_id VARCHAR NOT NULL,
+    turn_number SMALLINT NOT NULL,  -- Last turn covered, for tails
+    agent_id VARCHAR NOT NULL,  -- 'agent_a', 'agent_b', or 'both' for tails
+    signature UINTEGER[] NOT NULL
+);
+
+-- One row per signature band; items sharing a bucket are candidate matches
+CREATE TABLE IF NOT EXISTS minhash_bands (
+    item_type VARCHAR NOT NULL,
+    band UTINYINT NOT NULL,
+    bucket UINTEGER NOT NULL,
+    item_id BIGINT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_minhash_bands_bucket
+ON minhash_bands (item_type, band, bucket);
+
+CREATE INDEX IF NOT EXISTS idx_minhash_signatures_experiment
+ON minhash_signatures (experiment_id);
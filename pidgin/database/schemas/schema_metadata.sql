@@ -0,0 +1,8 @@
+-- Schema state of the database, so connections can skip the DDL when it
+-- is current. Keys: fingerprint (hash of all schema and migration SQL)
+-- and migration_version (last migration applied)
+CREATE TABLE IF NOT EXISTS schema_metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
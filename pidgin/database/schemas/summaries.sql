@@ -0,0 +1,62 @@
+-- Aggregates maintained by imports for the conversations they write, so
+-- summaries are read rather than computed from turns on every query
+
+-- One row per conversation
+CREATE TABLE IF NOT EXISTS conversation_summaries (
+    conversation_id TEXT PRIMARY KEY,
+    experiment_id TEXT NOT NULL,
+    agent_a_model TEXT NOT NULL,  -- 'unknown' if not recorded
+    agent_b_model TEXT NOT NULL,
+    status TEXT,
+    total_turns INTEGER,
+    final_convergence DOUBLE,
+    duration_ms INTEGER,
+    metric_turns INTEGER NOT NULL DEFAULT 0,  -- turn_metrics rows
+    convergence_turns INTEGER NOT NULL DEFAULT 0,  -- Turns with a convergence score
+    convergence_sum DOUBLE,  -- Of turn convergence scores, for experiment averages
+    max_turn_convergence DOUBLE,
+    total_tokens BIGINT NOT NULL DEFAULT 0,
+    total_cost DOUBLE NOT NULL DEFAULT 0.0,  -- In cents
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_conversation_summaries_experiment ON conversation_summaries(experiment_id);
+
+-- One row per experiment with conversations
+CREATE TABLE IF NOT EXISTS experiment_summaries (
+    experiment_id TEXT PRIMARY KEY,
+    total_conversations INTEGER NOT NULL,
+    completed_conversations INTEGER NOT NULL,
+    failed_conversations INTEGER NOT NULL,
+    running_conversations INTEGER NOT NULL,
+    total_turns BIGINT,
+    avg_convergence DOUBLE,  -- Of final convergence scores
+    median_convergence DOUBLE,
+    stddev_convergence DOUBLE,
+    max_convergence DOUBLE,
+    min_convergence DOUBLE,
+    avg_turn_convergence DOUBLE,  -- Of all turns' convergence scores
+    conversations_with_metrics INTEGER NOT NULL,
+    avg_duration_sec DOUBLE,
+    total_tokens BIGINT NOT NULL,
+    total_cost DOUBLE NOT NULL,  -- In cents
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- One row per model pair of each experiment
+CREATE TABLE IF NOT EXISTS model_pair_summaries (
+    experiment_id TEXT NOT NULL,
+    agent_a_model TEXT NOT NULL,
+    agent_b_model TEXT NOT NULL,
+    total_conversations INTEGER NOT NULL,
+    completed_conversations INTEGER NOT NULL,
+    total_turns BIGINT,
+    avg_convergence DOUBLE,  -- Of final convergence scores
+    max_convergence DOUBLE,
+    avg_turn_convergence DOUBLE,  -- Of all turns' convergence scores
+    total_tokens BIGINT NOT NULL,
+    total_cost DOUBLE NOT NULL,  -- In cents
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (experiment_id, agent_a_model, agent_b_model)
+);
@@ -0,0 +1,233 @@
+"""Repository for summary tables maintained by imports."""
+
+from typing import Any, Dict, List, Optional
+
+from ..io.logger import get_logger
+from .base_repository import BaseRepository
+
+logger = get_logger("summary_repository")
+
+# Final convergence is each conversation's last score; turn convergence is
+# averaged over all turns, weighted by each conversation's turn count
+_EXPERIMENT_AGGREGATES = """
+    count(*) AS total_conversations,
+    count(*) FILTER (WHERE status = 'completed') AS completed_conversations,
+    count(*) FILTER (WHERE status = 'failed') AS failed_conversations,
+    count(*) FILTER (WHERE status = 'running') AS running_conversations,
+    sum(total_turns) AS total_turns,
+    avg(final_convergence) AS avg_convergence,
+    median(final_convergence) AS median_convergence,
+    stddev(final_convergence) AS stddev_convergence,
+    max(final_convergence) AS max_convergence,
+    min(final_convergence) AS min_convergence,
+    sum(convergence_sum) / nullif(sum(convergence_turns), 0) AS avg_turn_convergence,
+    count(*) FILTER (WHERE metric_turns > 0) AS conversations_with_metrics,
+    avg(duration_ms) / 1000.0 AS avg_duration_sec,
+    sum(total_tokens) AS total_tokens,
+    sum(total_cost) AS total_cost
+"""
+
+_MODEL_PAIR_AGGREGATES = """
+    count(*) AS total_conversations,
+    count(*) FILTER (WHERE status = 'completed') AS completed_conversations,
+    sum(total_turns) AS total_turns,
+    avg(final_convergence) AS avg_convergence,
+    max(final_convergence) AS max_convergence,
+    sum(convergence_sum) / nullif(sum(convergence_turns), 0) AS avg_turn_convergence,
+    sum(total_tokens) AS total_tokens,
+    sum(total_cost) AS total_cost
+"""
+
+
+class SummaryRepository(BaseRepository):
+    """Maintains per-conversation, per-experiment and per-model-pair summaries.
+
+    Imports refresh the summaries of the conversations they write: their
+    conversation_summaries rows are recomputed from conversations,
+    turn_metrics and token_usage, and the experiment_summaries and
+    model_pair_summaries rows of their experiment from
+    conversation_summaries, which has one row per conversation. Reading a
+    summary is then a primary key lookup however many turns an experiment
+    has.
+    """
+
+    def refresh_conversations(
+        self, experiment_id: str, conversation_ids: List[str]
+    ) -> None:
+        """Recompute summaries of conversations and of their experiment.
+
+        Args:
+            experiment_id: Experiment the conversations belong to
+            conversation_ids: Conversations whose data changed
+        """
+        if conversation_ids:
+            self.execute(
+                """
+                INSERT OR REPLACE INTO conversation_summaries (
+                    conversation_id, experiment_id, agent_a_model, agent_b_model,
+                    status, total_turns, final_convergence, duration_ms,
+                    metric_turns, convergence_turns, convergence_sum,
+                    max_turn_convergence, total_tokens, total_cost, updated_at
+                )
+                SELECT
+                    c.conversation_id,
+                    c.experiment_id,
+                    COALESCE(c.agent_a_model, 'unknown'),
+                    COALESCE(c.agent_b_model, 'unknown'),
+                    c.status,
+                    c.total_turns,
+                    c.final_convergence_score,
+                    c.duration_ms,
+                    COALESCE(tm.metric_turns, 0),
+                    COALESCE(tm.convergence_turns, 0),
+                    tm.convergence_sum,
+                    tm.max_turn_convergence,
+                    COALESCE(tu.total_tokens, 0),
+                    COALESCE(tu.total_cost, 0.0),
+                    now()
+                FROM conversations c
+                LEFT JOIN (
+                    SELECT
+                        conversation_id,
+                        count(*) AS metric_turns,
+                        count(convergence_score) AS convergence_turns,
+                        sum(convergence_score) AS convergence_sum,
+                        max(convergence_score) AS max_turn_convergence
+                    FROM turn_metrics
+                    WHERE conversation_id IN (SELECT unnest($ids))
+                    GROUP BY conversation_id
+                ) tm USING (conversation_id)
+                LEFT JOIN (
+                    SELECT
+                        conversation_id,
+                        sum(total_tokens) AS total_tokens,
+                        sum(total_cost) AS total_cost
+                    FROM token_usage
+                    WHERE conversation_id IN (SELECT unnest($ids))
+                    GROUP BY conversation_id
+                ) tu USING (conversation_id)
+                WHERE c.conversation_id IN (SELECT unnest($ids))
+                """,
+                {"ids": conversation_ids},
+            )
+        self.refresh_experiment_aggregates(experiment_id)
+
+    def refresh_experiment(self, experiment_id: str) -> None:
+        """Recompute all summaries of an experiment.
+
+        For experiments imported before summaries were maintained, or whose
+        data was changed other than by an import.
+
+        Args:
+            experiment_id: Experiment ID
+        """
+        conversation_ids = [
+            row[0]
+            for row in self.fetchall(
+                "SELECT conversation_id FROM conversations WHERE experiment_id = ?",
+                [experiment_id],
+            )
+        ]
+        self.execute(
+            "DELETE FROM conversation_summaries WHERE experiment_id = ?",
+            [experiment_id],
+        )
+        self.refresh_conversations(experiment_id, conversation_ids)
+
+    def refresh_experiment_aggregates(self, experiment_id: str) -> None:
+        """Recompute an experiment's summaries from its conversation summaries.
+
+        Args:
+            experiment_id: Experiment ID
+        """
+        self.execute(
+            "DELETE FROM experiment_summaries WHERE experiment_id = ?", [experiment_id]
+        )
+        self.execute(
+            "DELETE FROM model_pair_summaries WHERE experiment_id = ?", [experiment_id]
+        )
+        self.execute(
+            f"""
+            INSERT INTO experiment_summaries BY NAME
+            SELECT experiment_id, {_EXPERIMENT_AGGREGATES}
+            FROM conversation_summaries
+            WHERE experiment_id = ?
+            GROUP BY experiment_id
+            """,
+            [experiment_id],
+        )
+        self.execute(
+            f"""
+            INSERT INTO model_pair_summaries BY NAME
+            SELECT experiment_id, agent_a_model, agent_b_model,
+                {_MODEL_PAIR_AGGREGATES}
+            FROM conversation_summaries
+            WHERE experiment_id = ?
+            GROUP BY experiment_id, agent_a_model, agent_b_model
+            """,
+            [experiment_id],
+        )
+        logger.debug(f"Refreshed summaries of {experiment_id}")
+
+    def get_experiment_summary(self, experiment_id: str) -> Optional[Dict[str, Any]]:
+        """Get an experiment's summary.
+
+        Args:
+            experiment_id: Experiment ID
+
+        Returns:
+            Summary as dict, or None if the experiment has none
+        """
+        result = self.fetchone(
+            "SELECT * FROM experiment_summaries WHERE experiment_id = ?",
+            [experiment_id],
+        )
+        return self.row_to_dict(result) if result else None
+
+    def get_model_pair_summaries(
+        self, experiment_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get summaries by model pair.
+
+        Args:
+            experiment_id: Only this experiment's model pairs if given
+
+        Returns:
+            Summaries as dicts, ordered by experiment and models
+        """
+        query = "SELECT * FROM model_pair_summaries"
+        params = []
+        if experiment_id is not None:
+            query += " WHERE experiment_id = ?"
+            params.append(experiment_id)
+        query += " ORDER BY experiment_id, agent_a_model, agent_b_model"
+        return [self.row_to_dict(row) for row in self.fetchall(query, params)]
+
+    def delete_conversation(self, conversation_id: str) -> None:
+        """Delete a conversation's summary and update its experiment's.
+
+        Args:
+            conversation_id: Conversation ID
+        """
+        result = self.fetchone(
+            "DELETE FROM conversation_summaries WHERE conversation_id = ? "
+            "RETURNING experiment_id",
+            [conversation_id],
+        )
+        if result:
+            self.refresh_experiment_aggregates(result[0])
+
+    def delete_experiment(self, experiment_id: str) -> None:
+        """Delete all summaries of an experiment.
+
+        Args:
+            experiment_id: Experiment ID
+        """
+        for table in (
+            "conversation_summaries",
+            "experiment_summaries",
+            "model_pair_summaries",
+        ):
+            self.execute(
+                f"DELETE FROM {table} WHERE experiment_id = ?", [experiment_id]
+            )
@@ -63,6 +63,9 @@ class ExperimentConfig:
     # Context management
     allow_truncation: bool = False  # Allow message truncation to fit context windows
 
+    # Load profile for local:synthetic agents (see SyntheticSettings)
+    synthetic: Optional[Dict[str, Any]] = None
+
     # Branch metadata
     branch_from_conversation: Optional[str] = None  # Source conversation ID
     branch_from_turn: Optional[int] = None  # Turn number to branch from
@@ -74,6 +74,7 @@ class ConversationOrchestrator:
             convergence_threshold_override=config.convergence_threshold,
             convergence_action_override=config.convergence_action,
             bus=event_bus,
+            hedging_policy=self.app_context.hedging_policy,
         )
 
         # Display mode is handled by the setup, not needed here
@@ -149,6 +150,7 @@ class ConversationOrchestrator:
                 convergence_threshold_override=config.convergence_threshold,
                 convergence_action_override=config.convergence_action,
                 bus=event_bus,
+                hedging_policy=self.app_context.hedging_policy,
             )
 
             # Display mode is handled by the setup, not needed here
@@ -102,7 +102,9 @@ class ExperimentSetup:
         logging.info(f"Creating provider for agent_a: {config.agent_a_model}")
         try:
             provider_a = await get_provider_for_model(
-                config.agent_a_model, temperature=config.temperature_a
+                config.agent_a_model,
+                temperature=config.temperature_a,
+                synthetic=config.synthetic,
             )
         except Exception as e:
             logging.error(f"Failed to create provider_a: {e}", exc_info=True)
@@ -111,7 +113,9 @@ class ExperimentSetup:
         logging.info(f"Creating provider for agent_b: {config.agent_b_model}")
         try:
             provider_b = await get_provider_for_model(
-                config.agent_b_model, temperature=config.temperature_b
+                config.agent_b_model,
+                temperature=config.temperature_b,
+                synthetic=config.synthetic,
             )
         except Exception as e:
             logging.error(f"Failed to create provider_b: {e}", exc_info=True)
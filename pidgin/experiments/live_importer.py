@@ -0,0 +1,111 @@
+"""Import a running experiment's turns into the database as they complete."""
+
+import asyncio
+import multiprocessing
+from multiprocessing.synchronize import Event
+from pathlib import Path
+from typing import Optional
+
+import duckdb
+
+from ..io.logger import get_logger
+
+logger = get_logger("live_importer")
+
+
+def import_running_experiment(exp_dir: Path, db_path: Path) -> None:
+    """Import what was appended to a running experiment's event files.
+
+    Args:
+        exp_dir: Experiment directory
+        db_path: Path to DuckDB database file
+    """
+    from ..config import Config
+    from ..database.import_service import ImportService
+
+    config = Config()
+    try:
+        service = ImportService(
+            str(db_path),
+            config.get("database.metrics_engine", "turn"),
+            config.get("database.import_workers", 1),
+            config.get("database.event_reader", "duckdb"),
+        )
+    except duckdb.IOException as e:
+        # Another process holds the database, e.g. a notebook writing to it
+        logger.info(f"Database busy, importing later: {e}")
+        return
+
+    try:
+        result = service.import_experiment_from_jsonl(exp_dir, running=True)
+        if result.success:
+            logger.debug(
+                f"Imported {result.turns_imported} turns of {result.experiment_id} "
+                f"in {result.duration_seconds:.1f}s"
+            )
+        else:
+            logger.warning(f"Live import of {exp_dir.name} failed: {result.error}")
+    finally:
+        service.close()
+
+
+def _import_periodically(
+    exp_dir: Path, db_path: Path, interval: float, stop: Event
+) -> None:
+    """Import a running experiment every interval seconds until stopped."""
+    while not stop.wait(interval):
+        import_running_experiment(exp_dir, db_path)
+
+
+class LiveImporter:
+    """Imports turns of a running experiment while it runs.
+
+    A dedicated process imports what was appended to the experiment's JSONL
+    files every few seconds. Imports continue from the import ledger, so
+    each one reads and calculates metrics only for turns completed since
+    the previous one and appends them to conversation_turns in one
+    transaction. The process is the only writer while the experiment runs
+    and connects to the database only while importing, so readers such as
+    notebooks can open it in between and see near-real-time data.
+    """
+
+    def __init__(self, exp_dir: Path, db_path: Path, interval: float = 30.0):
+        """Initialize importer.
+
+        Args:
+            exp_dir: Experiment directory
+            db_path: Path to DuckDB database file
+            interval: Seconds between imports
+        """
+        self.exp_dir = exp_dir
+        self.db_path = db_path
+        self.interval = interval
+        # Spawned rather than forked from the runner's event loop
+        self._context = multiprocessing.get_context("spawn")
+        self._stop = self._context.Event()
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+
+    def start(self) -> None:
+        """Start importing in the background."""
+        self._process = self._context.Process(
+            target=_import_periodically,
+            args=(self.exp_dir, self.db_path, self.interval, self._stop),
+            name="pidgin-live-import",
+            daemon=True,
+        )
+        self._process.start()
+        logger.info(
+            f"Importing {self.exp_dir.name} every {self.interval:g}s while it runs"
+        )
+
+    async def stop(self) -> None:
+        """Stop importing, waiting for an import in progress to finish.
+
+        The database is free for other writers afterwards, such as the
+        post-processing import of the rest of the experiment.
+        """
+        if self._process is None:
+            return
+        self._stop.set()
+        await asyncio.to_thread(self._process.join)
+        self._process = None
@@ -6,7 +6,7 @@ import os
 import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from ..core.constants import ConversationStatus, ExperimentStatus
 
@@ -201,6 +201,53 @@ class ManifestManager:
 
             self._write_atomic(manifest)
 
+    def update_latency(
+        self,
+        conversation_id: str,
+        agent_id: str,
+        time_to_first_token_ms: Optional[int],
+        tokens_per_second: Optional[float],
+        rate_limit_wait_ms: Optional[int],
+    ) -> None:
+        """Accumulate response latency for a conversation.
+
+        Args:
+            conversation_id: Conversation ID
+            agent_id: Either "agent_a" or "agent_b"
+            time_to_first_token_ms: Time to first token of the latest response
+            tokens_per_second: Generation throughput of the latest response
+            rate_limit_wait_ms: Time spent waiting on the rate limiter
+        """
+        with self._lock:
+            manifest = self._read()
+
+            if conversation_id not in manifest["conversations"]:
+                return
+
+            conv = manifest["conversations"][conversation_id]
+            latency = conv.setdefault("latency", {}).setdefault(
+                agent_id,
+                {
+                    "responses": 0,
+                    "ttft_ms_total": 0,
+                    "ttft_samples": 0,
+                    "tokens_per_second_total": 0.0,
+                    "tokens_per_second_samples": 0,
+                    "rate_limit_wait_ms_total": 0,
+                },
+            )
+
+            latency["responses"] += 1
+            if time_to_first_token_ms is not None:
+                latency["ttft_ms_total"] += time_to_first_token_ms
+                latency["ttft_samples"] += 1
+            if tokens_per_second is not None:
+                latency["tokens_per_second_total"] += tokens_per_second
+                latency["tokens_per_second_samples"] += 1
+            latency["rate_limit_wait_ms_total"] += rate_limit_wait_ms or 0
+
+            self._write_atomic(manifest)
+
     def update_conversation_status(
         self, conversation_id: str, status: str, completed_count: int, failed_count: int
     ) -> None:
@@ -16,8 +16,9 @@ from ..core.events import (
     PostProcessingStartEvent,
 )
 from ..database.event_store import EventStore
+from ..database.parquet_exporter import ParquetExporter
 from ..database.transcript_generator import TranscriptGenerator
-from ..io.paths import get_database_path
+from ..io.paths import get_database_path, get_parquet_dir
 from .manifest import ManifestManager
 
 logger = logging.getLogger(__name__)
@@ -134,8 +135,14 @@ class PostProcessor:
             log_file.write(f"Experiment ID: {experiment_id}\n")
             log_file.write(f"Started: {start_time.isoformat()}\n\n")
 
+            from ..config import Config
+
+            parquet_export = Config().get("database.parquet_export", False)
+
             # Track what we're doing
             tasks = ["README", "Jupyter notebook", "Database import", "Transcripts"]
+            if parquet_export:
+                tasks.append("Parquet export")
 
             # Emit start event
             start_event = PostProcessingStartEvent(
@@ -165,6 +172,30 @@ class PostProcessor:
                             f"[{datetime.now().isoformat()}] ✓ Database import complete\n"
                         )
 
+                        # Export to the Parquet archive before the notebook,
+                        # which then reads from it
+                        parquet_dir = None
+                        if parquet_export:
+                            log_file.write(
+                                f"[{datetime.now().isoformat()}] Exporting to Parquet...\n"
+                            )
+                            try:
+                                parquet_dir = get_parquet_dir()
+                                ParquetExporter(event_store.db).export_experiment(
+                                    experiment_id, parquet_dir
+                                )
+                                steps_completed.append("Parquet export")
+                                log_file.write(
+                                    f"[{datetime.now().isoformat()}] ✓ Parquet export complete\n"
+                                )
+                            except Exception as e:
+                                logger.error(f"Failed to export to Parquet: {e}")
+                                parquet_dir = None
+                                steps_failed.append("Parquet export")
+                                log_file.write(
+                                    f"[{datetime.now().isoformat()}] ✗ Parquet export failed: {e}\n"
+                                )
+
                         # 2. Generate Jupyter notebook (using same EventStore)
                         log_file.write(
                             f"[{datetime.now().isoformat()}] Generating notebook...\n"
@@ -172,7 +203,9 @@ class PostProcessor:
                         try:
                             from ..analysis.notebook_generator import NotebookGenerator
 
-                            notebook_gen = NotebookGenerator(exp_dir, event_store)
+                            notebook_gen = NotebookGenerator(
+                                exp_dir, event_store, parquet_dir=parquet_dir
+                            )
                             if notebook_gen.generate():
                                 steps_completed.append("Jupyter notebook")
                                 log_file.write(
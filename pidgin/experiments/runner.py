@@ -13,11 +13,13 @@ from ..core.app_context import AppContext
 from ..core.constants import ExperimentStatus
 from ..core.event_bus import EventBus
 from ..core.events import ExperimentCompleteEvent
+from ..io.paths import get_database_path
 from ..ui.display_utils import DisplayUtils
 from .config import ExperimentConfig
 from .conversation_orchestrator import ConversationOrchestrator
 from .daemon import ExperimentDaemon
 from .experiment_setup import ExperimentSetup
+from .live_importer import LiveImporter
 from .manifest import ManifestManager
 from .post_processor import PostProcessor
 
@@ -77,6 +79,16 @@ class ExperimentRunner:
         # Create PostProcessor to handle post-processing
         post_processor = PostProcessor(self.experiment_event_bus, self.output_dir)
 
+        # Optionally import turns while the experiment runs
+        live_importer = None
+        if self.app_context.config.get("database.live_import", False):
+            live_importer = LiveImporter(
+                exp_dir,
+                get_database_path(),
+                self.app_context.config.get("database.live_import_interval", 30.0),
+            )
+            live_importer.start()
+
         try:
             # Validate API keys
             self.setup.validate_api_keys(config)
@@ -105,6 +117,10 @@ class ExperimentRunner:
                         self.failed_count,
                     )
 
+            # Free the database for the post-processing import
+            if live_importer:
+                await live_importer.stop()
+
             # Emit experiment complete event
             await self.experiment_event_bus.emit(
                 ExperimentCompleteEvent(
@@ -138,6 +154,9 @@ class ExperimentRunner:
             )
             raise
         finally:
+            if live_importer:
+                await live_importer.stop()
+
             # Stop the experiment event bus
             await self.experiment_event_bus.stop()
 
@@ -10,6 +10,7 @@ from ..core.events import (
     ConversationStartEvent,
     ErrorEvent,
     Event,
+    MessageCompleteEvent,
     ThinkingCompleteEvent,
     TokenUsageEvent,
     TurnCompleteEvent,
@@ -103,6 +104,16 @@ class TrackingEventBus(EventBus):
                 event.model,
             )
 
+        elif isinstance(event, MessageCompleteEvent):
+            agent_id = "agent_a" if event.agent_id == "agent_a" else "agent_b"
+            self.manifest.update_latency(
+                self.conversation_id,
+                agent_id,
+                event.time_to_first_token_ms,
+                event.tokens_per_second,
+                event.rate_limit_wait_ms,
+            )
+
         elif isinstance(event, ThinkingCompleteEvent):
             # Track thinking token usage separately
             agent_id = "agent_a" if event.agent_id == "agent_a" else "agent_b"
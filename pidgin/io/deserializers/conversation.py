@@ -79,16 +79,25 @@ class ConversationDeserializer(BaseDeserializer):
         """Build TurnCompleteEvent from data."""
         from ...core.types import Message
 
+        # Messages are logged nested under "turn"; older logs had them flat
+        turn_data = data.get("turn") or {}
+
+        def message_content(key: str) -> str:
+            message = turn_data.get(key, data.get(key, ""))
+            if isinstance(message, dict):
+                return message.get("content", "")
+            return message or ""
+
         # Build Message objects for the Turn
         agent_a_msg = Message(
             role="assistant",
-            content=data.get("agent_a_message", ""),
+            content=message_content("agent_a_message"),
             agent_id="agent_a",
         )
 
         agent_b_msg = Message(
             role="assistant",
-            content=data.get("agent_b_message", ""),
+            content=message_content("agent_b_message"),
             agent_id="agent_b",
         )
 
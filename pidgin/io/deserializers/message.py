@@ -41,6 +41,7 @@ class MessageDeserializer(BaseDeserializer):
             turn_number=data.get("turn_number", 0),
             conversation_history=messages,  # Note: field is conversation_history, not messages
             temperature=data.get("temperature"),
+            rate_limit_wait_ms=data.get("rate_limit_wait_ms"),
         )
         event.timestamp = timestamp
         return event
@@ -90,6 +91,13 @@ class MessageDeserializer(BaseDeserializer):
             completion_tokens=data.get("completion_tokens", 0),
             total_tokens=data.get("total_tokens", 0),
             duration_ms=data.get("duration_ms", 0),
+            rate_limit_wait_ms=data.get("rate_limit_wait_ms"),
+            request_send_ms=data.get("request_send_ms"),
+            time_to_first_token_ms=data.get("time_to_first_token_ms"),
+            tokens_per_second=data.get("tokens_per_second"),
+            chunk_gap_p50_ms=data.get("chunk_gap_p50_ms"),
+            chunk_gap_p95_ms=data.get("chunk_gap_p95_ms"),
+            chunk_gap_max_ms=data.get("chunk_gap_max_ms"),
         )
         event.timestamp = timestamp
         return event
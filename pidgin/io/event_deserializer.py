@@ -246,17 +246,20 @@ class EventDeserializer:
         return BaseDeserializer.parse_timestamp(timestamp_str)
 
     def read_jsonl_events(
-        self, jsonl_file: Path
+        self, jsonl_file: Path, start: int = 0
     ) -> Generator[Tuple[int, Optional[Event]], None, None]:
         """Read and deserialize events from a JSONL file.
 
         Args:
             jsonl_file: Path to JSONL file
+            start: Byte offset of the line to start reading from
 
         Yields:
-            Tuple of (line_number, event) where event may be None if deserialization fails
+            Tuple of (line_number, event) where event may be None if deserialization fails;
+            line numbers count from the start offset
         """
-        with open(jsonl_file) as f:
+        with open(jsonl_file, "rb") as f:
+            f.seek(start)
             for line_num, line in enumerate(f, 1):
                 if not line.strip():
                     continue
@@ -265,5 +268,9 @@ class EventDeserializer:
                     event = self.deserialize_event(event_data)
                     yield line_num, event
                 except (json.JSONDecodeError, Exception) as e:
-                    logger.warning(f"Failed to deserialize line {line_num}: {e}")
+                    if line.endswith(b"\n"):
+                        logger.warning(f"Failed to deserialize line {line_num}: {e}")
+                    else:
+                        # Last line of a log that is still being written
+                        logger.debug(f"Skipping incomplete line {line_num}")
                     yield line_num, None
@@ -73,6 +73,15 @@ def get_conversations_dir() -> Path:
     return get_output_dir() / "conversations"
 
 
+def get_cassettes_dir() -> Path:
+    """Get the directory for recorded provider cassettes.
+
+    Returns:
+        Path to pidgin/cassettes directory
+    """
+    return get_output_dir() / "cassettes"
+
+
 def get_database_path() -> Path:
     """Get the path to the experiments database.
 
@@ -80,3 +89,12 @@ def get_database_path() -> Path:
         Path to pidgin/experiments.duckdb
     """
     return get_output_dir() / "experiments.duckdb"
+
+
+def get_parquet_dir() -> Path:
+    """Get the directory of the Parquet archive of experiments.
+
+    Returns:
+        Path to pidgin/parquet directory
+    """
+    return get_output_dir() / "parquet"
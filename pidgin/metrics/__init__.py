@@ -2,10 +2,14 @@
 
 from .calculator import MetricsCalculator
 from .display import calculate_structural_similarity, calculate_turn_metrics
+from .engine import MetricsEngine
+from .features import MessageFeatures
 
 __all__ = [
     # Main calculator
     "MetricsCalculator",
+    "MetricsEngine",
+    "MessageFeatures",
     # Display functions
     "calculate_turn_metrics",
     "calculate_structural_similarity",
@@ -0,0 +1,61 @@
+"""Batch metrics engine for importing whole experiments at once."""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .definitions import METRICS
+from .engine import MetricsEngine, MetricSpec
+from .registry import MetricRegistry
+
+
+class BatchMetricsCalculator(MetricsEngine):
+    """Calculates flat turn metrics for all conversations of an import.
+
+    Produces the same columns and values as FlatMetricsCalculator, from the
+    same registered metrics, but a conversation at a time. All messages
+    are encoded against one shared token index, and the metrics that
+    depend only on a message's text are computed once per distinct text
+    of the import, as long as it stays in the cache.
+    """
+
+    def __init__(
+        self,
+        cache_size: int = 10000,
+        metrics: Optional[Iterable[MetricSpec]] = None,
+        registry: MetricRegistry = METRICS,
+    ):
+        """Initialize engine.
+
+        Args:
+            cache_size: Maximum number of distinct message texts whose
+                metrics are kept for reuse, most recently used first
+            metrics: Metrics to output; defaults to FLAT_METRICS
+            registry: Metric definitions to use
+        """
+        super().__init__(
+            metrics, shape="flat", registry=registry, cache_size=cache_size
+        )
+
+    def calculate_conversation(
+        self,
+        turns: Iterable[Tuple[int, str, str]],
+        history: Iterable[Tuple[int, str, str]] = (),
+    ) -> List[Dict[str, Any]]:
+        """Calculate flat metrics for every turn of one conversation.
+
+        Args:
+            turns: (turn_number, agent_a_message, agent_b_message) tuples in
+                turn order
+            history: Earlier turns of the conversation, in the same form,
+                whose metrics were already calculated
+
+        Returns:
+            One flat metrics dictionary per turn, as FlatMetricsCalculator
+            would return for the same sequence of calls
+        """
+        self.reset()
+        for _, agent_a_message, agent_b_message in history:
+            self.replay_turn(agent_a_message, agent_b_message)
+        return [
+            self.calculate_turn_metrics(turn_number, agent_a_message, agent_b_message)
+            for turn_number, agent_a_message, agent_b_message in turns
+        ]
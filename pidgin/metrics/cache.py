@@ -0,0 +1,63 @@
+"""Bounded least-recently-used cache for per-message results."""
+
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Mapping that evicts its least recently used entry when full.
+
+    Unlike a cache that stops accepting entries once full, recent messages
+    keep being cached however long an import runs, which is what matters
+    for conversations that drift into repeating themselves.
+    """
+
+    def __init__(self, maxsize: int):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[K, V]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(self, key: K) -> Optional[V]:
+        """Get an entry and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if the key is not cached
+        """
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Add or replace an entry, evicting the oldest one if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache; None is not cached
+        """
+        if value is None or self.maxsize <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
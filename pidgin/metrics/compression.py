@@ -0,0 +1,142 @@
+"""Streaming compression ratios over whole conversations."""
+
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class CompressionStream:
+    """Compresses text incrementally with one persistent deflate stream.
+
+    Each chunk is compressed with a sync flush, so the bytes it produces
+    are exactly what it adds to the compressed stream so far. Text the
+    compressor has seen before is encoded as back-references, so the
+    marginal ratio of a chunk measures how much of it is new relative to
+    the preceding text. Deflate only looks back 32 KB, so repeats of text
+    from further back are not detected. Feeding a chunk costs O(chunk
+    length), however long the stream has grown.
+    """
+
+    def __init__(self, level: int = 6):
+        """Initialize stream.
+
+        Args:
+            level: zlib compression level
+        """
+        # Raw deflate: no header or checksum bytes to skew short streams
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        self.raw_bytes = 0
+        self.compressed_bytes = 0
+        # Ratio of the last chunk; None until one with text is fed
+        self.marginal_ratio: Optional[float] = None
+
+    def feed(self, text: str) -> Optional[float]:
+        """Compress the next chunk of text.
+
+        Args:
+            text: Text to append to the stream
+
+        Returns:
+            Compressed size of the chunk over its raw size; None if the
+            chunk is empty, as there is nothing to measure
+        """
+        data = text.encode("utf-8")
+        if not data:
+            self.marginal_ratio = None
+            return None
+        compressed = len(self._compressor.compress(data)) + len(
+            self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        )
+        self.raw_bytes += len(data)
+        self.compressed_bytes += compressed
+        self.marginal_ratio = compressed / len(data)
+        return self.marginal_ratio
+
+    @property
+    def cumulative_ratio(self) -> float:
+        """Compressed size of everything fed so far over its raw size."""
+        return self.compressed_bytes / self.raw_bytes if self.raw_bytes else 0.0
+
+
+class ConversationCompression:
+    """Cumulative and marginal compression ratios of a conversation.
+
+    Keeps one stream per agent and one for both agents' messages in order.
+    Falling ratios mean the conversation is repeating itself: the combined
+    stream catches agents echoing each other, the per-agent streams catch
+    each agent repeating itself.
+    """
+
+    def __init__(self, level: int = 6):
+        """Initialize streams.
+
+        Args:
+            level: zlib compression level
+        """
+        self.streams: Dict[str, CompressionStream] = {
+            "agent_a": CompressionStream(level),
+            "agent_b": CompressionStream(level),
+            "combined": CompressionStream(level),
+        }
+
+    def add_messages(self, messages: Iterable[Tuple[str, str]]) -> Dict[str, float]:
+        """Compress the messages of a turn.
+
+        Each stream is flushed once, so the marginal ratios cover all the
+        messages passed, e.g. both messages of a turn. Empty and
+        whitespace-only messages add nothing to the streams.
+
+        Args:
+            messages: (agent_id, content) pairs in order; agents other than
+                agent_a and agent_b are ignored
+
+        Returns:
+            a_/b_cumulative_compression_ratio, a_/b_marginal_compression_ratio,
+            and cumulative_/marginal_compression_ratio of the combined stream
+        """
+        chunks: Dict[str, List[str]] = {"agent_a": [], "agent_b": [], "combined": []}
+        for agent_id, content in messages:
+            if agent_id in chunks and content.strip():
+                chunks[agent_id].append(content)
+                chunks["combined"].append(content)
+
+        for name, stream in self.streams.items():
+            stream.feed("\n".join(chunks[name]))
+        return self.ratios()
+
+    def add_turn(self, message_a: str, message_b: str) -> Dict[str, float]:
+        """Compress both messages of a turn.
+
+        Args:
+            message_a: Agent A's message
+            message_b: Agent B's message
+
+        Returns:
+            Ratios as returned by add_messages
+        """
+        return self.add_messages((("agent_a", message_a), ("agent_b", message_b)))
+
+    @property
+    def marginal_ratio(self) -> Optional[float]:
+        """Marginal ratio of the last turn over both agents' messages.
+
+        None if the turn added no text, so it cannot be told apart from
+        a perfectly repetitive one by ratios().
+        """
+        return self.streams["combined"].marginal_ratio
+
+    def ratios(self) -> Dict[str, float]:
+        """Current ratios, with marginal ratios of the last turn added.
+
+        Marginal ratios of streams the turn added no text to are 0.0.
+        """
+        stream_a = self.streams["agent_a"]
+        stream_b = self.streams["agent_b"]
+        combined = self.streams["combined"]
+        return {
+            "a_cumulative_compression_ratio": stream_a.cumulative_ratio,
+            "a_marginal_compression_ratio": stream_a.marginal_ratio or 0.0,
+            "b_cumulative_compression_ratio": stream_b.cumulative_ratio,
+            "b_marginal_compression_ratio": stream_b.marginal_ratio or 0.0,
+            "cumulative_compression_ratio": combined.cumulative_ratio,
+            "marginal_compression_ratio": combined.marginal_ratio or 0.0,
+        }
@@ -1,15 +1,25 @@
 """Convergence and similarity metrics for conversation analysis."""
 
 import math
+import re
 import zlib
 from collections import Counter
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Union
 
-from .text_analysis import TextAnalyzer
+from .features import MessageFeatures, as_features
+
+Text = Union[str, MessageFeatures]
+
+# Two or more consecutive shared bigrams, i.e. a shared phrase of 3+ words
+SHARED_RUN_PATTERN = re.compile(rb"\x01{2,}")
 
 
 class ConvergenceCalculator:
-    """Calculates convergence-related metrics between messages."""
+    """Calculates convergence-related metrics between messages.
+
+    Messages may be passed as text or as MessageFeatures; with features the
+    pairwise metrics reuse each message's tokens and n-gram counts.
+    """
 
     @staticmethod
     def calculate_vocabulary_overlap(vocab_a: Set[str], vocab_b: Set[str]) -> float:
@@ -22,23 +32,39 @@ class ConvergenceCalculator:
         return len(vocab_a & vocab_b) / len(union)
 
     @staticmethod
-    def calculate_mimicry_score(message_a: str, message_b: str) -> float:
+    def calculate_mimicry_score(message_a: Text, message_b: Text) -> float:
         """Calculate how much message_b mimics phrases from message_a."""
-        words_a = TextAnalyzer.tokenize(message_a.lower())
-        words_b = TextAnalyzer.tokenize(message_b.lower())
+        features_a = as_features(message_a)
+        features_b = as_features(message_b)
+        words_a = features_a.tokens
+        words_b = features_b.tokens
 
         if not words_a or not words_b:
             return 0.0
 
         mimicry_score = 0.0
 
+        # Longer shared phrases lie within runs of shared bigrams
+        bigrams_a = features_a.ngrams(2)
+        bigrams_b = features_b.ngrams(2)
+        runs_a = _shared_runs(features_a, bigrams_b)
+        runs_b = _shared_runs(features_b, bigrams_a)
+
         # Check for copied phrases of different lengths
         for n in range(2, min(6, len(words_a), len(words_b)) + 1):
-            ngrams_a = set(zip(*[words_a[i:] for i in range(n)], strict=False))
-            ngrams_b = set(zip(*[words_b[i:] for i in range(n)], strict=False))
-
-            if ngrams_a:
-                overlap = len(ngrams_a & ngrams_b) / len(ngrams_a)
+            distinct_a = features_a.distinct_ngrams(n)
+
+            if distinct_a:
+                if n == 2:
+                    shared = len(bigrams_a.keys() & bigrams_b.keys())
+                elif not runs_a:
+                    shared = 0
+                else:
+                    shared = len(
+                        _ngrams_in_runs(words_a, runs_a, n)
+                        & _ngrams_in_runs(words_b, runs_b, n)
+                    )
+                overlap = shared / distinct_a
                 # Weight longer phrases more heavily
                 mimicry_score += overlap * (n - 1)
 
@@ -52,31 +78,28 @@ class ConvergenceCalculator:
         return mimicry_score
 
     @staticmethod
-    def calculate_cross_repetition(message_a: str, message_b: str) -> float:
+    def calculate_cross_repetition(message_a: Text, message_b: Text) -> float:
         """Calculate word repetition between messages."""
-        words_a = TextAnalyzer.tokenize(message_a.lower())
-        words_b = TextAnalyzer.tokenize(message_b.lower())
+        features_a = as_features(message_a)
+        features_b = as_features(message_b)
 
-        if not words_a or not words_b:
+        if not features_a.tokens or not features_b.tokens:
             return 0.0
 
         # Count shared words
-        counter_a = Counter(words_a)
-        counter_b = Counter(words_b)
-
-        shared_count = 0
-        for word in set(words_a) & set(words_b):
-            shared_count += min(counter_a[word], counter_b[word])
+        shared_count = sum((features_a.counter & features_b.counter).values())
 
         # Normalize by total words
-        total_words = len(words_a) + len(words_b)
+        total_words = features_a.word_count + features_b.word_count
         return (2 * shared_count) / total_words if total_words > 0 else 0.0
 
     @staticmethod
-    def calculate_structural_similarity(message_a: str, message_b: str) -> float:
+    def calculate_structural_similarity(message_a: Text, message_b: Text) -> float:
         """Calculate structural similarity between messages."""
-        sentences_a = TextAnalyzer.split_sentences(message_a)
-        sentences_b = TextAnalyzer.split_sentences(message_b)
+        features_a = as_features(message_a)
+        features_b = as_features(message_b)
+        sentences_a = features_a.sentences
+        sentences_b = features_b.sentences
 
         # Compare sentence counts
         len_similarity = 1 - abs(len(sentences_a) - len(sentences_b)) / max(
@@ -84,8 +107,8 @@ class ConvergenceCalculator:
         )
 
         # Compare average sentence lengths
-        avg_len_a = sum(len(s.split()) for s in sentences_a) / max(len(sentences_a), 1)
-        avg_len_b = sum(len(s.split()) for s in sentences_b) / max(len(sentences_b), 1)
+        avg_len_a = sum(features_a.sentence_lengths) / max(len(sentences_a), 1)
+        avg_len_b = sum(features_b.sentence_lengths) / max(len(sentences_b), 1)
 
         length_similarity = 1 - abs(avg_len_a - avg_len_b) / max(
             avg_len_a, avg_len_b, 1
@@ -95,8 +118,10 @@ class ConvergenceCalculator:
         return 0.5 * len_similarity + 0.5 * length_similarity
 
     @staticmethod
-    def calculate_compression_ratio(text: str) -> float:
+    def calculate_compression_ratio(text: Text) -> float:
         """Calculate compression ratio as a complexity metric."""
+        if isinstance(text, MessageFeatures):
+            text = text.text
         if not text:
             return 0.0
 
@@ -193,7 +218,7 @@ class ConvergenceCalculator:
 
     @staticmethod
     def calculate_repetition_ratio(
-        messages: List[str], min_phrase_length: int = 3
+        messages: List[Text], min_phrase_length: int = 3
     ) -> float:
         """Calculate ratio of repeated phrases across messages."""
         if len(messages) < 2:
@@ -203,7 +228,7 @@ class ConvergenceCalculator:
         all_phrases = []
 
         for message in messages:
-            words = TextAnalyzer.tokenize(message.lower())
+            words = as_features(message).tokens
             if len(words) >= min_phrase_length:
                 # Extract phrases of minimum length
                 for i in range(len(words) - min_phrase_length + 1):
@@ -218,3 +243,25 @@ class ConvergenceCalculator:
         repeated_phrases = sum(1 for count in phrase_counter.values() if count > 1)
 
         return repeated_phrases / len(all_phrases)
+
+
+def _shared_runs(features: MessageFeatures, other_bigrams: Counter) -> List[range]:
+    """Find the runs of consecutive bigrams that the other message also has.
+
+    An n-gram is in the other message only if its n - 1 bigrams are, i.e.
+    it starts at position i of a run with i + n - 1 <= run.stop.
+
+    Returns:
+        Bigram positions of each run of at least two shared bigrams
+    """
+    shared = bytes(map(other_bigrams.__contains__, features.bigrams()))
+    return [range(*m.span()) for m in SHARED_RUN_PATTERN.finditer(shared)]
+
+
+def _ngrams_in_runs(tokens: List[str], runs: List[range], n: int) -> Set[tuple]:
+    """N-grams, n >= 3, lying within the shared bigram runs."""
+    return {
+        tuple(tokens[i : i + n])
+        for run in runs
+        for i in range(run.start, run.stop - n + 2)
+    }
@@ -0,0 +1,469 @@
+"""Metric definitions and the metric sets of the flat and nested outputs."""
+
+from .convergence_metrics import ConvergenceCalculator
+from .linguistic_metrics import MARKER_SETS, LinguisticAnalyzer
+from .minhash import MinHasher
+from .registry import (
+    CONVERSATION,
+    CUMULATIVE,
+    MESSAGE,
+    PAIR,
+    MetricContext,
+    MetricRegistry,
+)
+from .text_analysis import TextAnalyzer
+
+METRICS = MetricRegistry()
+register = METRICS.register
+
+_minhasher = MinHasher()
+
+
+# Message metrics: depend only on the message's own text
+
+
+def _count(name, function):
+    register(name, MESSAGE, lambda ctx: function(ctx.features))
+
+
+register("message_length", MESSAGE, lambda ctx: len(ctx.features.text))
+register("word_count", MESSAGE, lambda ctx: len(ctx.features.tokens))
+register("vocabulary", MESSAGE, lambda ctx: ctx.features.vocabulary)
+register("vocabulary_size", MESSAGE, lambda ctx: len(ctx.features.vocabulary))
+register("sentence_count", MESSAGE, lambda ctx: len(ctx.features.sentences))
+register(
+    "avg_word_length",
+    MESSAGE,
+    lambda ctx: (
+        sum(len(w) for w in ctx.features.tokens) / max(ctx.values["word_count"], 1)
+    ),
+    dependencies=("word_count",),
+)
+register(
+    "avg_sentence_length",
+    MESSAGE,
+    lambda ctx: ctx.values["word_count"] / max(ctx.values["sentence_count"], 1),
+    dependencies=("word_count", "sentence_count"),
+)
+register(
+    "ttr",  # type-token ratio
+    MESSAGE,
+    lambda ctx: ctx.values["vocabulary_size"] / max(ctx.values["word_count"], 1),
+    dependencies=("word_count", "vocabulary_size"),
+)
+register(
+    "lexical_diversity",  # root TTR, independent of message length
+    MESSAGE,
+    lambda ctx: LinguisticAnalyzer.calculate_lexical_diversity_index(
+        ctx.values["word_count"], ctx.values["vocabulary_size"]
+    ),
+    dependencies=("word_count", "vocabulary_size"),
+)
+register(
+    "hapax_ratio",
+    MESSAGE,
+    lambda ctx: LinguisticAnalyzer.calculate_hapax_legomena_ratio(ctx.features.counter),
+)
+register(
+    "word_entropy",
+    MESSAGE,
+    lambda ctx: LinguisticAnalyzer.calculate_entropy(ctx.features.counter),
+)
+_count("ldi", LinguisticAnalyzer.calculate_lexical_diversity_index_ngrams)
+_count("self_repetition", LinguisticAnalyzer.calculate_self_repetition)
+_count("character_entropy", LinguisticAnalyzer.calculate_character_entropy)
+_count("formality_score", LinguisticAnalyzer.calculate_formality_score)
+_count("compression_ratio", ConvergenceCalculator.calculate_compression_ratio)
+_count("paragraph_count", TextAnalyzer.count_paragraphs)
+_count("question_count", TextAnalyzer.count_questions)
+_count("exclamation_count", TextAnalyzer.count_exclamations)
+_count("punctuation_diversity", TextAnalyzer.calculate_punctuation_diversity)
+_count("starts_with_acknowledgment", TextAnalyzer.starts_with_acknowledgment)
+_count("number_count", TextAnalyzer.count_numbers)
+_count("proper_noun_count", TextAnalyzer.count_proper_nouns)
+_count("symbol_density", TextAnalyzer.calculate_symbol_density)
+_count("emoji_count", TextAnalyzer.count_emojis)
+_count("arrow_count", TextAnalyzer.count_arrows)
+_count("minhash", _minhasher.signature)  # Near-duplicate detection
+register(
+    "special_char_count",
+    MESSAGE,
+    lambda ctx: TextAnalyzer.count_special_symbols(
+        ctx.features, ctx.values["emoji_count"], ctx.values["arrow_count"]
+    ),
+    dependencies=("emoji_count", "arrow_count"),
+)
+register(
+    "linguistic_markers",
+    MESSAGE,
+    lambda ctx: LinguisticAnalyzer.count_linguistic_markers(ctx.features),
+    outputs=tuple(MARKER_SETS),
+)
+register(
+    "repeated_ngrams",
+    MESSAGE,
+    lambda ctx: LinguisticAnalyzer.count_repeated_ngrams(ctx.features),
+    outputs=("repeated_bigrams", "repeated_trigrams"),
+)
+register(
+    "densities",
+    MESSAGE,
+    lambda ctx: LinguisticAnalyzer.calculate_densities(ctx.features),
+    outputs=("question_density", "hedge_density"),
+)
+
+# Columns of the wide table that are not calculated yet
+for _name in (
+    "emotional_intensity",
+    "syntactic_complexity",
+    "semantic_density",
+    "coherence_score",
+    "readability_score",
+    "cognitive_load",
+    "information_density",
+):
+    register(_name, MESSAGE, lambda ctx: 0.0)
+for _name in (
+    "math_symbol_count",
+    "discourse_markers",
+    "gratitude_markers",
+    "existential_language",
+    "compression_indicators",
+    "novel_symbols",
+    "meta_commentary",
+):
+    register(_name, MESSAGE, lambda ctx: 0)
+
+
+# Cumulative metrics: a message relative to the agent's earlier messages
+
+
+@register("turn_repetition", CUMULATIVE, history=("reuse",))
+def _turn_repetition(ctx: MetricContext) -> float:
+    """Mean share of each earlier message's vocabulary that is reused."""
+    if ctx.turn_number == 0:
+        return 0.0
+    return ctx.history.reuse.repetition(ctx.agent, ctx.features.vocabulary_ids)
+
+
+@register("vocabulary_repetition", CUMULATIVE, history=("vocabulary",))
+def _vocabulary_repetition(ctx: MetricContext) -> float:
+    """Share of the message's words the agent has used before."""
+    if ctx.turn_number == 0:
+        return 0.0
+
+    current_words = ctx.features.vocabulary_ids
+    if not current_words:
+        return 0.0
+
+    previous_words = ctx.history.vocabulary.words[ctx.agent]
+    if not len(previous_words):
+        return 0.0
+
+    overlap = sum(1 for token_id in current_words if token_id in previous_words)
+    return overlap / len(current_words)
+
+
+@register("new_words", CUMULATIVE, history=("vocabulary",))
+def _new_words(ctx: MetricContext) -> int:
+    """Number of words the agent has not used before."""
+    previous_words = ctx.history.vocabulary.words[ctx.agent]
+    return sum(
+        1 for token_id in ctx.features.vocabulary_ids if token_id not in previous_words
+    )
+
+
+# Pair metrics: the two messages of a turn
+
+
+register(
+    "vocabulary_overlap",
+    PAIR,
+    lambda ctx: ConvergenceCalculator.calculate_vocabulary_overlap(
+        ctx.features_a.vocabulary, ctx.features_b.vocabulary
+    ),
+)
+register(
+    "cross_repetition",
+    PAIR,
+    lambda ctx: ConvergenceCalculator.calculate_cross_repetition(
+        ctx.features_a, ctx.features_b
+    ),
+)
+register(
+    "structural_similarity",
+    PAIR,
+    lambda ctx: ConvergenceCalculator.calculate_structural_similarity(
+        ctx.features_a, ctx.features_b
+    ),
+)
+register(
+    "mimicry_a_to_b",
+    PAIR,
+    lambda ctx: ConvergenceCalculator.calculate_mimicry_score(
+        ctx.features_a, ctx.features_b
+    ),
+)
+register(
+    "mimicry_b_to_a",
+    PAIR,
+    lambda ctx: ConvergenceCalculator.calculate_mimicry_score(
+        ctx.features_b, ctx.features_a
+    ),
+)
+register(
+    "mimicry_score_a_to_b",
+    PAIR,
+    lambda ctx: ctx.values["mimicry_a_to_b"] or 0.0,
+    dependencies=("mimicry_a_to_b",),
+)
+register(
+    "mimicry_score_b_to_a",
+    PAIR,
+    lambda ctx: ctx.values["mimicry_b_to_a"] or 0.0,
+    dependencies=("mimicry_b_to_a",),
+)
+
+
+@register("mutual_mimicry", PAIR, dependencies=("mimicry_a_to_b", "mimicry_b_to_a"))
+def _mutual_mimicry(ctx: MetricContext) -> float:
+    mimicry_a_to_b = ctx.values["mimicry_a_to_b"]
+    mimicry_b_to_a = ctx.values["mimicry_b_to_a"]
+    if mimicry_a_to_b is None or mimicry_b_to_a is None:
+        return 0.0
+    return (mimicry_a_to_b + mimicry_b_to_a) / 2
+
+
+register(
+    "length_ratio",
+    PAIR,
+    lambda ctx: ConvergenceCalculator.calculate_message_length_ratio(
+        len(ctx.features_a.text), len(ctx.features_b.text)
+    ),
+)
+register(
+    "length_convergence",  # Closer to 1 = more convergent
+    PAIR,
+    lambda ctx: 1.0 - abs(ctx.values["length_ratio"] - 1.0),
+    dependencies=("length_ratio",),
+)
+register(
+    "sentence_pattern_similarity",
+    PAIR,
+    lambda ctx: ConvergenceCalculator.calculate_sentence_pattern_similarity(
+        ctx.features_a.sentences, ctx.features_b.sentences
+    ),
+)
+register(
+    "overall_convergence",
+    PAIR,
+    lambda ctx: ConvergenceCalculator.calculate_overall_convergence_score(
+        {
+            "vocabulary_overlap": ctx.values["vocabulary_overlap"],
+            "cross_repetition": ctx.values["cross_repetition"],
+            "structural_similarity": ctx.values["structural_similarity"],
+            "mutual_mimicry": ctx.values["mutual_mimicry"],
+        }
+    ),
+    dependencies=(
+        "vocabulary_overlap",
+        "cross_repetition",
+        "structural_similarity",
+        "mutual_mimicry",
+    ),
+)
+
+# Columns of the wide table that are not calculated yet; semantic
+# similarity is filled in on import by HashedEmbedder
+for _name in (
+    "semantic_similarity",
+    "sentiment_convergence",
+    "formality_convergence",
+    "rhythm_convergence",
+    "convergence_velocity",
+    "topic_consistency",
+    "syntactic_convergence",
+    "prosodic_alignment",
+    "discourse_coherence",
+):
+    register(_name, PAIR, lambda ctx: 0.0)
+register("turn_taking_balance", PAIR, lambda ctx: 0.5)
+
+
+# Conversation metrics: everything said so far, including this turn
+
+
+register(
+    "cumulative_convergence",
+    CONVERSATION,
+    lambda ctx: ctx.history.vocabulary.overlap(),
+    history=("vocabulary",),
+)
+register(
+    "compression",
+    CONVERSATION,
+    lambda ctx: ctx.history.compression.ratios(),
+    outputs=(
+        "a_cumulative_compression_ratio",
+        "a_marginal_compression_ratio",
+        "b_cumulative_compression_ratio",
+        "b_marginal_compression_ratio",
+        "cumulative_compression_ratio",
+        "marginal_compression_ratio",
+    ),
+    history=("compression",),
+)
+register(
+    "repetition_ratio",  # Repeated phrases over the last 5 turns
+    CONVERSATION,
+    lambda ctx: (
+        ctx.history.phrases.repetition_ratio
+        if ctx.history.phrases.messages_added >= 4  # At least 2 turns
+        else 0.0
+    ),
+    history=("phrases",),
+)
+
+
+# Metric sets, as (output key, metric) pairs where the key differs
+
+FLAT_METRICS = (
+    # Basic counts
+    "message_length",
+    ("character_count", "message_length"),  # Alias for consistency
+    "word_count",
+    "vocabulary_size",
+    "sentence_count",
+    "paragraph_count",
+    "avg_sentence_length",
+    # Lexical diversity
+    ("unique_words", "vocabulary_size"),
+    "ttr",
+    "hapax_ratio",
+    "ldi",
+    "self_repetition",
+    # Information theory
+    "word_entropy",
+    "character_entropy",
+    "compression_ratio",
+    # Symbol & punctuation
+    "symbol_density",
+    "emoji_count",
+    "arrow_count",
+    "math_symbol_count",
+    "punctuation_diversity",
+    "special_char_count",
+    "number_count",
+    "proper_noun_count",
+    # Linguistic patterns
+    "question_count",
+    "exclamation_count",
+    "formality_score",
+    "emotional_intensity",
+    # Advanced linguistic (placeholders for now)
+    "syntactic_complexity",
+    "semantic_density",
+    "coherence_score",
+    "readability_score",
+    "cognitive_load",
+    "information_density",
+    "discourse_markers",
+    # Research-specific patterns (placeholders)
+    "gratitude_markers",
+    "existential_language",
+    "compression_indicators",
+    "novel_symbols",
+    "meta_commentary",
+    "minhash",
+    *MARKER_SETS,
+    "repeated_bigrams",
+    "repeated_trigrams",
+    "question_density",
+    "hedge_density",
+    # History
+    "turn_repetition",
+    "new_words",
+    # Convergence
+    "vocabulary_overlap",
+    "length_convergence",
+    ("style_similarity", "structural_similarity"),
+    "structural_similarity",
+    "semantic_similarity",
+    "mimicry_score_a_to_b",
+    "mimicry_score_b_to_a",
+    "sentiment_convergence",
+    "formality_convergence",
+    "rhythm_convergence",
+    "overall_convergence",
+    "convergence_velocity",
+    "turn_taking_balance",
+    "topic_consistency",
+    ("phrase_alignment", "cross_repetition"),
+    "syntactic_convergence",
+    ("lexical_entrainment", "vocabulary_overlap"),
+    "prosodic_alignment",
+    "discourse_coherence",
+    "cumulative_convergence",
+    "a_cumulative_compression_ratio",
+    "a_marginal_compression_ratio",
+    "b_cumulative_compression_ratio",
+    "b_marginal_compression_ratio",
+    "cumulative_compression_ratio",
+    "marginal_compression_ratio",
+)
+
+NESTED_METRICS = (
+    # Basic counts
+    "message_length",
+    "word_count",
+    "vocabulary_size",
+    "vocabulary",
+    # Structure
+    "sentence_count",
+    "paragraph_count",
+    "avg_word_length",
+    "avg_sentence_length",
+    # Content types
+    "question_count",
+    "exclamation_count",
+    ("special_symbol_count", "special_char_count"),
+    "number_count",
+    "proper_noun_count",
+    "emoji_count",
+    "arrow_count",
+    "symbol_density",
+    "question_density",
+    "hedge_density",
+    # Linguistic markers
+    *MARKER_SETS,
+    # Complexity
+    ("entropy", "word_entropy"),
+    ("char_entropy", "character_entropy"),
+    "compression_ratio",
+    "lexical_diversity",
+    ("lexical_diversity_index", "ldi"),
+    "punctuation_diversity",
+    "hapax_ratio",
+    # Repetition
+    "self_repetition",
+    ("turn_repetition", "vocabulary_repetition"),
+    "repeated_bigrams",
+    "repeated_trigrams",
+    # Style
+    "formality_score",
+    "starts_with_acknowledgment",
+    ("unique_word_ratio", "ttr"),
+    "new_words",
+    # Convergence
+    "vocabulary_overlap",
+    ("cumulative_overlap", "cumulative_convergence"),
+    "cross_repetition",
+    "structural_similarity",
+    "mimicry_a_to_b",
+    "mimicry_b_to_a",
+    "mutual_mimicry",
+    "length_ratio",
+    "sentence_pattern_similarity",
+    ("overall_convergence_score", "overall_convergence"),
+    "repetition_ratio",
+)
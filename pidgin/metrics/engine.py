@@ -0,0 +1,318 @@
+"""Metrics engine calculating registered metrics for conversation turns."""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .cache import LRUCache
+from .compression import ConversationCompression
+from .definitions import FLAT_METRICS, METRICS, NESTED_METRICS
+from .features import MessageFeatures
+from .ngram_index import RollingNgramIndex
+from .registry import (
+    CONVERSATION,
+    CUMULATIVE,
+    MESSAGE,
+    PAIR,
+    MetricContext,
+    MetricRegistry,
+)
+from .vocabulary import CumulativeVocabulary, VocabularyReuse
+
+# A metric name, or an (output key, metric name) pair to rename it
+MetricSpec = Union[str, Tuple[str, str]]
+
+SHAPES = ("flat", "nested")
+
+# Compiled definition: (name, compute, returns several values)
+_Step = Tuple[str, Any, bool]
+
+
+class ConversationHistory:
+    """Conversation state read by cumulative and conversation metrics.
+
+    Only the trackers some requested metric reads are kept up to date.
+    """
+
+    def __init__(self, trackers: Iterable[str] = ()):
+        """Initialize history.
+
+        Args:
+            trackers: Names of the state to keep (see HISTORY_TRACKERS)
+        """
+        trackers = set(trackers)
+        # Words used so far by each agent, as token IDs
+        self.vocabulary = CumulativeVocabulary() if "vocabulary" in trackers else None
+        # Reuse of each agent's earlier message vocabularies
+        self.reuse = VocabularyReuse() if "reuse" in trackers else None
+        # Whole-conversation compression, fed one turn at a time
+        self.compression = (
+            ConversationCompression() if "compression" in trackers else None
+        )
+        # Repeated phrases over the last 5 turns (10 messages)
+        self.phrases = (
+            RollingNgramIndex(window=10, n=3) if "phrases" in trackers else None
+        )
+
+    def record_message(self, agent: str, features: MessageFeatures) -> None:
+        """Add a message after its cumulative metrics are calculated."""
+        if self.vocabulary is not None:
+            self.vocabulary.add(agent, features.vocabulary_ids)
+        if self.reuse is not None:
+            self.reuse.add(agent, features.vocabulary_ids)
+
+    def record_turn(
+        self, features_a: MessageFeatures, features_b: MessageFeatures
+    ) -> None:
+        """Add a turn before its conversation metrics are calculated."""
+        if self.compression is not None:
+            self.compression.add_turn(features_a.text, features_b.text)
+        if self.phrases is not None:
+            self.phrases.add(features_a)
+            self.phrases.add(features_b)
+
+
+class MetricsEngine:
+    """Calculates a chosen set of metrics for each turn of a conversation.
+
+    Metrics are looked up in a registry together with everything they
+    depend on, and each is calculated once per message or turn from the
+    message features shared by all of them. Turns are returned either as
+    one flat row with a_/b_ prefixed agent metrics, as stored in the
+    conversation_turns wide table, or nested by agent and convergence.
+
+    Features and message metrics of recent message texts are cached, so
+    conversations that settle into repeating messages analyze each text
+    once. They hold token IDs of the token index, so the cache must be
+    cleared with clear_cache() when the index is cleared or replaced.
+    """
+
+    def __init__(
+        self,
+        metrics: Optional[Iterable[MetricSpec]] = None,
+        shape: str = "flat",
+        token_index: Optional[Dict[str, int]] = None,
+        registry: MetricRegistry = METRICS,
+        cache_size: int = 1000,
+    ):
+        """Initialize engine.
+
+        Args:
+            metrics: Metrics to output, as names or (output key, name)
+                pairs; defaults to FLAT_METRICS or NESTED_METRICS
+            shape: "flat" or "nested"
+            token_index: Optional token -> ID mapping to intern words with,
+                shared by engines of the same experiment
+            registry: Metric definitions to use
+            cache_size: Maximum number of distinct message texts whose
+                features and message metrics are kept for reuse
+
+        Raises:
+            ValueError: If the shape is unknown
+            KeyError: If a metric is not registered
+        """
+        if shape not in SHAPES:
+            raise ValueError(
+                f"Unknown output shape '{shape}', expected one of {', '.join(SHAPES)}"
+            )
+        if metrics is None:
+            metrics = FLAT_METRICS if shape == "flat" else NESTED_METRICS
+        outputs = [(m, m) if isinstance(m, str) else m for m in metrics]
+
+        self.shape = shape
+        # Token IDs shared by all messages of the conversation
+        self.token_index: Dict[str, int] = {} if token_index is None else token_index
+
+        definitions = registry.resolve(name for _, name in outputs)
+        self._steps: Dict[str, List[_Step]] = {
+            scope: [
+                (d.name, d.compute, bool(d.outputs))
+                for d in definitions
+                if d.scope == scope
+            ]
+            for scope in (MESSAGE, CUMULATIVE, PAIR, CONVERSATION)
+        }
+        self._trackers = {tracker for d in definitions for tracker in d.history}
+        self.history = ConversationHistory(self._trackers)
+
+        # Output keys of agent metrics and of convergence metrics
+        agent_scopes = (MESSAGE, CUMULATIVE)
+        self._agent_outputs = [
+            (key, name)
+            for key, name in outputs
+            if registry.get(name).scope in agent_scopes
+        ]
+        self._turn_outputs = [
+            (key, name)
+            for key, name in outputs
+            if registry.get(name).scope not in agent_scopes
+        ]
+        self._columns_a = [("a_" + key, name) for key, name in self._agent_outputs]
+        self._columns_b = [("b_" + key, name) for key, name in self._agent_outputs]
+
+        # (features, message metric values) by message text
+        self._messages: LRUCache[str, Tuple[MessageFeatures, Dict[str, Any]]] = (
+            LRUCache(cache_size)
+        )
+
+    @property
+    def definitions(self) -> List[str]:
+        """Names of the definitions calculated, including dependencies."""
+        return [name for steps in self._steps.values() for name, _, _ in steps]
+
+    def reset(self) -> None:
+        """Start a new conversation."""
+        self.history = ConversationHistory(self._trackers)
+
+    def clear_cache(self) -> None:
+        """Forget cached messages, e.g. when the token index is cleared."""
+        self._messages.clear()
+
+    def _message(self, text: str) -> Tuple[MessageFeatures, Dict[str, Any]]:
+        """Get features and message metrics of a message, reusing repeats."""
+        message = self._messages.get(text)
+        if message is None:
+            features = MessageFeatures(text, self.token_index)
+            message = (features, self.calculate_message_metrics(features))
+            self._messages.put(text, message)
+        return message
+
+    def calculate_turn_metrics(
+        self, turn_number: int, agent_a_message: str, agent_b_message: str
+    ) -> Dict[str, Any]:
+        """Calculate the metrics of the next turn of the conversation.
+
+        Args:
+            turn_number: 0-indexed turn number
+            agent_a_message: Message from agent A
+            agent_b_message: Message from agent B
+
+        Returns:
+            Metrics in the engine's output shape
+        """
+        # Extract each message's features once for all metrics
+        features_a, message_a = self._message(agent_a_message)
+        features_b, message_b = self._message(agent_b_message)
+
+        values_a = self._message_values(
+            turn_number, features_a, features_b, "agent_a", message_a
+        )
+        values_b = self._message_values(
+            turn_number, features_a, features_b, "agent_b", message_b
+        )
+
+        context = MetricContext(turn_number, features_a, features_b, self.history)
+        self._run(self._steps[PAIR], context)
+        self.history.record_turn(features_a, features_b)
+        self._run(self._steps[CONVERSATION], context)
+
+        return self.shape_turn(turn_number, values_a, values_b, context.values)
+
+    def replay_turn(self, agent_a_message: str, agent_b_message: str) -> None:
+        """Add an earlier turn to the history without calculating its metrics.
+
+        Restores the state of a conversation whose earlier turns were
+        calculated before, e.g. by an earlier import.
+
+        Args:
+            agent_a_message: Message from agent A
+            agent_b_message: Message from agent B
+        """
+        if not self._trackers:
+            return
+        features_a, _ = self._message(agent_a_message)
+        features_b, _ = self._message(agent_b_message)
+        self.history.record_message("agent_a", features_a)
+        self.history.record_message("agent_b", features_b)
+        self.history.record_turn(features_a, features_b)
+
+    def _message_values(
+        self,
+        turn_number: int,
+        features_a: MessageFeatures,
+        features_b: MessageFeatures,
+        agent: str,
+        message_values: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Calculate one message's cumulative metrics and add it to the history.
+
+        The message's own metrics, message_values, are calculated already.
+        """
+        features = features_a if agent == "agent_a" else features_b
+        context = MetricContext(
+            turn_number, features_a, features_b, self.history, agent, features
+        )
+        context.values.update(message_values)
+        self._run(self._steps[CUMULATIVE], context)
+        self.history.record_message(agent, features)
+        return context.values
+
+    def calculate_message_metrics(self, features: MessageFeatures) -> Dict[str, Any]:
+        """Calculate the metrics that depend only on a message's own text.
+
+        Args:
+            features: Features of the message
+
+        Returns:
+            Message metric values by name, including dependencies
+        """
+        context = MetricContext(0, None, None, agent=None, features=features)
+        return self._run(self._steps[MESSAGE], context)
+
+    def calculate_pair_metrics(
+        self, features_a: MessageFeatures, features_b: MessageFeatures
+    ) -> Dict[str, Any]:
+        """Calculate the metrics that depend only on the messages of one turn.
+
+        Args:
+            features_a: Features of agent A's message
+            features_b: Features of agent B's message
+
+        Returns:
+            Pair metric values by name, including dependencies
+        """
+        context = MetricContext(0, features_a, features_b)
+        return self._run(self._steps[PAIR], context)
+
+    @staticmethod
+    def _run(steps: List[_Step], context: MetricContext) -> Dict[str, Any]:
+        """Calculate metrics in order into context.values."""
+        values = context.values
+        for name, compute, multiple in steps:
+            if multiple:
+                values.update(compute(context))
+            else:
+                values[name] = compute(context)
+        return values
+
+    def shape_turn(
+        self,
+        turn_number: int,
+        values_a: Dict[str, Any],
+        values_b: Dict[str, Any],
+        values_turn: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Arrange calculated metric values in the engine's output shape.
+
+        Args:
+            turn_number: 0-indexed turn number
+            values_a: Agent A's message and cumulative metrics by name
+            values_b: Agent B's message and cumulative metrics by name
+            values_turn: Pair and conversation metrics by name
+
+        Returns:
+            Flat row of a_/b_ prefixed agent metrics and convergence
+            metrics, or turn_number, agent_a, agent_b and convergence dicts
+        """
+        if self.shape == "nested":
+            return {
+                "turn_number": turn_number,
+                "agent_a": {key: values_a[name] for key, name in self._agent_outputs},
+                "agent_b": {key: values_b[name] for key, name in self._agent_outputs},
+                "convergence": {
+                    key: values_turn[name] for key, name in self._turn_outputs
+                },
+            }
+
+        row = {column: values_a[name] for column, name in self._columns_a}
+        row.update((column, values_b[name]) for column, name in self._columns_b)
+        row.update((key, values_turn[name]) for key, name in self._turn_outputs)
+        return row
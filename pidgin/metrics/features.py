@@ -0,0 +1,187 @@
+"""Per-message features shared by all metric analyzers."""
+
+import re
+from collections import Counter
+from itertools import compress
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Union
+
+TOKEN_PATTERN = re.compile(r"\b[\w']+\b")
+SENTENCE_SPLIT_PATTERN = re.compile(r"[.!?]+")
+
+
+class MessageFeatures:
+    """Tokens, counts and character histogram of one message.
+
+    Built once per message so that analyzers don't each re-tokenize,
+    re-lowercase or re-scan the text. N-gram counters and sentence word
+    lengths are computed on first use and then kept. Distinct and repeated
+    n-grams are derived from the bigram counts, so longer n-gram counters
+    are only built for metrics that need every n-gram.
+    """
+
+    def __init__(self, text: str, token_index: Optional[Dict[str, int]] = None):
+        """Extract features from a message.
+
+        Args:
+            text: Message text
+            token_index: Optional token -> ID mapping shared across messages,
+                so token IDs are comparable between them
+        """
+        self.text = text
+        self.tokens: List[str] = TOKEN_PATTERN.findall(text.lower())
+        self.counter: Counter = Counter(self.tokens)
+        self.vocabulary: Set[str] = set(self.counter)
+        self.sentences: List[str] = split_sentences(text)
+        self.char_counts: Counter = Counter(text)
+        self._token_index = token_index
+        self._token_ids: Optional[List[int]] = None
+        self._vocabulary_ids: Optional[FrozenSet[int]] = None
+        self._ngrams: Dict[int, Counter] = {}
+        self._repeated: Dict[int, Counter] = {}
+        self._repeated_starts: Optional[List[int]] = None
+        self._sentence_lengths: Optional[List[int]] = None
+
+    @property
+    def word_count(self) -> int:
+        """Number of tokens."""
+        return len(self.tokens)
+
+    @property
+    def token_ids(self) -> List[int]:
+        """Tokens interned as integer IDs."""
+        if self._token_ids is None:
+            if self._token_index is None:
+                self._token_index = {}
+            index = self._token_index
+            self._token_ids = [
+                index.setdefault(token, len(index)) for token in self.tokens
+            ]
+        return self._token_ids
+
+    @property
+    def vocabulary_ids(self) -> FrozenSet[int]:
+        """Distinct token IDs of the message."""
+        if self._vocabulary_ids is None:
+            self._vocabulary_ids = frozenset(self.token_ids)
+        return self._vocabulary_ids
+
+    @property
+    def sentence_lengths(self) -> List[int]:
+        """Whitespace-separated word count of each sentence."""
+        if self._sentence_lengths is None:
+            self._sentence_lengths = [len(s.split()) for s in self.sentences]
+        return self._sentence_lengths
+
+    def ngrams(self, n: int) -> Counter:
+        """Count the token n-grams of the message.
+
+        Args:
+            n: N-gram length
+
+        Returns:
+            Counter of n-gram tuples
+        """
+        counts = self._ngrams.get(n)
+        if counts is None:
+            tokens = self.tokens
+            counts = Counter(zip(*[tokens[i:] for i in range(n)], strict=False))
+            self._ngrams[n] = counts
+        return counts
+
+    def bigrams(self) -> Iterator[Tuple[str, str]]:
+        """Iterate over the token bigrams in order."""
+        return zip(self.tokens, self.tokens[1:], strict=False)
+
+    def repeated_ngrams(self, n: int) -> Counter:
+        """Count the n-grams that may occur more than once, for n >= 2.
+
+        Every occurrence of a repeated n-gram starts with a repeated
+        bigram, so only n-grams at those positions are counted; all other
+        n-grams of the message occur once.
+
+        Args:
+            n: N-gram length, at least 2
+
+        Returns:
+            Counter of n-gram tuples starting at a repeated bigram
+        """
+        counts = self._repeated.get(n)
+        if counts is None:
+            tokens = self.tokens
+            last = len(tokens) - n
+            counts = Counter(
+                tuple(tokens[i : i + n])
+                for i in self._repeated_bigram_starts()
+                if i <= last
+            )
+            self._repeated[n] = counts
+        return counts
+
+    def distinct_ngrams(self, n: int) -> int:
+        """Number of distinct token n-grams, for n >= 2.
+
+        Equals len(self.ngrams(n)) without counting every n-gram.
+
+        Args:
+            n: N-gram length, at least 2
+
+        Returns:
+            Number of distinct n-grams
+        """
+        if n == 2 or n in self._ngrams:
+            return len(self.ngrams(n))
+        total = len(self.tokens) - n + 1
+        if total <= 0:
+            return 0
+        repeated = self.repeated_ngrams(n)
+        # Each extra occurrence of a repeated n-gram is not distinct
+        return total - sum(repeated.values()) + len(repeated)
+
+    def _repeated_bigram_starts(self) -> List[int]:
+        """Positions of bigrams that occur more than once."""
+        if self._repeated_starts is None:
+            bigrams = self.ngrams(2)
+            tokens = self.tokens
+            if len(bigrams) == len(tokens) - 1:
+                self._repeated_starts = []
+            else:
+                repeated = map((1).__lt__, map(bigrams.__getitem__, self.bigrams()))
+                self._repeated_starts = list(compress(range(len(tokens)), repeated))
+        return self._repeated_starts
+
+    def count_chars(self, chars: Set[str]) -> int:
+        """Count occurrences of any of the given characters.
+
+        Args:
+            chars: Characters to count
+
+        Returns:
+            Total occurrences in the message
+        """
+        return sum(count for c, count in self.char_counts.items() if c in chars)
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into stripped, non-empty sentences.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        List of sentences
+    """
+    return [s for s in (s.strip() for s in SENTENCE_SPLIT_PATTERN.split(text)) if s]
+
+
+def as_features(message: Union[str, MessageFeatures]) -> MessageFeatures:
+    """Get features for a message given either its text or its features.
+
+    Args:
+        message: Message text or already extracted features
+
+    Returns:
+        MessageFeatures for the message
+    """
+    if isinstance(message, MessageFeatures):
+        return message
+    return MessageFeatures(message)
@@ -1,8 +1,9 @@
 """Linguistic and stylistic metrics for conversation analysis."""
 
 import math
+import re
 from collections import Counter
-from typing import Dict, List
+from typing import Dict, List, Tuple, Union
 
 from .constants import (
     AGREEMENT_MARKERS,
@@ -13,10 +14,37 @@ from .constants import (
     POLITENESS_MARKERS,
     SECOND_PERSON,
 )
+from .features import MessageFeatures, as_features
+
+Words = Union[List[str], MessageFeatures]
+
+# Marker word sets, in the order their counts are reported
+MARKER_SETS = {
+    "hedge_words": HEDGE_WORDS,
+    "agreement_markers": AGREEMENT_MARKERS,
+    "disagreement_markers": DISAGREEMENT_MARKERS,
+    "politeness_markers": POLITENESS_MARKERS,
+    "first_person_singular": FIRST_PERSON_SINGULAR,
+    "first_person_plural": FIRST_PERSON_PLURAL,
+    "second_person": SECOND_PERSON,
+}
+
+# Zero-width so that overlapping pairs are all counted
+DOUBLE_QUESTION_PATTERN = re.compile(r"(?=\?\?)")
+
+# Marker categories each word belongs to
+MARKER_INDEX: Dict[str, Tuple[str, ...]] = {
+    word: tuple(name for name, markers in MARKER_SETS.items() if word in markers)
+    for word in set().union(*MARKER_SETS.values())
+}
 
 
 class LinguisticAnalyzer:
-    """Calculates linguistic and stylistic metrics."""
+    """Calculates linguistic and stylistic metrics.
+
+    Methods taking a word list also accept MessageFeatures, in which case
+    they work from its precomputed counters and n-grams.
+    """
 
     @staticmethod
     def calculate_entropy(counter: Counter) -> float:
@@ -37,14 +65,15 @@ class LinguisticAnalyzer:
         return entropy
 
     @staticmethod
-    def calculate_character_entropy(text: str) -> float:
+    def calculate_character_entropy(text: Union[str, MessageFeatures]) -> float:
         """Calculate Shannon entropy of character distribution."""
-        if not text:
+        features = as_features(text)
+        if not features.text:
             return 0.0
 
         # Count character frequencies
-        char_counter = Counter(text)
-        total = len(text)
+        char_counter = features.char_counts
+        total = len(features.text)
 
         entropy = 0.0
         for count in char_counter.values():
@@ -55,8 +84,10 @@ class LinguisticAnalyzer:
         return entropy
 
     @staticmethod
-    def calculate_self_repetition(words: List[str]) -> float:
+    def calculate_self_repetition(words: Words) -> float:
         """Calculate repetition within a single message."""
+        if isinstance(words, MessageFeatures):
+            words = words.tokens
         if len(words) < 2:
             return 0.0
 
@@ -77,8 +108,15 @@ class LinguisticAnalyzer:
         return vocabulary_size / math.sqrt(word_count)
 
     @staticmethod
-    def count_linguistic_markers(words: List[str]) -> Dict[str, int]:
+    def count_linguistic_markers(words: Words) -> Dict[str, int]:
         """Count various linguistic markers in the message."""
+        if isinstance(words, MessageFeatures):
+            counts = dict.fromkeys(MARKER_SETS, 0)
+            for word, count in words.counter.items():
+                for name in MARKER_INDEX.get(word, ()):
+                    counts[name] += count
+            return counts
+
         words_lower = [w.lower() for w in words]
 
         return {
@@ -100,8 +138,14 @@ class LinguisticAnalyzer:
         }
 
     @staticmethod
-    def calculate_formality_score(text: str, words: List[str]) -> float:
+    def calculate_formality_score(
+        text: Union[str, MessageFeatures], words: Words = None
+    ) -> float:
         """Estimate formality based on various indicators."""
+        if isinstance(text, MessageFeatures):
+            return LinguisticAnalyzer._formality_from_features(text)
+        if isinstance(words, MessageFeatures):
+            words = words.tokens
         if not words:
             return 0.5  # Neutral
 
@@ -129,6 +173,34 @@ class LinguisticAnalyzer:
         # Normalize to 0-1 range
         return max(0.0, min(1.0, 0.5 + formal_score))
 
+    @staticmethod
+    def _formality_from_features(features: MessageFeatures) -> float:
+        words = features.tokens
+        if not words:
+            return 0.5
+
+        formal_score = 0.0
+        contraction_count = sum(
+            count for word, count in features.counter.items() if "'" in word
+        )
+        formal_score -= (contraction_count / len(words)) * 0.3
+
+        exclamation_count = features.char_counts["!"]
+        formal_score -= (exclamation_count / len(words)) * 0.2
+
+        # Overlapping "??" pairs; only possible with two or more question marks
+        multi_question = 0
+        if features.char_counts["?"] > 1:
+            multi_question = len(DOUBLE_QUESTION_PATTERN.findall(features.text))
+        formal_score -= (multi_question / len(words)) * 0.1
+
+        long_words = sum(
+            count for word, count in features.counter.items() if len(word) > 7
+        )
+        formal_score += (long_words / len(words)) * 0.3
+
+        return max(0.0, min(1.0, 0.5 + formal_score))
+
     @staticmethod
     def calculate_hapax_legomena_ratio(word_counter: Counter) -> float:
         """Calculate ratio of words appearing only once."""
@@ -144,8 +216,15 @@ class LinguisticAnalyzer:
         return hapax_count / total_unique
 
     @staticmethod
-    def calculate_lexical_diversity_index_ngrams(words: List[str]) -> float:
+    def calculate_lexical_diversity_index_ngrams(words: Words) -> float:
         """Calculate LDI using bigrams and trigrams."""
+        if isinstance(words, MessageFeatures):
+            count = words.word_count
+            if count < 3:
+                return 0.0
+            unique = words.distinct_ngrams(2) + words.distinct_ngrams(3)
+            return unique / ((count - 1) + (count - 2))
+
         if len(words) < 3:
             return 0.0
 
@@ -168,10 +247,19 @@ class LinguisticAnalyzer:
         return (unique_bigrams + unique_trigrams) / total
 
     @staticmethod
-    def count_repeated_ngrams(words: List[str]) -> Dict[str, int]:
+    def count_repeated_ngrams(words: Words) -> Dict[str, int]:
         """Count repeated bigrams and trigrams in the message."""
         result = {"repeated_bigrams": 0, "repeated_trigrams": 0}
 
+        if isinstance(words, MessageFeatures):
+            if words.word_count >= 2:
+                result["repeated_bigrams"] = len(words.repeated_ngrams(2))
+            if words.word_count >= 3:
+                result["repeated_trigrams"] = sum(
+                    1 for count in words.repeated_ngrams(3).values() if count >= 2
+                )
+            return result
+
         if len(words) < 2:
             return result
 
@@ -201,8 +289,22 @@ class LinguisticAnalyzer:
         return result
 
     @staticmethod
-    def calculate_densities(words: List[str], sentences: List[str]) -> Dict[str, float]:
+    def calculate_densities(
+        words: Words, sentences: List[str] = None
+    ) -> Dict[str, float]:
         """Calculate various linguistic densities."""
+        if isinstance(words, MessageFeatures):
+            features = words
+            sentences = features.sentences
+            question_sentences = sum(1 for s in sentences if s.endswith("?"))
+            hedge_count = sum(
+                count for word, count in features.counter.items() if word in HEDGE_WORDS
+            )
+            return {
+                "question_density": question_sentences / max(len(sentences), 1),
+                "hedge_density": hedge_count / max(features.word_count, 1),
+            }
+
         word_count = len(words)
         sentence_count = len(sentences)
 
@@ -0,0 +1,160 @@
+"""MinHash signatures and LSH banding for near-duplicate text detection."""
+
+import operator
+import struct
+import zlib
+from typing import Iterable, List, Sequence, Union
+
+from .features import MessageFeatures, as_features
+
+# Hash values are kept to 32 bits so signatures fit DuckDB UINTEGER[]
+MAX_HASH = (1 << 32) - 1
+EMPTY_BIN = MAX_HASH + 1
+GOLDEN_RATIO_32 = 0x9E3779B1
+
+
+class MinHasher:
+    """Computes MinHash signatures of messages' word shingles.
+
+    Shingles are the message's word n-grams, taken from the same token
+    stream the other metrics use; messages shorter than n words are one
+    shingle. Uses one-permutation hashing: each shingle is hashed once,
+    the hash picks one of num_perm bins, and each bin keeps its minimum.
+    Empty bins borrow the value of the next non-empty bin, offset by the
+    distance, so that signatures of short messages stay comparable. The
+    share of equal positions in two signatures estimates the Jaccard
+    similarity of their shingle sets.
+
+    Signatures are deterministic, so they can be stored and compared across
+    imports.
+    """
+
+    def __init__(self, num_perm: int = 32, shingle_size: int = 3):
+        """Initialize hasher.
+
+        Args:
+            num_perm: Signature length, a power of two up to 256
+            shingle_size: Words per shingle
+
+        Raises:
+            ValueError: If num_perm is not a power of two up to 256
+        """
+        if num_perm < 1 or num_perm > 256 or num_perm & (num_perm - 1):
+            raise ValueError(
+                f"num_perm must be a power of two up to 256, got {num_perm}"
+            )
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        # Top bits of the hash pick the bin, the rest is the value
+        self._value_bits = 32 - (num_perm.bit_length() - 1)
+        self._value_mask = (1 << self._value_bits) - 1
+
+    def signature(self, message: Union[str, MessageFeatures]) -> List[int]:
+        """Compute the MinHash signature of a message.
+
+        Args:
+            message: Message text or features
+
+        Returns:
+            num_perm hash values, or an empty list if the message has no words
+        """
+        features = as_features(message)
+        if not features.tokens:
+            return []
+        if features.word_count < self.shingle_size:
+            shingles: Iterable[Sequence[str]] = [features.tokens]
+        else:
+            shingles = features.ngrams(self.shingle_size)
+
+        bins = [EMPTY_BIN] * self.num_perm
+        value_bits = self._value_bits
+        value_mask = self._value_mask
+        for shingle in shingles:
+            # Multiplicative mixing spreads CRC32 output over the top bits
+            h = (zlib.crc32(" ".join(shingle).encode()) * GOLDEN_RATIO_32) & MAX_HASH
+            index = h >> value_bits
+            value = h & value_mask
+            if value < bins[index]:
+                bins[index] = value
+
+        return self._densify(bins)
+
+    def _densify(self, bins: List[int]) -> List[int]:
+        """Fill empty bins from the next non-empty bin to the right."""
+        if EMPTY_BIN not in bins:
+            return bins
+        size = len(bins)
+        offset = self._value_mask + 1
+        signature = list(bins)
+        for i in range(size):
+            if bins[i] != EMPTY_BIN:
+                continue
+            for distance in range(1, size):
+                value = bins[(i + distance) % size]
+                if value != EMPTY_BIN:
+                    # Borrowed values are at least offset, above any own value
+                    signature[i] = value + distance * offset
+                    break
+        return signature
+
+    def merge(self, signatures: Iterable[List[int]]) -> List[int]:
+        """Signature of the union of several messages' shingles.
+
+        Args:
+            signatures: Signatures from this hasher; empty ones are skipped
+
+        Returns:
+            Signature of the combined shingles, or an empty list if all
+            were empty
+        """
+        non_empty = [signature for signature in signatures if signature]
+        if not non_empty:
+            return []
+        # Values below the offset are bin minimums; others were borrowed
+        offset = self._value_mask + 1
+        bins = [
+            min((value for value in values if value < offset), default=EMPTY_BIN)
+            for values in zip(*non_empty, strict=True)
+        ]
+        return self._densify(bins)
+
+
+def estimate_similarity(signature_a: List[int], signature_b: List[int]) -> float:
+    """Estimate the Jaccard similarity of two signatures' shingle sets.
+
+    Args:
+        signature_a: First signature
+        signature_b: Second signature
+
+    Returns:
+        Share of equal positions; 0.0 if either signature is empty
+
+    Raises:
+        ValueError: If the signatures differ in length
+    """
+    if not signature_a or not signature_b:
+        return 0.0
+    if len(signature_a) != len(signature_b):
+        raise ValueError("Signatures must have the same length")
+    return sum(map(operator.eq, signature_a, signature_b)) / len(signature_a)
+
+
+def band_buckets(signature: List[int], bands: int) -> List[int]:
+    """Hash each band of a signature to an LSH bucket.
+
+    Items sharing a bucket in any band are candidate near-duplicates. With
+    b bands of r rows, items of similarity s share a bucket with
+    probability 1 - (1 - s^r)^b.
+
+    Args:
+        signature: MinHash signature, of a length divisible by bands
+        bands: Number of bands
+
+    Returns:
+        One 32-bit bucket per band
+    """
+    rows = len(signature) // bands
+    return [
+        zlib.crc32(struct.pack(f"<{rows}I", *signature[i * rows : (i + 1) * rows]))
+        for i in range(bands)
+    ]
@@ -0,0 +1,129 @@
+"""Sliding-window n-gram index for phrase repetition metrics."""
+
+from collections import Counter, deque
+from typing import Deque, Optional, Tuple, Union
+
+from .features import MessageFeatures, as_features
+
+
+class PhraseCounts:
+    """N-gram counts that also track how many n-grams occur more than once."""
+
+    def __init__(self) -> None:
+        """Initialize empty counts."""
+        self.counts: Counter = Counter()
+        self.total = 0
+        self.repeated = 0
+
+    def add(self, ngrams: Counter) -> None:
+        """Count the n-grams of one message.
+
+        Args:
+            ngrams: N-gram counts of the message
+        """
+        counts = self.counts
+        for gram, count in ngrams.items():
+            before = counts[gram]
+            counts[gram] = before + count
+            if before <= 1 < before + count:
+                self.repeated += 1
+        self.total += sum(ngrams.values())
+
+    def remove(self, ngrams: Counter) -> None:
+        """Uncount the n-grams of a message previously added.
+
+        Args:
+            ngrams: N-gram counts of the message
+        """
+        counts = self.counts
+        for gram, count in ngrams.items():
+            before = counts[gram]
+            after = before - count
+            if after <= 1 < before:
+                self.repeated -= 1
+            if after:
+                counts[gram] = after
+            else:
+                del counts[gram]
+        self.total -= sum(ngrams.values())
+
+    @property
+    def repetition_ratio(self) -> float:
+        """Distinct repeated n-grams per n-gram counted."""
+        return self.repeated / self.total if self.total else 0.0
+
+
+class RollingNgramIndex:
+    """Repeated-phrase counts over the last few messages, kept up to date.
+
+    Adding a message counts its n-grams and uncounts those of the message
+    leaving the window, so each update costs O(tokens of the two messages)
+    regardless of window size or conversation length. Messages shorter than
+    n words still take a place in the window.
+
+    A PhraseCounts passed as corpus accumulates the n-grams of every message
+    added, without eviction; share one between indexes to get running
+    counts across conversations.
+    """
+
+    def __init__(
+        self, window: int = 10, n: int = 3, corpus: Optional[PhraseCounts] = None
+    ):
+        """Initialize index.
+
+        Args:
+            window: Number of most recent messages to count
+            n: Phrase length in words
+            corpus: Optional counts of all messages ever added
+        """
+        self.window = window
+        self.n = n
+        self.corpus = corpus
+        self.phrases = PhraseCounts()
+        self.messages_added = 0
+        self._messages: Deque[Counter] = deque()
+
+    def add(self, message: Union[str, MessageFeatures]) -> None:
+        """Add a message, evicting the oldest one beyond the window.
+
+        Args:
+            message: Message text or features
+        """
+        features = as_features(message)
+        ngrams = features.ngrams(self.n)
+
+        self._messages.append(ngrams)
+        self.phrases.add(ngrams)
+        if self.corpus is not None:
+            self.corpus.add(ngrams)
+        if len(self._messages) > self.window:
+            self.phrases.remove(self._messages.popleft())
+        self.messages_added += 1
+
+    @property
+    def repetition_ratio(self) -> float:
+        """Repetition ratio of the messages in the window.
+
+        Same value as ConvergenceCalculator.calculate_repetition_ratio over
+        those messages.
+        """
+        if len(self._messages) < 2:
+            return 0.0
+        return self.phrases.repetition_ratio
+
+    def count(self, phrase: Tuple[str, ...]) -> int:
+        """Occurrences of a phrase in the window.
+
+        Args:
+            phrase: Tuple of n lowercase words
+
+        Returns:
+            Number of occurrences
+        """
+        return self.phrases.counts[phrase]
+
+    def reset(self) -> None:
+        """Empty the window; corpus counts are kept."""
+        self.phrases = PhraseCounts()
+        self.messages_added = 0
+        self._messages.clear()
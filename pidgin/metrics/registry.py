@@ -0,0 +1,198 @@
+"""Registry of metric definitions for the metrics engine."""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Scopes, in the order they are calculated within a turn
+MESSAGE = "message"  # One message's own text
+CUMULATIVE = "cumulative"  # One message given the agent's earlier messages
+PAIR = "pair"  # The two messages of a turn
+CONVERSATION = "conversation"  # The whole conversation up to this turn
+
+SCOPES = (MESSAGE, CUMULATIVE, PAIR, CONVERSATION)
+
+# Scopes whose values a metric of each scope may depend on
+_DEPENDENCY_SCOPES = {
+    MESSAGE: (MESSAGE,),
+    CUMULATIVE: (MESSAGE, CUMULATIVE),
+    PAIR: (PAIR,),
+    CONVERSATION: (PAIR, CONVERSATION),
+}
+
+# Conversation state a metric can read, see ConversationHistory
+HISTORY_TRACKERS = ("vocabulary", "reuse", "compression", "phrases")
+
+
+class MetricContext:
+    """What a metric's compute function is given.
+
+    For message and cumulative metrics, features and agent are those of the
+    message being measured; for pair and conversation metrics, they are
+    None. history is the conversation state before the message for
+    cumulative metrics and after the turn for conversation metrics.
+    values holds the metrics already calculated for the same message or
+    turn, including dependencies.
+    """
+
+    __slots__ = (
+        "agent",
+        "features",
+        "features_a",
+        "features_b",
+        "history",
+        "turn_number",
+        "values",
+    )
+
+    def __init__(
+        self,
+        turn_number: int,
+        features_a: Any,
+        features_b: Any,
+        history: Any = None,
+        agent: Optional[str] = None,
+        features: Any = None,
+    ):
+        self.turn_number = turn_number
+        self.features_a = features_a
+        self.features_b = features_b
+        self.history = history
+        self.agent = agent
+        self.features = features
+        self.values: Dict[str, Any] = {}
+
+
+@dataclass(frozen=True)
+class MetricDefinition:
+    """A named metric and how to calculate it.
+
+    Attributes:
+        name: Metric name
+        scope: MESSAGE, CUMULATIVE, PAIR or CONVERSATION
+        compute: Function of a MetricContext returning the value, or a dict
+            of values if outputs is set
+        dependencies: Metrics that must be calculated first, read from
+            context.values
+        outputs: Names of the metrics a multi-valued compute returns;
+            empty if it returns the single value of name
+        history: Conversation state the metric reads (see HISTORY_TRACKERS)
+    """
+
+    name: str
+    scope: str
+    compute: Callable[[MetricContext], Any]
+    dependencies: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    history: Tuple[str, ...] = ()
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Metrics this definition provides."""
+        return self.outputs or (self.name,)
+
+
+class MetricRegistry:
+    """Ordered collection of metric definitions.
+
+    Dependencies must be registered before the metrics that use them, so
+    registration order is always a valid calculation order.
+    """
+
+    def __init__(self) -> None:
+        self._definitions: List[MetricDefinition] = []
+        # Metric name -> definition providing it
+        self._providers: Dict[str, MetricDefinition] = {}
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._providers
+
+    def __iter__(self):
+        return iter(self._definitions)
+
+    def get(self, name: str) -> MetricDefinition:
+        """Get the definition providing a metric.
+
+        Raises:
+            KeyError: If no definition provides the metric
+        """
+        try:
+            return self._providers[name]
+        except KeyError:
+            raise KeyError(f"Unknown metric '{name}'") from None
+
+    def register(
+        self,
+        name: str,
+        scope: str,
+        compute: Optional[Callable[[MetricContext], Any]] = None,
+        dependencies: Iterable[str] = (),
+        outputs: Iterable[str] = (),
+        history: Iterable[str] = (),
+    ) -> Any:
+        """Register a metric, or return a decorator that registers one.
+
+        Args:
+            name: Metric name
+            scope: MESSAGE, CUMULATIVE, PAIR or CONVERSATION
+            compute: Function of a MetricContext; if omitted, the decorated
+                function is used
+            dependencies: Metrics the compute function reads
+            outputs: Metric names of a compute function returning a dict
+            history: Conversation state the compute function reads
+
+        Returns:
+            compute, or a decorator if compute was omitted
+
+        Raises:
+            ValueError: If the scope, a dependency or a tracker is invalid,
+                or a metric is already registered
+        """
+        if compute is None:
+            return lambda function: self.register(
+                name, scope, function, dependencies, outputs, history
+            )
+
+        definition = MetricDefinition(
+            name, scope, compute, tuple(dependencies), tuple(outputs), tuple(history)
+        )
+        if scope not in SCOPES:
+            raise ValueError(f"Unknown scope '{scope}' for metric '{name}'")
+        for dependency in definition.dependencies:
+            provider = self._providers.get(dependency)
+            if provider is None or provider.scope not in _DEPENDENCY_SCOPES[scope]:
+                raise ValueError(
+                    f"Metric '{name}' depends on '{dependency}', which is not "
+                    f"a registered {' or '.join(_DEPENDENCY_SCOPES[scope])} metric"
+                )
+        for tracker in definition.history:
+            if tracker not in HISTORY_TRACKERS:
+                raise ValueError(f"Unknown history '{tracker}' for metric '{name}'")
+        for provided in {name, *definition.names}:
+            if provided in self._providers or any(
+                d.name == provided for d in self._definitions
+            ):
+                raise ValueError(f"Metric '{provided}' is already registered")
+
+        self._definitions.append(definition)
+        for provided in definition.names:
+            self._providers[provided] = definition
+        return compute
+
+    def resolve(self, names: Iterable[str]) -> List[MetricDefinition]:
+        """Get the definitions needed to calculate some metrics.
+
+        Args:
+            names: Metric names
+
+        Returns:
+            Definitions of the metrics and everything they depend on, in
+            calculation order
+        """
+        needed = set()
+        pending = [self.get(name) for name in names]
+        while pending:
+            definition = pending.pop()
+            if definition.name not in needed:
+                needed.add(definition.name)
+                pending.extend(self.get(dep) for dep in definition.dependencies)
+        return [d for d in self._definitions if d.name in needed]
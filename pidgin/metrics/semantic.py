@@ -0,0 +1,200 @@
+"""Hashed TF-IDF embeddings for offline semantic similarity."""
+
+import math
+import zlib
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .cache import LRUCache
+from .features import TOKEN_PATTERN
+
+# Sparse vector: hashed feature bucket -> weight
+SparseVector = Dict[int, float]
+
+
+class HashedEmbedder:
+    """Embeds messages as L2-normalized TF-IDF vectors of hashed features.
+
+    Features are the lowercase words of a message and the character
+    n-grams of each word, including its boundaries, so that inflections
+    and spelling variants still overlap. Features are hashed into a fixed
+    number of buckets with CRC32, which keeps memory bounded and results
+    reproducible between runs. Inverse document frequencies come from the
+    texts passed to fit(); until then all features weigh the same.
+
+    This is a lexical approximation of semantic similarity that runs on
+    CPU without models or network access.
+    """
+
+    def __init__(
+        self, dimensions: int = 2**20, char_ngram: int = 3, cache_size: int = 10000
+    ):
+        """Initialize embedder.
+
+        Args:
+            dimensions: Number of hash buckets
+            char_ngram: Character n-gram length
+            cache_size: Maximum number of distinct texts whose vectors are
+                kept, most recently used first
+        """
+        self.dimensions = dimensions
+        self.char_ngram = char_ngram
+        self.document_count = 0
+        self.document_frequency: Counter = Counter()
+        self._word_buckets: LRUCache[str, Tuple[int, ...]] = LRUCache(cache_size * 10)
+        self._term_counts: LRUCache[str, Counter] = LRUCache(cache_size)
+        self._vectors: LRUCache[str, SparseVector] = LRUCache(cache_size)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the fitted weights without the caches, e.g. for workers."""
+        state = self.__dict__.copy()
+        for name in ("_word_buckets", "_term_counts", "_vectors"):
+            state[name] = LRUCache(state[name].maxsize)
+        return state
+
+    def _bucket(self, feature: str) -> int:
+        return zlib.crc32(feature.encode()) % self.dimensions
+
+    def _buckets_for_word(self, word: str) -> Tuple[int, ...]:
+        """Hash buckets of a word and its character n-grams, memoized."""
+        buckets = self._word_buckets.get(word)
+        if buckets is None:
+            padded = f"<{word}>"
+            n = self.char_ngram
+            grams = (padded[i : i + n] for i in range(max(len(padded) - n + 1, 1)))
+            buckets = (
+                self._bucket(f"w:{word}"),
+                *(self._bucket(f"c:{gram}") for gram in grams),
+            )
+            self._word_buckets.put(word, buckets)
+        return buckets
+
+    def term_counts(self, text: str) -> Counter:
+        """Count the hashed features of a text.
+
+        Args:
+            text: Message text
+
+        Returns:
+            Counter of bucket -> occurrences
+        """
+        counts = self._term_counts.get(text)
+        if counts is None:
+            counts = Counter()
+            for word, count in Counter(TOKEN_PATTERN.findall(text.lower())).items():
+                for bucket in self._buckets_for_word(word):
+                    counts[bucket] += count
+            self._term_counts.put(text, counts)
+        return counts
+
+    def fit(self, texts: Iterable[str]) -> None:
+        """Add texts to the corpus used for inverse document frequencies.
+
+        Vectors embedded before the call are recomputed on next use.
+
+        Args:
+            texts: Documents, one per message
+        """
+        for text in texts:
+            self.document_frequency.update(self.term_counts(text).keys())
+            self.document_count += 1
+        self._vectors.clear()
+
+    def idf(self, bucket: int) -> float:
+        """Smoothed inverse document frequency of a bucket."""
+        return (
+            math.log((1 + self.document_count) / (1 + self.document_frequency[bucket]))
+            + 1
+        )
+
+    def embed(self, text: str) -> SparseVector:
+        """Get the normalized TF-IDF vector of a text.
+
+        Args:
+            text: Message text
+
+        Returns:
+            Sparse vector; empty if the text has no words
+        """
+        vector = self._vectors.get(text)
+        if vector is None:
+            vector = {
+                bucket: count * self.idf(bucket)
+                for bucket, count in self.term_counts(text).items()
+            }
+            norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+            if norm:
+                vector = {bucket: weight / norm for bucket, weight in vector.items()}
+            self._vectors.put(text, vector)
+        return vector
+
+    def similarity(self, text_a: Optional[str], text_b: Optional[str]) -> float:
+        """Cosine similarity of two texts.
+
+        Args:
+            text_a: First text
+            text_b: Second text
+
+        Returns:
+            Similarity from 0.0 to 1.0; 0.0 if either text is missing or empty
+        """
+        if not text_a or not text_b:
+            return 0.0
+        return cosine(self.embed(text_a), self.embed(text_b))
+
+    def calculate_conversation(
+        self,
+        initial_prompt: Optional[str],
+        turns: Iterable[Tuple[int, str, str]],
+        previous: Optional[Tuple[int, str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Calculate semantic similarity metrics for every turn of a conversation.
+
+        Args:
+            initial_prompt: Prompt the conversation started from, if known
+            turns: (turn_number, agent_a_message, agent_b_message) tuples in
+                turn order
+            previous: The turn before the first, in the same form, if it
+                was calculated earlier
+
+        Returns:
+            One dictionary per turn with semantic_similarity (A to B),
+            a/b_prompt_similarity and a/b_self_similarity (to the agent's
+            message in the previous turn)
+        """
+        results = []
+        previous_a = previous_b = None
+        if previous is not None:
+            _, previous_a, previous_b = previous
+        for _, message_a, message_b in turns:
+            results.append(
+                {
+                    "semantic_similarity": self.similarity(message_a, message_b),
+                    "a_prompt_similarity": self.similarity(message_a, initial_prompt),
+                    "b_prompt_similarity": self.similarity(message_b, initial_prompt),
+                    "a_self_similarity": self.similarity(message_a, previous_a),
+                    "b_self_similarity": self.similarity(message_b, previous_b),
+                }
+            )
+            previous_a, previous_b = message_a, message_b
+        return results
+
+
+def cosine(vector_a: SparseVector, vector_b: SparseVector) -> float:
+    """Dot product of two normalized sparse vectors.
+
+    Args:
+        vector_a: First vector
+        vector_b: Second vector
+
+    Returns:
+        Cosine similarity, clamped to at most 1.0
+    """
+    if len(vector_b) < len(vector_a):
+        vector_a, vector_b = vector_b, vector_a
+    dot = sum(
+        weight * vector_b[bucket]
+        for bucket, weight in vector_a.items()
+        if bucket in vector_b
+    )
+    return min(float(dot), 1.0)
@@ -2,56 +2,77 @@
 
 import re
 from collections import Counter
-from typing import List, Set, Tuple
+from typing import List, Optional, Set, Tuple, Union
 
 from .constants import (
     ACKNOWLEDGMENT_REGEX,
     ALL_SPECIAL_SYMBOLS,
     ARROW_PATTERN,
+    ARROWS,
     EMOJI_PATTERN,
-    EXCLAMATION_PATTERN,
-    MATH_PATTERN,
-    QUESTION_PATTERN,
+    MATH_SYMBOLS,
     SENTENCE_ENDINGS,
 )
+from .features import TOKEN_PATTERN, MessageFeatures, as_features, split_sentences
+
+# Integers, decimals, and formatted numbers
+NUMBER_PATTERN = re.compile(r"\b\d+(?:[.,]\d+)*\b")
+PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+
+# Symbols counted by the emoji, arrow and math patterns in count_special_symbols
+_PATTERN_SYMBOLS = set("→←↑↓⟶⟵+-*/=≈≠≤≥<>")
+OTHER_SPECIAL_SYMBOLS = ALL_SPECIAL_SYMBOLS - _PATTERN_SYMBOLS
+
+# Every arrow match contains one of these characters
+_ARROW_CHARS = ARROWS | {"<", ">"}
+
+Text = Union[str, MessageFeatures]
 
 
 class TextAnalyzer:
-    """Handles text analysis operations for metrics."""
+    """Handles text analysis operations for metrics.
+
+    Methods taking a message accept either its text or its MessageFeatures;
+    passing features lets counts come from the shared character histogram
+    instead of another scan of the text.
+    """
 
     @staticmethod
     def tokenize(text: str) -> List[str]:
         """Simple word tokenization (handles contractions too)."""
-        return re.findall(r"\b[\w']+\b", text.lower())
+        return TOKEN_PATTERN.findall(text.lower())
 
     @staticmethod
-    def split_sentences(text: str) -> List[str]:
+    def split_sentences(text: Text) -> List[str]:
         """Split text into sentences using regex."""
-        sentences = re.split(r"[.!?]+", text)
-        return [s.strip() for s in sentences if s.strip()]
+        if isinstance(text, MessageFeatures):
+            return text.sentences
+        return split_sentences(text)
 
     @staticmethod
-    def count_sentences(text: str) -> int:
+    def count_sentences(text: Text) -> int:
         """Count sentences based on punctuation."""
-        return len(re.findall(SENTENCE_ENDINGS, text))
+        return len(SENTENCE_ENDINGS.findall(as_features(text).text))
 
     @staticmethod
-    def count_questions(text: str) -> int:
-        return len(re.findall(QUESTION_PATTERN, text))
+    def count_questions(text: Text) -> int:
+        return as_features(text).char_counts["?"]
 
     @staticmethod
-    def count_exclamations(text: str) -> int:
-        return len(re.findall(EXCLAMATION_PATTERN, text))
+    def count_exclamations(text: Text) -> int:
+        return as_features(text).char_counts["!"]
 
     @staticmethod
-    def count_paragraphs(text: str) -> int:
+    def count_paragraphs(text: Text) -> int:
         """Count paragraphs (separated by double newlines)."""
-        paragraphs = text.strip().split("\n\n")
+        paragraphs = as_features(text).text.strip().split("\n\n")
         return len([p for p in paragraphs if p.strip()])
 
     @staticmethod
-    def count_proper_nouns(words: List[str]) -> int:
+    def count_proper_nouns(words: Union[List[str], MessageFeatures]) -> int:
         """Estimate proper nouns by counting capitalized words not at sentence start."""
+        if isinstance(words, MessageFeatures):
+            words = words.tokens
         if not words:
             return 0
 
@@ -65,60 +86,81 @@ class TextAnalyzer:
         return proper_count
 
     @staticmethod
-    def count_numbers(text: str) -> int:
+    def count_numbers(text: Text) -> int:
         """Count numeric tokens in text."""
-        # Match integers, decimals, and formatted numbers
-        number_pattern = r"\b\d+(?:[.,]\d+)*\b"
-        return len(re.findall(number_pattern, text))
+        features = as_features(text)
+        if not any(char.isdecimal() for char in features.char_counts):
+            return 0
+        return len(NUMBER_PATTERN.findall(features.text))
 
     @staticmethod
-    def starts_with_acknowledgment(message: str) -> bool:
+    def starts_with_acknowledgment(message: Text) -> bool:
         """Check if message starts with acknowledgment phrase."""
-        return bool(ACKNOWLEDGMENT_REGEX.match(message.strip().lower()))
+        text = as_features(message).text
+        return bool(ACKNOWLEDGMENT_REGEX.match(text.strip().lower()))
 
     @staticmethod
-    def count_special_symbols(message: str) -> int:
-        """Count emojis, arrows, math symbols, and other special characters."""
-        emoji_count = len(EMOJI_PATTERN.findall(message))
-        arrow_count = len(ARROW_PATTERN.findall(message))
-        math_count = len(MATH_PATTERN.findall(message))
+    def count_special_symbols(
+        message: Text,
+        emoji_count: Optional[int] = None,
+        arrow_count: Optional[int] = None,
+    ) -> int:
+        """Count emojis, arrows, math symbols, and other special characters.
+
+        Emoji and arrow counts already calculated for the message may be
+        passed in to skip counting them again.
+        """
+        features = as_features(message)
+        if emoji_count is None:
+            emoji_count = TextAnalyzer.count_emojis(features)
+        if arrow_count is None:
+            arrow_count = TextAnalyzer.count_arrows(features)
+        math_count = features.count_chars(MATH_SYMBOLS)
 
         # Count other special symbols not covered above
-        other_count = 0
-        for char in message:
-            if char in ALL_SPECIAL_SYMBOLS and char not in "→←↑↓⟶⟵+-*/=≈≠≤≥<>":
-                other_count += 1
+        other_count = features.count_chars(OTHER_SPECIAL_SYMBOLS)
 
         return emoji_count + arrow_count + math_count + other_count
 
     @staticmethod
-    def calculate_punctuation_diversity(text: str) -> int:
+    def calculate_punctuation_diversity(text: Text) -> int:
         """Count unique punctuation marks used."""
-        punctuation = set(re.findall(r"[^\w\s]", text))
-        return len(punctuation)
+        distinct_chars = "".join(as_features(text).char_counts)
+        return len(PUNCTUATION_PATTERN.findall(distinct_chars))
 
     @staticmethod
-    def get_word_frequencies(message: str) -> Tuple[Counter, Set[str]]:
+    def get_word_frequencies(message: Text) -> Tuple[Counter, Set[str]]:
         """Get word frequency counter and vocabulary set."""
-        words = TextAnalyzer.tokenize(message)
-        return Counter(words), set(words)
+        features = as_features(message)
+        return Counter(features.counter), set(features.vocabulary)
 
     @staticmethod
-    def calculate_symbol_density(text: str) -> float:
+    def calculate_symbol_density(text: Text) -> float:
         """Calculate non-alphabetic character density."""
-        if not text:
+        features = as_features(text)
+        if not features.text:
             return 0.0
 
         # Count non-alphabetic characters (excluding spaces)
-        non_alpha = sum(1 for char in text if not char.isalpha() and not char.isspace())
-        return non_alpha / len(text)
+        non_alpha = sum(
+            count
+            for char, count in features.char_counts.items()
+            if not char.isalpha() and not char.isspace()
+        )
+        return non_alpha / len(features.text)
 
     @staticmethod
-    def count_emojis(text: str) -> int:
+    def count_emojis(text: Text) -> int:
         """Count Unicode emoji characters."""
+        text = as_features(text).text
+        if text.isascii():
+            return 0
         return len(EMOJI_PATTERN.findall(text))
 
     @staticmethod
-    def count_arrows(text: str) -> int:
+    def count_arrows(text: Text) -> int:
         """Count arrow symbols (both ASCII and Unicode)."""
-        return len(ARROW_PATTERN.findall(text))
+        features = as_features(text)
+        if _ARROW_CHARS.isdisjoint(features.char_counts):
+            return 0
+        return len(ARROW_PATTERN.findall(features.text))
@@ -0,0 +1,152 @@
+"""Compact cumulative vocabularies over interned token IDs."""
+
+from typing import Collection, Dict, Iterable, List
+
+
+class TokenBitset:
+    """Growable set of token IDs stored one bit per ID.
+
+    Token IDs come from a shared token index (see MessageFeatures), so they
+    are small, dense integers. Membership tests and insertions are O(1),
+    and a vocabulary of n distinct IDs takes about n / 8 bytes.
+    """
+
+    def __init__(self, token_ids: Iterable[int] = ()):
+        """Initialize bitset.
+
+        Args:
+            token_ids: Initial token IDs
+        """
+        self._bits = bytearray()
+        self._size = 0
+        self.update(token_ids)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, token_id: int) -> bool:
+        byte = token_id >> 3
+        return byte < len(self._bits) and bool(self._bits[byte] & (1 << (token_id & 7)))
+
+    def add(self, token_id: int) -> bool:
+        """Add a token ID.
+
+        Args:
+            token_id: Non-negative token ID
+
+        Returns:
+            True if the ID was not in the set yet
+        """
+        byte = token_id >> 3
+        if byte >= len(self._bits):
+            # Grow geometrically so appending new IDs stays amortized O(1)
+            self._bits.extend(
+                bytes(max(byte + 1, 2 * len(self._bits)) - len(self._bits))
+            )
+        mask = 1 << (token_id & 7)
+        if self._bits[byte] & mask:
+            return False
+        self._bits[byte] |= mask
+        self._size += 1
+        return True
+
+    def update(self, token_ids: Iterable[int]) -> List[int]:
+        """Add token IDs.
+
+        Args:
+            token_ids: Token IDs, each at most once
+
+        Returns:
+            IDs that were not in the set yet
+        """
+        return [token_id for token_id in token_ids if self.add(token_id)]
+
+
+class CumulativeVocabulary:
+    """Words used so far by each agent, with their overlap kept current.
+
+    The number of words shared by both agents is updated as words are
+    added, so the Jaccard overlap of the cumulative vocabularies costs
+    O(new words) per message rather than a pass over both vocabularies.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty vocabularies for agent_a and agent_b."""
+        self.words: Dict[str, TokenBitset] = {
+            "agent_a": TokenBitset(),
+            "agent_b": TokenBitset(),
+        }
+        self.shared = 0
+
+    def add(self, agent: str, token_ids: Iterable[int]) -> List[int]:
+        """Add the distinct token IDs of one of an agent's messages.
+
+        Args:
+            agent: Agent ID
+            token_ids: Distinct token IDs of the message
+
+        Returns:
+            IDs the agent had not used before
+        """
+        new_words = self.words[agent].update(token_ids)
+        other = self.words["agent_b" if agent == "agent_a" else "agent_a"]
+        self.shared += sum(1 for token_id in new_words if token_id in other)
+        return new_words
+
+    def overlap(self) -> float:
+        """Jaccard similarity of the agents' cumulative vocabularies.
+
+        Returns:
+            Similarity from 0.0 to 1.0; 0.0 while either vocabulary is empty
+        """
+        size_a = len(self.words["agent_a"])
+        size_b = len(self.words["agent_b"])
+        if not size_a or not size_b:
+            return 0.0
+        return self.shared / (size_a + size_b - self.shared)
+
+
+class VocabularyReuse:
+    """How much of each agent's earlier message vocabularies is reused.
+
+    For each token, the sum of 1/|vocabulary| over the agent's earlier
+    messages containing it is kept, so the mean share of each earlier
+    message's vocabulary found in a new message costs one lookup per
+    token of the new message instead of one set intersection per earlier
+    message.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty histories for agent_a and agent_b."""
+        self.weights: Dict[str, Dict[int, float]] = {"agent_a": {}, "agent_b": {}}
+        self.message_counts: Dict[str, int] = {"agent_a": 0, "agent_b": 0}
+
+    def repetition(self, agent: str, token_ids: Iterable[int]) -> float:
+        """Mean share of each earlier message's vocabulary that is reused.
+
+        Args:
+            agent: Agent ID
+            token_ids: Distinct token IDs of the new message
+
+        Returns:
+            Share from 0.0 to 1.0; 0.0 if the agent has no earlier messages
+        """
+        count = self.message_counts[agent]
+        if not count:
+            return 0.0
+        weights = self.weights[agent]
+        return sum(weights.get(token_id, 0.0) for token_id in token_ids) / count
+
+    def add(self, agent: str, token_ids: Collection[int]) -> None:
+        """Add the distinct token IDs of one of an agent's messages.
+
+        Args:
+            agent: Agent ID
+            token_ids: Distinct token IDs of the message
+        """
+        self.message_counts[agent] += 1
+        if token_ids:
+            weight = 1 / len(token_ids)
+            weights = self.weights[agent]
+            for token_id in token_ids:
+                weights[token_id] = weights.get(token_id, 0.0) + weight
@@ -108,6 +108,7 @@ class ConversationPanelBuilder:
         table.add_column("Turn", width=10)
         table.add_column("Models", width=20)
         table.add_column("Tokens", width=8)
+        table.add_column("Latency", width=14)
         table.add_column("Convergence", width=12)
         table.add_column("Truncation", width=10)
         table.add_column("Duration", width=10)
@@ -146,8 +147,10 @@ class ConversationPanelBuilder:
         # Duration
         duration_str = self._format_duration(conv.started_at, conv.completed_at)
 
-        # Tokens
-        tokens_str = self._get_conversation_tokens(exp, conv)
+        # Tokens and latency (both from the manifest)
+        conv_data = self._read_conversation_manifest(exp, conv)
+        tokens_str = self._get_conversation_tokens(conv_data)
+        latency_str = self._get_latency_display(conv_data)
 
         table.add_row(
             exp.name[:15],
@@ -156,6 +159,7 @@ class ConversationPanelBuilder:
             f"[{turn_color}]{turn_str}[/{turn_color}]",
             models_str,
             tokens_str,
+            latency_str,
             conv_str,
             trunc_str,
             duration_str,
@@ -247,28 +251,56 @@ class ConversationPanelBuilder:
             minutes = (total_seconds % 3600) // 60
             return f"{hours}h {minutes}m"
 
-    def _get_conversation_tokens(self, exp, conv):
-        """Get token count for a conversation from manifest."""
-        tokens_str = "-"
+    def _read_conversation_manifest(self, exp, conv):
+        """Get a conversation's manifest entry."""
         manifest_path = exp.directory / "manifest.json"
         if manifest_path.exists():
             try:
                 with open(manifest_path) as f:
                     manifest = json.load(f)
-                    conv_data = manifest.get("conversations", {}).get(
-                        conv.conversation_id, {}
-                    )
-                    if "token_usage" in conv_data:
-                        total_tokens = conv_data["token_usage"].get("total", 0)
-                        if total_tokens > 0:
-                            if total_tokens > 1000:
-                                tokens_str = f"{total_tokens / 1000:.1f}K"
-                            else:
-                                tokens_str = str(total_tokens)
+                return manifest.get("conversations", {}).get(conv.conversation_id, {})
             except Exception as e:
-                logger.debug(f"Error reading tokens for {conv.conversation_id}: {e}")
+                logger.debug(f"Error reading manifest for {conv.conversation_id}: {e}")
+        return {}
+
+    def _get_conversation_tokens(self, conv_data):
+        """Get token count for a conversation from its manifest entry."""
+        tokens_str = "-"
+        if "token_usage" in conv_data:
+            total_tokens = conv_data["token_usage"].get("total", 0)
+            if total_tokens > 0:
+                if total_tokens > 1000:
+                    tokens_str = f"{total_tokens / 1000:.1f}K"
+                else:
+                    tokens_str = str(total_tokens)
         return tokens_str
 
+    def _get_latency_display(self, conv_data):
+        """Get mean time to first token and throughput across both agents."""
+        latency = conv_data.get("latency", {})
+        ttft_total = sum(a.get("ttft_ms_total", 0) for a in latency.values())
+        ttft_samples = sum(a.get("ttft_samples", 0) for a in latency.values())
+        tps_total = sum(a.get("tokens_per_second_total", 0) for a in latency.values())
+        tps_samples = sum(
+            a.get("tokens_per_second_samples", 0) for a in latency.values()
+        )
+
+        if not ttft_samples:
+            return "-"
+
+        ttft_ms = ttft_total / ttft_samples
+        if ttft_ms >= 10000:
+            color = NORD_RED
+        elif ttft_ms >= 3000:
+            color = NORD_ORANGE
+        else:
+            color = NORD_GREEN
+        ttft_str = f"{ttft_ms / 1000:.1f}s" if ttft_ms >= 1000 else f"{ttft_ms:.0f}ms"
+
+        if tps_samples:
+            return f"[{color}]{ttft_str}[/{color}] {tps_total / tps_samples:.0f}t/s"
+        return f"[{color}]{ttft_str}[/{color}]"
+
     def _is_recent(self, timestamp, minutes=5):
         """Check if timestamp is recent."""
         try:
@@ -1,23 +1,33 @@
 """Provider builder - creates provider instances for models."""
 
-from typing import Optional
+from pathlib import Path
+from typing import Any, Dict, Optional
 
+from ..config import Config
 from ..config.models import get_model_config
+from ..io.paths import get_cassettes_dir
 from .anthropic import AnthropicProvider
+from .cassette import CassetteRecorder, ReplayProvider
 from .google import GoogleProvider
 from .local import LocalProvider
 from .ollama import OllamaProvider
 from .openai import OpenAIProvider
 from .silent import SilentProvider
+from .synthetic import SyntheticProvider, SyntheticSettings
 from .xai import xAIProvider
 
 
-async def build_provider(model_id: str, temperature: Optional[float] = None):
+async def build_provider(
+    model_id: str,
+    temperature: Optional[float] = None,
+    synthetic: Optional[Dict[str, Any]] = None,
+):
     """Create a provider instance for the given model.
 
     Args:
         model_id: Model identifier (e.g., 'gpt-4', 'claude', 'gemini-1.5-pro')
         temperature: Optional temperature override (not used here, temperature is passed to stream_response)
+        synthetic: Optional load profile for the local:synthetic model
 
     Returns:
         Provider instance
@@ -26,6 +36,23 @@ async def build_provider(model_id: str, temperature: Optional[float] = None):
     if not model_config:
         raise ValueError(f"Unknown model: {model_id}")
 
+    cassette = Config().get("providers.cassette", {}) or {}
+    mode = cassette.get("mode", "off")
+    cassette_dir = Path(cassette.get("directory") or get_cassettes_dir())
+
+    if mode == "replay":
+        return ReplayProvider(
+            model_config.model_id, cassette_dir, speed=cassette.get("speed", 1.0)
+        )
+
+    provider = _create_provider(model_config, synthetic)
+    if mode == "record":
+        CassetteRecorder(model_config.model_id, cassette_dir).attach(provider)
+    return provider
+
+
+def _create_provider(model_config, synthetic: Optional[Dict[str, Any]] = None):
+    """Create the real provider for a model configuration."""
     api_model_id = model_config.api.model_id
     if model_config.provider == "openai":
         return OpenAIProvider(model=api_model_id)
@@ -36,6 +63,8 @@ async def build_provider(model_id: str, temperature: Optional[float] = None):
     elif model_config.provider == "xai":
         return xAIProvider(model=api_model_id)
     elif model_config.provider == "local":
+        if api_model_id == "local:synthetic":
+            return SyntheticProvider(SyntheticSettings.from_dict(synthetic))
         return LocalProvider(model_name="test")
     elif model_config.provider == "ollama":
         ollama_model = model_config.api.ollama_model
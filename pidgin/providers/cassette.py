@@ -0,0 +1,203 @@
+"""Record and replay provider traffic using cassette files."""
+
+import asyncio
+import hashlib
+import json
+import re
+import time
+from collections import defaultdict
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..core.exceptions import ProviderError
+from ..core.types import Message
+from ..io.logger import get_logger
+from .base import Provider, ResponseChunk
+
+logger = get_logger("cassette")
+
+
+def request_key(
+    model: str,
+    messages: List[Message],
+    temperature: Optional[float] = None,
+    thinking_enabled: Optional[bool] = None,
+    thinking_budget: Optional[int] = None,
+) -> str:
+    """Hash the content of a request so replays can find its recording.
+
+    Args:
+        model: Model identifier
+        messages: Conversation messages sent to the provider
+        temperature: Temperature setting
+        thinking_enabled: Whether extended thinking was requested
+        thinking_budget: Thinking token budget
+
+    Returns:
+        Hex digest identifying the request
+    """
+    payload = {
+        "model": model,
+        "messages": [[m.role, m.content] for m in messages],
+        "temperature": temperature,
+        "thinking_enabled": thinking_enabled,
+        "thinking_budget": thinking_budget,
+    }
+    encoded = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:32]
+
+
+def cassette_path(cassette_dir: Path, model: str) -> Path:
+    """Get the cassette file for a model.
+
+    Args:
+        cassette_dir: Directory holding cassettes
+        model: Model identifier
+
+    Returns:
+        Path to the model's JSONL cassette
+    """
+    safe_name = re.sub(r"[^A-Za-z0-9._-]", "_", model)
+    return Path(cassette_dir) / f"{safe_name}.jsonl"
+
+
+class CassetteRecorder:
+    """Records each response a provider streams to a cassette file.
+
+    Every completed response is appended as one JSONL line holding the
+    request hash, the chunk sequence with the delay before each chunk, and
+    the provider's usage data if it reports any.
+    """
+
+    def __init__(self, model: str, cassette_dir: Path):
+        """Initialize recorder.
+
+        Args:
+            model: Model identifier used to key recordings
+            cassette_dir: Directory to write cassettes to
+        """
+        self.model = model
+        self.path = cassette_path(cassette_dir, model)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def attach(self, provider: Provider) -> Provider:
+        """Record everything the provider streams from now on.
+
+        The provider's stream_response is replaced on the instance rather
+        than wrapping the provider, so its class still names it for rate
+        limiting and token tracking.
+
+        Args:
+            provider: Provider making the real requests
+
+        Returns:
+            The same provider
+        """
+        stream_response = provider.stream_response
+
+        async def recording_stream_response(
+            messages: List[Message],
+            temperature: Optional[float] = None,
+            thinking_enabled: Optional[bool] = None,
+            thinking_budget: Optional[int] = None,
+        ) -> AsyncGenerator[ResponseChunk, None]:
+            chunks = []
+            last = time.monotonic()
+            async for chunk in stream_response(
+                messages,
+                temperature=temperature,
+                thinking_enabled=thinking_enabled,
+                thinking_budget=thinking_budget,
+            ):
+                now = time.monotonic()
+                if isinstance(chunk, ResponseChunk):
+                    chunks.append([chunk.chunk_type, chunk.content, _ms(now - last)])
+                else:
+                    chunks.append(["response", chunk, _ms(now - last)])
+                last = now
+                yield chunk
+
+            usage = None
+            if hasattr(provider, "get_last_usage"):
+                usage = provider.get_last_usage()
+            key = request_key(
+                self.model, messages, temperature, thinking_enabled, thinking_budget
+            )
+            self._write({"key": key, "chunks": chunks, "usage": usage})
+
+        provider.stream_response = recording_stream_response  # type: ignore[method-assign]
+        return provider
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, separators=(",", ":"), ensure_ascii=False))
+            f.write("\n")
+
+
+class ReplayProvider(Provider):
+    """Re-emits recorded responses without contacting any API.
+
+    Requests are matched to recordings by content hash. When a request was
+    recorded more than once, recordings are replayed in the order they were
+    made, wrapping around when exhausted.
+    """
+
+    def __init__(self, model: str, cassette_dir: Path, speed: float = 1.0):
+        """Initialize replay.
+
+        Args:
+            model: Model identifier used to key recordings
+            cassette_dir: Directory to read cassettes from
+            speed: Playback speed multiplier (0 replays without delays)
+        """
+        super().__init__()
+        self.model_name = model
+        self.speed = speed
+        self.path = cassette_path(cassette_dir, model)
+        self.recordings: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.replay_counts: Dict[str, int] = defaultdict(int)
+        self._last_usage: Optional[Dict[str, int]] = None
+
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        self.recordings[record["key"]].append(record)
+        else:
+            logger.warning(f"No cassette found for {model} at {self.path}")
+
+    def get_last_usage(self) -> Optional[Dict[str, int]]:
+        """Get the recorded usage of the last replayed response."""
+        return self._last_usage
+
+    async def stream_response(
+        self,
+        messages: List[Message],
+        temperature: Optional[float] = None,
+        thinking_enabled: Optional[bool] = None,
+        thinking_budget: Optional[int] = None,
+    ) -> AsyncGenerator[ResponseChunk, None]:
+        """Replay the recording for this request."""
+        key = request_key(
+            self.model_name, messages, temperature, thinking_enabled, thinking_budget
+        )
+        recordings = self.recordings.get(key)
+        if not recordings:
+            raise ProviderError(
+                f"No recording of this request for {self.model_name} in {self.path}"
+            )
+
+        record = recordings[self.replay_counts[key] % len(recordings)]
+        self.replay_counts[key] += 1
+        self._last_usage = record.get("usage")
+
+        for chunk_type, content, delay_ms in record["chunks"]:
+            if self.speed > 0 and delay_ms:
+                await asyncio.sleep(delay_ms / 1000 / self.speed)
+            yield ResponseChunk(content, chunk_type)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
@@ -3,7 +3,10 @@
 import asyncio
 import logging
 import time
+from collections.abc import AsyncIterator
+from typing import List, Optional
 
+from ..core.constants import RateLimits
 from ..core.event_bus import EventBus
 from ..core.events import (
     APIErrorEvent,
@@ -15,6 +18,8 @@ from ..core.events import (
 from ..core.router import DirectRouter  # For message transformation
 from ..core.types import Message
 from .base import Provider, ResponseChunk
+from .hedging import HedgingPolicy
+from .stream_timing import StreamTimer
 from .token_tracker import GlobalTokenTracker
 from .token_utils import estimate_messages_tokens, estimate_tokens
 
@@ -30,6 +35,8 @@ class EventAwareProvider:
         bus: EventBus,
         agent_id: str,
         token_tracker: GlobalTokenTracker,
+        rate_limiter=None,
+        hedging_policy: Optional[HedgingPolicy] = None,
     ):
         """Initialize wrapper.
 
@@ -38,11 +45,15 @@ class EventAwareProvider:
             bus: Event bus for emitting events
             agent_id: ID of the agent using this provider
             token_tracker: Token tracker for rate limiting
+            rate_limiter: Optional rate limiter that hedge requests draw from
+            hedging_policy: Optional policy enabling hedged requests
         """
         self.provider = provider
         self.bus = bus
         self.agent_id = agent_id
         self.token_tracker = token_tracker
+        self.rate_limiter = rate_limiter
+        self.hedging_policy = hedging_policy
 
         # Create a router for message transformation
         self.router = DirectRouter(
@@ -79,10 +90,12 @@ class EventAwareProvider:
                 self.provider, "model", None
             )
 
-            # Stream response and buffer chunks (no longer emitting chunk events)
-            thinking_chunks: list[str] = []
-            response_chunks: list[str] = []
+            # Chunks are buffered once in a stream that displays can follow
+            stream = self.bus.streams.open(
+                event.conversation_id, self.agent_id, event.turn_number
+            )
             thinking_start = None
+            timer = StreamTimer(requested_at=event.timestamp.timestamp())
 
             # Add timeout to prevent hanging
             import asyncio
@@ -93,23 +106,20 @@ class EventAwareProvider:
                 # asyncio.timeout is Python 3.11+, use wait_for for compatibility
                 async def _get_response():
                     nonlocal thinking_start
-                    async for chunk in self.provider.stream_response(
-                        agent_messages,
-                        temperature=event.temperature,
-                        thinking_enabled=event.thinking_enabled,
-                        thinking_budget=event.thinking_budget,
+                    async for chunk in self._stream_chunks(
+                        agent_messages, event, model_name, timer
                     ):
                         # Handle ResponseChunk objects
                         if isinstance(chunk, ResponseChunk):
-                            if chunk.chunk_type == "thinking":
-                                if not thinking_chunks:
-                                    thinking_start = time.time()
-                                thinking_chunks.append(chunk.content)
-                            else:
-                                response_chunks.append(chunk.content)
+                            if (
+                                chunk.chunk_type == "thinking"
+                                and thinking_start is None
+                            ):
+                                thinking_start = time.time()
+                            stream.append(chunk.chunk_type, chunk.content)
                         else:
                             # Backwards compatibility: treat raw strings as response
-                            response_chunks.append(chunk)
+                            stream.append("response", chunk)
 
                 await asyncio.wait_for(_get_response(), timeout=timeout_seconds)
             except asyncio.TimeoutError:
@@ -119,10 +129,15 @@ class EventAwareProvider:
                 raise Exception(
                     f"Provider response timed out after {timeout_seconds} seconds"
                 )
+            finally:
+                stream.close()
+
+            # Let stream followers drain before the final message is announced
+            await asyncio.sleep(0)
 
             # Emit thinking complete event if we have thinking content
-            if thinking_chunks:
-                thinking_content = "".join(thinking_chunks)
+            thinking_content = stream.text("thinking")
+            if thinking_content:
                 thinking_duration_ms = (
                     int((time.time() - thinking_start) * 1000)
                     if thinking_start
@@ -148,7 +163,7 @@ class EventAwareProvider:
                 )
 
             # Build complete message
-            content = "".join(response_chunks)
+            content = stream.text("response")
             message = Message(
                 role="assistant",
                 content=content,
@@ -185,6 +200,14 @@ class EventAwareProvider:
                 completion_tokens = estimate_tokens(content, model_name)
 
             total_tokens = prompt_tokens + completion_tokens
+            timing = timer.summary(completion_tokens)
+
+            if self.hedging_policy and model_name:
+                # Hedging compares against time to first token where measured
+                latency_ms = timing["time_to_first_token_ms"]
+                if latency_ms is None:
+                    latency_ms = duration_ms
+                self.hedging_policy.record_latency(model_name, latency_ms / 1000)
 
             # Emit completion event
             await self.bus.emit(
@@ -196,6 +219,8 @@ class EventAwareProvider:
                     completion_tokens=completion_tokens,
                     total_tokens=total_tokens,
                     duration_ms=duration_ms,
+                    rate_limit_wait_ms=event.rate_limit_wait_ms,
+                    **timing,
                 )
             )
 
@@ -338,3 +363,141 @@ class EventAwareProvider:
 
             # Don't raise - let conversation continue
             return
+
+    def _open_stream(
+        self, agent_messages: List[Message], event: MessageRequestEvent
+    ) -> AsyncIterator:
+        """Start a streaming request against the underlying provider."""
+        return self.provider.stream_response(
+            agent_messages,
+            temperature=event.temperature,
+            thinking_enabled=event.thinking_enabled,
+            thinking_budget=event.thinking_budget,
+        ).__aiter__()
+
+    async def _first_chunk(self, stream: AsyncIterator):
+        """Wait for the first chunk of a stream.
+
+        Returns:
+            (chunk, arrival time), with chunk None if the stream is empty
+        """
+        try:
+            chunk = await stream.__anext__()
+        except StopAsyncIteration:
+            chunk = None
+        return chunk, time.time()
+
+    async def _stream_chunks(
+        self,
+        agent_messages: List[Message],
+        event: MessageRequestEvent,
+        model_name: Optional[str],
+        timer: StreamTimer,
+    ):
+        """Yield response chunks, hedging slow requests when a policy is set.
+
+        If the first chunk has not arrived within the policy's delay, an
+        identical request is fired. The first stream to produce output is
+        consumed and the other is cancelled.
+
+        The timer is given the chunks of the stream consumed, timed from
+        when that stream's request was issued, so a winning hedge's time to
+        first token does not include the delay before it was fired.
+        """
+        hedge_delay = None
+        if self.hedging_policy and model_name:
+            hedge_delay = self.hedging_policy.get_hedge_delay(model_name)
+
+        timer.start()
+        primary_stream = self._open_stream(agent_messages, event)
+        if hedge_delay is None:
+            async for chunk in primary_stream:
+                timer.mark_chunk()
+                yield chunk
+            return
+
+        primary = asyncio.create_task(self._first_chunk(primary_stream))
+        streams = {primary: primary_stream}
+        issued_at = {primary: timer.stream_start}
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=hedge_delay)
+            if not done:
+                await self._acquire_hedge_budget(agent_messages, model_name)
+                issued_at_hedge = time.time()
+                hedge_stream = self._open_stream(agent_messages, event)
+                hedge = asyncio.create_task(self._first_chunk(hedge_stream))
+                streams[hedge] = hedge_stream
+                issued_at[hedge] = issued_at_hedge
+            winner = await self._pick_winner(set(streams))
+        finally:
+            # Don't leave first-chunk waits running if we were cancelled
+            for task in streams:
+                if not task.done():
+                    task.cancel()
+
+        if len(streams) > 1:
+            self.hedging_policy.record_hedge(
+                model_name, hedge_won=winner is not primary
+            )
+            await self._cancel_losers(streams, winner, agent_messages, model_name)
+
+        timer.start(at=issued_at[winner])
+        first, arrived_at = winner.result()
+        if first is not None:
+            timer.mark_chunk(at=arrived_at)
+            yield first
+            async for chunk in streams[winner]:
+                timer.mark_chunk()
+                yield chunk
+
+    async def _pick_winner(self, tasks: set) -> asyncio.Task:
+        """Return the first task to produce a chunk without raising."""
+        error: Optional[BaseException] = None
+        while tasks:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task
+                error = task.exception()
+        raise error  # type: ignore[misc]
+
+    async def _cancel_losers(
+        self,
+        streams: dict,
+        winner: asyncio.Task,
+        agent_messages: List[Message],
+        model_name: Optional[str],
+    ) -> None:
+        """Cancel losing hedge streams and account for their tokens."""
+        provider_name = self.provider.__class__.__name__.replace("Provider", "")
+        for task, stream in streams.items():
+            if task is winner:
+                continue
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            aclose = getattr(stream, "aclose", None)
+            if aclose:
+                try:
+                    await aclose()
+                except Exception as e:
+                    logger.debug(f"Error closing cancelled hedge stream: {e}")
+
+            # The upstream API still billed the prompt of the cancelled request
+            if self.token_tracker:
+                self.token_tracker.record_usage(
+                    provider_name.lower(),
+                    estimate_messages_tokens(agent_messages, model_name),
+                    model_name or "unknown",
+                )
+
+    async def _acquire_hedge_budget(
+        self, agent_messages: List[Message], model_name: Optional[str]
+    ) -> None:
+        """Make the hedge request consume rate limit budget like any other."""
+        if not self.rate_limiter:
+            return
+        estimated = (
+            estimate_messages_tokens(agent_messages, model_name)
+            + RateLimits.DEFAULT_RESPONSE_TOKENS
+        )
+        await self.rate_limiter.acquire(self.provider.__class__.__name__, estimated)
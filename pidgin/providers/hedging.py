@@ -0,0 +1,133 @@
+"""Hedged request policy for reducing provider tail latency."""
+
+from collections import defaultdict, deque
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from ..config.config import Config
+from ..io.logger import get_logger
+from .stream_timing import percentile
+
+logger = get_logger("hedging")
+
+
+class HedgingPolicy:
+    """Decides when to fire a backup request for a slow provider response.
+
+    Keeps a bounded history of observed response latencies per model. Once
+    enough samples exist, a request whose first chunk has not arrived by the
+    configured percentile of that history gets a second, identical request
+    fired alongside it. Whichever stream produces output first wins.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        min_samples: int = 20,
+        max_history: int = 200,
+        min_delay_seconds: float = 1.0,
+    ):
+        """Initialize the hedging policy.
+
+        Args:
+            percentile: Latency percentile (0-100) after which to hedge
+            min_samples: Samples required per model before hedging starts
+            max_history: Maximum latency samples kept per model
+            min_delay_seconds: Never hedge earlier than this
+        """
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay_seconds = min_delay_seconds
+
+        self.latency_history: Dict[str, deque] = defaultdict(
+            lambda: deque(maxlen=max_history)
+        )
+        self.hedges_fired: Dict[str, int] = defaultdict(int)
+        self.hedges_won: Dict[str, int] = defaultdict(int)
+        self.lock = Lock()
+
+    @classmethod
+    def from_config(cls, config: Config) -> Optional["HedgingPolicy"]:
+        """Build a policy from configuration.
+
+        Args:
+            config: Application configuration
+
+        Returns:
+            HedgingPolicy if hedging is enabled, None otherwise
+        """
+        settings = config.get("providers.hedging", {}) or {}
+        if not settings.get("enabled", False):
+            return None
+
+        return cls(
+            percentile=settings.get("percentile", 95.0),
+            min_samples=settings.get("min_samples", 20),
+            max_history=settings.get("max_history", 200),
+            min_delay_seconds=settings.get("min_delay_seconds", 1.0),
+        )
+
+    def record_latency(self, model: str, seconds: float) -> None:
+        """Record an observed response latency for a model.
+
+        Args:
+            model: Model name
+            seconds: Observed latency in seconds
+        """
+        with self.lock:
+            self.latency_history[model].append(seconds)
+
+    def get_hedge_delay(self, model: str) -> Optional[float]:
+        """Get how long to wait for a first chunk before hedging.
+
+        Args:
+            model: Model name
+
+        Returns:
+            Delay in seconds, or None if there is not enough history yet
+        """
+        with self.lock:
+            samples = list(self.latency_history.get(model, ()))
+
+        if len(samples) < self.min_samples:
+            return None
+
+        return max(self.min_delay_seconds, percentile(samples, self.percentile))
+
+    def record_hedge(self, model: str, hedge_won: bool) -> None:
+        """Record that a hedge request was fired.
+
+        Args:
+            model: Model name
+            hedge_won: Whether the hedge produced output before the original
+        """
+        with self.lock:
+            self.hedges_fired[model] += 1
+            if hedge_won:
+                self.hedges_won[model] += 1
+
+        logger.info(
+            f"Hedged request for {model}: {'hedge' if hedge_won else 'original'} won"
+        )
+
+    def get_stats(self, model: str) -> Dict[str, Any]:
+        """Get hedging statistics for a model.
+
+        Args:
+            model: Model name
+
+        Returns:
+            Dictionary with sample count, current delay and hedge counts
+        """
+        with self.lock:
+            sample_count = len(self.latency_history.get(model, ()))
+            fired = self.hedges_fired.get(model, 0)
+            won = self.hedges_won.get(model, 0)
+
+        return {
+            "model": model,
+            "samples": sample_count,
+            "hedge_delay": self.get_hedge_delay(model),
+            "hedges_fired": fired,
+            "hedges_won": won,
+        }
@@ -0,0 +1,97 @@
+"""Timing instrumentation for streamed provider responses."""
+
+import time
+from typing import Any, Dict, List, Optional
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Get a percentile using nearest-rank on a list of values.
+
+    Args:
+        values: Values to summarize
+        pct: Percentile between 0 and 100
+
+    Returns:
+        The percentile value, or None if values is empty
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(len(ordered) * pct / 100.0))
+    return ordered[index]
+
+
+class StreamTimer:
+    """Records when chunks of a streamed response arrive.
+
+    Distinguishes the time spent before the provider is called (request
+    send), waiting for the first chunk (time to first token), and
+    generating the rest of the response (throughput and inter-chunk gaps).
+    """
+
+    def __init__(self, requested_at: Optional[float] = None):
+        """Initialize timer.
+
+        Args:
+            requested_at: Epoch time the request was issued, if known
+        """
+        self.requested_at = requested_at
+        self.stream_start: Optional[float] = None
+        self.first_chunk: Optional[float] = None
+        self.last_chunk: Optional[float] = None
+        self.gaps_ms: List[float] = []
+
+    def start(self, at: Optional[float] = None) -> None:
+        """Mark the moment the provider stream is opened.
+
+        Args:
+            at: Epoch time the stream was opened, if not now
+        """
+        self.stream_start = time.time() if at is None else at
+
+    def mark_chunk(self, at: Optional[float] = None) -> None:
+        """Mark the arrival of a chunk.
+
+        Args:
+            at: Epoch time the chunk arrived, if not now
+        """
+        now = time.time() if at is None else at
+        if self.first_chunk is None:
+            self.first_chunk = now
+        else:
+            self.gaps_ms.append(round((now - self.last_chunk) * 1000, 2))
+        self.last_chunk = now
+
+    def summary(self, completion_tokens: int) -> Dict[str, Any]:
+        """Summarize the stream timing.
+
+        Args:
+            completion_tokens: Tokens generated, for throughput
+
+        Returns:
+            Dictionary of timing fields for MessageCompleteEvent
+        """
+        request_send_ms = None
+        if self.requested_at is not None and self.stream_start is not None:
+            request_send_ms = max(
+                0, int((self.stream_start - self.requested_at) * 1000)
+            )
+
+        ttft_ms = None
+        if self.first_chunk is not None and self.stream_start is not None:
+            ttft_ms = int((self.first_chunk - self.stream_start) * 1000)
+
+        tokens_per_second = None
+        if self.first_chunk is not None and self.last_chunk > self.first_chunk:
+            tokens_per_second = round(
+                completion_tokens / (self.last_chunk - self.first_chunk), 2
+            )
+
+        return {
+            "request_send_ms": request_send_ms,
+            "time_to_first_token_ms": ttft_ms,
+            "tokens_per_second": tokens_per_second,
+            "chunk_gap_p50_ms": percentile(self.gaps_ms, 50),
+            "chunk_gap_p95_ms": percentile(self.gaps_ms, 95),
+            "chunk_gap_max_ms": max(self.gaps_ms) if self.gaps_ms else None,
+        }
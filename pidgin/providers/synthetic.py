@@ -0,0 +1,170 @@
+"""Synthetic load generator provider for offline throughput benchmarks."""
+
+import asyncio
+import random
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, fields
+from itertools import accumulate, count
+from typing import Any, Dict, List, Optional
+
+from ..core.exceptions import ProviderError, RateLimitError
+from ..core.types import Message
+from .base import Provider, ResponseChunk
+from .retry_utils import retry_with_exponential_backoff
+
+# Word pool for generated text; sampled with Zipf-like weights so that
+# vocabulary and repetition metrics see a realistic spread.
+VOCABULARY = (
+    "the of and to a in is that it for as with was on be by this are or from "
+    "at an but not have which they you we their has more one can all its "
+    "about there been would so what when also were into only other some these "
+    "time new like then than first could them most over such how through "
+    "pattern language meaning signal structure idea system question answer "
+    "between across within toward each shared simple common rhythm echo form "
+    "world thought sense space change point word symbol image voice listen "
+    "consider notice return continue explore build follow mirror reflect"
+).split()
+CUM_WEIGHTS = list(accumulate(1.0 / rank for rank in range(1, len(VOCABULARY) + 1)))
+
+
+@dataclass
+class SyntheticSettings:
+    """Load profile for the synthetic provider.
+
+    Token counts are drawn from a normal distribution clipped at zero.
+    Thinking is only generated for requests with thinking enabled. Set
+    tokens_per_second to 0 to stream without delays.
+    """
+
+    response_tokens_mean: float = 150.0
+    response_tokens_stddev: float = 50.0
+    thinking_tokens_mean: float = 0.0
+    thinking_tokens_stddev: float = 0.0
+    tokens_per_second: float = 80.0
+    ttft_ms_mean: float = 400.0
+    ttft_ms_stddev: float = 100.0
+    chunk_tokens: int = 4
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    max_retries: int = 3
+    retry_base_delay: float = 1.0
+    seed: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "SyntheticSettings":
+        """Build settings from a spec dictionary, ignoring unknown keys.
+
+        Args:
+            data: The `synthetic` section of an experiment spec
+
+        Returns:
+            SyntheticSettings with defaults for missing values
+        """
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in (data or {}).items() if k in known})
+
+
+class SyntheticProvider(Provider):
+    """Generates filler responses with a configurable latency and error model.
+
+    Unlike LocalTestModel, responses have realistic lengths and streaming
+    cadence, and can fail with injected errors or 429s, so large offline
+    runs exercise the event bus, rate limiting and import paths.
+    """
+
+    # Numbers instances so seeded agents don't all produce the same stream
+    _instances = count()
+
+    def __init__(self, settings: Optional[SyntheticSettings] = None):
+        """Initialize synthetic provider.
+
+        Args:
+            settings: Load profile (defaults if omitted)
+        """
+        super().__init__()
+        self.model_name = "synthetic"
+        self.settings = settings or SyntheticSettings()
+        seed = self.settings.seed
+        if seed is not None:
+            seed = f"{seed}:{next(self._instances)}"
+        self.rng = random.Random(seed)
+        self._last_usage: Optional[Dict[str, int]] = None
+
+    def get_last_usage(self) -> Optional[Dict[str, int]]:
+        """Get token usage of the last generated response."""
+        return self._last_usage
+
+    async def stream_response(
+        self,
+        messages: List[Message],
+        temperature: Optional[float] = None,
+        thinking_enabled: Optional[bool] = None,
+        thinking_budget: Optional[int] = None,
+    ) -> AsyncGenerator[ResponseChunk, None]:
+        """Stream a generated response, retrying injected failures."""
+        async for chunk in retry_with_exponential_backoff(
+            self._generate,
+            messages,
+            thinking_enabled,
+            thinking_budget,
+            max_retries=self.settings.max_retries,
+            base_delay=self.settings.retry_base_delay,
+            retry_on=(RateLimitError,),
+        ):
+            if isinstance(chunk, ResponseChunk):
+                yield chunk
+
+    async def _generate(
+        self,
+        messages: List[Message],
+        thinking_enabled: Optional[bool],
+        thinking_budget: Optional[int],
+    ) -> AsyncGenerator[ResponseChunk, None]:
+        s = self.settings
+
+        # Failures happen before any output, like a rejected API request
+        roll = self.rng.random()
+        if roll < s.rate_limit_rate:
+            raise RateLimitError("synthetic", s.retry_base_delay)
+        if roll < s.rate_limit_rate + s.error_rate:
+            raise ProviderError("Synthetic provider error (injected)")
+
+        thinking_tokens = 0
+        if thinking_enabled:
+            thinking_tokens = self._sample(
+                s.thinking_tokens_mean, s.thinking_tokens_stddev
+            )
+            if thinking_budget:
+                thinking_tokens = min(thinking_tokens, thinking_budget)
+        response_tokens = max(
+            1, self._sample(s.response_tokens_mean, s.response_tokens_stddev)
+        )
+
+        await asyncio.sleep(self._sample(s.ttft_ms_mean, s.ttft_ms_stddev) / 1000)
+
+        for chunk_type, tokens in (
+            ("thinking", thinking_tokens),
+            ("response", response_tokens),
+        ):
+            remaining = tokens
+            while remaining > 0:
+                size = min(s.chunk_tokens, remaining)
+                remaining -= size
+                words = self.rng.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=size)
+                yield ResponseChunk(" ".join(words) + " ", chunk_type)
+                if s.tokens_per_second > 0:
+                    await asyncio.sleep(size / s.tokens_per_second)
+
+        # Thinking is billed as output, as by the APIs
+        prompt_tokens = sum(len(m.content) for m in messages) // 4
+        completion_tokens = response_tokens + thinking_tokens
+        self._last_usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+    def _sample(self, mean: float, stddev: float) -> int:
+        if stddev <= 0:
+            return max(0, int(mean))
+        return max(0, int(self.rng.gauss(mean, stddev)))
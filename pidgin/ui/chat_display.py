@@ -1,9 +1,11 @@
 """Chat display for watching conversations with minimal metadata."""
 
-from typing import Dict, Union
+import asyncio
+from typing import Dict, Optional, Union
 
 from rich.align import Align
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.padding import Padding
 from rich.panel import Panel
@@ -20,6 +22,7 @@ from ..core.events import (
     ThinkingCompleteEvent,
     TurnCompleteEvent,
 )
+from ..core.message_stream import MessageStream
 from ..core.types import Agent
 
 
@@ -38,6 +41,9 @@ class ChatDisplay:
         "dim": "#4c566a",  # Nord3 gray
     }
 
+    # Characters of in-flight text kept in the live preview
+    PREVIEW_CHARS = 600
+
     def __init__(self, bus: EventBus, console: Console, agents: Dict[str, Agent]):
         """Initialize chat display.
 
@@ -57,6 +63,7 @@ class ChatDisplay:
         self._shown_prompts: set = (
             set()
         )  # Track (agent_id, prompt_hash) to avoid duplicates
+        self._live: Optional[Live] = None
 
         # Subscribe to relevant events
         bus.subscribe(SystemPromptEvent, self.handle_system_prompt)
@@ -66,6 +73,7 @@ class ChatDisplay:
         bus.subscribe(TurnCompleteEvent, self.handle_turn_complete)
         bus.subscribe(ConversationEndEvent, self.handle_end)
         bus.subscribe(ContextTruncationEvent, self.handle_truncation)
+        bus.streams.subscribe(self.handle_stream)
 
     def calculate_bubble_width(self) -> int:
         """Calculate responsive bubble width based on terminal size.
@@ -241,6 +249,8 @@ class ChatDisplay:
         Args:
             event: Thinking complete event
         """
+        self._stop_preview()
+
         # Get agent info
         agent_name = "Unknown"
         color = self.COLORS["dim"]
@@ -288,6 +298,8 @@ class ChatDisplay:
         Args:
             event: Message complete event
         """
+        self._stop_preview()
+
         # Skip system messages
         if hasattr(event.message, "role") and event.message.role == "system":
             return
@@ -345,6 +357,70 @@ class ChatDisplay:
         self.console.print()
         self.print_bubble(message_panel, event.agent_id)
 
+    def handle_stream(self, stream: MessageStream) -> None:
+        """Show a live preview of a message while it is generated.
+
+        The preview is transient: it is cleared once the final thinking or
+        message bubble is printed.
+
+        Args:
+            stream: Stream of the in-flight message
+        """
+        # Rich supports one live display at a time, and only on terminals
+        if self._live is not None or not self.console.is_terminal:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        self._live = Live(console=self.console, transient=True, refresh_per_second=8)
+        self._live.start()
+        loop.create_task(self._follow_stream(stream, self._live))
+
+    async def _follow_stream(self, stream: MessageStream, live: Live) -> None:
+        """Update the live preview with text from the stream."""
+        color = self.COLORS.get(stream.agent_id, self.COLORS["dim"])
+        agent = self.agents.get(stream.agent_id)
+        agent_name = (agent.display_name or agent.model) if agent else "Unknown"
+
+        tail = ""
+        current_kind = None
+        try:
+            async for kind, content in stream.follow():
+                if not live.is_started:
+                    return
+                if kind != current_kind:
+                    current_kind, tail = kind, ""
+                tail = (tail + content)[-self.PREVIEW_CHARS :]
+
+                header = Text()
+                header.append(f"{agent_name} ", style=color)
+                header.append(
+                    "thinking…" if kind == "thinking" else "typing…",
+                    style=f"{color} dim italic",
+                )
+                live.update(
+                    Panel(
+                        Text(tail, style="dim italic"),
+                        title=header,
+                        title_align="left",
+                        border_style=f"{color} dim",
+                        padding=(1, 2),
+                        width=self.calculate_bubble_width(),
+                        expand=False,
+                    )
+                )
+        finally:
+            if self._live is live:
+                self._stop_preview()
+
+    def _stop_preview(self) -> None:
+        """Remove the live preview, if one is showing."""
+        if self._live is not None:
+            live, self._live = self._live, None
+            live.stop()
+
     def handle_turn_complete(self, event: TurnCompleteEvent) -> None:
         """Display turn separator.
 
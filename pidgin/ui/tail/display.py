@@ -1,5 +1,7 @@
 """Main tail display module."""
 
+import asyncio
+
 from rich.console import Console
 from rich.text import Text
 
@@ -23,6 +25,7 @@ from ...core.events import (
     TurnCompleteEvent,
     TurnStartEvent,
 )
+from ...core.message_stream import MessageStream
 from .constants import EVENT_COLORS, EVENT_GLYPHS, NORD_GRAY
 from .formatters import TailFormatter
 from .handlers import EventHandlers
@@ -45,6 +48,21 @@ class TailDisplay:
 
         # Subscribe to all events
         self.bus.subscribe(Event, self.log_event)
+        self.bus.streams.subscribe(self.handle_stream)
+
+    def handle_stream(self, stream: MessageStream) -> None:
+        """Follow the text of a message while it is generated.
+
+        Args:
+            stream: Stream of the in-flight message
+        """
+        if self.console is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        loop.create_task(self.handlers.follow_stream(stream))
 
     def _format_agent_id(self, agent_id: str) -> str:
         """Format agent identifier for display.
@@ -1,5 +1,6 @@
 """Event handlers for tail display."""
 
+from datetime import datetime
 from typing import Dict, Optional
 
 from rich.console import Console
@@ -23,6 +24,7 @@ from ...core.events import (
     TurnCompleteEvent,
     TurnStartEvent,
 )
+from ...core.message_stream import MessageStream
 from .constants import NORD_CYAN, NORD_GRAY, NORD_PURPLE
 from .formatters import TailFormatter
 
@@ -187,6 +189,33 @@ class EventHandlers:
         content = f"{self.formatter.format_agent_id(event.agent_id)}: {truncated_chunk}"
         self._print(header, content)
 
+    async def follow_stream(self, stream: MessageStream) -> None:
+        """Print each line of a message as soon as it is complete."""
+        pending = ""
+        async for kind, content in stream.follow():
+            if kind != "response":
+                continue
+            pending += content
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                self._print_stream_line(stream.agent_id, line)
+        if pending:
+            self._print_stream_line(stream.agent_id, pending)
+
+    def _print_stream_line(self, agent_id: str, line: str) -> None:
+        """Print one line of in-flight message text."""
+        line = line.strip()
+        if not line:
+            return
+        if len(line) > 80:
+            line = line[:77] + "..."
+
+        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        header = Text()
+        header.append(f"[{timestamp}] ", style=NORD_GRAY)
+        header.append("· Streaming", style=NORD_PURPLE + " bold")
+        self._print(header, f"{self.formatter.format_agent_id(agent_id)}: {line}")
+
     def display_api_error(self, event: APIErrorEvent, header: Text, color: str) -> None:
         """Display API error event."""
         error_type = getattr(event, "error_type", "Unknown")
@@ -0,0 +1,32 @@
+"""Recorded provider traffic replays identically."""
+
+import pytest
+
+from pidgin.core.exceptions import ProviderError
+from pidgin.core.types import Message
+from pidgin.providers.cassette import CassetteRecorder, ReplayProvider
+from pidgin.providers.local import LocalProvider
+
+
+async def _collect(provider, messages, temperature=None):
+    return [
+        (chunk.chunk_type, chunk.content)
+        async for chunk in provider.stream_response(messages, temperature=temperature)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_record_then_replay(tmp_path):
+    """A replay re-emits the recorded chunks for the same request."""
+    messages = [Message(role="user", content="Hello there", agent_id="human")]
+
+    provider = CassetteRecorder("local:test", tmp_path).attach(LocalProvider())
+    recorded = await _collect(provider, messages, temperature=0.5)
+    assert isinstance(provider, LocalProvider)
+
+    replay = ReplayProvider("local:test", tmp_path, speed=0)
+    assert await _collect(replay, messages, temperature=0.5) == recorded
+
+    # A different request has no recording
+    with pytest.raises(ProviderError):
+        await _collect(replay, messages, temperature=0.9)
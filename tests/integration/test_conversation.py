@@ -1,5 +1,7 @@
 """Smoke test that core imports and basic object construction work."""
 
+import pytest
+
 from pidgin.experiments.config import ExperimentConfig
 from pidgin.providers.test_model import LocalTestModel
 
@@ -23,3 +25,107 @@ def test_core_imports_and_construction():
 
     model = LocalTestModel()
     assert model is not None
+
+
+class _Bus:
+    """Event bus stand-in that keeps emitted events."""
+
+    def __init__(self):
+        self.events = []
+
+    def subscribe(self, event_type, handler):
+        pass
+
+    async def emit(self, event):
+        self.events.append(event)
+
+
+class _Handler:
+    """Message handler stand-in replying with scripted turns."""
+
+    def __init__(self, turns):
+        self.turns = turns
+
+    async def get_agent_message(
+        self, conversation_id, agent, turn_number, messages, interrupt_handler
+    ):
+        from pidgin.core.types import Message
+
+        content = self.turns[turn_number][0 if agent.id == "agent_a" else 1]
+        return Message(role="assistant", content=content, agent_id=agent.id)
+
+
+class _Config:
+    def __init__(self, **convergence):
+        self.convergence = convergence
+
+    def get_convergence_config(self):
+        return self.convergence
+
+
+async def _run_turns(turns, caplog, **convergence):
+    """Run turns until the executor stops; return the stopping turn or None."""
+    import logging
+
+    from pidgin.analysis.convergence import ConvergenceCalculator
+    from pidgin.core import turn_executor
+    from pidgin.core.types import Agent, Conversation
+
+    agents = [
+        Agent(id="agent_a", model="local:test"),
+        Agent(id="agent_b", model="local:test"),
+    ]
+    conversation = Conversation(agents=agents, initial_prompt="Hello")
+    executor = turn_executor.TurnExecutor(
+        _Bus(), _Handler(turns), ConvergenceCalculator(), _Config(**convergence), None
+    )
+    turn_executor.logger.addHandler(caplog.handler)
+    caplog.set_level(logging.INFO, logger=turn_executor.logger.name)
+    try:
+        for turn_number in range(len(turns)):
+            turn = await executor.run_single_turn(
+                conversation, turn_number, *agents, None
+            )
+            if turn is None:
+                return turn_number, executor.stop_reason
+        return None, executor.stop_reason
+    finally:
+        turn_executor.logger.removeHandler(caplog.handler)
+
+
+STORY = (
+    "The lighthouse keeper counted ships until the fog rolled in over the bay.",
+    "Beyond the harbor, gulls argued over the fishing boats at dawn again.",
+)
+
+
+@pytest.mark.asyncio
+async def test_repetitive_turn_stops_conversation(caplog):
+    """A turn repeating earlier text trips the compression threshold."""
+    stopped_at, reason = await _run_turns(
+        [STORY, STORY],
+        caplog,
+        convergence_threshold=2.0,
+        convergence_action="stop",
+        compression_threshold=0.3,
+    )
+
+    assert stopped_at == 1
+    assert reason == "high_convergence"
+    assert "marginal compression ratio" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_empty_turn_does_not_trip_compression_threshold(caplog):
+    """Turns without text are skipped by the compression check."""
+    stopped_at, reason = await _run_turns(
+        [STORY, ("", "   \n"), ("Something new entirely.", "")],
+        caplog,
+        convergence_threshold=2.0,
+        convergence_action="stop",
+        compression_threshold=0.3,
+    )
+
+    assert stopped_at is None
+    assert reason is None
+    assert caplog.text == ""
@@ -78,3 +78,619 @@ def test_can_import_to_database(tmp_path):
 
     # Cleanup
     service.close()
+
+
+def test_bulk_inserter_matches_parameter_inserts():
+    """Batched rows are stored exactly as row-at-a-time inserts store them."""
+    from datetime import datetime, timezone
+
+    import duckdb
+
+    from pidgin.database.importers.bulk_insert import BulkInserter
+
+    db = duckdb.connect()
+    db.execute(
+        """
+        CREATE TABLE t (
+            id INTEGER, sent TIMESTAMP, score DOUBLE, tags UINTEGER[],
+            doc JSON, note TEXT, flag BOOLEAN DEFAULT true
+        )
+        """
+    )
+    rows = [
+        {
+            "id": 1,
+            "sent": datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+            "score": 0.1 + 0.2,
+            "tags": [1, 4294967295],
+            "doc": json.dumps({"a": [1, 2]}),
+            "note": 'it\'s "quoted"\n☃',
+        },
+        {"id": 2, "sent": datetime(2025, 1, 2), "score": float("nan"), "tags": []},
+    ]
+    for row in rows:
+        columns = ", ".join(row)
+        placeholders = ", ".join("?" for _ in row)
+        db.execute(
+            f"INSERT INTO t ({columns}) VALUES ({placeholders})", list(row.values())
+        )
+
+    batch = BulkInserter(db, "t", batch_size=2)
+    batch.append(rows[0])
+    batch.append(rows[1])  # Flushes
+    assert len(batch) == 0
+    batch.append({"id": 3})
+    batch.discard()
+    assert batch.flush() == 0
+
+    stored = db.execute("SELECT * FROM t ORDER BY id").fetchall()
+    assert len(stored) == 4
+    # Each row stored twice, identically
+    assert repr(stored[0]) == repr(stored[1])
+    assert repr(stored[2]) == repr(stored[3])
+    assert stored[1][6] is True  # Default for a column no row has
+    assert stored[3][4] is None and stored[3][5] is None
+
+
+def test_event_scanner_matches_event_reader(tmp_path):
+    """DuckDB's scan gives the same conversation data as the event reader."""
+    import duckdb
+
+    from pidgin.database.importers import EventProcessor, EventScanner
+
+    def message(agent_id, tokens):
+        return {
+            "event_type": "MessageCompleteEvent",
+            "conversation_id": "conv_test",
+            "agent_id": agent_id,
+            "message": {"role": "assistant", "content": "ignored"},
+            "prompt_tokens": tokens,
+            "completion_tokens": tokens,
+            "total_tokens": 2 * tokens,
+            "duration_ms": 100 * tokens,
+            "timestamp": "2025-01-01T00:00:01+00:00",
+        }
+
+    def turn(turn_number, content_a, content_b, timestamp):
+        return {
+            "event_type": "TurnCompleteEvent",
+            "conversation_id": "conv_test",
+            "turn_number": turn_number,
+            "turn": {
+                "agent_a_message": {"role": "assistant", "content": content_a},
+                "agent_b_message": {"role": "assistant", "content": content_b},
+            },
+            "convergence_score": 0.5,
+            "timestamp": timestamp,
+        }
+
+    events = [
+        {
+            "event_type": "ConversationStartEvent",
+            "conversation_id": "conv_test",
+            "agent_a": {"id": "agent_a"},
+            "agent_b": {"id": "agent_b"},
+            "agent_a_model": "local:test",
+            "agent_b_model": "local:test",
+            "initial_prompt": "Hello",
+            "timestamp": "2025-01-01T00:00:00+00:00",
+        },
+        {
+            "event_type": "TurnStartEvent",
+            "conversation_id": "conv_test",
+            "turn_number": 0,
+            "timestamp": "2025-01-01T00:00:00.5+00:00",
+        },
+        message("agent_a", 1),
+        message("agent_a", 2),
+        message("agent_b", 3),
+        {
+            "event_type": "ThinkingCompleteEvent",
+            "conversation_id": "conv_test",
+            "turn_number": 0,
+            "agent_id": "agent_b",
+            "thinking_content": "Hmm",
+            "timestamp": "2025-01-01 00:00:01",
+        },
+        turn(0, "Hello there", "Hi back", "2025-01-01T00:00:02+00:00"),
+        # No messages of its own, no start event, and completed twice
+        turn(1, "Again", "And again", "2025-01-01T00:00:03"),
+        turn(1, "Once more", "And more", "2025-01-01T00:00:04"),
+    ]
+    events_file = tmp_path / "events_conv_test.jsonl"
+    events_file.write_text("".join(json.dumps(event) + "\n" for event in events))
+
+    processor = EventProcessor(None, None)
+    expected = processor.read_jsonl_file(events_file)["conv_test"]
+    db = duckdb.connect()
+    scanned = EventScanner(db).scan([events_file])[0]["conv_test"]
+
+    assert scanned["turns"] == expected["turns"]
+    assert scanned["config"] == expected["config"]
+    assert scanned["thinking"] == expected["thinking"]
+    for turn_number in expected["turns"]:
+        assert scanned["turn_messages"].get(turn_number) == (
+            expected["turn_messages"].get(turn_number) or expected["messages"]
+        )
+
+    # Legacy events nested under "data" are left to the event reader
+    legacy_file = tmp_path / "events_legacy.jsonl"
+    legacy_file.write_text(
+        json.dumps({"event_type": "TurnStartEvent", "data": events[1]}) + "\n"
+    )
+    assert EventScanner(db).scan([events_file, legacy_file]) is None
+
+
+def test_incremental_import_continues_from_ledger(tmp_path):
+    """Re-importing reads only turns appended since the last import."""
+    exp_dir = tmp_path / "experiment_test"
+    exp_dir.mkdir()
+    (exp_dir / "manifest.json").write_text(
+        json.dumps({"experiment_id": "test_exp", "name": "Test Experiment"})
+    )
+
+    def turn(turn_number):
+        return {
+            "event_type": "TurnCompleteEvent",
+            "conversation_id": "conv_test",
+            "turn_number": turn_number,
+            "turn": {
+                "agent_a_message": {"role": "assistant", "content": f"A {turn_number}"},
+                "agent_b_message": {"role": "assistant", "content": "Same"},
+            },
+            "convergence_score": 0.1 * turn_number,
+            "timestamp": f"2025-01-01T00:00:0{turn_number}",
+        }
+
+    start = {
+        "event_type": "ConversationStartEvent",
+        "conversation_id": "conv_test",
+        "agent_a": {"id": "agent_a"},
+        "agent_b": {"id": "agent_b"},
+        "agent_a_model": "local:test",
+        "agent_b_model": "local:test",
+        "initial_prompt": "Hello",
+        "timestamp": "2025-01-01T00:00:00",
+    }
+    events_file = exp_dir / "events_conv_test.jsonl"
+    events_file.write_text(
+        "".join(json.dumps(event) + "\n" for event in [start, turn(0), turn(1)])
+    )
+
+    service = ImportService(str(tmp_path / "test.duckdb"))
+    assert service.import_experiment_from_jsonl(exp_dir).turns_imported == 2
+
+    # Append two turns and a partial line still being written
+    partial = '{"event_type": "TurnStartEvent", '
+    with open(events_file, "a") as f:
+        f.write(json.dumps(turn(2)) + "\n" + json.dumps(turn(3)) + "\n")
+        f.write(partial)
+    assert service.import_experiment_from_jsonl(exp_dir).turns_imported == 2
+    assert service.import_experiment_from_jsonl(exp_dir).turns_imported == 0
+
+    db = service.db
+    assert db.execute(
+        "SELECT count(*), count(DISTINCT turn_number) FROM conversation_turns"
+    ).fetchone() == (4, 4)
+    # Text repeated across turns and messages is stored once
+    assert db.execute("SELECT count(*) FROM message_bodies").fetchone() == (5,)
+    assert db.execute(
+        "SELECT DISTINCT agent_b_message FROM conversation_turns"
+    ).fetchall() == [("Same",)]
+    assert db.execute(
+        "SELECT count(*) FROM messages WHERE content = 'A 3'"
+    ).fetchone() == (1,)
+    total_turns, final_score = db.execute(
+        "SELECT total_turns, final_convergence_score FROM conversations"
+    ).fetchone()
+    assert total_turns == 4
+    assert abs(final_score - 0.3) < 1e-9
+    assert db.execute(
+        "SELECT total_turns, conversations_with_metrics FROM experiment_summaries"
+    ).fetchone() == (4, 1)
+    assert db.execute(
+        "SELECT byte_offset, last_turn FROM import_ledger"
+    ).fetchone() == (
+        events_file.stat().st_size - len(partial),
+        3,
+    )
+
+    service.close()
+
+
+def test_saved_events_continue_conversation_sequence():
+    """Batched and single event saves share each conversation's sequence."""
+    import duckdb
+
+    from pidgin.core.events import TurnStartEvent
+    from pidgin.database.event_repository import EventRepository
+    from pidgin.database.schema import EVENT_SCHEMA
+
+    db = duckdb.connect()
+    db.execute(EVENT_SCHEMA)
+    repository = EventRepository(db)
+
+    events = [TurnStartEvent("conv_a", turn_number) for turn_number in range(5)]
+    assert repository.save_events(events, "exp", "conv_a") == 5
+    repository.save_event(TurnStartEvent("conv_b", 0), "exp", "conv_b")
+    repository.save_event(TurnStartEvent("conv_a", 5), "exp", "conv_a")
+    # A new repository continues from the stored sequences
+    EventRepository(db).save_events([TurnStartEvent("conv_a", 6)], "exp", "conv_a")
+
+    rows = db.execute(
+        "SELECT conversation_id, sequence, event_data->>'turn_number' FROM events "
+        "ORDER BY conversation_id, sequence"
+    ).fetchall()
+    assert rows == [("conv_a", n + 1, str(n)) for n in range(7)] + [("conv_b", 1, "0")]
+
+
+def test_event_stores_on_one_file_share_sequences(tmp_path):
+    """Stores sharing a database file never allocate a sequence twice."""
+    from pidgin.core.events import TurnStartEvent
+    from pidgin.database.event_store import EventStore
+
+    db_path = tmp_path / "shared.duckdb"
+    first = EventStore(db_path)
+    second = EventStore(db_path)
+    for turn_number in range(4):
+        store = first if turn_number % 2 == 0 else second
+        store.save_event(TurnStartEvent("c1", turn_number), "exp", "c1")
+    second.save_events([TurnStartEvent("c1", 4), TurnStartEvent("c1", 5)], "exp", "c1")
+    first.save_event(TurnStartEvent("c1", 6), "exp", "c1")
+
+    rows = first.db.execute(
+        "SELECT sequence, event_data->>'turn_number' FROM events "
+        "WHERE conversation_id = 'c1' ORDER BY sequence"
+    ).fetchall()
+    first.close()
+    second.close()
+
+    assert rows == [(n + 1, str(n)) for n in range(7)]
+
+
+def test_saved_messages_share_bodies_and_keep_null_content(tmp_path):
+    """Repeated texts are stored once; messages without text have no body."""
+    import duckdb
+
+    from pidgin.database.message_repository import MessageRepository
+    from pidgin.database.schema_manager import SchemaManager
+
+    db = duckdb.connect()
+    SchemaManager().ensure_schema(db, str(tmp_path / "memory"))
+    repository = MessageRepository(db)
+    for turn_number, content in enumerate(["Hello", None, "Hello"]):
+        repository.save_message("conv", turn_number, "agent_a", "assistant", content)
+
+    rows = db.execute(
+        "SELECT turn_number, message_hash IS NULL, content FROM message_records "
+        "LEFT JOIN message_bodies USING (message_hash) "
+        "ORDER BY turn_number"
+    ).fetchall()
+    assert rows == [(0, False, "Hello"), (1, True, None), (2, False, "Hello")]
+    assert db.execute("SELECT count(*) FROM message_bodies").fetchone() == (1,)
+
+
+def test_parquet_export_partitions_by_experiment_and_model_pair(tmp_path):
+    """Exported tables can be queried by partition, and re-exports replace.
+
+    Turns and messages of a model that was never recorded share the same
+    unknown model pair partition.
+    """
+    import duckdb
+
+    from pidgin.database.message_repository import MessageRepository
+    from pidgin.database.parquet_exporter import ParquetExporter
+    from pidgin.database.schema import CONVERSATION_TURNS_SCHEMA
+    from pidgin.database.schema_manager import SchemaManager
+
+    db = duckdb.connect()
+    SchemaManager().ensure_schema(db, str(tmp_path / "memory"))
+    # Allow a turn whose model was never recorded
+    db.execute("DROP VIEW conversation_turns")
+    db.execute("DROP TABLE turn_records")
+    db.execute(
+        CONVERSATION_TURNS_SCHEMA.replace(
+            "agent_a_model VARCHAR NOT NULL", "agent_a_model VARCHAR"
+        )
+    )
+    experiments = [("exp_a", "local:test"), ("exp_b", "openai:gpt"), ("exp_c", None)]
+    for experiment_id, model in experiments:
+        conversation_id = f"conv_{experiment_id}"
+        db.execute(
+            "INSERT INTO conversations (conversation_id, experiment_id, "
+            "agent_a_model, agent_b_model) VALUES (?, ?, ?, 'local:test')",
+            [conversation_id, experiment_id, model],
+        )
+        for turn_number in range(3):
+            db.execute(
+                "INSERT INTO turn_records (experiment_id, conversation_id, "
+                "turn_number, timestamp, agent_a_model, agent_b_model) "
+                "VALUES (?, ?, ?, now(), ?, 'local:test')",
+                [experiment_id, conversation_id, turn_number, model],
+            )
+            MessageRepository(db).save_message(
+                conversation_id, turn_number, "agent_a", "assistant", "Hello"
+            )
+
+    exporter = ParquetExporter(db)
+    exporter.export_experiments(tmp_path / "archive")
+    counts = exporter.export_experiment("exp_a", tmp_path / "archive")
+    assert counts["conversation_turns"] == 3
+    assert counts["messages"] == 3
+
+    def read(table, where):
+        return duckdb.sql(
+            f"SELECT experiment_id, model_pair, count(*) FROM read_parquet("
+            f"'{tmp_path}/archive/{table}/*/*/*.parquet', hive_partitioning = true) "
+            f"WHERE {where} GROUP BY ALL ORDER BY ALL"
+        ).fetchall()
+
+    assert read("conversation_turns", "true") == [
+        ("exp_a", "local:test__local:test", 3),
+        ("exp_b", "openai:gpt__local:test", 3),
+        ("exp_c", "unknown__local:test", 3),
+    ]
+    assert read("messages", "experiment_id = 'exp_c'") == [
+        ("exp_c", "unknown__local:test", 3)
+    ]
+    assert read("messages", "model_pair LIKE 'openai:%'") == [
+        ("exp_b", "openai:gpt__local:test", 3)
+    ]
+
+
+def test_stores_share_one_connection_per_database(tmp_path):
+    """Stores of one file share its connection, which closes with the last."""
+    import duckdb
+    import pytest
+
+    from pidgin.core.exceptions import DatabaseError, DatabaseLockError
+    from pidgin.database.connection_registry import connection_registry
+    from pidgin.database.event_store import EventStore
+
+    db_path = tmp_path / "shared.duckdb"
+    store = EventStore(db_path)
+    service = ImportService(str(db_path))
+    reader = EventStore(db_path, read_only=True)
+
+    store.db.execute(
+        "INSERT INTO experiments (experiment_id, name) VALUES ('exp', 'Shared')"
+    )
+    assert service.db.execute("SELECT name FROM experiments").fetchone() == ("Shared",)
+    assert reader.experiments.get_experiment("exp") is not None
+    with pytest.raises(DatabaseError):
+        reader.import_all_pending(tmp_path)
+
+    store.close()
+    service.close()
+    reader.close()
+
+    # The file is closed, so it can be opened in another mode
+    duckdb.connect(str(db_path), read_only=True).close()
+    reader = EventStore(db_path, read_only=True)
+    with pytest.raises(DatabaseLockError):
+        connection_registry.connect(db_path)
+    reader.close()
+
+
+def test_schema_fingerprint_skips_ddl_and_runs_pending_migrations(tmp_path):
+    """Current databases skip the DDL; stale ones get pending migrations."""
+    import duckdb
+
+    from pidgin.database.schema_loader import get_migrations
+    from pidgin.database.schema_manager import SchemaManager
+
+    db_path = str(tmp_path / "schema.duckdb")
+    db = duckdb.connect(db_path)
+    SchemaManager().ensure_schema(db, db_path)
+    latest = str(get_migrations()[-1].version)
+    assert (
+        dict(db.execute("SELECT key, value FROM schema_metadata").fetchall())[
+            "migration_version"
+        ]
+        == latest
+    )
+
+    def views():
+        return {
+            row[0]
+            for row in db.execute(
+                "SELECT view_name FROM duckdb_views() WHERE NOT internal"
+            ).fetchall()
+        }
+
+    # The fingerprint matches, so nothing is recreated
+    db.execute("DROP VIEW experiment_dashboard")
+    SchemaManager().ensure_schema(db, db_path)
+    assert "experiment_dashboard" not in views()
+
+    # An older schema gets the migrations after its version and the DDL. Turn
+    # and message text was stored inline before migration 3.
+    db.execute("DROP VIEW conversation_turns")
+    for (index,) in db.execute(
+        "SELECT index_name FROM duckdb_indexes() WHERE table_name = 'turn_records'"
+    ).fetchall():
+        db.execute(f"DROP INDEX {index}")
+    db.execute("ALTER TABLE turn_records RENAME TO conversation_turns")
+    db.execute("ALTER TABLE conversation_turns ADD COLUMN agent_a_message TEXT")
+    db.execute("ALTER TABLE conversation_turns ADD COLUMN agent_b_message TEXT")
+    db.execute("CREATE TABLE old_messages AS SELECT * FROM messages")
+    db.execute("DROP VIEW messages")
+    db.execute("DROP TABLE message_records")
+    db.execute("ALTER TABLE old_messages RENAME TO messages")
+    db.execute("DROP TABLE message_bodies")
+    db.execute("CREATE INDEX idx_messages_turn ON messages(turn_number)")
+    for turn_number in range(3):
+        db.execute(
+            "INSERT INTO conversation_turns (experiment_id, conversation_id, "
+            "turn_number, timestamp, agent_a_model, agent_b_model, "
+            "agent_a_message, agent_b_message) "
+            "VALUES ('exp', 'conv', ?, now(), 'a', 'b', 'Same here', ?)",
+            [turn_number, f"Turn {turn_number}"],
+        )
+        db.execute(
+            "INSERT INTO messages (conversation_id, turn_number, agent_id, content) "
+            "VALUES ('conv', ?, 'agent_a', 'Same here')",
+            [turn_number],
+        )
+    db.execute("CREATE INDEX idx_events_conversation ON events(conversation_id)")
+    db.execute(
+        "UPDATE schema_metadata SET value = CASE key "
+        "WHEN 'fingerprint' THEN 'stale' ELSE '1' END"
+    )
+    SchemaManager().ensure_schema(db, db_path)
+    assert "experiment_dashboard" in views()
+    assert not db.execute(
+        "SELECT * FROM duckdb_indexes() WHERE index_name = 'idx_events_conversation'"
+    ).fetchall()
+    assert db.execute("SELECT count(*) FROM message_bodies").fetchone()[0] == 4
+    assert db.execute(
+        "SELECT turn_number, agent_a_message, agent_b_message FROM conversation_turns "
+        "ORDER BY turn_number"
+    ).fetchall() == [(n, "Same here", f"Turn {n}") for n in range(3)]
+    assert db.execute("SELECT DISTINCT content FROM messages").fetchall() == [
+        ("Same here",)
+    ]
+    assert (
+        dict(db.execute("SELECT key, value FROM schema_metadata").fetchall())[
+            "migration_version"
+        ]
+        == latest
+    )
+
+
+def test_schema_creates_thinking_traces(tmp_path):
+    """A fresh database has every table the importer writes to."""
+    import duckdb
+
+    from pidgin.database.schema_manager import SchemaManager
+
+    db_path = str(tmp_path / "fresh.duckdb")
+    db = duckdb.connect(db_path)
+    SchemaManager().ensure_schema(db, db_path)
+    tables = {row[0] for row in db.execute("SHOW TABLES").fetchall()}
+    db.close()
+
+    assert "thinking_traces" in tables
+    assert {"token_usage", "message_bodies", "turn_records"} <= tables
+
+
+def test_summaries_match_aggregates_over_turns(tmp_path):
+    """Summary tables give the metrics otherwise calculated from turns."""
+    import duckdb
+
+    from pidgin.database.experiment_repository import ExperimentRepository
+    from pidgin.database.schema_manager import SchemaManager
+    from pidgin.database.summary_repository import SummaryRepository
+
+    db = duckdb.connect()
+    SchemaManager().ensure_schema(db, str(tmp_path / "memory"))
+    conversations = [
+        ("conv_1", "local:a", "completed", [0.1, 0.5]),
+        ("conv_2", "local:a", "failed", [0.2]),
+        ("conv_3", "local:b", "completed", [0.3, None, 0.9]),
+    ]
+    for conversation_id, model, status, scores in conversations:
+        db.execute(
+            "INSERT INTO conversations (conversation_id, experiment_id, status, "
+            "agent_a_model, agent_b_model, total_turns, final_convergence_score) "
+            "VALUES (?, 'exp', ?, ?, 'local:test', ?, ?)",
+            [conversation_id, status, model, len(scores), scores[-1]],
+        )
+        for turn_number, score in enumerate(scores):
+            db.execute(
+                "INSERT INTO turn_metrics (conversation_id, turn_number, "
+                "convergence_score) VALUES (?, ?, ?)",
+                [conversation_id, turn_number, score],
+            )
+
+    experiments = ExperimentRepository(db)
+    calculated = experiments.get_experiment_metrics("exp")
+
+    summaries = SummaryRepository(db)
+    summaries.refresh_conversations("exp", ["conv_1", "conv_2"])
+    summaries.refresh_conversations("exp", ["conv_3"])
+    summarized = experiments.get_experiment_metrics("exp")
+    assert summarized.keys() == calculated.keys()
+    for key, value in calculated.items():
+        assert abs(summarized[key] - value) < 1e-9, key
+
+    pairs = {
+        row["agent_a_model"]: row["total_conversations"]
+        for row in summaries.get_model_pair_summaries("exp")
+    }
+    assert pairs == {"local:a": 2, "local:b": 1}
+
+    summaries.delete_conversation("conv_3")
+    assert summaries.get_experiment_summary("exp")["total_conversations"] == 2
+    assert len(summaries.get_model_pair_summaries("exp")) == 1
+
+
+def test_import_fills_latency_columns(tmp_path):
+    """Turns get time to first token per agent and start-to-complete duration."""
+    exp_dir = tmp_path / "experiment_test"
+    exp_dir.mkdir()
+    (exp_dir / "manifest.json").write_text(
+        json.dumps({"experiment_id": "test_exp", "name": "Test Experiment"})
+    )
+
+    def message(agent_id, ttft_ms, timestamp):
+        return {
+            "event_type": "MessageCompleteEvent",
+            "conversation_id": "conv_test",
+            "agent_id": agent_id,
+            "message": {"role": "assistant", "content": "ignored"},
+            "prompt_tokens": 5,
+            "completion_tokens": 10,
+            "total_tokens": 15,
+            "duration_ms": 800,
+            "time_to_first_token_ms": ttft_ms,
+            "tokens_per_second": 25.0,
+            "timestamp": timestamp,
+        }
+
+    events = [
+        {
+            "event_type": "ConversationStartEvent",
+            "conversation_id": "conv_test",
+            "agent_a": {"id": "agent_a"},
+            "agent_b": {"id": "agent_b"},
+            "agent_a_model": "local:test",
+            "agent_b_model": "local:test",
+            "initial_prompt": "Hello",
+            "timestamp": "2025-01-01T00:00:00+00:00",
+        },
+        {
+            "event_type": "TurnStartEvent",
+            "conversation_id": "conv_test",
+            "turn_number": 0,
+            "timestamp": "2025-01-01T00:00:00.5+00:00",
+        },
+        message("agent_a", 120, "2025-01-01T00:00:01+00:00"),
+        message("agent_b", 340, "2025-01-01T00:00:02+00:00"),
+        {
+            "event_type": "TurnCompleteEvent",
+            "conversation_id": "conv_test",
+            "turn_number": 0,
+            "turn": {
+                "agent_a_message": {"role": "assistant", "content": "Hello there"},
+                "agent_b_message": {"role": "assistant", "content": "Hi back"},
+            },
+            "convergence_score": 0.5,
+            "timestamp": "2025-01-01T00:00:03+00:00",
+        },
+    ]
+    (exp_dir / "events_conv_test.jsonl").write_text(
+        "".join(json.dumps(event) + "\n" for event in events)
+    )
+
+    for event_reader in ("duckdb", "python"):
+        service = ImportService(
+            str(tmp_path / f"{event_reader}.duckdb"), event_reader=event_reader
+        )
+        assert service.import_experiment_from_jsonl(exp_dir).success
+        row = service.db.execute(
+            "SELECT api_latency_a, api_latency_b, turn_duration_ms, "
+            "a_completion_tokens, b_completion_tokens FROM conversation_turns"
+        ).fetchone()
+        service.close()
+        assert row == (120, 340, 2500, 10, 10), event_reader
@@ -11,6 +11,7 @@ from pathlib import Path
 from pidgin.core.events import (
     ConversationEndEvent,
     ConversationStartEvent,
+    MessageCompleteEvent,
     MessageRequestEvent,
     SystemPromptEvent,
     TurnCompleteEvent,
@@ -75,6 +76,28 @@ def test_turn_complete_event_deserialization():
     assert event.convergence_score == 0.75
 
 
+def test_turn_complete_event_reads_nested_turn():
+    """Test that messages logged nested under "turn" are recovered."""
+    event_data = {
+        "event_type": "TurnCompleteEvent",
+        "timestamp": "2024-01-01T12:00:05",
+        "conversation_id": "test-conv-123",
+        "turn_number": 2,
+        "convergence_score": 0.5,
+        "turn": {
+            "agent_a_message": {"role": "assistant", "content": "Hello there!"},
+            "agent_b_message": {"role": "assistant", "content": "Hi!"},
+        },
+    }
+
+    event = EventDeserializer().deserialize_event(event_data)
+
+    assert isinstance(event, TurnCompleteEvent)
+    assert event.turn.agent_a_message.content == "Hello there!"
+    assert event.turn.agent_b_message.content == "Hi!"
+    assert event.turn.agent_a_message.agent_id == "agent_a"
+
+
 def test_system_prompt_event_deserialization():
     """Test that SystemPromptEvent can be deserialized from JSONL."""
     event_data = {
@@ -126,6 +149,66 @@ def test_message_request_event_deserialization():
     assert len(event.conversation_history) == 2
 
 
+def test_message_complete_event_timing_deserialization():
+    """Latency breakdown fields round-trip, and are None in older logs."""
+    event_data = {
+        "event_type": "MessageCompleteEvent",
+        "timestamp": "2024-01-01T12:00:03",
+        "conversation_id": "test-conv-123",
+        "agent_id": "agent_a",
+        "message": {"role": "assistant", "content": "Hi there!"},
+        "prompt_tokens": 10,
+        "completion_tokens": 20,
+        "total_tokens": 30,
+        "duration_ms": 900,
+        "rate_limit_wait_ms": 50,
+        "request_send_ms": 5,
+        "time_to_first_token_ms": 400,
+        "tokens_per_second": 42.5,
+        "chunk_gap_p50_ms": 10.0,
+        "chunk_gap_p95_ms": 30.0,
+        "chunk_gap_max_ms": 55.5,
+    }
+
+    deserializer = EventDeserializer()
+    event = deserializer.deserialize_event(event_data)
+
+    assert isinstance(event, MessageCompleteEvent)
+    assert event.rate_limit_wait_ms == 50
+    assert event.request_send_ms == 5
+    assert event.time_to_first_token_ms == 400
+    assert event.tokens_per_second == 42.5
+    assert event.chunk_gap_max_ms == 55.5
+
+    for field in (
+        "rate_limit_wait_ms",
+        "request_send_ms",
+        "time_to_first_token_ms",
+        "tokens_per_second",
+        "chunk_gap_p50_ms",
+        "chunk_gap_p95_ms",
+        "chunk_gap_max_ms",
+    ):
+        del event_data[field]
+    legacy = deserializer.deserialize_event(event_data)
+    assert legacy.time_to_first_token_ms is None
+    assert legacy.tokens_per_second is None
+    assert legacy.rate_limit_wait_ms is None
+
+    request = deserializer.deserialize_event(
+        {
+            "event_type": "MessageRequestEvent",
+            "timestamp": "2024-01-01T12:00:02",
+            "conversation_id": "test-conv-123",
+            "agent_id": "agent_a",
+            "turn_number": 1,
+            "messages": [],
+            "rate_limit_wait_ms": 75,
+        }
+    )
+    assert request.rate_limit_wait_ms == 75
+
+
 def test_full_conversation_deserialization():
     """Test deserializing a complete conversation from JSONL file."""
     # Create a temporary JSONL file with a full conversation
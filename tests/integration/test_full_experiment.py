@@ -208,3 +208,49 @@ async def test_parallel_experiment_execution():
         assert exp_state.name == "parallel_test"
         assert exp_state.status == "completed"
         assert len(exp_state.conversations) == 4
+
+
+@pytest.mark.asyncio
+async def test_message_timing_accumulates_in_manifest(tmp_path):
+    """Each response's latency is added to its conversation's manifest entry."""
+    from pidgin.core.events import MessageCompleteEvent
+    from pidgin.core.types import Message
+    from pidgin.experiments.manifest import ManifestManager
+    from pidgin.experiments.tracking_event_bus import TrackingEventBus
+
+    manifest = ManifestManager(tmp_path)
+    manifest.create("exp", "latency", {}, total_conversations=1)
+    manifest.add_conversation("conv_latency", "events_conv_latency.jsonl")
+    bus = TrackingEventBus(tmp_path, "conv_latency")
+
+    def complete(agent_id, ttft_ms, tokens_per_second, wait_ms):
+        return MessageCompleteEvent(
+            conversation_id="conv_latency",
+            agent_id=agent_id,
+            message=Message(role="assistant", content="Hi", agent_id=agent_id),
+            prompt_tokens=1,
+            completion_tokens=1,
+            total_tokens=2,
+            duration_ms=100,
+            time_to_first_token_ms=ttft_ms,
+            tokens_per_second=tokens_per_second,
+            rate_limit_wait_ms=wait_ms,
+        )
+
+    await bus.emit(complete("agent_a", 200, 40.0, 10))
+    await bus.emit(complete("agent_a", 400, None, None))
+    await bus.emit(complete("agent_b", None, None, 5))
+    await bus.stop()
+
+    latency = manifest.get_manifest()["conversations"]["conv_latency"]["latency"]
+    assert latency["agent_a"] == {
+        "responses": 2,
+        "ttft_ms_total": 600,
+        "ttft_samples": 2,
+        "tokens_per_second_total": 40.0,
+        "tokens_per_second_samples": 1,
+        "rate_limit_wait_ms_total": 10,
+    }
+    assert latency["agent_b"]["responses"] == 1
+    assert latency["agent_b"]["ttft_samples"] == 0
+    assert latency["agent_b"]["rate_limit_wait_ms_total"] == 5
@@ -0,0 +1,170 @@
+"""Hedged requests cut tail latency without changing responses."""
+
+import asyncio
+import time
+
+import pytest
+
+from pidgin.core.event_bus import EventBus
+from pidgin.core.events import MessageCompleteEvent, MessageRequestEvent
+from pidgin.core.types import Message
+from pidgin.providers.base import Provider, ResponseChunk
+from pidgin.providers.event_wrapper import EventAwareProvider
+from pidgin.providers.hedging import HedgingPolicy
+from pidgin.providers.stream_timing import StreamTimer, percentile
+
+
+class LatencyProvider(Provider):
+    """Fake provider whose time-to-first-token comes from a fixed sequence."""
+
+    def __init__(self, latencies):
+        super().__init__()
+        self.model_name = "latency-test"
+        self.latencies = list(latencies)
+        self.calls = 0
+
+    async def stream_response(
+        self,
+        messages,
+        temperature=None,
+        thinking_enabled=None,
+        thinking_budget=None,
+    ):
+        call = self.calls
+        self.calls += 1
+        await asyncio.sleep(self.latencies[call % len(self.latencies)])
+        yield ResponseChunk(f"response from call {call}", "response")
+
+
+async def _request(provider, policy):
+    bus = EventBus()
+    completed = []
+    bus.subscribe(MessageCompleteEvent, completed.append)
+    wrapper = EventAwareProvider(
+        provider, bus, "agent_a", token_tracker=None, hedging_policy=policy
+    )
+
+    start = time.time()
+    await wrapper.handle_message_request(
+        MessageRequestEvent(
+            conversation_id="conv_hedge",
+            agent_id="agent_a",
+            turn_number=0,
+            conversation_history=[Message(role="user", content="Hi", agent_id="human")],
+        )
+    )
+    return completed[0], time.time() - start
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged():
+    """A stalled first request loses to the hedge fired after the threshold."""
+    policy = HedgingPolicy(min_samples=5, min_delay_seconds=0.0)
+    for _ in range(5):
+        policy.record_latency("latency-test", 0.05)
+
+    # First call stalls, the hedge answers immediately
+    provider = LatencyProvider([2.0, 0.0])
+    event, elapsed = await _request(provider, policy)
+
+    assert event.message.content == "response from call 1"
+    assert elapsed < 1.0
+    stats = policy.get_stats("latency-test")
+    assert stats["hedges_fired"] == 1
+    assert stats["hedges_won"] == 1
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_without_history():
+    """Hedging stays off until enough latency samples exist."""
+    policy = HedgingPolicy(min_samples=5, min_delay_seconds=0.0)
+    provider = LatencyProvider([0.1])
+
+    event, _ = await _request(provider, policy)
+
+    assert event.message.content == "response from call 0"
+    assert provider.calls == 1
+    assert policy.get_stats("latency-test")["hedges_fired"] == 0
+
+
+@pytest.mark.asyncio
+async def test_winning_hedge_records_its_own_latency():
+    """A winning hedge is timed from when it was fired, not from the request."""
+    policy = HedgingPolicy(min_samples=5, min_delay_seconds=0.0)
+    for _ in range(5):
+        policy.record_latency("latency-test", 0.2)
+
+    # Hedge fires after 0.2s and answers 0.2s later, 0.4s into the request
+    provider = LatencyProvider([2.0, 0.2])
+    event, _ = await _request(provider, policy)
+
+    assert event.message.content == "response from call 1"
+    assert 150 <= event.time_to_first_token_ms < 350
+    recorded = policy.latency_history["latency-test"][-1]
+    assert 0.15 <= recorded < 0.35
+
+
+class SlowTailProvider(LatencyProvider):
+    """Fake provider that answers at once but takes a while to finish."""
+
+    async def stream_response(
+        self,
+        messages,
+        temperature=None,
+        thinking_enabled=None,
+        thinking_budget=None,
+    ):
+        self.calls += 1
+        yield ResponseChunk("first ", "response")
+        await asyncio.sleep(self.latencies[0])
+        yield ResponseChunk("last", "response")
+
+
+@pytest.mark.asyncio
+async def test_instant_first_token_is_recorded_as_zero():
+    """A measured 0 ms first token is kept rather than the full duration."""
+    policy = HedgingPolicy(min_samples=5, min_delay_seconds=0.0)
+    provider = SlowTailProvider([0.3])
+
+    event, _ = await _request(provider, policy)
+
+    assert event.message.content == "first last"
+    assert event.time_to_first_token_ms == 0
+    assert policy.latency_history["latency-test"][-1] == 0
+
+
+def test_percentile_uses_nearest_rank():
+    """Percentiles pick an observed value; empty input has none."""
+    values = [5.0, 1.0, 4.0, 2.0, 3.0]
+    assert percentile(values, 0) == 1.0
+    assert percentile(values, 50) == 3.0
+    assert percentile(values, 95) == 5.0
+    assert percentile(values, 100) == 5.0
+    assert percentile([], 50) is None
+
+
+def test_stream_timer_breaks_down_latency():
+    """Send, first token, throughput and chunk gaps come from marked times."""
+    timer = StreamTimer(requested_at=100.0)
+    timer.start(at=100.25)
+    for at in (101.0, 101.5, 101.75, 103.0):
+        timer.mark_chunk(at=at)
+
+    timing = timer.summary(completion_tokens=20)
+
+    assert timing["request_send_ms"] == 250
+    assert timing["time_to_first_token_ms"] == 750
+    assert timing["tokens_per_second"] == 10.0
+    assert timing["chunk_gap_p50_ms"] == 500.0
+    assert timing["chunk_gap_p95_ms"] == 1250.0
+    assert timing["chunk_gap_max_ms"] == 1250.0
+
+    # Nothing streamed: nothing to report
+    assert StreamTimer().summary(completion_tokens=0) == {
+        "request_send_ms": None,
+        "time_to_first_token_ms": None,
+        "tokens_per_second": None,
+        "chunk_gap_p50_ms": None,
+        "chunk_gap_p95_ms": None,
+        "chunk_gap_max_ms": None,
+    }
@@ -0,0 +1,93 @@
+"""Message streams deliver in-flight text to every reader in order."""
+
+import asyncio
+
+import pytest
+
+from pidgin.core.event_bus import EventBus
+from pidgin.core.message_stream import StreamChannel
+
+
+async def _collect(stream):
+    return [chunk async for chunk in stream.follow()]
+
+
+@pytest.mark.asyncio
+async def test_appended_chunks_reach_followers_in_order():
+    """Every follower sees each chunk once, in arrival order."""
+    channel = StreamChannel()
+    followers = []
+    channel.subscribe(
+        lambda stream: followers.append(asyncio.create_task(_collect(stream)))
+    )
+
+    stream = channel.open("conv", "agent_a", 0)
+    await asyncio.sleep(0)
+    stream.append("thinking", "Hmm")
+    stream.append("response", "Hello")
+    await asyncio.sleep(0)
+    stream.append("response", " there")
+    stream.close()
+
+    expected = [("thinking", "Hmm"), ("response", "Hello"), ("response", " there")]
+    assert await asyncio.wait_for(asyncio.gather(*followers), 1) == [expected]
+    assert stream.text() == "Hello there"
+    assert stream.text("thinking") == "Hmm"
+
+
+@pytest.mark.asyncio
+async def test_follow_ends_after_close():
+    """A follower waiting for more text finishes when the stream closes."""
+    stream = StreamChannel().open("conv", "agent_a", 0)
+    follower = asyncio.create_task(_collect(stream))
+    await asyncio.sleep(0)
+    assert not follower.done()
+
+    stream.close()
+
+    assert await asyncio.wait_for(follower, 1) == []
+    assert stream._waiters == []
+
+
+@pytest.mark.asyncio
+async def test_late_follower_sees_buffered_text():
+    """Following after chunks arrived starts from the first chunk."""
+    stream = StreamChannel().open("conv", "agent_b", 3)
+    stream.append("response", "Already")
+    stream.append("response", " here")
+
+    follower = asyncio.create_task(_collect(stream))
+    await asyncio.sleep(0)
+    stream.append("response", "!")
+    stream.close()
+
+    assert await asyncio.wait_for(follower, 1) == [
+        ("response", "Already"),
+        ("response", " here"),
+        ("response", "!"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_and_channel_close():
+    """Unsubscribed callbacks get no streams; closing ends open streams."""
+    bus = EventBus()
+    opened = []
+    bus.streams.subscribe(opened.append)
+    bus.streams.open("conv", "agent_a", 0).close()
+    bus.streams.unsubscribe(opened.append)
+    bus.streams.open("conv", "agent_b", 0)
+    assert len(opened) == 1
+
+    bus.streams.subscribe(opened.append)
+    pending = bus.streams.open("conv", "agent_a", 1)
+    follower = asyncio.create_task(_collect(pending))
+    pending.append("response", "Cut")
+    await asyncio.sleep(0)
+
+    await bus.stop()
+
+    assert pending.closed
+    assert await asyncio.wait_for(follower, 1) == [("response", "Cut")]
+    bus.streams.open("conv", "agent_b", 1)
+    assert len(opened) == 2
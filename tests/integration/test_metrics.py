@@ -1,5 +1,7 @@
 """Quick sanity check that metrics still work."""
 
+import pytest
+
 from pidgin.metrics.flat_calculator import FlatMetricsCalculator
 
 
@@ -44,3 +46,416 @@ def test_convergence_increases_with_similarity():
 
     # Similar should have higher convergence
     assert metrics2["overall_convergence"] > metrics1["overall_convergence"]
+
+
+def test_metrics_from_shared_features():
+    """Analyzers fed MessageFeatures match the original per-text results."""
+    from pidgin.metrics.convergence_metrics import ConvergenceCalculator
+    from pidgin.metrics.features import MessageFeatures
+    from pidgin.metrics.text_analysis import TextAnalyzer
+
+    features_a = MessageFeatures(
+        "Wait?? The signal -> echo → 3.14 ≈ π! 🌀🌀 Isn't it, really?"
+    )
+    features_b = MessageFeatures("The signal echoes... isn't it? 42 ways → one.")
+
+    assert TextAnalyzer.count_special_symbols(features_a) == 6
+    assert TextAnalyzer.count_numbers(features_a) == 1
+    assert TextAnalyzer.count_emojis(features_a) == 1
+    assert TextAnalyzer.count_arrows(features_a) == 2
+    assert TextAnalyzer.calculate_punctuation_diversity(features_a) == 10
+    assert TextAnalyzer.calculate_symbol_density(features_a) == pytest.approx(8 / 29)
+
+    calc = ConvergenceCalculator
+    assert calc.calculate_mimicry_score(features_a, features_b) == pytest.approx(
+        2 / 135
+    )
+    assert calc.calculate_cross_repetition(features_a, features_b) == pytest.approx(
+        4 / 9
+    )
+    assert calc.calculate_structural_similarity(
+        features_a, features_b
+    ) == pytest.approx(0.8035714285714286)
+
+
+def test_ngram_shortcuts_match_full_counts():
+    """Derived n-gram counts and mimicry agree with counting every n-gram."""
+    import random
+
+    from pidgin.metrics.convergence_metrics import ConvergenceCalculator
+    from pidgin.metrics.features import MessageFeatures
+
+    def full_mimicry(a, b):
+        score = 0.0
+        max_n = min(6, a.word_count, b.word_count)
+        for n in range(2, max_n + 1):
+            ngrams_a = a.ngrams(n)
+            score += len(ngrams_a.keys() & b.ngrams(n).keys()) / len(ngrams_a) * (n - 1)
+        return score / sum(range(1, max_n)) if max_n > 1 else score
+
+    rng = random.Random(3)
+    for _ in range(200):
+        vocab = ["the", "cat", "sat", "on", "mat"][: rng.randint(1, 5)]
+        text_a = " ".join(rng.choices(vocab, k=rng.randint(0, 30)))
+        text_b = " ".join(rng.choices(vocab, k=rng.randint(0, 30)))
+        a, b = MessageFeatures(text_a), MessageFeatures(text_b)
+
+        assert ConvergenceCalculator.calculate_mimicry_score(a, b) == pytest.approx(
+            full_mimicry(MessageFeatures(text_a), b)
+        )
+        for n in range(2, 7):
+            counts = MessageFeatures(text_a).ngrams(n)
+            assert a.distinct_ngrams(n) == len(counts)
+            repeated = a.repeated_ngrams(n)
+            assert all(counts[ngram] == c for ngram, c in repeated.items())
+            assert all(ngram in repeated for ngram, c in counts.items() if c > 1)
+
+
+def test_batch_engine_matches_turn_by_turn():
+    """The batch engine emits the same columns and values as the flat one."""
+    from pidgin.metrics.batch_calculator import BatchMetricsCalculator
+
+    conversation = [
+        ("Hello world, how are you?", "Hello there! I'm fine -> thanks."),
+        ("I like cats and dogs.", "I love cats; dogs are fine too."),
+        ("Cats cats cats 🐈", "Hello world, how are you?"),
+        ("", "Nothing to add."),
+        ("Hello world, how are you?", "I love cats; dogs are fine too."),
+    ]
+
+    calc = FlatMetricsCalculator()
+    expected = [
+        calc.calculate_turn_metrics(turn, a, b)
+        for turn, (a, b) in enumerate(conversation)
+    ]
+    batch = BatchMetricsCalculator().calculate_conversation(
+        (turn, a, b) for turn, (a, b) in enumerate(conversation)
+    )
+
+    assert batch == expected
+
+
+def test_batch_engine_calculates_registered_history_metrics():
+    """Newly registered cumulative and conversation metrics work in batches."""
+    from pidgin.metrics.batch_calculator import BatchMetricsCalculator
+    from pidgin.metrics.engine import MetricsEngine
+    from pidgin.metrics.registry import (
+        CONVERSATION,
+        CUMULATIVE,
+        MESSAGE,
+        MetricRegistry,
+    )
+
+    registry = MetricRegistry()
+    registry.register("words", MESSAGE, lambda ctx: ctx.features.word_count)
+    registry.register(
+        "reused_words",
+        CUMULATIVE,
+        lambda ctx: (
+            ctx.values["words"]
+            * ctx.history.reuse.repetition(ctx.agent, ctx.features.vocabulary_ids)
+        ),
+        dependencies=("words",),
+        history=("reuse",),
+    )
+    registry.register(
+        "shared_vocabulary",
+        CONVERSATION,
+        lambda ctx: ctx.history.vocabulary.overlap(),
+        history=("vocabulary",),
+    )
+    metrics = ["reused_words", "shared_vocabulary"]
+    conversation = [
+        (0, "I like cats and dogs.", "I love cats; dogs are fine too."),
+        (1, "Cats and dogs are fine.", "Dogs are fine, cats too."),
+        (2, "Cats cats cats", "Dogs dogs"),
+    ]
+
+    engine = MetricsEngine(metrics, registry=registry)
+    engine.replay_turn(*conversation[0][1:])
+    expected = [engine.calculate_turn_metrics(*turn) for turn in conversation[1:]]
+    batch = BatchMetricsCalculator(metrics=metrics, registry=registry)
+
+    got = batch.calculate_conversation(conversation[1:], history=conversation[:1])
+
+    assert got == expected
+    assert set(got[0]) == {"a_reused_words", "b_reused_words", "shared_vocabulary"}
+    assert got[0]["shared_vocabulary"] > 0
+
+
+def test_rolling_ngram_index_matches_window_recount():
+    """The rolling index agrees with recounting the window every turn."""
+    from pidgin.metrics.convergence_metrics import ConvergenceCalculator
+    from pidgin.metrics.ngram_index import PhraseCounts, RollingNgramIndex
+
+    messages = [
+        "the cat sat on the mat",
+        "the cat sat on the hat",
+        "short",
+        "on the mat the cat sat",
+        "a new phrase entirely here",
+        "the cat sat on the mat again",
+    ]
+    corpus = PhraseCounts()
+    index = RollingNgramIndex(window=3, n=3, corpus=corpus)
+
+    for i, message in enumerate(messages):
+        index.add(message)
+        window = messages[max(0, i - 2) : i + 1]
+        assert (
+            index.repetition_ratio
+            == ConvergenceCalculator.calculate_repetition_ratio(window)
+        )
+
+    assert index.count(("the", "cat", "sat")) == 2
+    assert corpus.counts[("the", "cat", "sat")] == 4
+
+
+def test_live_convergence_is_incremental():
+    """Scores from an appended-to history match scoring it from scratch."""
+    from pidgin.analysis.convergence import ConvergenceCalculator
+    from pidgin.core.types import Message
+
+    turns = [
+        ("agent_a", "Hello there! How are you today?"),
+        ("system", "Turn 1"),
+        ("agent_b", "**Agent B**: Hi, I am fine - thanks."),
+        ("agent_a", "Great.\n\n\n\n1. one\n2. two"),
+        ("agent_b", "Good: lists are fun; right?"),
+        ("agent_a", "Same words here"),
+        ("agent_b", "same words here"),
+    ]
+    calculator = ConvergenceCalculator(window_size=4)
+    messages = []
+    scores = []
+    for agent_id, content in turns:
+        messages.append(Message(role="assistant", content=content, agent_id=agent_id))
+        scores.append(calculator.calculate(messages))
+        fresh = ConvergenceCalculator(window_size=4).calculate(list(messages))
+        assert scores[-1] == fresh
+
+    assert scores == [0.0, 0.0, 0.35, 0.4, 0.38, 0.35, 1.0]
+
+
+def test_hashed_embedder_similarities():
+    """Related messages score higher than unrelated ones, offline."""
+    from pidgin.metrics.semantic import HashedEmbedder
+
+    embedder = HashedEmbedder()
+    embedder.fit(
+        [
+            "The cat sat on the mat.",
+            "A cat was sitting on a mat!",
+            "Quarterly revenue grew by ten percent.",
+        ]
+    )
+
+    same = embedder.similarity("The cat sat on the mat.", "the cat sat on the mat")
+    related = embedder.similarity(
+        "The cat sat on the mat.", "A cat was sitting on a mat!"
+    )
+    unrelated = embedder.similarity(
+        "The cat sat on the mat.", "Quarterly revenue grew by ten percent."
+    )
+    assert same == pytest.approx(1.0)
+    assert related > unrelated >= 0.0
+    assert embedder.similarity("", "anything") == 0.0
+
+    turns = embedder.calculate_conversation(
+        "Talk about cats",
+        [(0, "Cats are great.", "Cats are great."), (1, "Cats nap.", "Mats too.")],
+    )
+    assert turns[0]["semantic_similarity"] == pytest.approx(1.0)
+    assert turns[0]["a_self_similarity"] == 0.0
+    assert turns[1]["a_self_similarity"] > turns[1]["b_self_similarity"]
+    assert turns[1]["a_prompt_similarity"] > 0.0
+
+
+def test_minhash_attractor_index():
+    """Conversations ending in the same text cluster; unrelated ones do not."""
+    import duckdb
+
+    from pidgin.database.attractor_repository import AttractorRepository
+    from pidgin.database.schema import get_all_schemas
+    from pidgin.metrics.minhash import MinHasher, estimate_similarity
+
+    hasher = MinHasher()
+    text = "we keep returning to the quiet spiral of gratitude and shared wonder"
+    assert hasher.signature(text) == hasher.signature(text.upper())
+    assert estimate_similarity(hasher.signature(text), hasher.signature(text)) == 1.0
+    assert hasher.signature("") == []
+
+    db = duckdb.connect()
+    for schema in get_all_schemas():
+        db.execute(schema)
+    repository = AttractorRepository(db, hasher)
+
+    endings = {
+        "conv_1": (text, text),
+        "conv_2": (text, text),
+        "conv_3": ("entirely unrelated words", "nothing in common here"),
+    }
+    for conversation_id, ending in endings.items():
+        turns = [
+            (0, f"opening of {conversation_id}", f"reply in {conversation_id}"),
+            (1, *ending),
+        ]
+        repository.index_conversation(
+            "exp",
+            conversation_id,
+            [(n, hasher.signature(a), hasher.signature(b)) for n, a, b in turns],
+        )
+
+    clusters = repository.find_clusters("message", threshold=0.9)
+    assert len(clusters) == 1
+    assert clusters[0].conversations == [("exp", "conv_1"), ("exp", "conv_2")]
+    assert len(clusters[0].members) == 4
+
+    assert repository.find_clusters(experiment_ids=["other"]) == []
+    repository.delete_experiment("exp")
+    assert repository.find_clusters("message") == []
+
+
+def test_cumulative_vocabulary_and_lru_cache():
+    """Incremental overlap matches Jaccard; the cache evicts the oldest entry."""
+    from pidgin.metrics.cache import LRUCache
+    from pidgin.metrics.vocabulary import CumulativeVocabulary
+
+    vocabulary = CumulativeVocabulary()
+    assert vocabulary.add("agent_a", [0, 1, 2]) == [0, 1, 2]
+    assert vocabulary.overlap() == 0.0
+    assert vocabulary.add("agent_b", [2, 3, 100]) == [2, 3, 100]
+    assert vocabulary.add("agent_a", [1, 3]) == [3]
+    # {0, 1, 2, 3} vs {2, 3, 100}
+    assert vocabulary.overlap() == pytest.approx(2 / 5)
+    assert 100 in vocabulary.words["agent_b"]
+    assert 100 not in vocabulary.words["agent_a"]
+
+    cache: LRUCache[str, int] = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert len(cache) == 2
+
+
+def test_streaming_compression_ratios():
+    """Repeated turns compress far better given the conversation so far."""
+    from pidgin.metrics.compression import ConversationCompression
+
+    compression = ConversationCompression()
+    first = compression.add_turn(
+        "The lighthouse keeper counted ships until the fog rolled in.",
+        "Beyond the harbor, gulls argued over the fishing boats at dawn.",
+    )
+    repeat = compression.add_turn(
+        "The lighthouse keeper counted ships until the fog rolled in.",
+        "Beyond the harbor, gulls argued over the fishing boats at dawn.",
+    )
+
+    assert (
+        repeat["marginal_compression_ratio"] < first["marginal_compression_ratio"] / 2
+    )
+    assert (
+        repeat["a_marginal_compression_ratio"] < first["a_marginal_compression_ratio"]
+    )
+    assert (
+        repeat["cumulative_compression_ratio"] < first["cumulative_compression_ratio"]
+    )
+    # A turn without text has no marginal ratio; stored columns get 0.0
+    assert compression.add_turn("", " \n")["marginal_compression_ratio"] == 0.0
+    assert compression.marginal_ratio is None
+    assert compression.add_turn("", "New words.")["a_marginal_compression_ratio"] == 0.0
+    assert compression.marginal_ratio > 0
+
+    calc = FlatMetricsCalculator()
+    metrics = calc.calculate_turn_metrics(0, "Hello world", "Hello there")
+    assert metrics["a_cumulative_compression_ratio"] > 0
+    assert "marginal_compression_ratio" in metrics
+
+
+def test_parallel_metrics_pipeline_matches_serial():
+    """Worker processes calculate the same metrics as the importing process."""
+    from pidgin.database.importers.metrics_pipeline import MetricsPipeline
+
+    conversations = [
+        ["Hello world, how are you?", "Hello there! I'm fine -> thanks."],
+        ["I like cats and dogs.", "I love cats; dogs are fine too."],
+        ["Cats cats cats 🐈", "Hello world, how are you?"],
+    ]
+    jobs = [
+        (
+            {
+                turn: {"agent_a_message": a, "agent_b_message": f"{b} {turn}"}
+                for turn in range(3)
+            },
+            [0, 1, 2],
+            "Talk about cats",
+        )
+        for a, b in conversations
+    ]
+    corpus = [
+        message
+        for turns, _, _ in jobs
+        for turn in turns.values()
+        for message in turn.values()
+    ]
+
+    serial = MetricsPipeline(workers=1)
+    serial.fit_corpus(corpus)
+    parallel = MetricsPipeline(workers=2)
+    parallel.fit_corpus(corpus)
+
+    expected = serial.calculate_many(jobs)
+    assert parallel.calculate_many(jobs) == expected
+    assert [len(turns) for turns in expected] == [3, 3, 3]
+
+    with pytest.raises(ValueError):
+        MetricsPipeline(workers=-1)
+
+
+def test_metrics_engine_subsets_and_shapes():
+    """Requested subsets match the full set and skip unneeded metrics."""
+    from pidgin.metrics.calculator import MetricsCalculator
+    from pidgin.metrics.engine import MetricsEngine
+    from pidgin.metrics.registry import PAIR, MetricRegistry
+
+    conversation = [
+        ("Hello world, how are you?", "Hello there! I'm fine -> thanks."),
+        ("I like cats and dogs.", "I love cats; dogs are fine too."),
+        ("Hello world, how are you?", "I love cats; dogs are fine too."),
+    ]
+    full = FlatMetricsCalculator()
+    subset = MetricsEngine(["word_count", "new_words", "overall_convergence"])
+    nested = MetricsCalculator()
+    for turn, (a, b) in enumerate(conversation):
+        expected = full.calculate_turn_metrics(turn, a, b)
+        got = subset.calculate_turn_metrics(turn, a, b)
+        assert got == {key: expected[key] for key in got}
+        assert set(got) == {
+            "a_word_count",
+            "b_word_count",
+            "a_new_words",
+            "b_new_words",
+            "overall_convergence",
+        }
+
+        metrics = nested.calculate_turn_metrics(turn, a, b)
+        assert metrics["agent_a"]["entropy"] == expected["a_word_entropy"]
+        assert (
+            metrics["convergence"]["overall_convergence_score"]
+            == expected["overall_convergence"]
+        )
+
+    # Only dependencies are calculated, and no unused history is kept
+    assert "minhash" not in subset.definitions
+    assert "mutual_mimicry" in subset.definitions
+    assert subset.history.compression is None
+
+    registry = MetricRegistry()
+    with pytest.raises(ValueError):
+        registry.register("score", PAIR, lambda ctx: 0.0, dependencies=("missing",))
+    with pytest.raises(KeyError):
+        MetricsEngine(["missing"])
@@ -83,3 +83,68 @@ def test_post_processing_pipeline_works(tmp_path):
 
     # If we got here, post-processing pipeline is at least loadable
     assert True
+
+
+def test_live_import_while_experiment_runs(tmp_path):
+    """Turns are imported while an experiment runs, before post-processing."""
+    import asyncio
+    import time
+
+    import duckdb
+
+    from pidgin.experiments.live_importer import LiveImporter
+
+    exp_dir = tmp_path / "experiment_live"
+    exp_dir.mkdir()
+    (exp_dir / "manifest.json").write_text(
+        json.dumps({"experiment_id": "live", "name": "Live Test"})
+    )
+    events = [
+        {
+            "event_type": "ConversationStartEvent",
+            "conversation_id": "conv_live",
+            "agent_a": {"id": "agent_a"},
+            "agent_b": {"id": "agent_b"},
+            "agent_a_model": "local:test",
+            "agent_b_model": "local:test",
+            "initial_prompt": "Hello",
+            "timestamp": "2025-01-01T00:00:00",
+        },
+        {
+            "event_type": "TurnCompleteEvent",
+            "conversation_id": "conv_live",
+            "turn_number": 0,
+            "turn": {
+                "agent_a_message": {"role": "assistant", "content": "Hello there"},
+                "agent_b_message": {"role": "assistant", "content": "Hi back"},
+            },
+            "convergence_score": 0.5,
+            "timestamp": "2025-01-01T00:00:01",
+        },
+    ]
+    (exp_dir / "events_conv_live.jsonl").write_text(
+        "".join(json.dumps(event) + "\n" for event in events)
+    )
+
+    db_path = tmp_path / "live.duckdb"
+    importer = LiveImporter(exp_dir, db_path, interval=0.1)
+    importer.start()
+    try:
+        imported = None
+        deadline = time.monotonic() + 60
+        while not imported and time.monotonic() < deadline:
+            time.sleep(0.2)
+            try:
+                # Readers can connect between imports
+                with duckdb.connect(str(db_path), read_only=True) as db:
+                    imported = db.execute(
+                        "SELECT e.status, count(t.turn_number) "
+                        "FROM experiments e JOIN conversation_turns t USING "
+                        "(experiment_id) GROUP BY e.status"
+                    ).fetchone()
+            except duckdb.Error:
+                continue
+    finally:
+        asyncio.run(importer.stop())
+
+    assert imported == ("running", 1)
@@ -0,0 +1,144 @@
+"""The synthetic provider generates reproducible load offline."""
+
+import time
+
+import pytest
+
+from pidgin.config.models import get_model_config
+from pidgin.core.exceptions import ProviderError, RateLimitError
+from pidgin.core.types import Message
+from pidgin.providers.builder import _create_provider
+from pidgin.providers.synthetic import SyntheticProvider, SyntheticSettings
+
+MESSAGES = [Message(role="user", content="Hello there", agent_id="human")]
+
+
+async def _collect(provider, thinking_enabled=None):
+    return [
+        (chunk.chunk_type, chunk.content)
+        async for chunk in provider.stream_response(
+            MESSAGES, thinking_enabled=thinking_enabled
+        )
+    ]
+
+
+def _count_attempts(provider):
+    """Count calls of the provider's generator, i.e. attempts."""
+    attempts = []
+    generate = provider._generate
+
+    def counting(*args):
+        attempts.append(args)
+        return generate(*args)
+
+    provider._generate = counting
+    return attempts
+
+
+@pytest.mark.asyncio
+async def test_seeded_profile_is_deterministic():
+    """Same seed, same lengths and delays; lengths follow the profile."""
+    settings = {
+        "response_tokens_mean": 40,
+        "response_tokens_stddev": 10,
+        "tokens_per_second": 0,
+        "ttft_ms_mean": 30,
+        "ttft_ms_stddev": 10,
+        "chunk_tokens": 4,
+        "seed": 7,
+    }
+
+    def ttft_samples(provider):
+        rng_state = provider.rng.getstate()
+        provider.rng.random()  # The failure roll comes first
+        provider.rng.gauss(40, 10)  # Then the response length
+        samples = provider._sample(30, 10)
+        provider.rng.setstate(rng_state)
+        return samples
+
+    runs = []
+    for _ in range(2):
+        # Instances are numbered per seed, so compare the first of each run
+        SyntheticProvider._instances = iter(range(100))
+        provider = SyntheticProvider(SyntheticSettings(**settings))
+        ttft_ms = ttft_samples(provider)
+        start = time.monotonic()
+        chunks = await _collect(provider)
+        elapsed_ms = (time.monotonic() - start) * 1000
+        runs.append((chunks, provider.get_last_usage(), ttft_ms))
+        assert elapsed_ms >= ttft_ms - 1
+
+    assert runs[0] == runs[1]
+    chunks, usage, _ = runs[0]
+    words = sum(len(content.split()) for _, content in chunks)
+    assert words == usage["completion_tokens"]
+    assert all(chunk_type == "response" for chunk_type, _ in chunks)
+    assert all(len(content.split()) <= 4 for _, content in chunks)
+
+    # A second agent with the same seed gets a different stream
+    other = SyntheticProvider(SyntheticSettings(**settings))
+    assert await _collect(other) != chunks
+
+
+@pytest.mark.asyncio
+async def test_thinking_only_when_enabled():
+    """Thinking is generated on request and billed as completion tokens."""
+    settings = SyntheticSettings(
+        response_tokens_mean=8,
+        response_tokens_stddev=0,
+        thinking_tokens_mean=12,
+        tokens_per_second=0,
+        ttft_ms_mean=0,
+        ttft_ms_stddev=0,
+        seed=1,
+    )
+    provider = SyntheticProvider(settings)
+
+    chunks = await _collect(provider, thinking_enabled=False)
+    assert {chunk_type for chunk_type, _ in chunks} == {"response"}
+    assert provider.get_last_usage()["completion_tokens"] == 8
+
+    chunks = await _collect(provider, thinking_enabled=True)
+    thinking = [c for chunk_type, c in chunks if chunk_type == "thinking"]
+    assert sum(len(c.split()) for c in thinking) == 12
+    assert provider.get_last_usage()["completion_tokens"] == 20
+
+
+@pytest.mark.asyncio
+async def test_rate_limits_are_retried_up_to_max_retries():
+    """Injected 429s are retried, and raised once attempts run out."""
+    provider = SyntheticProvider(
+        SyntheticSettings(rate_limit_rate=1.0, max_retries=3, retry_base_delay=0)
+    )
+    attempts = _count_attempts(provider)
+
+    with pytest.raises(RateLimitError):
+        await _collect(provider)
+    assert len(attempts) == 3
+
+
+@pytest.mark.asyncio
+async def test_injected_errors_are_not_retried():
+    """Injected provider errors fail the request without retries."""
+    provider = SyntheticProvider(
+        SyntheticSettings(error_rate=1.0, max_retries=3, retry_base_delay=0)
+    )
+    attempts = _count_attempts(provider)
+
+    with pytest.raises(ProviderError, match="injected"):
+        await _collect(provider)
+    assert len(attempts) == 1
+    assert provider.get_last_usage() is None
+
+
+def test_local_synthetic_builds_synthetic_provider():
+    """local:synthetic gets the experiment's load profile; local:test does not."""
+    provider = _create_provider(
+        get_model_config("local:synthetic"), {"chunk_tokens": 9, "unknown": 1}
+    )
+    assert isinstance(provider, SyntheticProvider)
+    assert provider.settings.chunk_tokens == 9
+
+    assert not isinstance(
+        _create_provider(get_model_config("local:test")), SyntheticProvider
+    )